@@ -2,7 +2,7 @@ from dharitri_py_sdk.account_management import (
     AccountController,
     AccountTransactionsFactory,
 )
-from dharitri_py_sdk.accounts import Account, LedgerAccount
+from dharitri_py_sdk.accounts import Account, LedgerAccount, NonceManager
 from dharitri_py_sdk.core import (
     Address,
     AddressComputer,
@@ -40,6 +40,7 @@ from dharitri_py_sdk.entrypoints import (
     NetworkEntrypoint,
     TestnetEntrypoint,
 )
+from dharitri_py_sdk.gas_estimator import GasLimitEstimationError, GasLimitEstimator
 from dharitri_py_sdk.ledger.ledger_app import LedgerApp
 from dharitri_py_sdk.native_auth.config import (
     NativeAuthClientConfig,
@@ -51,25 +52,55 @@ from dharitri_py_sdk.network_providers import (
     AccountAwaiter,
     AccountOnNetwork,
     AccountStorage,
+    AccountStorageDiff,
     AccountStorageEntry,
+    AccountStorageRefresher,
+    AccountStorageSnapshot,
     ApiNetworkProvider,
     AwaitingOptions,
+    BaseTransactionNotifier,
     BlockCoordinates,
     BlockOnNetwork,
+    BulkTransactionAwaiter,
+    CachingNetworkProvider,
+    CachingOptions,
+    ChainDataCache,
+    ChainFollower,
+    ChainFollowerOptions,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
     FungibleTokenMetadata,
     GenericResponse,
+    JsonLinesExchangeStore,
+    MultiEndpointNetworkProvider,
+    MultiEndpointOptions,
     NetworkConfig,
     NetworkProviderConfig,
     NetworkProviderError,
+    NetworkProviderMetrics,
     NetworkStatus,
     ProxyNetworkProvider,
+    RateLimit,
+    RateLimiter,
+    RecordedExchange,
+    RecordingNetworkProvider,
+    ReplayNetworkProvider,
     RequestsRetryOptions,
+    RouteSummary,
+    SQLiteExchangeStore,
     TokenAmountOnNetwork,
     TokensCollectionMetadata,
     TransactionAwaiter,
+    TransactionCostCache,
     TransactionCostResponse,
     TransactionDecoder,
     TransactionMetadata,
+    TransactionNotifier,
+    TransactionNotifierOptions,
+    TransactionSubmitter,
+    TransactionSubmitterOptions,
+    TransfersColumns,
 )
 from dharitri_py_sdk.relayed import RelayedController, RelayedTransactionsFactory
 from dharitri_py_sdk.smart_contracts import (
@@ -77,6 +108,7 @@ from dharitri_py_sdk.smart_contracts import (
     ParsedSmartContractCallOutcome,
     SmartContractController,
     SmartContractDeployOutcome,
+    SmartContractQueriesRunner,
     SmartContractQuery,
     SmartContractQueryResponse,
     SmartContractTransactionsFactory,
@@ -253,4 +285,38 @@ __all__ = [
     "ValidatorsController",
     "ValidatorsSigners",
     "RequestsRetryOptions",
+    "MultiEndpointNetworkProvider",
+    "MultiEndpointOptions",
+    "RateLimit",
+    "RateLimiter",
+    "CachingNetworkProvider",
+    "CachingOptions",
+    "ChainFollower",
+    "ChainFollowerOptions",
+    "SmartContractQueriesRunner",
+    "AccountStorageSnapshot",
+    "AccountStorageDiff",
+    "AccountStorageRefresher",
+    "NetworkProviderMetrics",
+    "RouteSummary",
+    "RecordingNetworkProvider",
+    "ReplayNetworkProvider",
+    "RecordedExchange",
+    "JsonLinesExchangeStore",
+    "SQLiteExchangeStore",
+    "BaseTransactionNotifier",
+    "TransactionNotifier",
+    "TransactionNotifierOptions",
+    "ChainDataCache",
+    "TransfersColumns",
+    "NonceManager",
+    "TransactionSubmitter",
+    "TransactionSubmitterOptions",
+    "BulkTransactionAwaiter",
+    "TransactionCostCache",
+    "GasLimitEstimator",
+    "GasLimitEstimationError",
+    "CircuitBreaker",
+    "CircuitState",
+    "CircuitOpenError",
 ]
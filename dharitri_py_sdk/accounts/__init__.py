@@ -1,4 +1,5 @@
 from dharitri_py_sdk.accounts.account import Account
 from dharitri_py_sdk.accounts.ledger_account import LedgerAccount
+from dharitri_py_sdk.accounts.nonce_manager import NonceManager
 
-__all__ = ["Account", "LedgerAccount"]
+__all__ = ["Account", "LedgerAccount", "NonceManager"]
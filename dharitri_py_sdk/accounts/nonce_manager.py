@@ -0,0 +1,316 @@
+import heapq
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Protocol, Union
+
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.network_providers.resources import AccountOnNetwork
+
+logger = logging.getLogger("nonce_manager")
+
+STATE_FORMAT_VERSION = 1
+
+
+# fmt: off
+class IAccountFetcher(Protocol):
+    def get_account(self, address: Address) -> AccountOnNetwork:
+        ...
+# fmt: on
+
+
+@dataclass
+class _SenderState:
+    next_nonce: int
+    network_nonce: int
+    # allocated, but not yet reported as sent (or unused)
+    in_flight: set[int] = field(default_factory=set)
+    # in flight when the state was saved (e.g. before a crash): they might have been sent, or not (resolved when synchronizing)
+    unknown: set[int] = field(default_factory=set)
+    # reported as sent while synchronizing (they might be missing from the fetched mempool, although sent)
+    sent_while_syncing: set[int] = field(default_factory=set)
+    is_syncing: bool = False
+    # nonces below "next_nonce" that aren't used (they must be filled, otherwise the subsequent transactions get stuck)
+    gaps: list[int] = field(default_factory=list)
+    # states loaded from the file are reconciled with the network on first use
+    is_synced: bool = True
+
+
+class NonceManager:
+    """
+    Allocates the nonces of (one or more) senders, atomically, so that many threads (or asyncio tasks) can send transactions
+    on behalf of the same sender without collisions.
+
+    The nonce of a sender is fetched from the network on first use (and when resynchronizing), then tracked locally.
+    Nonces that end up unused (e.g. the transaction couldn't be built, or it was rejected) are handed out again, before new ones,
+    so that no gaps are left behind (a gap would block the execution of all the subsequent transactions of the sender).
+
+    If the fetcher can also tell the nonces of the pending transactions of a sender (`get_pending_nonces_of_account()`, e.g. `ProxyNetworkProvider`),
+    synchronizing detects the transactions that have been dropped from the mempool, as well: their nonces become gaps, to be filled.
+
+    If a state file is provided, the state is persisted after each change, so that a (crashed) sender process can resume.
+    Nonces that were allocated, but not reported as sent, are resolved against the network before being handed out again:
+    the ones executed or pending in the mempool are skipped, the others are considered gaps. If the mempool cannot be checked,
+    all the ones not yet executed are considered gaps.
+    """
+
+    def __init__(self, fetcher: IAccountFetcher, state_path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Args:
+            fetcher (IAccountFetcher): used to fetch the nonces of the senders (e.g. a network provider).
+            state_path (Optional[Union[str, Path]]): if set, the state is persisted in this (JSON) file, and loaded from it (if it exists).
+        """
+        self.fetcher = fetcher
+        self.state_path = Path(state_path).expanduser() if state_path else None
+
+        self._lock = threading.RLock()
+        self._senders: dict[str, _SenderState] = {}
+        self._sync_locks: dict[str, threading.Lock] = {}
+        # the file is written outside of the main lock; concurrent changes are written at once (see `_save()`)
+        self._save_lock = threading.Lock()
+        self._num_changes = 0
+        self._num_saved_changes = 0
+
+        if self.state_path and self.state_path.exists():
+            self._load()
+
+    def allocate_nonce(self, sender: Address) -> int:
+        """Returns the next nonce to be used by the sender (filling the known gaps first)."""
+        return self.allocate_nonces(sender, 1)[0]
+
+    def allocate_nonces(self, sender: Address, count: int) -> list[int]:
+        """Allocates many nonces at once (cheaper than allocating them one by one, e.g. when sending transactions in batches)."""
+        key = sender.to_bech32()
+        self._ensure_synced(sender, key)
+
+        with self._lock:
+            state = self._senders[key]
+            num_gaps = min(count, len(state.gaps))
+            nonces = [heapq.heappop(state.gaps) for _ in range(num_gaps)]
+            nonces.extend(range(state.next_nonce, state.next_nonce + count - num_gaps))
+
+            state.next_nonce += count - num_gaps
+            state.in_flight.update(nonces)
+
+        self._save()
+        return nonces
+
+    def mark_sent(self, sender: Address, nonce: int) -> None:
+        """Records that the transaction having the given nonce has been accepted by the network."""
+        with self._lock:
+            state = self._get_state(sender)
+            state.in_flight.discard(nonce)
+
+            if state.is_syncing:
+                state.sent_while_syncing.add(nonce)
+
+        self._save()
+
+    def mark_unused(self, sender: Address, nonce: int) -> None:
+        """Records that the given nonce hasn't been used (e.g. the transaction wasn't sent), so that it's handed out again."""
+        with self._lock:
+            state = self._get_state(sender)
+            state.in_flight.discard(nonce)
+            self._add_gap(state, nonce)
+
+        self._save()
+
+    def mark_rejected(self, sender: Address, nonce: int) -> None:
+        """
+        Records that the transaction having the given nonce has been rejected by the network, then resynchronizes the sender.
+        If the nonce is still usable (not yet executed), it's handed out again.
+        """
+        self.mark_unused(sender, nonce)
+        self.resync(sender)
+
+    def resync(self, sender: Address) -> int:
+        """Fetches the nonce of the sender from the network and reconciles it with the local state. Returns the nonce on the network."""
+        key = sender.to_bech32()
+
+        with self._get_sync_lock(key):
+            return self._resync(sender, key)
+
+    def detect_gaps(self, sender: Address) -> list[int]:
+        """
+        Resynchronizes the sender, then returns the nonces (between the nonce on the network and the next nonce) that aren't used,
+        nor in flight: the ones reported as unused, and (if the mempool can be checked, see the class docstring) the ones of the transactions
+        that aren't pending anymore, although not executed. They are handed out (filled) by the next allocations.
+        """
+        self.resync(sender)
+
+        with self._lock:
+            return sorted(self._get_state(sender).gaps)
+
+    def get_next_nonce(self, sender: Address) -> int:
+        """Returns the nonce that follows the highest allocated one (without allocating it)."""
+        key = sender.to_bech32()
+        self._ensure_synced(sender, key)
+
+        with self._lock:
+            return self._senders[key].next_nonce
+
+    def count_in_flight(self, sender: Address) -> int:
+        with self._lock:
+            return len(self._get_state(sender).in_flight)
+
+    def _ensure_synced(self, sender: Address, key: str) -> None:
+        if self._is_synced(key):
+            return
+
+        with self._get_sync_lock(key):
+            # another thread might have synchronized the sender in the meantime
+            if not self._is_synced(key):
+                self._resync(sender, key)
+
+    def _is_synced(self, key: str) -> bool:
+        with self._lock:
+            state = self._senders.get(key)
+            return state is not None and state.is_synced
+
+    def _resync(self, sender: Address, key: str) -> int:
+        with self._lock:
+            state = self._senders.get(key)
+            if state is not None:
+                state.is_syncing = True
+                state.sent_while_syncing.clear()
+
+        # the mempool is fetched first: a transaction executed in the meantime is still accounted for, by the nonce of the account
+        pending_nonces = self._fetch_pending_nonces(sender)
+        network_nonce = self.fetcher.get_account(sender).nonce
+
+        with self._lock:
+            state = self._senders.get(key)
+
+            if state is None:
+                self._senders[key] = _SenderState(next_nonce=network_nonce, network_nonce=network_nonce)
+            else:
+                self._reconcile(key, state, network_nonce, pending_nonces)
+
+        self._save()
+        return network_nonce
+
+    def _fetch_pending_nonces(self, sender: Address) -> Optional[set[int]]:
+        get_pending_nonces = getattr(self.fetcher, "get_pending_nonces_of_account", None)
+        if get_pending_nonces is None:
+            return None
+        return set(get_pending_nonces(sender))
+
+    def _reconcile(self, key: str, state: _SenderState, network_nonce: int, pending_nonces: Optional[set[int]]) -> None:
+        # the highest nonce known to be used on the network (executed, or pending)
+        highest_nonce = network_nonce - 1
+        if pending_nonces:
+            highest_nonce = max(highest_nonce, max(pending_nonces))
+
+        if highest_nonce >= state.next_nonce:
+            logger.warning(
+                f"Nonce of {key} advanced on the network (to {highest_nonce + 1}), beyond the local nonce ({state.next_nonce})."
+            )
+            state.next_nonce = highest_nonce + 1
+
+        # executed (or pending) nonces can't be used anymore
+        state.gaps = [nonce for nonce in state.gaps if nonce >= network_nonce and nonce not in (pending_nonces or ())]
+        heapq.heapify(state.gaps)
+        state.in_flight = {nonce for nonce in state.in_flight if nonce >= network_nonce}
+        state.network_nonce = network_nonce
+
+        if pending_nonces is None:
+            # without a view of the mempool, the nonces of the transactions that might have been sent are considered gaps
+            missing_nonces = state.unknown
+        else:
+            known_nonces = state.in_flight | state.sent_while_syncing | pending_nonces | set(state.gaps)
+            missing_nonces = set(range(network_nonce, state.next_nonce)) - known_nonces
+
+        for nonce in sorted(missing_nonces):
+            self._add_gap(state, nonce)
+
+        state.unknown = set()
+        state.sent_while_syncing = set()
+        state.is_syncing = False
+        state.is_synced = True
+
+    def _get_state(self, sender: Address) -> _SenderState:
+        key = sender.to_bech32()
+        state = self._senders.get(key)
+
+        if state is None:
+            raise ValueError(f"no nonce has been allocated for {key}")
+        return state
+
+    def _get_sync_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._sync_locks.setdefault(key, threading.Lock())
+
+    def _add_gap(self, state: _SenderState, nonce: int) -> None:
+        if nonce >= state.network_nonce and nonce < state.next_nonce and nonce not in state.gaps:
+            heapq.heappush(state.gaps, nonce)
+
+    def _save(self) -> None:
+        """
+        Persists the state (to be called after each change, without holding the main lock). The callers wait for their change to be on disk,
+        but the file is written outside the main lock (allocations aren't blocked meanwhile), and the changes made by concurrent callers
+        are written at once (by the first one to get the turn).
+        """
+        if self.state_path is None:
+            return
+
+        with self._lock:
+            self._num_changes += 1
+            change = self._num_changes
+
+        with self._save_lock:
+            # already written, along with the change of another caller
+            if self._num_saved_changes >= change:
+                return
+
+            with self._lock:
+                num_changes = self._num_changes
+                data = self._to_dictionary()
+
+            self._write(data)
+            self._num_saved_changes = num_changes
+
+    def _to_dictionary(self) -> dict[str, Any]:
+        return {
+            "version": STATE_FORMAT_VERSION,
+            "senders": {
+                key: {
+                    "nextNonce": state.next_nonce,
+                    "networkNonce": state.network_nonce,
+                    # the ones not yet resolved are still unknown after a restart
+                    "inFlight": sorted(state.in_flight | state.unknown),
+                    "gaps": sorted(state.gaps),
+                }
+                for key, state in self._senders.items()
+            },
+        }
+
+    def _write(self, data: dict[str, Any]) -> None:
+        assert self.state_path is not None
+        temporary_path = self.state_path.with_name(self.state_path.name + ".tmp")
+
+        with open(temporary_path, "w") as file:
+            json.dump(data, file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temporary_path, self.state_path)
+
+    def _load(self) -> None:
+        assert self.state_path is not None
+        data = json.loads(self.state_path.read_text())
+
+        if data.get("version") != STATE_FORMAT_VERSION:
+            raise ValueError(f"unsupported nonce manager state: {self.state_path}")
+
+        for key, item in data.get("senders", {}).items():
+            # the process might have crashed before (or after) sending the transactions that were in flight, so their nonces are resolved on first use
+            self._senders[key] = _SenderState(
+                next_nonce=item["nextNonce"],
+                network_nonce=item.get("networkNonce", 0),
+                unknown=set(item.get("inFlight", [])),
+                gaps=sorted(item.get("gaps", [])),
+                is_synced=False,
+            )
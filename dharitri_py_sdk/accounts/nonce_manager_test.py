@@ -0,0 +1,171 @@
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from dharitri_py_sdk.accounts.nonce_manager import NonceManager
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.network_providers.resources import AccountOnNetwork
+
+ALICE = Address.new_from_bech32("drt1c7pyyq2yaq5k7atn9z6qn5qkxwlc6zwc4vg7uuxn9ssy7evfh5jq4nm79l")
+
+
+class AccountFetcher:
+    def __init__(self, nonce: int) -> None:
+        self.nonce = nonce
+        self.num_fetches = 0
+
+    def get_account(self, address: Address) -> AccountOnNetwork:
+        self.num_fetches += 1
+        return AccountOnNetwork(raw={}, address=address, nonce=self.nonce, balance=0, is_guarded=False)
+
+
+class MempoolAwareAccountFetcher(AccountFetcher):
+    def __init__(self, nonce: int, pending_nonces: list[int]) -> None:
+        super().__init__(nonce)
+        self.pending_nonces = pending_nonces
+
+    def get_pending_nonces_of_account(self, address: Address) -> list[int]:
+        return self.pending_nonces
+
+
+def test_concurrent_allocation():
+    fetcher = AccountFetcher(nonce=5)
+    manager = NonceManager(fetcher)
+    allocated: list[int] = []
+    lock = threading.Lock()
+
+    def allocate():
+        nonces = [manager.allocate_nonce(ALICE) for _ in range(500)]
+        with lock:
+            allocated.extend(nonces)
+
+    threads = [threading.Thread(target=allocate) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(allocated) == list(range(5, 4005))
+    assert fetcher.num_fetches == 1
+    assert manager.get_next_nonce(ALICE) == 4005
+    assert manager.count_in_flight(ALICE) == 4000
+
+
+def test_unused_and_rejected_nonces_are_filled():
+    fetcher = AccountFetcher(nonce=0)
+    manager = NonceManager(fetcher)
+
+    assert manager.allocate_nonces(ALICE, 5) == [0, 1, 2, 3, 4]
+    for nonce in [0, 1, 4]:
+        manager.mark_sent(ALICE, nonce)
+
+    manager.mark_unused(ALICE, 2)
+    assert manager.allocate_nonce(ALICE) == 2
+
+    # the network executed the first two transactions, then rejected the one having the nonce 3
+    fetcher.nonce = 2
+    manager.mark_rejected(ALICE, 3)
+    assert manager.allocate_nonces(ALICE, 2) == [3, 5]
+
+    # a nonce rejected after being executed (e.g. a duplicate) isn't handed out again
+    fetcher.nonce = 4
+    manager.mark_rejected(ALICE, 3)
+    assert manager.detect_gaps(ALICE) == []
+    assert manager.allocate_nonce(ALICE) == 6
+
+
+def test_network_nonce_advanced_elsewhere():
+    fetcher = AccountFetcher(nonce=3)
+    manager = NonceManager(fetcher)
+
+    assert manager.allocate_nonce(ALICE) == 3
+
+    fetcher.nonce = 10
+    assert manager.resync(ALICE) == 10
+    assert manager.allocate_nonce(ALICE) == 10
+    assert manager.count_in_flight(ALICE) == 1
+
+
+def test_resume_after_crash(tmp_path: Path):
+    path = tmp_path / "nonces.json"
+    fetcher = AccountFetcher(nonce=7)
+
+    manager = NonceManager(fetcher, path)
+    assert manager.allocate_nonces(ALICE, 4) == [7, 8, 9, 10]
+    manager.mark_sent(ALICE, 7)
+    manager.mark_sent(ALICE, 9)
+    # the process crashes before sending the transactions having the nonces 8 and 10
+
+    fetcher.nonce = 8
+    resumed = NonceManager(fetcher, path)
+
+    assert resumed.detect_gaps(ALICE) == [8, 10]
+    assert resumed.allocate_nonces(ALICE, 3) == [8, 10, 11]
+    assert fetcher.num_fetches == 2
+
+
+def test_resume_after_crash_checks_the_mempool(tmp_path: Path):
+    path = tmp_path / "nonces.json"
+    fetcher = MempoolAwareAccountFetcher(nonce=7, pending_nonces=[])
+
+    manager = NonceManager(fetcher, path)
+    assert manager.allocate_nonces(ALICE, 4) == [7, 8, 9, 10]
+    manager.mark_sent(ALICE, 7)
+    manager.mark_sent(ALICE, 9)
+    # the transaction having the nonce 8 is sent, then the process crashes (before recording it, and before sending the one having the nonce 10);
+    # meanwhile, the transaction having the nonce 9 is dropped from the mempool
+
+    fetcher.nonce = 8
+    fetcher.pending_nonces = [8]
+    resumed = NonceManager(fetcher, path)
+
+    assert resumed.detect_gaps(ALICE) == [9, 10]
+    assert resumed.allocate_nonces(ALICE, 3) == [9, 10, 11]
+
+
+def test_detect_gaps_of_dropped_transactions():
+    fetcher = MempoolAwareAccountFetcher(nonce=0, pending_nonces=[])
+    manager = NonceManager(fetcher)
+
+    assert manager.allocate_nonces(ALICE, 5) == [0, 1, 2, 3, 4]
+    for nonce in [0, 1, 2, 3]:
+        manager.mark_sent(ALICE, nonce)
+
+    # the transaction having the nonce 0 is dropped from the mempool, while the one having the nonce 4 is still in flight
+    fetcher.pending_nonces = [1, 2, 3]
+    assert manager.detect_gaps(ALICE) == [0]
+
+    # transactions of the sender, sent by someone else
+    fetcher.pending_nonces = [0, 1, 2, 3, 6]
+    assert manager.detect_gaps(ALICE) == [5]
+    assert manager.get_next_nonce(ALICE) == 7
+
+
+def test_state_is_saved_once_for_concurrent_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path = tmp_path / "nonces.json"
+    manager = NonceManager(AccountFetcher(nonce=0), path)
+    manager.allocate_nonce(ALICE)
+
+    num_writes = 0
+    write = manager._write
+
+    def slow_write(data: dict[str, Any]) -> None:
+        nonlocal num_writes
+        num_writes += 1
+        time.sleep(0.05)
+        write(data)
+
+    monkeypatch.setattr(manager, "_write", slow_write)
+
+    threads = [threading.Thread(target=manager.allocate_nonce, args=[ALICE]) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert num_writes < 8
+    assert json.loads(path.read_text())["senders"][ALICE.to_bech32()]["nextNonce"] == 9
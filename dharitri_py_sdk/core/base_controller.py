@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Protocol
 
 from dharitri_py_sdk.core.constants import (
     EXTRA_GAS_LIMIT_FOR_GUARDED_TRANSACTIONS,
@@ -9,9 +9,19 @@ from dharitri_py_sdk.core.transaction import Transaction
 from dharitri_py_sdk.core.transaction_computer import TransactionComputer
 
 
+class IGasLimitEstimator(Protocol):
+    # fmt: off
+    def estimate_gas_limit(self, transaction: Transaction, endpoint: Optional[str] = None) -> int:
+        ...
+    # fmt: on
+
+
 class BaseController:
     """This is the base class for all controllers. **Internal use only.**"""
 
+    # if set, the gas limit is estimated whenever it isn't explicitly provided
+    gas_limit_estimator: Optional[IGasLimitEstimator] = None
+
     def _set_version_and_options_for_hash_signing(self, sender: IAccount, transaction: Transaction):
         """If the Account has the `use_hash_signing` flag set to `True`, this method will set the correct `version` and `options` properties of `Transaction`."""
         if sender.use_hash_signing:
@@ -31,14 +41,19 @@ class BaseController:
         transaction: Transaction,
         gas_limit: Optional[int] = None,
         gas_price: Optional[int] = None,
+        endpoint: Optional[str] = None,
     ):
         if gas_price:
             transaction.gas_price = gas_price
 
         if gas_limit:
             transaction.gas_limit = gas_limit
-        else:
-            self._add_extra_gas_limit_if_required(transaction)
+            return
+
+        if self.gas_limit_estimator is not None:
+            transaction.gas_limit = self.gas_limit_estimator.estimate_gas_limit(transaction, endpoint)
+
+        self._add_extra_gas_limit_if_required(transaction)
 
     def _set_version_and_options_for_guardian(self, transaction: Transaction):
         if transaction.guardian:
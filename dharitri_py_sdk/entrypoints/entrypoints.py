@@ -26,6 +26,7 @@ from dharitri_py_sdk.entrypoints.config import (
     TestnetEntrypointConfig,
 )
 from dharitri_py_sdk.entrypoints.errors import InvalidNetworkProviderKindError
+from dharitri_py_sdk.gas_estimator.gas_limit_estimator import GasLimitEstimator
 from dharitri_py_sdk.network_providers import ApiNetworkProvider, ProxyNetworkProvider
 from dharitri_py_sdk.network_providers.interface import INetworkProvider
 from dharitri_py_sdk.relayed.relayed_controller import RelayedController
@@ -159,14 +160,22 @@ class NetworkEntrypoint:
     def create_relayed_transactions_factory(self) -> RelayedTransactionsFactory:
         return RelayedTransactionsFactory(TransactionsFactoryConfig(self._get_chain_id()))
 
-    def create_smart_contract_controller(self, abi: Optional[Abi] = None) -> SmartContractController:
-        return SmartContractController(self._get_chain_id(), self.network_provider, abi)
+    def create_smart_contract_controller(
+        self, abi: Optional[Abi] = None, gas_limit_estimator: Optional[GasLimitEstimator] = None
+    ) -> SmartContractController:
+        return SmartContractController(self._get_chain_id(), self.network_provider, abi, gas_limit_estimator)
 
     def create_smart_contract_transactions_factory(self, abi: Optional[Abi] = None) -> SmartContractTransactionsFactory:
         return SmartContractTransactionsFactory(config=TransactionsFactoryConfig(self._get_chain_id()), abi=abi)
 
-    def create_token_management_controller(self) -> TokenManagementController:
-        return TokenManagementController(self._get_chain_id(), self.network_provider)
+    def create_token_management_controller(
+        self, gas_limit_estimator: Optional[GasLimitEstimator] = None
+    ) -> TokenManagementController:
+        return TokenManagementController(self._get_chain_id(), self.network_provider, gas_limit_estimator)
+
+    def create_gas_limit_estimator(self, gas_multiplier: float = 1.1) -> GasLimitEstimator:
+        """Creates a `GasLimitEstimator` that uses the network provider of the entrypoint (to be passed to the controllers)."""
+        return GasLimitEstimator(self.network_provider, gas_multiplier)
 
     def create_token_management_transactions_factory(
         self,
@@ -0,0 +1,4 @@
+from dharitri_py_sdk.gas_estimator.errors import GasLimitEstimationError
+from dharitri_py_sdk.gas_estimator.gas_limit_estimator import GasLimitEstimator
+
+__all__ = ["GasLimitEstimator", "GasLimitEstimationError"]
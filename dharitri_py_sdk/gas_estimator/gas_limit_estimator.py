@@ -0,0 +1,100 @@
+import logging
+import math
+from hashlib import blake2b
+from typing import Optional, Protocol
+
+from dharitri_py_sdk.core.transaction import Transaction
+from dharitri_py_sdk.gas_estimator.errors import GasLimitEstimationError
+from dharitri_py_sdk.network_providers.cache_backends import (
+    ICacheBackend,
+    InMemoryCacheBackend,
+)
+from dharitri_py_sdk.network_providers.resources import TransactionCostResponse
+
+logger = logging.getLogger("gas_limit_estimator")
+
+# the first part of the data field is usually the name of the function, but it's the whole bytecode for deployments
+MAX_FUNCTION_LENGTH_IN_KEY = 64
+
+
+# fmt: off
+class INetworkProvider(Protocol):
+    def estimate_transaction_cost(self, transaction: Transaction) -> TransactionCostResponse:
+        ...
+# fmt: on
+
+
+class GasLimitEstimator:
+    """
+    Estimates the gas limit of transactions (using the cost estimation of the network), then applies a safety multiplier.
+    Pass it to the controllers (e.g. `SmartContractController`), so that they estimate the gas limit whenever it isn't explicitly provided.
+
+    Estimations are cached per endpoint and shape of the arguments (receiver, function, number and lengths of the arguments),
+    so that repeated calls of the same endpoint aren't estimated again (until the cached estimation expires).
+    Keys are namespaced by the chain ID of the transaction and by the network provider, so that a cache can be shared.
+    """
+
+    def __init__(
+        self,
+        network_provider: INetworkProvider,
+        gas_multiplier: float = 1.1,
+        cache: Optional[ICacheBackend] = None,
+        ttl_in_seconds: Optional[float] = 600,
+        namespace: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            network_provider (INetworkProvider): used to estimate the cost of the transactions.
+            gas_multiplier (float): the estimated gas limit is multiplied by this value (the margin protects against estimations that are slightly off, e.g. because of different arguments or a changed contract state).
+            cache (Optional[ICacheBackend]): where the estimations are stored. Defaults to an in-memory cache.
+            ttl_in_seconds (Optional[float]): for how long an estimation is reused. If `None`, estimations never expire. Set it to 0 to disable caching.
+            namespace (Optional[str]): the prefix of the keys in the cache. Defaults to the URL of the network provider (if it has one).
+        """
+        if gas_multiplier < 1:
+            raise ValueError("The gas multiplier must be at least 1")
+
+        self.network_provider = network_provider
+        self.gas_multiplier = gas_multiplier
+        self.cache = cache if cache is not None else InMemoryCacheBackend()
+        self.ttl_in_seconds = ttl_in_seconds
+        self.namespace = namespace if namespace is not None else getattr(network_provider, "url", "")
+
+    def estimate_gas_limit(self, transaction: Transaction, endpoint: Optional[str] = None) -> int:
+        """
+        Returns the gas limit to be set on the transaction (it doesn't alter the transaction).
+
+        Args:
+            transaction (Transaction): the transaction, as it will be sent (the gas limit and the signature don't matter).
+            endpoint (Optional[str]): the endpoint called by the transaction, if it can't be derived from the data field (e.g. contract calls along with token transfers).
+        """
+        key = self.get_key(transaction, endpoint)
+        is_caching_enabled = self.ttl_in_seconds != 0
+
+        cached: Optional[int] = self.cache.get(key) if is_caching_enabled else None
+        if cached is not None:
+            return cached
+
+        cost = self.network_provider.estimate_transaction_cost(transaction)
+        return_message = cost.raw.get("returnMessage")
+
+        if cost.gas_limit <= 0 or return_message:
+            raise GasLimitEstimationError(f"Could not estimate the gas limit: {return_message or cost.raw}")
+
+        gas_limit = math.ceil(cost.gas_limit * self.gas_multiplier)
+        logger.debug(f"Estimated the gas limit for {key}: {cost.gas_limit} (applied: {gas_limit}).")
+
+        if is_caching_enabled:
+            self.cache.set(key, gas_limit, self.ttl_in_seconds)
+
+        return gas_limit
+
+    def get_key(self, transaction: Transaction, endpoint: Optional[str] = None) -> str:
+        function, *arguments = transaction.data.split(b"@") if transaction.data else [b""]
+        if len(function) > MAX_FUNCTION_LENGTH_IN_KEY:
+            function = blake2b(function, digest_size=16).hexdigest().encode()
+
+        shape = ",".join(str(len(argument)) for argument in arguments)
+        receiver = transaction.receiver.to_bech32()
+        has_value = transaction.value > 0
+        prefix = f"gas:{self.namespace}:{transaction.chain_id}"
+        return f"{prefix}:{receiver}:{function.decode(errors='replace')}:{endpoint or ''}:{shape}:{has_value}"
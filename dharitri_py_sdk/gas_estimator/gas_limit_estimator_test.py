@@ -0,0 +1,150 @@
+import math
+from pathlib import Path
+
+import pytest
+
+from dharitri_py_sdk.abi.biguint_value import BigUIntValue
+from dharitri_py_sdk.accounts.account import Account
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.core.errors import BadUsageError
+from dharitri_py_sdk.core.tokens import Token, TokenTransfer
+from dharitri_py_sdk.core.transaction import Transaction
+from dharitri_py_sdk.core.transaction_status import TransactionStatus
+from dharitri_py_sdk.gas_estimator.errors import GasLimitEstimationError
+from dharitri_py_sdk.gas_estimator.gas_limit_estimator import GasLimitEstimator
+from dharitri_py_sdk.network_providers.cache_backends import InMemoryCacheBackend
+from dharitri_py_sdk.network_providers.resources import TransactionCostResponse
+from dharitri_py_sdk.smart_contracts.smart_contract_controller import (
+    SmartContractController,
+)
+from dharitri_py_sdk.testutils.mock_network_provider import MockNetworkProvider
+from dharitri_py_sdk.token_management.token_management_controller import (
+    TokenManagementController,
+)
+
+CONTRACT = Address.new_from_bech32("drt1qqqqqqqqqqqqqpgqhy6nl6zq07rnzry8uyh6rtyq0uzgtk3e69fq4h4xut")
+
+
+class CostEstimator:
+    """Estimates the cost by the length of the data field, and fails for the "fail" endpoint."""
+
+    def __init__(self) -> None:
+        self.estimated: list[Transaction] = []
+
+    def estimate_transaction_cost(self, transaction: Transaction) -> TransactionCostResponse:
+        self.estimated.append(transaction)
+
+        if transaction.data.startswith(b"fail"):
+            raw = {"txGasUnits": 0, "returnMessage": "function not found"}
+            return TransactionCostResponse(raw=raw, gas_limit=0, status=TransactionStatus(""))
+
+        gas_limit = 1_000_000 + 1000 * len(transaction.data)
+        return TransactionCostResponse(raw={"txGasUnits": gas_limit}, gas_limit=gas_limit, status=TransactionStatus(""))
+
+
+class TestGasLimitEstimator:
+    testwallets = Path(__file__).parent.parent / "testutils" / "testwallets"
+    alice = Account.new_from_pem(testwallets / "alice.pem")
+
+    def test_estimations_are_cached_per_endpoint_and_shape(self):
+        provider = CostEstimator()
+        estimator = GasLimitEstimator(provider, gas_multiplier=1.5)
+        controller = SmartContractController(
+            chain_id="D", network_provider=MockNetworkProvider(), gas_limit_estimator=estimator
+        )
+
+        def execute(function: str, amount: int, token_transfers: list[TokenTransfer] = []) -> Transaction:
+            return controller.create_transaction_for_execute(
+                sender=self.alice,
+                nonce=self.alice.get_nonce_then_increment(),
+                contract=CONTRACT,
+                gas_limit=None,
+                function=function,
+                arguments=[BigUIntValue(amount)],
+                token_transfers=token_transfers,
+            )
+
+        transaction = execute("add", 1)
+        assert transaction.gas_limit == (1_000_000 + 1000 * len(b"add@01")) * 1.5
+        assert len(provider.estimated) == 1
+
+        # same endpoint, same shape of the arguments
+        assert execute("add", 2).gas_limit == transaction.gas_limit
+        assert len(provider.estimated) == 1
+
+        # another shape of the arguments, another endpoint
+        execute("add", 1000)
+        execute("sub", 1)
+        assert len(provider.estimated) == 3
+
+        # calls along with token transfers are distinguished by the called endpoint
+        transfers = [TokenTransfer(Token("TEST-123456"), 10)]
+        execute("add", 1, transfers)
+        execute("sub", 1, transfers)
+        assert len(provider.estimated) == 5
+
+        # an explicit gas limit takes precedence
+        assert (
+            controller.create_transaction_for_execute(self.alice, 42, CONTRACT, 7_000_000, "add").gas_limit == 7_000_000
+        )
+        assert len(provider.estimated) == 5
+
+        with pytest.raises(GasLimitEstimationError, match="function not found"):
+            execute("fail", 1)
+
+    def test_token_management_controller(self):
+        provider = CostEstimator()
+        estimator = GasLimitEstimator(provider, gas_multiplier=1.1)
+        controller = TokenManagementController(
+            chain_id="D", network_provider=MockNetworkProvider(), gas_limit_estimator=estimator
+        )
+
+        transaction = controller.create_transaction_for_setting_burn_role_globally(
+            sender=self.alice,
+            nonce=self.alice.get_nonce_then_increment(),
+            token_identifier="TEST-123456",
+        )
+
+        assert len(provider.estimated) == 1
+        assert transaction.gas_limit == math.ceil((1_000_000 + 1000 * len(transaction.data)) * 1.1)
+
+        # without an estimator, the static gas limit is used
+        controller = TokenManagementController(chain_id="D", network_provider=MockNetworkProvider())
+        transaction = controller.create_transaction_for_setting_burn_role_globally(
+            sender=self.alice,
+            nonce=self.alice.get_nonce_then_increment(),
+            token_identifier="TEST-123456",
+        )
+
+        assert transaction.gas_limit > 60_000_000
+        assert len(provider.estimated) == 1
+
+    def test_missing_gas_limit_without_estimator(self):
+        controller = SmartContractController(chain_id="D", network_provider=MockNetworkProvider())
+
+        with pytest.raises(BadUsageError, match="gas limit must be provided"):
+            controller.create_transaction_for_deploy(sender=self.alice, nonce=42, bytecode=b"0061736d")
+
+        with pytest.raises(BadUsageError, match="gas limit must be provided"):
+            controller.create_transaction_for_execute(self.alice, 42, CONTRACT, None, "add")
+
+    def test_keys_are_short_and_namespaced(self):
+        provider = CostEstimator()
+        cache = InMemoryCacheBackend()
+        estimator = GasLimitEstimator(provider, cache=cache, namespace="https://gateway")
+        assert estimator.cache is cache
+
+        bytecode = b"0061736d" * 50_000
+        deployment = Transaction(
+            sender=self.alice.address, receiver=CONTRACT, gas_limit=0, chain_id="D", data=bytecode + b"@0500@0504"
+        )
+        key = estimator.get_key(deployment)
+        assert len(key) < 200
+        assert key.startswith("gas:https://gateway:D:")
+
+        deployment.data = b"00" + deployment.data
+        assert estimator.get_key(deployment) != key
+
+        # the same transaction, on another network
+        deployment.chain_id = "T"
+        assert not estimator.get_key(deployment).startswith("gas:https://gateway:D:")
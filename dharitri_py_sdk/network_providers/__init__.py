@@ -1,11 +1,63 @@
 from dharitri_py_sdk.network_providers.account_awaiter import AccountAwaiter
+from dharitri_py_sdk.network_providers.account_storage_snapshot import (
+    AccountStorageDiff,
+    AccountStorageRefresher,
+    AccountStorageSnapshot,
+)
 from dharitri_py_sdk.network_providers.api_network_provider import ApiNetworkProvider
+from dharitri_py_sdk.network_providers.bulk_transaction_awaiter import (
+    BulkTransactionAwaiter,
+)
+from dharitri_py_sdk.network_providers.cache_backends import (
+    InMemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+from dharitri_py_sdk.network_providers.caching_network_provider import (
+    CacheStats,
+    CachingNetworkProvider,
+)
+from dharitri_py_sdk.network_providers.chain_data_cache import ChainDataCache
+from dharitri_py_sdk.network_providers.chain_follower import (
+    BlockWithTransactions,
+    ChainFollower,
+)
+from dharitri_py_sdk.network_providers.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
 from dharitri_py_sdk.network_providers.config import (
+    CachingOptions,
+    ChainFollowerOptions,
+    MultiEndpointOptions,
     NetworkProviderConfig,
     RequestsRetryOptions,
+    TransactionSubmitterOptions,
+)
+from dharitri_py_sdk.network_providers.errors import (
+    CircuitOpenError,
+    NetworkProviderError,
+)
+from dharitri_py_sdk.network_providers.exchange_stores import (
+    JsonLinesExchangeStore,
+    RecordedExchange,
+    SQLiteExchangeStore,
+)
+from dharitri_py_sdk.network_providers.lazy_transaction_on_network import (
+    LazyTransactionOnNetwork,
+)
+from dharitri_py_sdk.network_providers.metrics import (
+    NetworkProviderMetrics,
+    RouteSummary,
+)
+from dharitri_py_sdk.network_providers.multi_endpoint_network_provider import (
+    MultiEndpointNetworkProvider,
 )
-from dharitri_py_sdk.network_providers.errors import NetworkProviderError
 from dharitri_py_sdk.network_providers.proxy_network_provider import ProxyNetworkProvider
+from dharitri_py_sdk.network_providers.rate_limiter import RateLimit, RateLimiter
+from dharitri_py_sdk.network_providers.replay_network_provider import (
+    RecordingNetworkProvider,
+    ReplayNetworkProvider,
+)
 from dharitri_py_sdk.network_providers.resources import (
     AccountOnNetwork,
     AccountStorage,
@@ -21,11 +73,22 @@ from dharitri_py_sdk.network_providers.resources import (
     TokensCollectionMetadata,
     TransactionCostResponse,
 )
+from dharitri_py_sdk.network_providers.single_flight import SingleFlight
 from dharitri_py_sdk.network_providers.transaction_awaiter import TransactionAwaiter
+from dharitri_py_sdk.network_providers.transaction_cost_cache import (
+    TransactionCostCache,
+)
 from dharitri_py_sdk.network_providers.transaction_decoder import (
     TransactionDecoder,
     TransactionMetadata,
+    TransfersColumns,
+)
+from dharitri_py_sdk.network_providers.transaction_notifier import (
+    BaseTransactionNotifier,
+    TransactionNotifier,
+    TransactionNotifierOptions,
 )
+from dharitri_py_sdk.network_providers.transaction_submitter import TransactionSubmitter
 
 __all__ = [
     "NetworkProviderError",
@@ -50,4 +113,40 @@ __all__ = [
     "TransactionCostResponse",
     "AccountAwaiter",
     "RequestsRetryOptions",
+    "MultiEndpointNetworkProvider",
+    "MultiEndpointOptions",
+    "RateLimit",
+    "RateLimiter",
+    "SingleFlight",
+    "CachingNetworkProvider",
+    "CachingOptions",
+    "CacheStats",
+    "InMemoryCacheBackend",
+    "SQLiteCacheBackend",
+    "LazyTransactionOnNetwork",
+    "ChainFollower",
+    "ChainFollowerOptions",
+    "BlockWithTransactions",
+    "AccountStorageSnapshot",
+    "AccountStorageDiff",
+    "AccountStorageRefresher",
+    "NetworkProviderMetrics",
+    "RouteSummary",
+    "RecordingNetworkProvider",
+    "ReplayNetworkProvider",
+    "RecordedExchange",
+    "JsonLinesExchangeStore",
+    "SQLiteExchangeStore",
+    "BaseTransactionNotifier",
+    "TransactionNotifier",
+    "TransactionNotifierOptions",
+    "ChainDataCache",
+    "TransfersColumns",
+    "TransactionSubmitter",
+    "TransactionSubmitterOptions",
+    "BulkTransactionAwaiter",
+    "TransactionCostCache",
+    "CircuitBreaker",
+    "CircuitState",
+    "CircuitOpenError",
 ]
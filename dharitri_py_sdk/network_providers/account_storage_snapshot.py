@@ -0,0 +1,511 @@
+import hashlib
+import json
+import os
+import struct
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping, Optional, Protocol, Sequence, Union
+
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.network_providers.resources import (
+    AccountStorage,
+    AccountStorageEntry,
+    BlockCoordinates,
+)
+
+_FILE_MAGIC = b"DRTSTORE"
+_FILE_FORMAT_VERSION = 1
+_HEADER_LENGTH = struct.Struct("<I")
+
+
+# fmt: off
+class INetworkProvider(Protocol):
+    def get_account_storage_entry(self, address: Address, entry_key: str) -> AccountStorageEntry:
+        ...
+# fmt: on
+
+
+@dataclass
+class AccountStorageDiff:
+    """The changes between two snapshots of the storage of an account (keys and values are bytes)."""
+
+    added: dict[bytes, bytes] = field(default_factory=dict)
+    removed: dict[bytes, bytes] = field(default_factory=dict)
+    # maps each changed key to its (old value, new value)
+    changed: dict[bytes, tuple[bytes, bytes]] = field(default_factory=dict)
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+
+class AccountStorageSnapshot:
+    """
+    A compact, read-only copy of the storage of an account.
+    Keys and values are held in contiguous buffers (instead of one object per entry), which makes it suitable for very large storages.
+
+    A snapshot fetched at once (e.g. `get_account_storage_snapshot()`) is consistent with its `block_coordinates`. A snapshot updated
+    entry by entry (e.g. by `with_updates()` or the `AccountStorageRefresher`) isn't: its entries might have been read at different blocks,
+    and `block_coordinates` only tells the newest of them.
+    """
+
+    def __init__(self, block_coordinates: Optional[BlockCoordinates] = None) -> None:
+        """
+        Args:
+            block_coordinates (Optional[BlockCoordinates]): the block at which the storage was read, if known.
+        """
+        self.block_coordinates = block_coordinates
+        self._keys = bytearray()
+        self._values = bytearray()
+        # the end offset of each key (and value), in the buffers above
+        self._key_ends = array("Q")
+        self._value_ends = array("Q")
+        self._index: Optional[dict[int, int]] = None
+        self._colliding_positions: dict[int, list[int]] = {}
+
+    @classmethod
+    def new_from_pairs(cls, pairs: Iterable[tuple[str, str]]) -> "AccountStorageSnapshot":
+        """Creates a snapshot from (hex-encoded key, hex-encoded value) pairs, as returned by the network."""
+        snapshot = cls()
+
+        for key, value in pairs:
+            snapshot._append(bytes.fromhex(key), bytes.fromhex(value))
+
+        return snapshot
+
+    @classmethod
+    def new_from_entries(cls, entries: Iterable[AccountStorageEntry]) -> "AccountStorageSnapshot":
+        """
+        Creates a snapshot from storage entries.
+        The original (hex-encoded) keys are recovered from the raw entries, if available (since the decoded keys might be lossy).
+        """
+        snapshot = cls()
+
+        for entry in entries:
+            snapshot._append(_get_original_key(entry), entry.value)
+
+        return snapshot
+
+    @classmethod
+    def new_from_account_storage(cls, storage: AccountStorage) -> "AccountStorageSnapshot":
+        """Creates a snapshot from the result of `get_account_storage()`, keeping its block coordinates."""
+        pairs = storage.raw.get("pairs")
+
+        if isinstance(pairs, dict):
+            snapshot = cls.new_from_pairs(pairs.items())
+        else:
+            snapshot = cls.new_from_entries(storage.entries)
+
+        snapshot.block_coordinates = storage.block_coordinates
+        return snapshot
+
+    @classmethod
+    def load(cls, path: Path) -> "AccountStorageSnapshot":
+        """Loads a snapshot previously saved with `save()`."""
+        with open(path, "rb") as file:
+            if file.read(len(_FILE_MAGIC)) != _FILE_MAGIC:
+                raise ValueError(f"not an account storage snapshot: {path}")
+
+            (header_length,) = _HEADER_LENGTH.unpack(file.read(_HEADER_LENGTH.size))
+            header: dict[str, Any] = json.loads(file.read(header_length))
+
+            if header.get("version") != _FILE_FORMAT_VERSION:
+                raise ValueError(f"unsupported account storage snapshot version: {header.get('version')}")
+
+            snapshot = cls(block_coordinates=_block_coordinates_from_dictionary(header.get("blockCoordinates")))
+            num_entries = header["numEntries"]
+            snapshot._key_ends = _read_offsets(file.read(8 * num_entries))
+            snapshot._value_ends = _read_offsets(file.read(8 * num_entries))
+            snapshot._keys = bytearray(file.read(header["keysLength"]))
+            snapshot._values = bytearray(file.read(header["valuesLength"]))
+
+        is_truncated = len(snapshot._value_ends) != num_entries or len(snapshot._values) != header["valuesLength"]
+        if is_truncated:
+            raise ValueError(f"truncated account storage snapshot: {path}")
+
+        return snapshot
+
+    def save(self, path: Path) -> None:
+        """
+        Saves the snapshot to a (binary) file. The buffers are written as they are, so that saving and loading are cheap.
+        The file is replaced atomically (it's never left half-written).
+        """
+        header = {
+            "version": _FILE_FORMAT_VERSION,
+            "numEntries": len(self),
+            "keysLength": len(self._keys),
+            "valuesLength": len(self._values),
+            "blockCoordinates": _block_coordinates_to_dictionary(self.block_coordinates),
+        }
+        header_bytes = json.dumps(header).encode()
+
+        temporary_path = path.with_name(path.name + ".tmp")
+
+        with open(temporary_path, "wb") as file:
+            file.write(_FILE_MAGIC)
+            file.write(_HEADER_LENGTH.pack(len(header_bytes)))
+            file.write(header_bytes)
+            file.write(_offsets_to_bytes(self._key_ends))
+            file.write(_offsets_to_bytes(self._value_ends))
+            file.write(self._keys)
+            file.write(self._values)
+
+        os.replace(temporary_path, path)
+
+    def diff(self, newer: "AccountStorageSnapshot") -> AccountStorageDiff:
+        """
+        Computes the changes from this snapshot to a newer one.
+        Keys are matched through the hashed key indexes of the snapshots (values are only compared for keys present in both).
+        """
+        old_index = self._get_index()
+        new_index = newer._get_index()
+        diff = AccountStorageDiff()
+
+        # each key of the old snapshot is visited once (through the index, or among the colliding keys)
+        old_positions = [old_index[key_hash] for key_hash in old_index]
+        old_positions.extend(position for positions in self._colliding_positions.values() for position in positions)
+
+        for position in old_positions:
+            key = self._get_key_at(position)
+            new_position = newer._find(key)
+
+            if new_position is None:
+                diff.removed[key] = self._get_value_at(position)
+                continue
+
+            old_value = self._get_value_at(position)
+            new_value = newer._get_value_at(new_position)
+            if old_value != new_value:
+                diff.changed[key] = (old_value, new_value)
+
+        # keys whose hashes are missing from the old index are surely added; the others have to be looked up
+        for key_hash in new_index.keys() - old_index.keys():
+            position = new_index[key_hash]
+            diff.added[newer._get_key_at(position)] = newer._get_value_at(position)
+
+        candidates = [new_index[key_hash] for key_hash in new_index.keys() & old_index.keys()]
+        candidates.extend(position for positions in newer._colliding_positions.values() for position in positions)
+
+        for position in candidates:
+            key = newer._get_key_at(position)
+            if self._find(key) is None:
+                diff.added[key] = newer._get_value_at(position)
+
+        return diff
+
+    def with_updates(
+        self,
+        updates: Mapping[Union[str, bytes], Optional[bytes]],
+        block_coordinates: Optional[BlockCoordinates] = None,
+    ) -> "AccountStorageSnapshot":
+        """
+        Returns a new snapshot, with the given keys updated (or added). Keys mapped to an empty value (or None) are removed,
+        since the network does not distinguish between a missing key and an empty value.
+        The other entries are kept as they are, so the new snapshot isn't consistent with the given block coordinates (see the class docstring).
+        """
+        snapshot, _ = self.with_updates_and_diff(updates, block_coordinates)
+        return snapshot
+
+    def with_updates_and_diff(
+        self,
+        updates: Mapping[Union[str, bytes], Optional[bytes]],
+        block_coordinates: Optional[BlockCoordinates] = None,
+    ) -> tuple["AccountStorageSnapshot", AccountStorageDiff]:
+        """
+        Same as `with_updates()`, but also returns the changes. Only the updated keys are looked up (and compared),
+        so it's much cheaper than `diff()` when few keys of a large snapshot are updated.
+        """
+        diff = AccountStorageDiff()
+        # maps the positions of the updated entries to their new values (empty, if removed)
+        replacements: dict[int, bytes] = {}
+        additions: dict[bytes, bytes] = {}
+
+        for key, value in updates.items():
+            key = _as_bytes(key)
+            value = value or b""
+            position = self._find(key)
+
+            if position is None:
+                if value:
+                    additions[key] = value
+                    diff.added[key] = value
+                continue
+
+            old_value = self._get_value_at(position)
+            if value == old_value:
+                continue
+
+            replacements[position] = value
+            if value:
+                diff.changed[key] = (old_value, value)
+            else:
+                diff.removed[key] = old_value
+
+        snapshot = self._copy_with_replacements(replacements)
+        snapshot.block_coordinates = block_coordinates or self.block_coordinates
+
+        for key, value in additions.items():
+            snapshot._append(key, value)
+
+        return snapshot, diff
+
+    def __len__(self) -> int:
+        return len(self._key_ends)
+
+    def __iter__(self) -> Iterator[tuple[bytes, bytes]]:
+        """Yields the (key, value) pairs, in their original order."""
+        for position in range(len(self)):
+            yield self._get_key_at(position), self._get_value_at(position)
+
+    def __contains__(self, key: Union[str, bytes]) -> bool:
+        return self._find(_as_bytes(key)) is not None
+
+    def get(self, key: Union[str, bytes]) -> Optional[bytes]:
+        """Returns the value of a key (if a string is provided, it's UTF-8 encoded), or None if the key is missing."""
+        position = self._find(_as_bytes(key))
+        return self._get_value_at(position) if position is not None else None
+
+    def keys(self) -> Iterator[bytes]:
+        for position in range(len(self)):
+            yield self._get_key_at(position)
+
+    def entries(self) -> Iterator[AccountStorageEntry]:
+        """Yields the pairs as storage entries (the keys are decoded as in `get_account_storage`)."""
+        for key, value in self:
+            yield AccountStorageEntry(raw={key.hex(): value.hex()}, key=key.decode(errors="ignore"), value=value)
+
+    def _append(self, key: bytes, value: bytes) -> None:
+        self._keys += key
+        self._values += value
+        self._key_ends.append(len(self._keys))
+        self._value_ends.append(len(self._values))
+
+        # an index already built is kept up to date (instead of hashing all keys again)
+        if self._index is not None:
+            self._add_to_index(self._index, key, len(self) - 1)
+
+    def _copy_with_replacements(self, replacements: Mapping[int, bytes]) -> "AccountStorageSnapshot":
+        """Copies the snapshot, replacing the values at the given positions (the entries replaced by an empty value are removed)."""
+        snapshot = AccountStorageSnapshot(block_coordinates=self.block_coordinates)
+        previous_end = 0
+
+        for position in sorted(replacements):
+            snapshot._extend_from(self, previous_end, position)
+            previous_end = position + 1
+
+            if replacements[position]:
+                snapshot._append(self._get_key_at(position), replacements[position])
+
+        snapshot._extend_from(self, previous_end, len(self))
+
+        # unless entries are removed, the keys keep their positions, so the index remains valid
+        is_any_removed = not all(replacements.values())
+        if self._index is not None and not is_any_removed:
+            snapshot._index = dict(self._index)
+            snapshot._colliding_positions = {
+                key_hash: list(positions) for key_hash, positions in self._colliding_positions.items()
+            }
+
+        return snapshot
+
+    def _extend_from(self, other: "AccountStorageSnapshot", start: int, end: int) -> None:
+        """Appends the entries of another snapshot, from `start` to `end` (exclusive), copying their buffers at once."""
+        if start >= end:
+            return
+
+        keys_start = other._key_ends[start - 1] if start else 0
+        values_start = other._value_ends[start - 1] if start else 0
+        keys_shift = len(self._keys) - keys_start
+        values_shift = len(self._values) - values_start
+
+        self._keys += other._keys[keys_start : other._key_ends[end - 1]]
+        self._values += other._values[values_start : other._value_ends[end - 1]]
+        self._key_ends.extend(key_end + keys_shift for key_end in other._key_ends[start:end])
+        self._value_ends.extend(value_end + values_shift for value_end in other._value_ends[start:end])
+        self._index = None
+
+    def _get_key_at(self, position: int) -> bytes:
+        start = self._key_ends[position - 1] if position else 0
+        return bytes(self._keys[start : self._key_ends[position]])
+
+    def _get_value_at(self, position: int) -> bytes:
+        start = self._value_ends[position - 1] if position else 0
+        return bytes(self._values[start : self._value_ends[position]])
+
+    def _find(self, key: bytes) -> Optional[int]:
+        key_hash = _hash_key(key)
+        position = self._get_index().get(key_hash)
+        if position is None:
+            return None
+
+        for candidate in [position, *self._colliding_positions.get(key_hash, [])]:
+            if self._get_key_at(candidate) == key:
+                return candidate
+
+        return None
+
+    def _get_index(self) -> dict[int, int]:
+        if self._index is None:
+            self._index = self._build_index()
+
+        return self._index
+
+    def _build_index(self) -> dict[int, int]:
+        """Maps the (64 bits) hashes of the keys to their positions. Collisions (very unlikely) are kept aside."""
+        index: dict[int, int] = {}
+        self._colliding_positions = {}
+
+        for position, key in enumerate(self.keys()):
+            self._add_to_index(index, key, position)
+
+        return index
+
+    def _add_to_index(self, index: dict[int, int], key: bytes, position: int) -> None:
+        key_hash = _hash_key(key)
+
+        if key_hash in index:
+            self._colliding_positions.setdefault(key_hash, []).append(position)
+        else:
+            index[key_hash] = position
+
+
+class AccountStorageRefresher:
+    """
+    Keeps a snapshot of (some keys of) the storage of an account up to date, by re-fetching only the keys of interest, in parallel
+    (instead of fetching the whole storage again). The keys are fetched on the executor of the network provider, if it supports
+    `get_account_storage_entries()` (e.g. `ProxyNetworkProvider`), otherwise on a pool of threads owned by the refresher.
+
+    The keys are fetched one by one, so the refreshed snapshot isn't necessarily consistent (see `AccountStorageSnapshot`).
+    """
+
+    def __init__(
+        self,
+        network_provider: INetworkProvider,
+        address: Address,
+        keys: Sequence[str],
+        max_workers: int = 8,
+    ) -> None:
+        """
+        Args:
+            network_provider (INetworkProvider): the provider used to fetch the storage entries.
+            address (Address): the account.
+            keys (Sequence[str]): the keys of interest.
+            max_workers (int): the maximum number of entries fetched at the same time, if the network provider has no executor of its own.
+        """
+        self.network_provider = network_provider
+        self.address = address
+        self.keys = list(keys)
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def refresh(self, snapshot: Optional[AccountStorageSnapshot] = None) -> AccountStorageSnapshot:
+        """
+        Fetches the keys of interest and returns a new snapshot, with the previous snapshot (if any) updated accordingly.
+        If any key cannot be fetched, the first error is raised (the previous snapshot is not partially updated).
+        """
+        new_snapshot, _ = self.refresh_and_diff(snapshot or AccountStorageSnapshot())
+        return new_snapshot
+
+    def refresh_and_diff(self, snapshot: AccountStorageSnapshot) -> tuple[AccountStorageSnapshot, AccountStorageDiff]:
+        """Same as `refresh()`, but also returns the changes of the keys of interest (computed only over these keys)."""
+        entries = self._fetch_entries()
+        updates: dict[Union[str, bytes], Optional[bytes]] = {entry.key: entry.value for entry in entries}
+        block_coordinates = _get_latest_block_coordinates(entries)
+
+        return snapshot.with_updates_and_diff(updates, block_coordinates)
+
+    def close(self) -> None:
+        """Shuts down the pool of threads of the refresher (if any)."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _fetch_entries(self) -> list[AccountStorageEntry]:
+        get_entries = getattr(self.network_provider, "get_account_storage_entries", None)
+        if get_entries is None:
+            return list(self._get_executor().map(self._fetch_entry, self.keys))
+
+        entries: list[AccountStorageEntry] = []
+        for entry in get_entries(self.address, self.keys):
+            if isinstance(entry, Exception):
+                raise entry
+            entries.append(entry)
+
+        return entries
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="storage-refresher")
+        return self._executor
+
+    def _fetch_entry(self, key: str) -> AccountStorageEntry:
+        return self.network_provider.get_account_storage_entry(self.address, key)
+
+
+def _get_latest_block_coordinates(entries: Sequence[AccountStorageEntry]) -> Optional[BlockCoordinates]:
+    coordinates = [entry.block_coordinates for entry in entries if entry.block_coordinates]
+    return max(coordinates, key=lambda item: int(item.nonce), default=None)
+
+
+def _block_coordinates_to_dictionary(block_coordinates: Optional[BlockCoordinates]) -> Optional[dict[str, Any]]:
+    if block_coordinates is None:
+        return None
+
+    return {
+        "nonce": block_coordinates.nonce,
+        "hash": block_coordinates.hash.hex(),
+        "rootHash": block_coordinates.root_hash.hex(),
+    }
+
+
+def _block_coordinates_from_dictionary(raw: Optional[dict[str, Any]]) -> Optional[BlockCoordinates]:
+    if raw is None:
+        return None
+
+    return BlockCoordinates(
+        nonce=raw["nonce"],
+        hash=bytes.fromhex(raw["hash"]),
+        root_hash=bytes.fromhex(raw["rootHash"]),
+    )
+
+
+def _offsets_to_bytes(offsets: "array[int]") -> bytes:
+    # offsets are always saved as little-endian
+    if sys.byteorder == "little":
+        return offsets.tobytes()
+
+    swapped = array("Q", offsets)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def _read_offsets(data: bytes) -> "array[int]":
+    offsets = array("Q")
+    offsets.frombytes(data)
+
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    return offsets
+
+
+def _get_original_key(entry: AccountStorageEntry) -> bytes:
+    value_as_hex = entry.value.hex()
+
+    for raw_key, raw_value in entry.raw.items():
+        if raw_value == value_as_hex:
+            try:
+                return bytes.fromhex(raw_key)
+            except ValueError:
+                pass
+
+    return entry.key.encode()
+
+
+def _hash_key(key: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def _as_bytes(key: Union[str, bytes]) -> bytes:
+    return key.encode() if isinstance(key, str) else key
@@ -0,0 +1,248 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Optional, Union
+
+import pytest
+
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.network_providers.account_storage_snapshot import (
+    AccountStorageRefresher,
+    AccountStorageSnapshot,
+)
+from dharitri_py_sdk.network_providers.errors import NetworkProviderError
+from dharitri_py_sdk.network_providers.http_resources import (
+    account_storage_entry_from_response,
+    account_storage_from_response,
+)
+from dharitri_py_sdk.network_providers.resources import AccountStorageEntry
+from dharitri_py_sdk.network_providers.shared import map_concurrently
+
+CONTRACT = Address(bytes([0] * 8 + [5, 0] + [1] * 22), "drt")
+
+
+def test_snapshot_from_pairs():
+    pairs = [(b"sum".hex(), "2a"), (b"owner".hex(), "00" * 32), ("ff00", ""), (b"user\x00\x01".hex(), "0102")]
+    snapshot = AccountStorageSnapshot.new_from_pairs(pairs)
+
+    assert len(snapshot) == 4
+    assert list(snapshot) == [(bytes.fromhex(key), bytes.fromhex(value)) for key, value in pairs]
+    assert snapshot.get("sum") == b"\x2a"
+    assert snapshot.get(b"\xff\x00") == b""
+    assert snapshot.get(b"user\x00\x01") == b"\x01\x02"
+    assert snapshot.get("missing") is None
+    assert "owner" in snapshot
+    assert b"own" not in snapshot
+
+    entries = list(snapshot.entries())
+    assert entries[0].key == "sum"
+    assert entries[0].value == b"\x2a"
+    assert entries[0].raw == {b"sum".hex(): "2a"}
+
+
+def test_snapshot_from_entries_keeps_original_keys():
+    storage = account_storage_from_response({"pairs": {"ff00": "01", b"sum".hex(): "2a"}})
+    snapshot = AccountStorageSnapshot.new_from_entries(storage.entries)
+
+    # the decoded key of the first entry is lossy ("\xff" is dropped), but the snapshot keeps the original one
+    assert storage.entries[0].key == "\x00"
+    assert list(snapshot.keys()) == [b"\xff\x00", b"sum"]
+
+    entry = account_storage_entry_from_response({"value": "05"}, "sum")
+    snapshot = AccountStorageSnapshot.new_from_entries([entry])
+    assert snapshot.get("sum") == b"\x05"
+
+
+def test_snapshot_from_account_storage():
+    storage = account_storage_from_response(
+        {
+            "pairs": {"ff00": "01", b"sum".hex(): "2a"},
+            "blockInfo": {"nonce": 42, "hash": "aa" * 32, "rootHash": "bb" * 32},
+        }
+    )
+    snapshot = AccountStorageSnapshot.new_from_account_storage(storage)
+
+    assert list(snapshot.keys()) == [b"\xff\x00", b"sum"]
+    assert snapshot.block_coordinates == storage.block_coordinates
+    assert snapshot.block_coordinates is not None
+    assert snapshot.block_coordinates.nonce == 42
+
+
+def test_save_and_load(tmp_path: Path):
+    storage = account_storage_from_response(
+        {
+            "pairs": {(b"key-%d" % index).hex(): (b"value-%d" % index).hex() for index in range(1000)},
+            "blockInfo": {"nonce": 7, "hash": "aa" * 32, "rootHash": "bb" * 32},
+        }
+    )
+    snapshot = AccountStorageSnapshot.new_from_account_storage(storage)
+    path = tmp_path / "snapshot.bin"
+
+    snapshot.save(path)
+    loaded = AccountStorageSnapshot.load(path)
+
+    assert list(loaded) == list(snapshot)
+    assert loaded.block_coordinates == snapshot.block_coordinates
+    assert loaded.get("key-999") == b"value-999"
+    assert not path.with_name("snapshot.bin.tmp").exists()
+
+    empty_path = tmp_path / "empty.bin"
+    AccountStorageSnapshot().save(empty_path)
+    assert len(AccountStorageSnapshot.load(empty_path)) == 0
+
+    path.write_bytes(path.read_bytes()[:-3])
+    with pytest.raises(ValueError, match="truncated"):
+        AccountStorageSnapshot.load(path)
+
+    path.write_bytes(b"something else")
+    with pytest.raises(ValueError, match="not an account storage snapshot"):
+        AccountStorageSnapshot.load(path)
+
+
+def test_diff():
+    old = AccountStorageSnapshot.new_from_pairs(
+        [(b"a".hex(), "01"), (b"b".hex(), "02"), (b"c".hex(), "03"), (b"d".hex(), "04")]
+    )
+    new = AccountStorageSnapshot.new_from_pairs(
+        [(b"b".hex(), "02"), (b"c".hex(), "33"), (b"d".hex(), "04"), (b"e".hex(), "05")]
+    )
+
+    diff = old.diff(new)
+
+    assert diff.added == {b"e": b"\x05"}
+    assert diff.removed == {b"a": b"\x01"}
+    assert diff.changed == {b"c": (b"\x03", b"\x33")}
+    assert not diff.is_empty()
+    assert old.diff(old).is_empty()
+
+    reverse = new.diff(old)
+    assert reverse.added == diff.removed
+    assert reverse.removed == diff.added
+
+
+def test_diff_with_hash_collisions(monkeypatch: pytest.MonkeyPatch):
+    # all keys have the same hash, so that only the colliding positions are used
+    monkeypatch.setattr("dharitri_py_sdk.network_providers.account_storage_snapshot._hash_key", lambda key: 0)
+
+    old = AccountStorageSnapshot.new_from_pairs([(b"a".hex(), "01"), (b"b".hex(), "02")])
+    new = AccountStorageSnapshot.new_from_pairs([(b"b".hex(), "22"), (b"c".hex(), "03")])
+
+    diff = old.diff(new)
+
+    assert diff.added == {b"c": b"\x03"}
+    assert diff.removed == {b"a": b"\x01"}
+    assert diff.changed == {b"b": (b"\x02", b"\x22")}
+
+
+def test_with_updates():
+    snapshot = AccountStorageSnapshot.new_from_pairs([(b"a".hex(), "01"), (b"b".hex(), "02"), (b"c".hex(), "03")])
+
+    updated = snapshot.with_updates({"a": b"\x11", b"b": None, "c": b"", "d": b"\x04", "e": b""})
+
+    assert list(updated) == [(b"a", b"\x11"), (b"d", b"\x04")]
+    assert list(snapshot.keys()) == [b"a", b"b", b"c"]
+
+
+def test_with_updates_and_diff():
+    snapshot = AccountStorageSnapshot.new_from_pairs([(f"{index:04x}", "01") for index in range(1000)])
+    updates: dict[Union[str, bytes], Optional[bytes]] = {
+        b"\x00\x01": b"\x02",
+        b"\x00\x02": b"\x01",
+        b"\x00\x03": None,
+        b"new": b"\x03",
+    }
+
+    updated, diff = snapshot.with_updates_and_diff(updates)
+
+    assert diff == snapshot.diff(updated)
+    assert diff.added == {b"new": b"\x03"}
+    assert diff.removed == {b"\x00\x03": b"\x01"}
+    assert diff.changed == {b"\x00\x01": (b"\x01", b"\x02")}
+    assert len(updated) == 1000
+    assert list(updated)[:4] == [
+        (b"\x00\x00", b"\x01"),
+        (b"\x00\x01", b"\x02"),
+        (b"\x00\x02", b"\x01"),
+        (b"\x00\x04", b"\x01"),
+    ]
+    assert updated.get("new") == b"\x03"
+
+    # without removals, the index is carried over (and extended with the added keys)
+    updated, _ = snapshot.with_updates_and_diff({b"\x00\x01": b"\x02", b"new": b"\x03"})
+    assert updated._index is not None
+    assert [updated.get(b"\x00\x01"), updated.get(b"\x03\xe7"), updated.get(b"new")] == [b"\x02", b"\x01", b"\x03"]
+
+
+class FakeStorageProvider:
+    def __init__(self, storage: dict[str, bytes]) -> None:
+        self.storage = storage
+        self.requested_keys: list[str] = []
+        self.lock = threading.Lock()
+
+    def get_account_storage_entry(self, address: Address, entry_key: str) -> AccountStorageEntry:
+        with self.lock:
+            self.requested_keys.append(entry_key)
+
+        if entry_key == "broken":
+            raise NetworkProviderError("address/key", "timeout")
+
+        raw = {
+            "value": self.storage.get(entry_key, b"").hex(),
+            "blockInfo": {"nonce": len(self.requested_keys), "hash": "aa" * 32, "rootHash": "bb" * 32},
+        }
+        return account_storage_entry_from_response(raw, entry_key)
+
+
+def test_refresher():
+    provider = FakeStorageProvider({"a": b"\x01", "b": b"\x02"})
+    snapshot = AccountStorageSnapshot.new_from_pairs([(b"a".hex(), "01"), (b"b".hex(), "02"), (b"other".hex(), "ff")])
+    refresher = AccountStorageRefresher(provider, CONTRACT, keys=["a", "b", "c"], max_workers=3)  # type: ignore
+
+    provider.storage = {"a": b"\x11", "c": b"\x03"}
+    new_snapshot, diff = refresher.refresh_and_diff(snapshot)
+
+    assert sorted(provider.requested_keys) == ["a", "b", "c"]
+    assert list(new_snapshot) == [(b"a", b"\x11"), (b"other", b"\xff"), (b"c", b"\x03")]
+    assert new_snapshot.block_coordinates is not None
+    assert new_snapshot.block_coordinates.nonce == 3
+    assert diff.added == {b"c": b"\x03"}
+    assert diff.removed == {b"b": b"\x02"}
+    assert diff.changed == {b"a": (b"\x01", b"\x11")}
+
+    refresher.keys.append("broken")
+    with pytest.raises(NetworkProviderError):
+        refresher.refresh(new_snapshot)
+
+    refresher.keys.remove("broken")
+    executor = refresher._executor
+    refresher.refresh(new_snapshot)
+    assert refresher._executor is executor
+
+    refresher.close()
+    assert refresher._executor is None
+
+
+class FakeBulkStorageProvider(FakeStorageProvider):
+    def __init__(self, storage: dict[str, bytes], executor: ThreadPoolExecutor) -> None:
+        super().__init__(storage)
+        self.executor = executor
+
+    def get_account_storage_entries(self, address: Address, entry_keys: list[str]):
+        return map_concurrently(self.executor, partial(self.get_account_storage_entry, address), entry_keys)
+
+
+def test_refresher_uses_executor_of_provider():
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="provider") as executor:
+        provider = FakeBulkStorageProvider({"a": b"\x01"}, executor)
+        refresher = AccountStorageRefresher(provider, CONTRACT, keys=["a", "b"])  # type: ignore
+
+        new_snapshot = refresher.refresh(AccountStorageSnapshot())
+
+        assert list(new_snapshot) == [(b"a", b"\x01")]
+        assert sorted(provider.requested_keys) == ["a", "b"]
+        assert refresher._executor is None
+
+        refresher.keys.append("broken")
+        with pytest.raises(NetworkProviderError):
+            refresher.refresh(new_snapshot)
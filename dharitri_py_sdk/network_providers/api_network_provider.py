@@ -1,9 +1,9 @@
+import copy
+import json
+import logging
 import urllib.parse
-from typing import Any, Callable, Optional, Union, cast
-
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3 import Retry
+from functools import partial
+from typing import Any, Callable, Iterator, Optional, Sequence, Union, cast
 
 from dharitri_py_sdk.core import (
     Address,
@@ -12,13 +12,18 @@ from dharitri_py_sdk.core import (
     Transaction,
     TransactionOnNetwork,
 )
-from dharitri_py_sdk.core.config import LibraryConfig
 from dharitri_py_sdk.core.constants import METACHAIN_ID
 from dharitri_py_sdk.network_providers.account_awaiter import AccountAwaiter
+from dharitri_py_sdk.network_providers.base_http_network_provider import (
+    BaseHttpNetworkProvider,
+)
 from dharitri_py_sdk.network_providers.config import NetworkProviderConfig
 from dharitri_py_sdk.network_providers.constants import (
+    API_MAX_ADDRESSES_PER_REQUEST,
+    API_MAX_RESULTS_WINDOW,
     BASE_USER_AGENT,
     DEFAULT_ACCOUNT_AWAITING_PATIENCE_IN_MILLISECONDS,
+    DEFAULT_PAGE_SIZE,
 )
 from dharitri_py_sdk.network_providers.errors import (
     NetworkProviderError,
@@ -31,6 +36,7 @@ from dharitri_py_sdk.network_providers.http_resources import (
     block_from_response,
     definition_of_fungible_token_from_api_response,
     definition_of_tokens_collection_from_api_response,
+    lazy_transaction_from_api_response,
     smart_contract_query_to_vm_query_request,
     token_amount_from_api_response,
     transaction_cost_estimation_from_response,
@@ -40,7 +46,9 @@ from dharitri_py_sdk.network_providers.http_resources import (
     vm_query_response_to_smart_contract_query_response,
 )
 from dharitri_py_sdk.network_providers.interface import INetworkProvider
-from dharitri_py_sdk.network_providers.proxy_network_provider import ProxyNetworkProvider
+from dharitri_py_sdk.network_providers.proxy_network_provider import (
+    ProxyNetworkProvider,
+)
 from dharitri_py_sdk.network_providers.resources import (
     AccountOnNetwork,
     AccountStorage,
@@ -57,29 +65,37 @@ from dharitri_py_sdk.network_providers.resources import (
 from dharitri_py_sdk.network_providers.shared import (
     convert_boolean_query_params_to_lowercase,
     convert_tx_hash_to_string,
+    map_concurrently,
+    submit_task,
+    wait_or_steal,
 )
 from dharitri_py_sdk.network_providers.transaction_awaiter import TransactionAwaiter
-from dharitri_py_sdk.network_providers.user_agent import extend_user_agent
 from dharitri_py_sdk.smart_contracts.smart_contract_query import (
     SmartContractQuery,
     SmartContractQueryResponse,
 )
 
+logger = logging.getLogger("api_network_provider")
+
 
-class ApiNetworkProvider(INetworkProvider):
+class ApiNetworkProvider(BaseHttpNetworkProvider, INetworkProvider):
     def __init__(
         self,
         url: str,
         address_hrp: Optional[str] = None,
         config: Optional[NetworkProviderConfig] = None,
     ) -> None:
-        self.url = url
-        self.address_hrp = address_hrp or LibraryConfig.default_address_hrp
-        self.backing_proxy = ProxyNetworkProvider(url, self.address_hrp)
-        self.config = config if config is not None else NetworkProviderConfig()
-
-        self.user_agent_prefix = f"{BASE_USER_AGENT}/api"
-        extend_user_agent(self.user_agent_prefix, self.config)
+        config = config if config is not None else NetworkProviderConfig()
+        # the backing proxy shares the whole configuration (timeouts, retries, metrics, circuit breaker, caches etc.),
+        # except for the headers (each provider sets its own user agent)
+        proxy_config = copy.copy(config)
+        proxy_config.requests_options = {
+            **config.requests_options,
+            "headers": dict(config.requests_options.get("headers", {})),
+        }
+
+        super().__init__(url, address_hrp, config, f"{BASE_USER_AGENT}/api")
+        self.backing_proxy = ProxyNetworkProvider(url, self.address_hrp, proxy_config)
 
     def get_network_config(self) -> NetworkConfig:
         """Fetches the general configuration of the network."""
@@ -92,21 +108,84 @@ class ApiNetworkProvider(INetworkProvider):
     def get_block(self, block_hash: Union[str, bytes]) -> BlockOnNetwork:
         """Fetches a block by hash."""
         block_hash = block_hash.hex() if isinstance(block_hash, bytes) else block_hash
+        url = f"blocks/{block_hash}"
 
-        result = self.do_get_generic(f"blocks/{block_hash}")
-        return block_from_response(result)
+        cached = self._get_from_chain_data_cache(url)
+        if cached is not None:
+            return block_from_response(cached)
+
+        result = self.do_get_generic(url)
+        block = block_from_response(result)
+
+        if self.config.chain_data_cache is not None and self._is_block_final(block):
+            self._store_in_chain_data_cache(url, result)
+
+        return block
 
     def get_latest_block(self) -> BlockOnNetwork:
         """Fetches the latest block of a shard."""
         result = self.do_get_generic("/blocks/latest")
         return block_from_response(result)
 
-    def get_account(self, address: Address) -> AccountOnNetwork:
-        """Fetches account information for a given address."""
-        response = self.do_get_generic(f"accounts/{address.to_bech32()}")
+    def get_account(self, address: Address, fields: Optional[Sequence[str]] = None) -> AccountOnNetwork:
+        """
+        Fetches account information for a given address.
+
+        Args:
+            address (Address): the account.
+            fields (Optional[Sequence[str]]): if provided, only these fields (e.g. `balance`, `nonce`) are requested, so that large ones (e.g. the contract `code`) are not downloaded. The other fields of the result hold default values.
+        """
+        url_parameters = _add_fields_projection(None, fields, ["address"])
+        response = self.do_get_generic(f"accounts/{address.to_bech32()}", url_parameters)
         account = account_from_api_response(response)
         return account
 
+    def get_accounts(
+        self, addresses: Sequence[Address], use_bulk_endpoint: bool = True
+    ) -> list[Union[AccountOnNetwork, NetworkProviderError]]:
+        """
+        Fetches multiple accounts. The results are returned in the order of the addresses.
+        If an account cannot be fetched, the error is returned in its place.
+
+        Args:
+            addresses (Sequence[Address]): the accounts to fetch.
+            use_bulk_endpoint (bool): whether to fetch the accounts in chunks, using `accounts?addresses=...`. The bulk endpoint only returns a summary of each account (e.g. balance, nonce),
+                without contract code or guardian data. If not set (or for the accounts missing from the bulk response), the accounts are fetched one by one, in parallel (see `NetworkProviderConfig.max_workers`).
+        """
+        executor = self._get_executor()
+        results: dict[str, Union[AccountOnNetwork, NetworkProviderError]] = {}
+
+        if use_bulk_endpoint:
+            unique_addresses = list(dict.fromkeys(address.to_bech32() for address in addresses))
+            chunks = [
+                unique_addresses[i : i + API_MAX_ADDRESSES_PER_REQUEST]
+                for i in range(0, len(unique_addresses), API_MAX_ADDRESSES_PER_REQUEST)
+            ]
+
+            for chunk_result in map_concurrently(executor, self._get_accounts_chunk, chunks):
+                # if a whole chunk fails, its accounts are fetched one by one, below
+                if isinstance(chunk_result, NetworkProviderError):
+                    continue
+
+                for account in chunk_result:
+                    results[account.address.to_bech32()] = account
+
+        missing_by_bech32 = {
+            address.to_bech32(): address for address in addresses if address.to_bech32() not in results
+        }
+        missing = list(missing_by_bech32.values())
+
+        for address, result in zip(missing, map_concurrently(executor, self.get_account, missing)):
+            results[address.to_bech32()] = result
+
+        return [results[address.to_bech32()] for address in addresses]
+
+    def _get_accounts_chunk(self, addresses: list[str]) -> list[AccountOnNetwork]:
+        response: list[dict[str, Any]] = self.do_get_generic(
+            "accounts", {"addresses": ",".join(addresses), "size": len(addresses)}
+        )
+        return [account_from_api_response(item) for item in response]
+
     def get_account_storage(self, address: Address) -> AccountStorage:
         """
         Fetches the storage (key-value pairs) of an account.
@@ -155,8 +234,7 @@ class ApiNetworkProvider(INetworkProvider):
         response: dict[str, Any] = self.do_post_generic(url, transaction.to_dictionary())
         return transaction_from_simulate_response(transaction, response.get("data", {}).get("result", {}))
 
-    def estimate_transaction_cost(self, transaction: Transaction) -> TransactionCostResponse:
-        """Estimates the cost of a transaction."""
+    def _fetch_transaction_cost(self, transaction: Transaction) -> TransactionCostResponse:
         response: dict[str, Any] = self.do_post_generic("transaction/cost", transaction.to_dictionary())
         return transaction_cost_estimation_from_response(response.get("data", {}))
 
@@ -170,19 +248,53 @@ class ApiNetworkProvider(INetworkProvider):
         response: dict[str, Any] = self.do_post_generic("transaction/send-multiple", transactions_as_dictionaries)
         return transactions_from_send_multiple_response(response.get("data", {}), len(transactions))
 
-    def get_transaction(self, transaction_hash: Union[str, bytes]) -> TransactionOnNetwork:
-        """Fetches a transaction that was previously broadcasted (maybe already processed by the network)."""
+    def get_transaction(
+        self, transaction_hash: Union[str, bytes], fields: Optional[Sequence[str]] = None
+    ) -> TransactionOnNetwork:
+        """
+        Fetches a transaction that was previously broadcasted (maybe already processed by the network).
+
+        Args:
+            transaction_hash (Union[str, bytes]): the hash of the transaction.
+            fields (Optional[Sequence[str]]): if provided, only these fields (e.g. `status`, `function`) are requested, so that large ones (e.g. `logs`, `results`) are not downloaded. The other fields of the result hold default values.
+        """
         transaction_hash = convert_tx_hash_to_string(transaction_hash)
+        url = f"transactions/{transaction_hash}"
+
+        # projections (partial transactions) aren't cached
+        cached = self._get_from_chain_data_cache(url) if fields is None else None
+        if cached is not None:
+            return transaction_from_api_response(transaction_hash, cached)
+
+        url_parameters = _add_fields_projection(None, fields, [])
         try:
-            response = self.do_get_generic(f"transactions/{transaction_hash}")
+            response = self.do_get_generic(url, url_parameters)
         except NetworkProviderError as ge:
             raise TransactionFetchingError(ge.url, ge.data)
-        return transaction_from_api_response(transaction_hash, response)
+
+        transaction = transaction_from_api_response(transaction_hash, response)
+
+        if fields is None and transaction.status.is_completed:
+            self._store_in_chain_data_cache(url, response)
+
+        return transaction
 
     def get_transactions(
-        self, address: Address, url_parameters: Optional[dict[str, Any]] = None
+        self,
+        address: Address,
+        url_parameters: Optional[dict[str, Any]] = None,
+        lazy: bool = False,
+        fields: Optional[Sequence[str]] = None,
     ) -> list[TransactionOnNetwork]:
-        """Fetches the transactions of an account"""
+        """
+        Fetches the transactions of an account.
+        If `lazy` is set, the fields of the transactions are decoded upon first access (see `LazyTransactionOnNetwork`).
+        If `fields` is provided, only these fields are requested (the other fields of the results hold default values).
+        Logs and smart contract results can be requested using `withLogs` and `withScResults` (in `url_parameters`).
+        """
+        create_transaction = lazy_transaction_from_api_response if lazy else transaction_from_api_response
+        url_parameters = _add_fields_projection(url_parameters, fields, ["txHash"])
+
         try:
             response = self.do_get_generic(f"accounts/{address.to_bech32()}/transactions", url_parameters)
         except NetworkProviderError as ge:
@@ -191,10 +303,73 @@ class ApiNetworkProvider(INetworkProvider):
         transactions: list[TransactionOnNetwork] = []
         for tx in response:
             hash = tx.get("txHash")
-            transactions.append(transaction_from_api_response(hash, tx))
+            transactions.append(create_transaction(hash, tx))
 
         return transactions
 
+    def iter_transactions(
+        self,
+        address: Address,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        url_parameters: Optional[dict[str, Any]] = None,
+        lazy: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[TransactionOnNetwork]:
+        """
+        Iterates over all the transactions of an account, page by page (the next page is fetched while the current one is consumed).
+        Since the API limits the results window (`from` + `size`), once the window is exhausted, the iteration continues
+        with a new window, starting at the timestamp of the last transaction seen (`before` or `after`, according to `order`).
+
+        Args:
+            address (Address): the account.
+            page_size (int): the number of transactions fetched per request.
+            url_parameters (Optional[dict[str, Any]]): additional filters (e.g. `status`, `function`, `order`). `from` and `size` are managed by the iterator.
+            lazy (bool): whether to decode the fields of the transactions upon first access (see `LazyTransactionOnNetwork`).
+            fields (Optional[Sequence[str]]): if provided, only these fields are requested (the other fields of the results hold default values).
+        """
+        create_transaction = lazy_transaction_from_api_response if lazy else transaction_from_api_response
+        url = f"accounts/{address.to_bech32()}/transactions"
+        parameters = dict(_add_fields_projection(url_parameters, fields, ["txHash", "timestamp"]) or {})
+        cursor_parameter = "after" if parameters.get("order") == "asc" else "before"
+        seen_at_cursor: set[str] = set()
+
+        while True:
+            num_items_in_window = 0
+            last_timestamp: Optional[int] = None
+            hashes_at_last_timestamp: set[str] = set()
+
+            try:
+                for page in self._iter_pages(url, parameters, page_size, API_MAX_RESULTS_WINDOW):
+                    for item in page:
+                        num_items_in_window += 1
+                        tx_hash = item.get("txHash", "")
+                        timestamp = item.get("timestamp")
+
+                        if timestamp != last_timestamp:
+                            last_timestamp = timestamp
+                            hashes_at_last_timestamp = set()
+                        hashes_at_last_timestamp.add(tx_hash)
+
+                        if tx_hash in seen_at_cursor:
+                            continue
+
+                        yield create_transaction(tx_hash, item)
+            except NetworkProviderError as ge:
+                raise TransactionFetchingError(ge.url, ge.data)
+
+            is_window_exhausted = num_items_in_window >= API_MAX_RESULTS_WINDOW
+            if not is_window_exhausted or last_timestamp is None:
+                return
+
+            # a whole window of transactions sharing the same timestamp: the iteration cannot advance any further
+            if parameters.get(cursor_parameter) == last_timestamp:
+                logger.warning(f"Cannot iterate beyond timestamp {last_timestamp} for {url}")
+                return
+
+            # transactions sharing the timestamp of the cursor might be returned again, in the next window
+            seen_at_cursor = hashes_at_last_timestamp
+            parameters[cursor_parameter] = last_timestamp
+
     def await_transaction_completed(
         self,
         transaction_hash: Union[str, bytes],
@@ -211,6 +386,7 @@ class ApiNetworkProvider(INetworkProvider):
             polling_interval_in_milliseconds=options.polling_interval_in_milliseconds,
             timeout_interval_in_milliseconds=options.timeout_in_milliseconds,
             patience_time_in_milliseconds=options.patience_in_milliseconds,
+            notifier=self.config.transaction_notifier,
         )
 
         return awaiter.await_completed(transaction_hash)
@@ -232,6 +408,7 @@ class ApiNetworkProvider(INetworkProvider):
             polling_interval_in_milliseconds=options.polling_interval_in_milliseconds,
             timeout_interval_in_milliseconds=options.timeout_in_milliseconds,
             patience_time_in_milliseconds=options.patience_in_milliseconds,
+            notifier=self.config.transaction_notifier,
         )
 
         return awaiter.await_on_condition(transaction_hash, condition)
@@ -252,7 +429,7 @@ class ApiNetworkProvider(INetworkProvider):
     def get_fungible_tokens_of_account(self, address: Address) -> list[TokenAmountOnNetwork]:
         """
         Fetches the balances of an account, for all fungible tokens held by the account.
-        Pagination isn't explicitly handled by a basic network provider, but can be achieved by using `do_get_generic`.
+        Only the first page is fetched. In order to fetch all the tokens, use `iter_fungible_tokens_of_account`.
         """
         result: list[dict[str, Any]] = self.do_get_generic(f"accounts/{address.to_bech32()}/tokens")
         return [token_amount_from_api_response(token) for token in result]
@@ -260,24 +437,52 @@ class ApiNetworkProvider(INetworkProvider):
     def get_non_fungible_tokens_of_account(self, address: Address) -> list[TokenAmountOnNetwork]:
         """
         Fetches the balances of an account, for all non-fungible tokens held by the account.
-        Pagination isn't explicitly handled by a basic network provider, but can be achieved by using `do_get_generic`.
+        Only the first page is fetched. In order to fetch all the tokens, use `iter_non_fungible_tokens_of_account`.
         """
         result: list[dict[str, Any]] = self.do_get_generic(f"accounts/{address.to_bech32()}/nfts")
         return [token_amount_from_api_response(token) for token in result]
 
+    def iter_fungible_tokens_of_account(
+        self, address: Address, page_size: int = DEFAULT_PAGE_SIZE, fields: Optional[Sequence[str]] = None
+    ) -> Iterator[TokenAmountOnNetwork]:
+        """Iterates over the balances of an account, for all fungible tokens held by the account, page by page."""
+        url_parameters = _add_fields_projection(None, fields, ["identifier"]) or {}
+        url = f"accounts/{address.to_bech32()}/tokens"
+
+        for page in self._iter_pages(url, url_parameters, page_size, API_MAX_RESULTS_WINDOW):
+            for token in page:
+                yield token_amount_from_api_response(token)
+
+    def iter_non_fungible_tokens_of_account(
+        self, address: Address, page_size: int = DEFAULT_PAGE_SIZE, fields: Optional[Sequence[str]] = None
+    ) -> Iterator[TokenAmountOnNetwork]:
+        """Iterates over the balances of an account, for all non-fungible tokens held by the account, page by page."""
+        url_parameters = _add_fields_projection(None, fields, ["identifier"]) or {}
+        url = f"accounts/{address.to_bech32()}/nfts"
+
+        for page in self._iter_pages(url, url_parameters, page_size, API_MAX_RESULTS_WINDOW):
+            for token in page:
+                yield token_amount_from_api_response(token)
+
     def get_definition_of_fungible_token(self, token_identifier: str) -> FungibleTokenMetadata:
         """Fetches the definition of a fungible token."""
-        result = self.do_get_generic(f"tokens/{token_identifier}")
-        return definition_of_fungible_token_from_api_response(result)
+        return definition_of_fungible_token_from_api_response(self._get_token_definition(f"tokens/{token_identifier}"))
 
     def get_definition_of_tokens_collection(self, collection_name: str) -> TokensCollectionMetadata:
         """Fetches the definition of a tokens collection."""
-        result = self.do_get_generic(f"collections/{collection_name}")
-        return definition_of_tokens_collection_from_api_response(result)
+        return definition_of_tokens_collection_from_api_response(
+            self._get_token_definition(f"collections/{collection_name}")
+        )
 
     def query_contract(self, query: SmartContractQuery) -> SmartContractQueryResponse:
         request = smart_contract_query_to_vm_query_request(query)
-        response = self.do_post_generic("query", request)
+
+        if self.config.coalesce_requests:
+            key = ("query", json.dumps(request, sort_keys=True))
+            response = self._single_flight.do(key, lambda: self.do_post_generic("query", request))
+        else:
+            response = self.do_post_generic("query", request)
+
         return vm_query_response_to_smart_contract_query_response(response, query.function)
 
     def do_get_generic(self, url: str, url_parameters: Optional[dict[str, Any]] = None) -> Any:
@@ -289,6 +494,9 @@ class ApiNetworkProvider(INetworkProvider):
             params = urllib.parse.urlencode(url_parameters)
             url = f"{url}?{params}"
 
+        if self.config.coalesce_requests:
+            return self._single_flight.do(url, lambda: self._do_get(url))
+
         response = self._do_get(url)
         return response
 
@@ -304,45 +512,40 @@ class ApiNetworkProvider(INetworkProvider):
         response = self._do_post(url, data)
         return response
 
-    def _do_get(self, url: str) -> Any:
-        try:
-            retry_strategy = Retry(
-                total=self.config.requests_retry_options.retries,
-                backoff_factor=self.config.requests_retry_options.backoff_factor,
-                status_forcelist=self.config.requests_retry_options.status_forcelist,
-            )
-
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-
-            with requests.Session() as session:
-                session.mount("https://", adapter)
-                session.mount("http://", adapter)
-                response = session.get(url, **self.config.requests_options)
-
-            response.raise_for_status()
-            parsed = response.json()
-            return self._get_data(parsed, url)
-        except requests.HTTPError as err:
-            error_data = self._extract_error_from_response(err.response)
-            raise NetworkProviderError(url, error_data)
-        except requests.ConnectionError as err:
-            raise NetworkProviderError(url, err)
-        except Exception as err:
-            raise NetworkProviderError(url, err)
-
-    def _do_post(self, url: str, payload: Any) -> dict[str, Any]:
+    def _iter_pages(
+        self, url: str, url_parameters: dict[str, Any], page_size: int, max_results: int
+    ) -> Iterator[list[Any]]:
+        """Yields the pages of a paginated resource (using `from` and `size`), prefetching the next page in the background."""
+
+        def fetch_page(start: int) -> list[Any]:
+            size = min(page_size, max_results - start)
+            return self.do_get_generic(url, {**url_parameters, "from": start, "size": size})
+
+        executor = self._get_executor()
+        start = 0
+        next_page = submit_task(executor, partial(fetch_page, start))
+
         try:
-            response = requests.post(url, json=payload, **self.config.requests_options)
-            response.raise_for_status()
-            parsed = response.json()
-            return cast(dict[str, Any], self._get_data(parsed, url))
-        except requests.HTTPError as err:
-            error_data = self._extract_error_from_response(err.response)
-            raise NetworkProviderError(url, error_data)
-        except requests.ConnectionError as err:
-            raise NetworkProviderError(url, err)
-        except Exception as err:
-            raise NetworkProviderError(url, err)
+            while next_page is not None:
+                page = wait_or_steal(next_page, partial(fetch_page, start))
+                start += len(page)
+                is_last_page = len(page) < page_size or start >= max_results
+                next_page = None if is_last_page else submit_task(executor, partial(fetch_page, start))
+
+                yield page
+        finally:
+            # the iteration has been abandoned, so the prefetched page isn't needed anymore
+            if next_page is not None:
+                next_page.cancel()
+
+    def _get_token_definition(self, url: str) -> Any:
+        cached = self._get_from_chain_data_cache(url)
+        if cached is not None:
+            return cached
+
+        result = self.do_get_generic(url)
+        self._store_token_definition_in_chain_data_cache(url, result)
+        return result
 
     def _get_data(self, parsed: Any, url: str) -> Any:
         if isinstance(parsed, list):
@@ -355,8 +558,13 @@ class ApiNetworkProvider(INetworkProvider):
             else:
                 return parsed
 
-    def _extract_error_from_response(self, response: Any):
-        try:
-            return response.json()
-        except Exception:
-            return response.text
+
+def _add_fields_projection(
+    url_parameters: Optional[dict[str, Any]], fields: Optional[Sequence[str]], required_fields: Sequence[str]
+) -> Optional[dict[str, Any]]:
+    """Adds the `fields` parameter (if fields are provided), making sure the fields required for parsing are included."""
+    if not fields:
+        return url_parameters
+
+    all_fields = list(dict.fromkeys([*required_fields, *fields]))
+    return {**(url_parameters or {}), "fields": ",".join(all_fields)}
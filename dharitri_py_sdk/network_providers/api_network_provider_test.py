@@ -1,3 +1,5 @@
+from typing import Any
+
 import pytest
 import requests
 
@@ -12,7 +14,9 @@ from dharitri_py_sdk.core import (
 from dharitri_py_sdk.network_providers.api_network_provider import ApiNetworkProvider
 from dharitri_py_sdk.network_providers.config import NetworkProviderConfig
 from dharitri_py_sdk.network_providers.constants import BASE_USER_AGENT
+from dharitri_py_sdk.network_providers.errors import NetworkProviderError
 from dharitri_py_sdk.network_providers.http_resources import account_from_api_response
+from dharitri_py_sdk.network_providers.metrics import NetworkProviderMetrics
 from dharitri_py_sdk.network_providers.resources import TokenAmountOnNetwork
 from dharitri_py_sdk.network_providers.user_agent import extend_user_agent
 from dharitri_py_sdk.smart_contracts.smart_contract_query import SmartContractQuery
@@ -455,3 +459,185 @@ class TestApi:
         transactions = self.api.get_transactions(address, {"size": 1, "isRelayed": True})
         assert len(transactions) == 1
         assert transactions[0].raw.get("isRelayed")
+
+
+class TestApiPagination:
+    address = Address.new_from_bech32("drt1c7pyyq2yaq5k7atn9z6qn5qkxwlc6zwc4vg7uuxn9ssy7evfh5jq4nm79l")
+
+    def create_transactions(self, count: int) -> list[dict[str, Any]]:
+        # newest first, two transactions per timestamp
+        return [
+            {
+                "txHash": f"{index:064x}",
+                "timestamp": 1000000 - index // 2,
+                "sender": self.address.to_bech32(),
+                "receiver": self.address.to_bech32(),
+                "nonce": index,
+                "status": "success",
+            }
+            for index in range(count)
+        ]
+
+    def test_iter_transactions(self, mocker: Any):
+        transactions = self.create_transactions(23)
+        requested_parameters: list[dict[str, Any]] = []
+
+        def do_get_generic(url: str, url_parameters: dict[str, Any]) -> list[dict[str, Any]]:
+            requested_parameters.append(url_parameters)
+            before = url_parameters.get("before", float("inf"))
+            matching = [tx for tx in transactions if tx["timestamp"] <= before]
+            start = url_parameters["from"]
+            return matching[start : start + url_parameters["size"]]
+
+        api = ApiNetworkProvider("https://api")
+        mocker.patch.object(api, "do_get_generic", side_effect=do_get_generic)
+        mocker.patch("dharitri_py_sdk.network_providers.api_network_provider.API_MAX_RESULTS_WINDOW", 10)
+
+        result = list(api.iter_transactions(self.address, page_size=4, url_parameters={"status": "success"}))
+
+        assert [tx.hash.hex() for tx in result] == [tx["txHash"] for tx in transactions]
+        assert all(isinstance(tx, TransactionOnNetwork) for tx in result)
+        assert all(parameters["status"] == "success" for parameters in requested_parameters)
+        assert all(parameters["from"] + parameters["size"] <= 10 for parameters in requested_parameters)
+        assert requested_parameters[3] == {"status": "success", "from": 0, "size": 4, "before": 999996}
+
+    def test_iter_tokens_of_account(self, mocker: Any):
+        tokens = [{"identifier": f"TEST{index}-abcdef", "balance": str(index)} for index in range(7)]
+
+        def do_get_generic(url: str, url_parameters: dict[str, Any]) -> list[dict[str, Any]]:
+            assert url.endswith("/tokens")
+            start = url_parameters["from"]
+            return tokens[start : start + url_parameters["size"]]
+
+        api = ApiNetworkProvider("https://api")
+        get = mocker.patch.object(api, "do_get_generic", side_effect=do_get_generic)
+
+        result = list(api.iter_fungible_tokens_of_account(self.address, page_size=3))
+
+        assert get.call_count == 3
+        assert [token.token.identifier for token in result] == [token["identifier"] for token in tokens]
+        assert [token.amount for token in result] == list(range(7))
+
+
+class TestApiBulk:
+    def test_get_accounts(self, mocker: Any):
+        addresses = [Address(bytes([index] * 32), "drt") for index in range(120)]
+        missing = addresses[7]
+        failing = addresses[9]
+
+        def do_get_generic(url: str, url_parameters: Any = None) -> Any:
+            if url == "accounts":
+                requested = url_parameters["addresses"].split(",")
+                assert len(requested) <= 50
+                return [
+                    {"address": address, "nonce": 1, "balance": "10"}
+                    for address in requested
+                    if address not in [missing.to_bech32(), failing.to_bech32()]
+                ]
+
+            if url == f"accounts/{failing.to_bech32()}":
+                raise NetworkProviderError(url, "not available")
+
+            return {"address": url.split("/")[-1], "nonce": 0, "balance": "0", "isGuarded": True}
+
+        api = ApiNetworkProvider("https://api")
+        get = mocker.patch.object(api, "do_get_generic", side_effect=do_get_generic)
+
+        results = api.get_accounts([*addresses, addresses[0]])
+
+        assert get.call_count == 3 + 2
+        assert len(results) == 121
+        assert isinstance(results[9], NetworkProviderError)
+
+        accounts = [result for result in results if not isinstance(result, NetworkProviderError)]
+        assert [account.address for account in accounts] == [
+            address for address in [*addresses, addresses[0]] if address != failing
+        ]
+        assert accounts[7].is_guarded
+        assert accounts[0].balance == 10
+
+    def test_get_accounts_without_bulk_endpoint(self, mocker: Any):
+        addresses = [Address(bytes([index] * 32), "drt") for index in range(5)]
+
+        api = ApiNetworkProvider("https://api")
+        get = mocker.patch.object(
+            api,
+            "do_get_generic",
+            side_effect=lambda url, url_parameters=None: {"address": url.split("/")[-1], "balance": "1"},
+        )
+
+        results = api.get_accounts(addresses, use_bulk_endpoint=False)
+
+        assert get.call_count == 5
+        assert [account.address for account in results] == addresses  # type: ignore
+
+
+class TestApiProjection:
+    address = Address.new_from_bech32("drt1c7pyyq2yaq5k7atn9z6qn5qkxwlc6zwc4vg7uuxn9ssy7evfh5jq4nm79l")
+
+    def test_get_account_with_fields(self, mocker: Any):
+        api = ApiNetworkProvider("https://api")
+        get = mocker.patch.object(
+            api, "do_get_generic", return_value={"address": self.address.to_bech32(), "balance": "42", "nonce": 3}
+        )
+
+        account = api.get_account(self.address, fields=["balance", "nonce"])
+
+        get.assert_called_once_with(f"accounts/{self.address.to_bech32()}", {"fields": "address,balance,nonce"})
+        assert account.address == self.address
+        assert account.balance == 42
+        assert account.nonce == 3
+        assert account.contract_code == b""
+
+    def test_get_transactions_with_fields(self, mocker: Any):
+        api = ApiNetworkProvider("https://api")
+        get = mocker.patch.object(
+            api,
+            "do_get_generic",
+            return_value=[{"txHash": "aa" * 32, "status": "success", "function": "claim"}],
+        )
+
+        transactions = api.get_transactions(self.address, {"withLogs": True}, fields=["status", "function"])
+
+        get.assert_called_once_with(
+            f"accounts/{self.address.to_bech32()}/transactions",
+            {"withLogs": True, "fields": "txHash,status,function"},
+        )
+        assert transactions[0].hash.hex() == "aa" * 32
+        assert transactions[0].status.is_successful
+        assert transactions[0].function == "claim"
+        assert transactions[0].sender == Address.empty()
+        assert transactions[0].logs.events == []
+
+    def test_get_transaction_with_fields(self, mocker: Any):
+        api = ApiNetworkProvider("https://api")
+        get = mocker.patch.object(api, "do_get_generic", return_value={"status": "pending"})
+
+        transaction = api.get_transaction("bb" * 32, fields=["status"])
+
+        get.assert_called_once_with(f"transactions/{'bb' * 32}", {"fields": "status"})
+        assert transaction.status.status == "pending"
+        assert transaction.smart_contract_results == []
+
+
+class TestApiBackingProxy:
+    def test_backing_proxy_shares_the_config(self, mocker: Any):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"data": {"status": {"drt_nonce": 42}}, "code": "successful"}'
+        get = mocker.patch("requests.Session.get", return_value=response)
+
+        metrics = NetworkProviderMetrics()
+        config = NetworkProviderConfig(requests_options={"timeout": 3}, metrics=metrics)
+        api = ApiNetworkProvider("https://api", config=config)
+
+        assert api.get_network_status().block_nonce == 42
+        assert get.call_args.kwargs["timeout"] == 3
+        assert [summary.route for summary in metrics.get_summaries()] == ["/network/status/{number}"]
+
+    def test_backing_proxy_has_its_own_user_agent(self):
+        config = NetworkProviderConfig(client_name="test", requests_options={"headers": {"User-Agent": "app"}})
+        api = ApiNetworkProvider("https://api", config=config)
+
+        assert api.config.requests_options["headers"]["User-Agent"] == "app dharitri-py-sdk/api/test"
+        assert api.backing_proxy.config.requests_options["headers"]["User-Agent"] == "app dharitri-py-sdk/proxy/test"
@@ -0,0 +1,366 @@
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterator, Optional, Sequence, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import Retry
+
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.core.config import LibraryConfig
+from dharitri_py_sdk.core.transaction import Transaction
+from dharitri_py_sdk.core.transaction_on_network import TransactionOnNetwork
+from dharitri_py_sdk.network_providers.account_storage_snapshot import (
+    AccountStorageSnapshot,
+)
+from dharitri_py_sdk.network_providers.bulk_transaction_awaiter import (
+    BulkTransactionAwaiter,
+    has_data,
+)
+from dharitri_py_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_py_sdk.network_providers.constants import STREAMING_CHUNK_SIZE
+from dharitri_py_sdk.network_providers.errors import (
+    CircuitOpenError,
+    NetworkProviderError,
+)
+from dharitri_py_sdk.network_providers.http_resources import (
+    account_storage_entry_from_pair,
+    account_storage_pairs_from_stream,
+    block_coordinates_from_response,
+)
+from dharitri_py_sdk.network_providers.resources import (
+    AccountOnNetwork,
+    AccountStorageEntry,
+    AwaitingOptions,
+    BlockOnNetwork,
+    NetworkStatus,
+    TransactionCostResponse,
+)
+from dharitri_py_sdk.network_providers.shared import (
+    estimate_costs_concurrently,
+    map_concurrently,
+    run_hedged,
+)
+from dharitri_py_sdk.network_providers.single_flight import SingleFlight
+from dharitri_py_sdk.network_providers.user_agent import extend_user_agent
+
+
+class BaseHttpNetworkProvider(ABC):
+    """
+    The plumbing shared by `ProxyNetworkProvider` and `ApiNetworkProvider`: the HTTP session, the executors, the request pipeline
+    (metrics, circuit breaker, rate limiter, hedging), the chain data cache, and the operations that both providers implement alike.
+    Subclasses implement the abstract methods (the endpoints, and the format of the responses, differ between the proxy and the API).
+    """
+
+    def __init__(
+        self,
+        url: str,
+        address_hrp: Optional[str],
+        config: Optional[NetworkProviderConfig],
+        user_agent_prefix: str,
+    ) -> None:
+        self.url = url
+        self.address_hrp = address_hrp or LibraryConfig.default_address_hrp
+        self.config = config if config is not None else NetworkProviderConfig()
+
+        self.user_agent_prefix = user_agent_prefix
+        extend_user_agent(self.user_agent_prefix, self.config)
+        self._single_flight = SingleFlight()
+        self._session: Optional[requests.Session] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._hedging_executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._highest_final_block_nonces: dict[int, int] = {}
+
+    @property
+    def executor(self) -> Executor:
+        """The executor of the provider, shared by all its parallel work (e.g. `simulate_transactions()`), and reusable by the callers."""
+        return self._get_executor()
+
+    @abstractmethod
+    def get_network_status(self, shard: int) -> NetworkStatus: ...
+
+    @abstractmethod
+    def get_account(self, address: Address) -> AccountOnNetwork: ...
+
+    @abstractmethod
+    def get_account_storage_entry(self, address: Address, entry_key: str) -> AccountStorageEntry: ...
+
+    @abstractmethod
+    def get_transaction(self, transaction_hash: Union[bytes, str]) -> TransactionOnNetwork: ...
+
+    @abstractmethod
+    def simulate_transaction(self, transaction: Transaction, check_signature: bool = False) -> TransactionOnNetwork: ...
+
+    def iter_account_storage(
+        self, address: Address, key_prefix: Optional[Union[str, bytes]] = None
+    ) -> Iterator[AccountStorageEntry]:
+        """
+        Iterates over the storage entries of an account. The response is parsed incrementally, so that the whole storage is never held in memory.
+        Optionally, only the entries whose keys start with `key_prefix` are yielded.
+        """
+        for key, value in self._iter_account_storage_pairs(address, key_prefix):
+            yield account_storage_entry_from_pair(key, value)
+
+    def get_account_storage_snapshot(
+        self, address: Address, key_prefix: Optional[Union[str, bytes]] = None
+    ) -> AccountStorageSnapshot:
+        """
+        Fetches the storage of an account (optionally, only the entries whose keys start with `key_prefix`) into a compact snapshot.
+        Recommended for very large storages.
+        """
+        other_fields: dict[str, Any] = {}
+        pairs = self._iter_account_storage_pairs(address, key_prefix, other_fields)
+        snapshot = AccountStorageSnapshot.new_from_pairs(pairs)
+        snapshot.block_coordinates = block_coordinates_from_response(other_fields)
+        return snapshot
+
+    def get_account_storage_entries(
+        self, address: Address, entry_keys: Sequence[str]
+    ) -> list[Union[AccountStorageEntry, NetworkProviderError]]:
+        """
+        Fetches specific storage entries of an account, in parallel (on the executor of the provider).
+        The entries are returned in the order of the keys. If fetching an entry fails, the error is returned in its place.
+        """
+        return map_concurrently(self._get_executor(), partial(self.get_account_storage_entry, address), entry_keys)
+
+    def simulate_transactions(
+        self, transactions: Sequence[Transaction], check_signature: bool = False
+    ) -> list[Union[TransactionOnNetwork, NetworkProviderError]]:
+        """
+        Simulates multiple transactions, in parallel (see `NetworkProviderConfig.max_workers`).
+        The results are returned in the order of the transactions. If a simulation fails, the error is returned in its place.
+        """
+        simulate = partial(self.simulate_transaction, check_signature=check_signature)
+        return map_concurrently(self._get_executor(), simulate, transactions)
+
+    def estimate_transaction_cost(self, transaction: Transaction) -> TransactionCostResponse:
+        """Estimates the cost of a transaction (see `NetworkProviderConfig.transaction_cost_cache`)."""
+        cache = self.config.transaction_cost_cache
+        cached = cache.get(transaction) if cache is not None else None
+
+        if cached is not None:
+            return cached
+
+        cost = self._fetch_transaction_cost(transaction)
+
+        if cache is not None:
+            cache.set(transaction, cost)
+
+        return cost
+
+    def estimate_transactions_cost(
+        self, transactions: Sequence[Transaction]
+    ) -> list[Union[TransactionCostResponse, NetworkProviderError]]:
+        """
+        Estimates the costs of multiple transactions, in parallel (see `NetworkProviderConfig.max_workers`).
+        The results are returned in the order of the transactions. If an estimation fails, the error is returned in its place.
+        If `NetworkProviderConfig.transaction_cost_cache` is set, similar transactions are estimated only once.
+        """
+        return estimate_costs_concurrently(
+            self._get_executor(), self.estimate_transaction_cost, transactions, self.config.transaction_cost_cache
+        )
+
+    def await_transactions_processed(
+        self,
+        transactions: Sequence[Transaction],
+        options: Optional[AwaitingOptions] = None,
+        needs_outcome: Callable[[Transaction], bool] = has_data,
+    ) -> list[Optional[TransactionOnNetwork]]:
+        """
+        Waits until many transactions are processed, by watching the nonces of their senders (see `BulkTransactionAwaiter`),
+        then fetches (awaiting their completion) only the transactions whose outcome is needed. The others are returned as `None`.
+        """
+        if options is None:
+            options = AwaitingOptions()
+
+        awaiter = BulkTransactionAwaiter(
+            fetcher=self,
+            polling_interval_in_milliseconds=options.polling_interval_in_milliseconds,
+            timeout_interval_in_milliseconds=options.timeout_in_milliseconds,
+            patience_time_in_milliseconds=options.patience_in_milliseconds,
+            needs_outcome=needs_outcome,
+        )
+
+        return awaiter.await_processed(transactions)
+
+    @abstractmethod
+    def _fetch_transaction_cost(self, transaction: Transaction) -> TransactionCostResponse: ...
+
+    def _iter_account_storage_pairs(
+        self,
+        address: Address,
+        key_prefix: Optional[Union[str, bytes]],
+        other_fields: Optional[dict[str, Any]] = None,
+    ) -> Iterator[tuple[str, str]]:
+        url = f"{self.url}/address/{address.to_bech32()}/keys"
+
+        with self._do_get_stream(url) as response:
+            try:
+                chunks = response.iter_content(chunk_size=STREAMING_CHUNK_SIZE)
+                yield from account_storage_pairs_from_stream(chunks, key_prefix, other_fields)
+            except ValueError as err:
+                raise NetworkProviderError(url, str(err))
+            except requests.RequestException as err:
+                raise NetworkProviderError(url, err)
+
+    def _get_session(self) -> requests.Session:
+        """Returns the HTTP session of the provider (created on first use), so that connections are reused."""
+        with self._lock:
+            if self._session is None:
+                retry_strategy = Retry(
+                    total=self.config.requests_retry_options.retries,
+                    backoff_factor=self.config.requests_retry_options.backoff_factor,
+                    status_forcelist=self.config.requests_retry_options.status_forcelist,
+                )
+
+                adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=self.config.max_connections)
+                self._session = requests.Session()
+                self._session.mount("https://", adapter)
+                self._session.mount("http://", adapter)
+
+            return self._session
+
+    def _get_executor(self) -> Executor:
+        """Returns the executor of the provider (the configured one, or a pool created on first use), shared by all parallel work."""
+        if self.config.executor is not None:
+            return self.config.executor
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_workers, thread_name_prefix=self.user_agent_prefix
+                )
+
+            return self._executor
+
+    def _get_hedging_executor(self) -> ThreadPoolExecutor:
+        """
+        Returns the executor of the hedged requests (created on first use), which runs both the original requests and their hedges.
+        It's separate from the executor of the bulk operations, so that hedged requests don't wait behind the tasks of a bulk operation.
+        It's sized like the pool of HTTP connections (more concurrent requests would not get a connection of their own, anyway).
+        """
+        with self._lock:
+            if self._hedging_executor is None:
+                self._hedging_executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_connections, thread_name_prefix=f"{self.user_agent_prefix}/hedging"
+                )
+
+            return self._hedging_executor
+
+    def _get_from_chain_data_cache(self, url: str) -> Optional[Any]:
+        cache = self.config.chain_data_cache
+        return cache.get(f"{self.url}/{url}") if cache is not None else None
+
+    def _store_in_chain_data_cache(self, url: str, data: Any) -> None:
+        cache = self.config.chain_data_cache
+        if cache is not None:
+            cache.set(f"{self.url}/{url}", data)
+
+    def _store_token_definition_in_chain_data_cache(self, url: str, data: Any) -> None:
+        cache = self.config.chain_data_cache
+        if cache is not None:
+            cache.set(f"{self.url}/{url}", data, cache.token_definitions_ttl_in_seconds)
+
+    def _is_block_final(self, block: BlockOnNetwork) -> bool:
+        # the network status is only fetched when the block is newer than the last known final block (of its shard)
+        if block.nonce <= self._highest_final_block_nonces.get(block.shard, -1):
+            return True
+
+        highest_final_block_nonce = self.get_network_status(block.shard).highest_final_block_nonce
+        self._highest_final_block_nonces[block.shard] = highest_final_block_nonce
+        return block.nonce <= highest_final_block_nonce
+
+    def _do_get(self, url: str) -> Any:
+        try:
+            session = self._get_session()
+            response = self._send_request(url, lambda: session.get(url, **self.config.requests_options))
+
+            response.raise_for_status()
+            parsed = self._parse_json(url, response)
+            return self._get_data(parsed, url)
+        except requests.HTTPError as err:
+            error_data = self._extract_error_from_response(err.response)
+            raise NetworkProviderError(url, error_data)
+        except requests.ConnectionError as err:
+            raise NetworkProviderError(url, err)
+        except CircuitOpenError:
+            raise
+        except Exception as err:
+            raise NetworkProviderError(url, err)
+
+    def _do_get_stream(self, url: str) -> requests.Response:
+        """Does a GET request, without reading the body of the response (it should be read incrementally, then closed)."""
+        try:
+            session = self._get_session()
+            response = self._send_request(
+                url, lambda: session.get(url, stream=True, **self.config.requests_options), is_stream=True
+            )
+            response.raise_for_status()
+            return response
+        except requests.HTTPError as err:
+            error_data = self._extract_error_from_response(err.response)
+            raise NetworkProviderError(url, error_data)
+        except CircuitOpenError:
+            raise
+        except Exception as err:
+            raise NetworkProviderError(url, err)
+
+    def _do_post(self, url: str, payload: Any) -> Any:
+        try:
+            session = self._get_session()
+            response = self._send_request(
+                url, lambda: session.post(url, json=payload, **self.config.requests_options), method="POST"
+            )
+            response.raise_for_status()
+            parsed = self._parse_json(url, response, method="POST")
+            return self._get_data(parsed, url)
+        except requests.HTTPError as err:
+            error_data = self._extract_error_from_response(err.response)
+            raise NetworkProviderError(url, error_data)
+        except requests.ConnectionError as err:
+            raise NetworkProviderError(url, err)
+        except CircuitOpenError:
+            raise
+        except Exception as err:
+            raise NetworkProviderError(url, err)
+
+    def _send_request(
+        self,
+        url: str,
+        do_request: Callable[[], requests.Response],
+        method: str = "GET",
+        is_stream: bool = False,
+    ) -> requests.Response:
+        if self.config.metrics is not None:
+            do_request = partial(self.config.metrics.send_request, method, url, do_request, is_stream)
+
+        if self.config.circuit_breaker is not None:
+            do_request = partial(self.config.circuit_breaker.run, url, do_request)
+
+        if self.config.rate_limiter is not None:
+            do_request = partial(self.config.rate_limiter.run, url, do_request)
+
+        hedging_delay = self.config.hedging_delay_in_milliseconds
+        if method == "GET" and not is_stream and hedging_delay is not None:
+            return run_hedged(self._get_hedging_executor(), do_request, hedging_delay / 1000)
+
+        return do_request()
+
+    def _parse_json(self, url: str, response: requests.Response, method: str = "GET") -> Any:
+        if self.config.metrics is None:
+            return response.json()
+        return self.config.metrics.parse_json(method, url, response)
+
+    @abstractmethod
+    def _get_data(self, parsed: Any, url: str) -> Any:
+        """Unwraps the data from the (parsed) response, raising if the response holds an error."""
+        ...
+
+    def _extract_error_from_response(self, response: Any):
+        try:
+            return response.json()
+        except Exception:
+            return response.text
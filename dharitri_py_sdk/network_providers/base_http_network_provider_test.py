@@ -0,0 +1,16 @@
+import pytest
+
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.network_providers.base_http_network_provider import (
+    BaseHttpNetworkProvider,
+)
+from dharitri_py_sdk.network_providers.resources import AccountOnNetwork
+
+
+def test_incomplete_provider_cannot_be_instantiated():
+    class IncompleteProvider(BaseHttpNetworkProvider):
+        def get_account(self, address: Address) -> AccountOnNetwork:
+            return AccountOnNetwork(raw={}, address=address, nonce=0, balance=0, is_guarded=False)
+
+    with pytest.raises(TypeError, match="abstract"):
+        IncompleteProvider("https://gateway", None, None, "test")  # type: ignore
@@ -0,0 +1,162 @@
+import logging
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Optional, Protocol, Sequence, Union
+
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.core.transaction import Transaction
+from dharitri_py_sdk.core.transaction_computer import TransactionComputer
+from dharitri_py_sdk.core.transaction_on_network import TransactionOnNetwork
+from dharitri_py_sdk.network_providers.account_awaiter import AccountAwaiter
+from dharitri_py_sdk.network_providers.constants import (
+    DEFAULT_TRANSACTION_AWAITING_PATIENCE_IN_MILLISECONDS,
+    DEFAULT_TRANSACTION_AWAITING_POLLING_TIMEOUT_IN_MILLISECONDS,
+    DEFAULT_TRANSACTION_AWAITING_TIMEOUT_IN_MILLISECONDS,
+    ONE_SECOND_IN_MILLISECONDS,
+)
+from dharitri_py_sdk.network_providers.resources import AccountOnNetwork
+from dharitri_py_sdk.network_providers.transaction_awaiter import TransactionAwaiter
+
+logger = logging.getLogger("bulk_transaction_awaiter")
+
+
+# fmt: off
+class IAccountAndTransactionFetcher(Protocol):
+    def get_account(self, address: Address) -> AccountOnNetwork:
+        ...
+
+    def get_transaction(self, transaction_hash: Union[bytes, str]) -> TransactionOnNetwork:
+        ...
+# fmt: on
+
+
+def has_data(transaction: Transaction) -> bool:
+    return len(transaction.data) > 0
+
+
+class BulkTransactionAwaiter:
+    """
+    Awaits the processing of many transactions (e.g. thousands of sequential transactions of a few senders) by watching the nonces of their senders,
+    instead of polling each transaction: once the nonce of a sender (on the network) exceeds the nonce of a transaction, the transaction has been processed.
+    Then, only the transactions whose outcome is needed (e.g. contract calls) are fetched, concurrently, awaiting their completion.
+    The fetches run on the executor of the fetcher, if it has one (e.g. `ProxyNetworkProvider`), otherwise on a pool owned by the awaiter.
+
+    Beware: the nonce of the sender is incremented even if the transaction fails. Also, for cross-shard transactions, it only tells that the transaction
+    has been processed in the shard of the sender. Transactions that aren't fetched should be checked by other means, if needed.
+    """
+
+    def __init__(
+        self,
+        fetcher: IAccountAndTransactionFetcher,
+        polling_interval_in_milliseconds: Optional[int] = None,
+        timeout_interval_in_milliseconds: Optional[int] = None,
+        patience_time_in_milliseconds: Optional[int] = None,
+        needs_outcome: Callable[[Transaction], bool] = has_data,
+        max_concurrency: int = 8,
+    ) -> None:
+        """
+        Args:
+            fetcher (IAccountAndTransactionFetcher): Used to fetch the accounts of the senders, and the transactions whose outcome is needed.
+            polling_interval_in_milliseconds (Optional[int]): The polling interval, in milliseconds.
+            timeout_interval_in_milliseconds (Optional[int]): The timeout (for each sender, and for each fetched transaction), in milliseconds.
+            patience_time_in_milliseconds (Optional[int]): The patience, an extra time (in milliseconds) to wait once, after the senders are awaited and before the transactions are fetched.
+            needs_outcome (Callable[[Transaction], bool]): tells whether a transaction should be fetched (by default, the ones having data, such as contract calls and token transfers).
+            max_concurrency (int): the maximum number of transactions fetched at the same time, if the fetcher has no executor of its own
+                (otherwise, see `NetworkProviderConfig.max_workers`).
+        """
+        self.fetcher = fetcher
+        self.needs_outcome = needs_outcome
+        self.max_concurrency = max_concurrency
+        self._executor: Optional[Executor] = getattr(fetcher, "executor", None)
+        self._lock = Lock()
+
+        if polling_interval_in_milliseconds is None:
+            self.polling_interval_in_milliseconds = DEFAULT_TRANSACTION_AWAITING_POLLING_TIMEOUT_IN_MILLISECONDS
+        else:
+            self.polling_interval_in_milliseconds = polling_interval_in_milliseconds
+
+        if timeout_interval_in_milliseconds is None:
+            self.timeout_interval_in_milliseconds = DEFAULT_TRANSACTION_AWAITING_TIMEOUT_IN_MILLISECONDS
+        else:
+            self.timeout_interval_in_milliseconds = timeout_interval_in_milliseconds
+
+        if patience_time_in_milliseconds is None:
+            self.patience_time_in_milliseconds = DEFAULT_TRANSACTION_AWAITING_PATIENCE_IN_MILLISECONDS
+        else:
+            self.patience_time_in_milliseconds = patience_time_in_milliseconds
+
+    def await_processed(self, transactions: Sequence[Transaction]) -> list[Optional[TransactionOnNetwork]]:
+        """
+        Waits until all the transactions are processed. For each transaction (in the order of the input),
+        returns the completed transaction (if its outcome is needed), or `None`.
+        """
+        self.await_senders(transactions)
+
+        computer = TransactionComputer()
+        indices = [index for index, transaction in enumerate(transactions) if self.needs_outcome(transaction)]
+        hashes = [computer.compute_transaction_hash(transactions[index]) for index in indices]
+        results: list[Optional[TransactionOnNetwork]] = [None] * len(transactions)
+
+        if not hashes:
+            return results
+
+        # the patience is paid once for all transactions, instead of once per fetched transaction
+        if self.patience_time_in_milliseconds:
+            time.sleep(self.patience_time_in_milliseconds / ONE_SECOND_IN_MILLISECONDS)
+
+        for index, transaction_on_network in zip(indices, self._get_executor().map(self._fetch_completed, hashes)):
+            results[index] = transaction_on_network
+
+        return results
+
+    def await_senders(self, transactions: Sequence[Transaction]) -> list[AccountOnNetwork]:
+        """Waits until the nonce of each sender exceeds the nonces of its transactions. Returns the accounts of the senders."""
+        highest_nonces: dict[str, int] = {}
+        senders: dict[str, Address] = {}
+
+        for transaction in transactions:
+            key = transaction.sender.to_bech32()
+            senders[key] = transaction.sender
+            highest_nonces[key] = max(highest_nonces.get(key, 0), transaction.nonce)
+
+        account_awaiter = AccountAwaiter(
+            fetcher=self.fetcher,
+            polling_interval_in_milliseconds=self.polling_interval_in_milliseconds,
+            timeout_interval_in_milliseconds=self.timeout_interval_in_milliseconds,
+            patience_time_in_milliseconds=0,
+        )
+
+        accounts: list[AccountOnNetwork] = []
+
+        # while awaiting a sender, the others make progress, as well (so they are usually found ready, by a single fetch)
+        for key, sender in senders.items():
+            highest_nonce = highest_nonces[key]
+            logger.debug(f"Awaiting the nonce of {key} to exceed {highest_nonce}.")
+
+            account = account_awaiter.await_on_condition(sender, lambda account: account.nonce > highest_nonce)
+            accounts.append(account)
+
+        return accounts
+
+    def _fetch_completed(self, transaction_hash: bytes) -> TransactionOnNetwork:
+        transaction = self.fetcher.get_transaction(transaction_hash)
+        if transaction.status.is_completed:
+            return transaction
+
+        # e.g. a cross-shard transaction, processed in the shard of the sender, but not yet completed
+        transaction_awaiter = TransactionAwaiter(
+            fetcher=self.fetcher,
+            polling_interval_in_milliseconds=self.polling_interval_in_milliseconds,
+            timeout_interval_in_milliseconds=self.timeout_interval_in_milliseconds,
+            patience_time_in_milliseconds=0,
+        )
+
+        return transaction_awaiter.await_completed(transaction_hash)
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+
+            return self._executor
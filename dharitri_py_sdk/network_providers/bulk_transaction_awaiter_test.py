@@ -0,0 +1,111 @@
+import time
+from typing import Union
+
+import pytest
+
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.core.transaction import Transaction
+from dharitri_py_sdk.core.transaction_computer import TransactionComputer
+from dharitri_py_sdk.core.transaction_on_network import TransactionOnNetwork
+from dharitri_py_sdk.core.transaction_status import TransactionStatus
+from dharitri_py_sdk.network_providers.bulk_transaction_awaiter import (
+    BulkTransactionAwaiter,
+)
+from dharitri_py_sdk.network_providers.errors import (
+    ExpectedAccountConditionNotReachedError,
+)
+from dharitri_py_sdk.network_providers.resources import AccountOnNetwork
+from dharitri_py_sdk.testutils.mock_transaction_on_network import (
+    get_empty_transaction_on_network,
+)
+
+ALICE = Address.new_from_bech32("drt1c7pyyq2yaq5k7atn9z6qn5qkxwlc6zwc4vg7uuxn9ssy7evfh5jq4nm79l")
+BOB = Address.new_from_bech32("drt18h03w0y7qtqwtra3u4f0gu7e3kn2fslj83lqxny39m5c4rwaectswerhd2")
+
+
+class Network:
+    """Executes a few transactions of each sender before each fetch of an account."""
+
+    def __init__(self, nonces: dict[str, int], executed_per_fetch: int) -> None:
+        self.nonces = nonces
+        self.executed_per_fetch = executed_per_fetch
+        self.fetched_accounts: list[str] = []
+        self.fetched_transactions: list[str] = []
+        self.pending_transactions: set[str] = set()
+
+    def get_account(self, address: Address) -> AccountOnNetwork:
+        key = address.to_bech32()
+        self.fetched_accounts.append(key)
+
+        for sender in self.nonces:
+            self.nonces[sender] += self.executed_per_fetch
+
+        return AccountOnNetwork(raw={}, address=address, nonce=self.nonces[key], balance=0, is_guarded=False)
+
+    def get_transaction(self, transaction_hash: Union[bytes, str]) -> TransactionOnNetwork:
+        assert isinstance(transaction_hash, bytes)
+        self.fetched_transactions.append(transaction_hash.hex())
+
+        transaction = get_empty_transaction_on_network()
+        transaction.hash = transaction_hash
+        transaction.status = TransactionStatus("success")
+
+        # a pending transaction is completed by the next fetch
+        if transaction_hash.hex() in self.pending_transactions:
+            self.pending_transactions.remove(transaction_hash.hex())
+            transaction.status = TransactionStatus("pending")
+
+        return transaction
+
+
+def create_transactions(sender: Address, nonces: range, data: bytes = b"") -> list[Transaction]:
+    return [
+        Transaction(sender=sender, receiver=BOB, gas_limit=50000, chain_id="D", nonce=nonce, data=data)
+        for nonce in nonces
+    ]
+
+
+def test_await_processed():
+    network = Network({ALICE.to_bech32(): 0, BOB.to_bech32(): 100}, executed_per_fetch=250)
+    transfers = create_transactions(ALICE, range(1000))
+    contract_calls = create_transactions(BOB, range(100, 103), data=b"add@01")
+    transactions = transfers[:500] + contract_calls + transfers[500:]
+
+    awaiter = BulkTransactionAwaiter(network, polling_interval_in_milliseconds=1, patience_time_in_milliseconds=0)
+    results = awaiter.await_processed(transactions)
+
+    assert len(results) == len(transactions)
+    assert all(result is None for result in results[:500] + results[503:])
+
+    computer = TransactionComputer()
+    expected_hashes = [computer.compute_transaction_hash(transaction) for transaction in contract_calls]
+    assert [result.hash for result in results[500:503] if result] == expected_hashes
+
+    # the nonce of ALICE is fetched 4 times, instead of fetching 1000 transactions
+    assert network.fetched_accounts.count(ALICE.to_bech32()) == 4
+    assert network.fetched_accounts.count(BOB.to_bech32()) == 1
+    assert len(network.fetched_transactions) == 3
+
+
+def test_await_processed_pays_the_patience_once():
+    network = Network({ALICE.to_bech32(): 0}, executed_per_fetch=100)
+    contract_calls = create_transactions(ALICE, range(10), data=b"add@01")
+    network.pending_transactions.add(TransactionComputer().compute_transaction_hash(contract_calls[3]).hex())
+
+    awaiter = BulkTransactionAwaiter(network, polling_interval_in_milliseconds=1, patience_time_in_milliseconds=200)
+    start = time.perf_counter()
+    results = awaiter.await_processed(contract_calls)
+
+    assert time.perf_counter() - start < 1
+    assert all(result and result.status.is_completed for result in results)
+
+    # the pending transaction is fetched again, until completed
+    assert len(network.fetched_transactions) == 11
+
+
+def test_await_processed_with_timeout():
+    network = Network({ALICE.to_bech32(): 0}, executed_per_fetch=0)
+    awaiter = BulkTransactionAwaiter(network, polling_interval_in_milliseconds=1, timeout_interval_in_milliseconds=10)
+
+    with pytest.raises(ExpectedAccountConditionNotReachedError):
+        awaiter.await_processed(create_transactions(ALICE, range(3)))
@@ -0,0 +1,177 @@
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Protocol, Union
+
+
+class ICacheBackend(Protocol):
+    def get(self, key: str) -> Optional[Any]: ...
+
+    def set(self, key: str, value: Any, ttl_in_seconds: Optional[float] = None) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class InMemoryCacheBackend:
+    """A bounded, thread-safe, in-memory LRU cache. Entries may have an expiration time."""
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[Any, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl_in_seconds: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl_in_seconds if ttl_in_seconds is not None else None
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend:
+    """
+    A bounded cache persisted in a SQLite file (values are pickled), so that it survives across runs.
+    When the number of entries exceeds `max_entries`, the expired entries, then the least recently used ones, are evicted.
+
+    Reads don't write to the file: expired entries are simply skipped, and the access times (for the LRU eviction)
+    are kept in memory, then flushed along with the next write.
+
+    Only use cache files created by yourself, since unpickling untrusted data is unsafe.
+    """
+
+    def __init__(self, path: Union[str, Path], max_entries: int = 100_000) -> None:
+        self.path = Path(path).expanduser()
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB, expires_at REAL, last_access REAL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+        self._connection.commit()
+        self._pending_accesses: dict[str, float] = {}
+        # an estimation (the file might be shared by other processes), checked against the table before evicting
+        self._num_entries = self._count()
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+
+        with self._lock:
+            row = self._connection.execute("SELECT value, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                return None
+
+            self._pending_accesses[key] = now
+
+        return pickle.loads(value)
+
+    def set(self, key: str, value: Any, ttl_in_seconds: Optional[float] = None) -> None:
+        now = time.time()
+        expires_at = now + ttl_in_seconds if ttl_in_seconds is not None else None
+        data = pickle.dumps(value)
+
+        with self._lock:
+            self._flush_accesses()
+            self._pending_accesses.pop(key, None)
+
+            cursor = self._connection.execute(
+                "UPDATE entries SET value = ?, expires_at = ?, last_access = ? WHERE key = ?",
+                (data, expires_at, now, key),
+            )
+            if cursor.rowcount == 0:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                    (key, data, expires_at, now),
+                )
+                self._num_entries += 1
+
+            if self._num_entries > self.max_entries:
+                self._evict(now)
+
+            self._connection.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pending_accesses.pop(key, None)
+            cursor = self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._num_entries = max(0, self._num_entries - cursor.rowcount)
+            self._connection.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending_accesses.clear()
+            self._connection.execute("DELETE FROM entries")
+            self._num_entries = 0
+            self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_accesses()
+            self._connection.commit()
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+
+    def _count(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def _flush_accesses(self) -> None:
+        if not self._pending_accesses:
+            return
+
+        self._connection.executemany(
+            "UPDATE entries SET last_access = ? WHERE key = ?",
+            [(last_access, key) for key, last_access in self._pending_accesses.items()],
+        )
+        self._pending_accesses.clear()
+
+    def _evict(self, now: float) -> None:
+        self._connection.execute("DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        self._num_entries = self._count()
+        excess = self._num_entries - self.max_entries
+
+        if excess > 0:
+            self._connection.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY last_access LIMIT ?)",
+                (excess,),
+            )
+            self._num_entries -= excess
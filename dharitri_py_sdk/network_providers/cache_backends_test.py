@@ -0,0 +1,92 @@
+import time
+from pathlib import Path
+
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.network_providers.cache_backends import (
+    InMemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+from dharitri_py_sdk.network_providers.resources import FungibleTokenMetadata
+
+
+def test_in_memory_backend_evicts_least_recently_used():
+    backend = InMemoryCacheBackend(max_entries=2)
+    backend.set("a", 1)
+    backend.set("b", 2)
+
+    # "a" becomes the most recently used
+    assert backend.get("a") == 1
+
+    backend.set("c", 3)
+    assert len(backend) == 2
+    assert backend.get("b") is None
+    assert backend.get("a") == 1
+    assert backend.get("c") == 3
+
+
+def test_in_memory_backend_expiration():
+    backend = InMemoryCacheBackend()
+    backend.set("a", 1, ttl_in_seconds=0.05)
+    backend.set("b", 2)
+
+    assert backend.get("a") == 1
+    time.sleep(0.06)
+    assert backend.get("a") is None
+    assert backend.get("b") == 2
+
+
+def test_sqlite_backend(tmp_path: Path):
+    path = tmp_path / "cache.sqlite"
+    token = FungibleTokenMetadata(
+        raw={"identifier": "TEST-abcdef"},
+        identifier="TEST-abcdef",
+        name="Test",
+        ticker="TEST",
+        owner=Address.new_from_hex("00" * 32).to_bech32(),
+        decimals=6,
+    )
+
+    backend = SQLiteCacheBackend(path, max_entries=2)
+    backend.set("token", token)
+    backend.set("expiring", 42, ttl_in_seconds=0.05)
+    backend.close()
+
+    # the entries survive across instances
+    backend = SQLiteCacheBackend(path, max_entries=2)
+    assert backend.get("token") == token
+    time.sleep(0.06)
+    assert backend.get("expiring") is None
+
+    backend.set("b", 2)
+    backend.set("c", 3)
+    assert len(backend) == 2
+    assert backend.get("token") is None
+
+    backend.clear()
+    assert len(backend) == 0
+
+
+def test_sqlite_backend_reads_do_not_write(tmp_path: Path):
+    backend = SQLiteCacheBackend(tmp_path / "cache.sqlite", max_entries=2)
+    backend.set("a", 1)
+    backend.set("b", 2)
+
+    statements: list[str] = []
+    backend._connection.set_trace_callback(statements.append)
+    changes = backend._connection.total_changes
+
+    assert backend.get("a") == 1
+    assert backend._connection.total_changes == changes
+    assert all(statement.startswith("SELECT") for statement in statements)
+
+    # the access is taken into account by the next write ("b" becomes the least recently used), without counting the entries
+    statements.clear()
+    backend.set("c", 3)
+    assert sum("COUNT" in statement for statement in statements) == 1
+    statements.clear()
+    backend.set("c", 4)
+    assert not any("COUNT" in statement for statement in statements)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == 1
+    assert backend.get("c") == 4
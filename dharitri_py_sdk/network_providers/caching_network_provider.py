@@ -0,0 +1,346 @@
+import copy
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar, Union
+
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.core.constants import METACHAIN_ID
+from dharitri_py_sdk.core.tokens import Token
+from dharitri_py_sdk.core.transaction import Transaction
+from dharitri_py_sdk.core.transaction_on_network import TransactionOnNetwork
+from dharitri_py_sdk.network_providers.account_awaiter import AccountAwaiter
+from dharitri_py_sdk.network_providers.cache_backends import (
+    ICacheBackend,
+    InMemoryCacheBackend,
+)
+from dharitri_py_sdk.network_providers.config import CachingOptions
+from dharitri_py_sdk.network_providers.constants import (
+    DEFAULT_ACCOUNT_AWAITING_PATIENCE_IN_MILLISECONDS,
+    ONE_SECOND_IN_MILLISECONDS,
+)
+from dharitri_py_sdk.network_providers.interface import INetworkProvider
+from dharitri_py_sdk.network_providers.resources import (
+    AccountOnNetwork,
+    AccountStorage,
+    AccountStorageEntry,
+    AwaitingOptions,
+    BlockOnNetwork,
+    FungibleTokenMetadata,
+    NetworkConfig,
+    NetworkStatus,
+    TokenAmountOnNetwork,
+    TokensCollectionMetadata,
+    TransactionCostResponse,
+)
+from dharitri_py_sdk.network_providers.shared import (
+    convert_tx_hash_to_string,
+    get_smart_contract_query_key,
+)
+from dharitri_py_sdk.network_providers.transaction_awaiter import TransactionAwaiter
+from dharitri_py_sdk.smart_contracts.smart_contract_query import (
+    SmartContractQuery,
+    SmartContractQueryResponse,
+)
+
+T = TypeVar("T")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+class CachingNetworkProvider(INetworkProvider):
+    """
+    A decorator over any network provider, which caches data that doesn't change (or rarely changes):
+        - the network configuration (long TTL),
+        - the definitions of tokens and collections,
+        - completed transactions and final blocks (indefinitely),
+        - the results of contract queries, for a configurable number of rounds (until the round boundary).
+
+    Everything else (accounts, storage, balances, broadcasting etc.) is passed through to the underlying provider.
+
+    Keys are prefixed with a namespace (by default, the URL of the underlying provider), so that a backend can be shared by providers
+    connected to different networks. Callers receive copies of the cached items, so they can't alter the cache.
+    """
+
+    def __init__(
+        self,
+        provider: INetworkProvider,
+        backend: Optional[ICacheBackend] = None,
+        options: Optional[CachingOptions] = None,
+        namespace: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            provider (INetworkProvider): the underlying network provider.
+            backend (Optional[ICacheBackend]): where the cached items are held. Defaults to a bounded, in-memory LRU cache.
+            options (Optional[CachingOptions]): the TTLs of the cached items.
+            namespace (Optional[str]): the prefix of the keys. Defaults to the URL of the underlying provider (or the URLs of its endpoints).
+        """
+        self.provider = provider
+        self.namespace = namespace if namespace is not None else _get_namespace(provider)
+        self.backend = backend if backend is not None else InMemoryCacheBackend()
+        self.options = options if options is not None else CachingOptions()
+        self.stats: dict[str, CacheStats] = {}
+        self._stats_lock = threading.Lock()
+
+    def get_network_config(self) -> NetworkConfig:
+        """Fetches (or loads from cache) the general configuration of the network."""
+        return self._get_or_fetch(
+            category="network_config",
+            key="network_config",
+            fetch=self.provider.get_network_config,
+            get_ttl=lambda _: self.options.network_config_ttl_in_seconds,
+        )
+
+    def get_network_status(self, shard: int = METACHAIN_ID) -> NetworkStatus:
+        """Fetches the current status of the network (cached for a short while)."""
+        return self._get_or_fetch(
+            category="network_status",
+            key=f"network_status:{shard}",
+            fetch=lambda: self.provider.get_network_status(shard),
+            get_ttl=lambda _: self.options.network_status_ttl_in_seconds,
+        )
+
+    def get_block(self, *args: Any, **kwargs: Any) -> BlockOnNetwork:
+        """
+        Fetches a block (the arguments are the ones of the underlying provider's `get_block()`).
+        Blocks are cached indefinitely, once final.
+        """
+        key = _make_key("block", *args, *sorted(kwargs.items()))
+        fetch_block: Callable[..., BlockOnNetwork] = getattr(self.provider, "get_block")
+
+        return self._get_or_fetch(
+            category="blocks",
+            key=key,
+            fetch=lambda: fetch_block(*args, **kwargs),
+            get_ttl=self._get_ttl_of_block,
+        )
+
+    def get_account(self, address: Address) -> AccountOnNetwork:
+        """Fetches account information for a given address (not cached)."""
+        return self.provider.get_account(address)
+
+    def get_account_storage(self, address: Address) -> AccountStorage:
+        """Fetches the storage (key-value pairs) of an account (not cached)."""
+        return self.provider.get_account_storage(address)
+
+    def get_account_storage_entry(self, address: Address, entry_key: str) -> AccountStorageEntry:
+        """Fetches a specific storage entry of an account (not cached)."""
+        return self.provider.get_account_storage_entry(address, entry_key)
+
+    def await_account_on_condition(
+        self,
+        address: Address,
+        condition: Callable[[AccountOnNetwork], bool],
+        options: Optional[AwaitingOptions] = None,
+    ) -> AccountOnNetwork:
+        """Waits until an account satisfies a given condition."""
+        if options is None:
+            options = AwaitingOptions(patience_in_milliseconds=DEFAULT_ACCOUNT_AWAITING_PATIENCE_IN_MILLISECONDS)
+
+        awaiter = AccountAwaiter(
+            fetcher=self,
+            polling_interval_in_milliseconds=options.polling_interval_in_milliseconds,
+            timeout_interval_in_milliseconds=options.timeout_in_milliseconds,
+            patience_time_in_milliseconds=options.patience_in_milliseconds,
+        )
+
+        return awaiter.await_on_condition(address=address, condition=condition)
+
+    def send_transaction(self, transaction: Transaction) -> bytes:
+        """Broadcasts a transaction and returns its hash."""
+        return self.provider.send_transaction(transaction)
+
+    def simulate_transaction(self, transaction: Transaction) -> TransactionOnNetwork:
+        """Simulates a transaction (not cached)."""
+        return self.provider.simulate_transaction(transaction)
+
+    def estimate_transaction_cost(self, transaction: Transaction) -> TransactionCostResponse:
+        """Estimates the cost of a transaction (not cached)."""
+        return self.provider.estimate_transaction_cost(transaction)
+
+    def send_transactions(self, transactions: list[Transaction]) -> tuple[int, list[bytes]]:
+        """Broadcasts multiple transactions and returns a tuple of (number of accepted transactions, list of transaction hashes)."""
+        return self.provider.send_transactions(transactions)
+
+    def get_transaction(self, transaction_hash: Union[bytes, str]) -> TransactionOnNetwork:
+        """Fetches a transaction. Completed transactions are cached indefinitely."""
+        transaction_hash = convert_tx_hash_to_string(transaction_hash)
+
+        return self._get_or_fetch(
+            category="transactions",
+            key=f"transaction:{transaction_hash}",
+            fetch=lambda: self.provider.get_transaction(transaction_hash),
+            get_ttl=_get_ttl_of_transaction,
+        )
+
+    def await_transaction_completed(
+        self,
+        transaction_hash: Union[bytes, str],
+        options: Optional[AwaitingOptions] = None,
+    ) -> TransactionOnNetwork:
+        """Waits until the transaction is completely processed."""
+        transaction_hash = convert_tx_hash_to_string(transaction_hash)
+
+        if options is None:
+            options = AwaitingOptions()
+
+        awaiter = TransactionAwaiter(
+            fetcher=self,
+            polling_interval_in_milliseconds=options.polling_interval_in_milliseconds,
+            timeout_interval_in_milliseconds=options.timeout_in_milliseconds,
+            patience_time_in_milliseconds=options.patience_in_milliseconds,
+        )
+
+        return awaiter.await_completed(transaction_hash)
+
+    def await_transaction_on_condition(
+        self,
+        transaction_hash: Union[bytes, str],
+        condition: Callable[[TransactionOnNetwork], bool],
+        options: Optional[AwaitingOptions] = None,
+    ) -> TransactionOnNetwork:
+        """Waits until a transaction satisfies a given condition."""
+        transaction_hash = convert_tx_hash_to_string(transaction_hash)
+
+        if options is None:
+            options = AwaitingOptions()
+
+        awaiter = TransactionAwaiter(
+            fetcher=self,
+            polling_interval_in_milliseconds=options.polling_interval_in_milliseconds,
+            timeout_interval_in_milliseconds=options.timeout_in_milliseconds,
+            patience_time_in_milliseconds=options.patience_in_milliseconds,
+        )
+
+        return awaiter.await_on_condition(transaction_hash, condition)
+
+    def get_token_of_account(self, address: Address, token: Token) -> TokenAmountOnNetwork:
+        """Fetches the balance of an account, for a given token (not cached)."""
+        return self.provider.get_token_of_account(address, token)
+
+    def get_fungible_tokens_of_account(self, address: Address) -> list[TokenAmountOnNetwork]:
+        """Fetches the balances of an account, for all fungible tokens held by the account (not cached)."""
+        return self.provider.get_fungible_tokens_of_account(address)
+
+    def get_non_fungible_tokens_of_account(self, address: Address) -> list[TokenAmountOnNetwork]:
+        """Fetches the balances of an account, for all non-fungible tokens held by the account (not cached)."""
+        return self.provider.get_non_fungible_tokens_of_account(address)
+
+    def get_definition_of_fungible_token(self, token_identifier: str) -> FungibleTokenMetadata:
+        """Fetches (or loads from cache) the definition of a fungible token."""
+        return self._get_or_fetch(
+            category="token_definitions",
+            key=f"fungible_token:{token_identifier}",
+            fetch=lambda: self.provider.get_definition_of_fungible_token(token_identifier),
+            get_ttl=lambda _: self.options.token_definitions_ttl_in_seconds,
+        )
+
+    def get_definition_of_tokens_collection(self, collection_name: str) -> TokensCollectionMetadata:
+        """Fetches (or loads from cache) the definition of a tokens collection."""
+        return self._get_or_fetch(
+            category="token_definitions",
+            key=f"tokens_collection:{collection_name}",
+            fetch=lambda: self.provider.get_definition_of_tokens_collection(collection_name),
+            get_ttl=lambda _: self.options.token_definitions_ttl_in_seconds,
+        )
+
+    def query_contract(self, query: SmartContractQuery) -> SmartContractQueryResponse:
+        """Queries a smart contract. The result is cached until the end of the current round (or of the next ones, according to the options)."""
+        if not self.options.query_ttl_in_rounds:
+            return self.provider.query_contract(query)
+
+        return self._get_or_fetch(
+            category="queries",
+            key=f"query:{get_smart_contract_query_key(query)}",
+            fetch=lambda: self.provider.query_contract(query),
+            get_ttl=lambda _: self._get_seconds_until_end_of_rounds(self.options.query_ttl_in_rounds),
+        )
+
+    def do_get_generic(self, url: str, url_parameters: Optional[dict[str, Any]] = None) -> Any:
+        """Does a generic GET request against the network (not cached)."""
+        return self.provider.do_get_generic(url, url_parameters)
+
+    def do_post_generic(self, url: str, data: Any, url_parameters: Optional[dict[str, Any]] = None) -> Any:
+        """Does a generic POST request against the network (not cached)."""
+        return self.provider.do_post_generic(url, data, url_parameters)
+
+    def clear(self) -> None:
+        """Removes all the cached items."""
+        self.backend.clear()
+
+    def _get_or_fetch(
+        self,
+        category: str,
+        key: str,
+        fetch: Callable[[], T],
+        get_ttl: Callable[[T], Optional[float]],
+    ) -> T:
+        key = f"{self.namespace}/{key}"
+        cached = self.backend.get(key)
+        self._record(category, hit=cached is not None)
+
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        value = fetch()
+        ttl = get_ttl(value)
+
+        # a TTL of zero (or less) means "do not cache"
+        if ttl is None or ttl > 0:
+            self.backend.set(key, copy.deepcopy(value), ttl)
+
+        return value
+
+    def _record(self, category: str, hit: bool) -> None:
+        with self._stats_lock:
+            stats = self.stats.setdefault(category, CacheStats())
+
+            if hit:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+
+    def _get_ttl_of_block(self, block: BlockOnNetwork) -> Optional[float]:
+        status = self.get_network_status(block.shard)
+        is_final = block.nonce <= status.highest_final_block_nonce
+        return None if is_final else 0
+
+    def _get_seconds_until_end_of_rounds(self, rounds: int) -> float:
+        config = self.get_network_config()
+        round_duration = config.round_duration / ONE_SECOND_IN_MILLISECONDS
+
+        if round_duration <= 0:
+            return 0
+
+        elapsed_in_current_round = (time.time() - config.genesis_timestamp) % round_duration
+        return rounds * round_duration - elapsed_in_current_round
+
+
+def _get_ttl_of_transaction(transaction: TransactionOnNetwork) -> Optional[float]:
+    return None if transaction.status.is_completed else 0
+
+
+def _get_namespace(provider: Any) -> str:
+    """The URL of the provider, or the URLs of its endpoints (e.g. for a `MultiEndpointNetworkProvider`)."""
+    url = getattr(provider, "url", None)
+    if isinstance(url, str):
+        return url
+
+    endpoints = getattr(provider, "endpoints", None) or []
+    return ",".join(_get_namespace(getattr(endpoint, "provider", None)) for endpoint in endpoints)
+
+
+def _make_key(prefix: str, *parts: Any) -> str:
+    def stringify(part: Any) -> str:
+        if isinstance(part, bytes):
+            return part.hex()
+        if isinstance(part, tuple):
+            return "=".join(stringify(item) for item in part)
+        return str(part)
+
+    return ":".join([prefix, *[stringify(part) for part in parts]])
@@ -0,0 +1,193 @@
+import time
+from collections import Counter
+from typing import Any, Optional
+
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.core.transaction_status import TransactionStatus
+from dharitri_py_sdk.network_providers.cache_backends import InMemoryCacheBackend
+from dharitri_py_sdk.network_providers.caching_network_provider import (
+    CachingNetworkProvider,
+)
+from dharitri_py_sdk.network_providers.config import CachingOptions
+from dharitri_py_sdk.network_providers.resources import (
+    BlockOnNetwork,
+    FungibleTokenMetadata,
+    NetworkConfig,
+    NetworkStatus,
+)
+from dharitri_py_sdk.smart_contracts.smart_contract_query import (
+    SmartContractQuery,
+    SmartContractQueryResponse,
+)
+from dharitri_py_sdk.testutils.mock_transaction_on_network import (
+    get_empty_transaction_on_network,
+)
+
+
+class CountingProvider:
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+        self.transaction_status = "pending"
+        self.highest_final_block_nonce = 100
+        self.round_duration = 6000
+
+    def get_network_config(self) -> NetworkConfig:
+        self.calls["get_network_config"] += 1
+        return NetworkConfig(
+            raw={},
+            chain_id="D",
+            gas_per_data_byte=1500,
+            gas_price_modifier=0.01,
+            min_gas_limit=50000,
+            min_gas_price=1000000000,
+            extra_gas_limit_for_guarded_transactions=50000,
+            num_shards=3,
+            round_duration=self.round_duration,
+            num_rounds_per_epoch=14400,
+            genesis_timestamp=0,
+        )
+
+    def get_network_status(self, shard: int) -> NetworkStatus:
+        self.calls["get_network_status"] += 1
+        return NetworkStatus(
+            raw={},
+            block_timestamp=0,
+            block_nonce=self.highest_final_block_nonce + 1,
+            highest_final_block_nonce=self.highest_final_block_nonce,
+            current_round=0,
+            current_epoch=0,
+        )
+
+    def get_block(self, shard: int, block_hash: Optional[bytes] = None, block_nonce: Optional[int] = None):
+        self.calls["get_block"] += 1
+        return BlockOnNetwork(
+            raw={},
+            shard=shard,
+            nonce=block_nonce or 0,
+            hash=block_hash or b"",
+            previous_hash=b"",
+            timestamp=0,
+            round=0,
+            epoch=0,
+        )
+
+    def get_transaction(self, transaction_hash: str):
+        self.calls["get_transaction"] += 1
+        transaction = get_empty_transaction_on_network()
+        transaction.status = TransactionStatus(self.transaction_status)
+        return transaction
+
+    def get_definition_of_fungible_token(self, token_identifier: str) -> FungibleTokenMetadata:
+        self.calls["get_definition_of_fungible_token"] += 1
+        return FungibleTokenMetadata(raw={}, identifier=token_identifier, name="", ticker="", owner="", decimals=6)
+
+    def query_contract(self, query: SmartContractQuery) -> SmartContractQueryResponse:
+        self.calls["query_contract"] += 1
+        return SmartContractQueryResponse(
+            function=query.function, return_code="ok", return_message="", return_data_parts=[b"\x01"]
+        )
+
+    def get_account(self, address: Address) -> Any:
+        self.calls["get_account"] += 1
+
+
+class TestCachingNetworkProvider:
+    contract = Address.new_from_bech32("drt1qqqqqqqqqqqqqpgq076flgeualrdu5jyyj60snvrh7zu4qrg05vqy7r36d")
+
+    def test_caches_network_config_and_token_definitions(self):
+        provider = CountingProvider()
+        cache = CachingNetworkProvider(provider)  # type: ignore
+
+        for _ in range(3):
+            assert cache.get_network_config().chain_id == "D"
+            assert cache.get_definition_of_fungible_token("TEST-abcdef").decimals == 6
+            cache.get_definition_of_fungible_token("OTHER-abcdef")
+
+        assert provider.calls["get_network_config"] == 1
+        assert provider.calls["get_definition_of_fungible_token"] == 2
+        assert cache.stats["network_config"].hits == 2
+        assert cache.stats["network_config"].misses == 1
+        assert cache.stats["token_definitions"].hits == 4
+        assert cache.stats["token_definitions"].misses == 2
+
+    def test_caches_only_completed_transactions(self):
+        provider = CountingProvider()
+        cache = CachingNetworkProvider(provider)  # type: ignore
+        tx_hash = "aa" * 32
+
+        cache.get_transaction(tx_hash)
+        cache.get_transaction(bytes.fromhex(tx_hash))
+        assert provider.calls["get_transaction"] == 2
+
+        provider.transaction_status = "success"
+        cache.get_transaction(tx_hash)
+        cache.get_transaction(tx_hash)
+        assert provider.calls["get_transaction"] == 3
+        assert cache.get_transaction(tx_hash).status.is_successful
+
+    def test_caches_only_final_blocks(self):
+        provider = CountingProvider()
+        cache = CachingNetworkProvider(provider)  # type: ignore
+
+        cache.get_block(1, block_nonce=100)
+        cache.get_block(1, block_nonce=100)
+        assert provider.calls["get_block"] == 1
+
+        cache.get_block(1, block_nonce=101)
+        cache.get_block(1, block_nonce=101)
+        assert provider.calls["get_block"] == 3
+
+    def test_caches_queries_until_round_boundary(self):
+        provider = CountingProvider()
+        provider.round_duration = 200
+        cache = CachingNetworkProvider(provider, options=CachingOptions(query_ttl_in_rounds=1))  # type: ignore
+
+        query = SmartContractQuery(contract=self.contract, function="getSum", arguments=[b"\x01"])
+        other_query = SmartContractQuery(contract=self.contract, function="getSum", arguments=[b"\x02"])
+
+        cache.query_contract(query)
+        cache.query_contract(query)
+        cache.query_contract(other_query)
+        assert provider.calls["query_contract"] == 2
+
+        time.sleep(0.25)
+        cache.query_contract(query)
+        assert provider.calls["query_contract"] == 3
+
+    def test_queries_are_not_cached_if_disabled(self):
+        provider = CountingProvider()
+        cache = CachingNetworkProvider(provider, options=CachingOptions(query_ttl_in_rounds=0))  # type: ignore
+        query = SmartContractQuery(contract=self.contract, function="getSum", arguments=[])
+
+        cache.query_contract(query)
+        cache.query_contract(query)
+        assert provider.calls["query_contract"] == 2
+
+    def test_passes_through_accounts(self):
+        provider = CountingProvider()
+        cache = CachingNetworkProvider(provider)  # type: ignore
+
+        cache.get_account(self.contract)
+        cache.get_account(self.contract)
+        assert provider.calls["get_account"] == 2
+
+    def test_keys_are_namespaced_and_items_are_copied(self):
+        backend = InMemoryCacheBackend()
+        mainnet, devnet = CountingProvider(), CountingProvider()
+        mainnet.url = "https://gateway.dharitri.org"  # type: ignore
+        devnet.url = "https://devnet-gateway.dharitri.org"  # type: ignore
+
+        mainnet_cache = CachingNetworkProvider(mainnet, backend=backend)  # type: ignore
+        devnet_cache = CachingNetworkProvider(devnet, backend=backend)  # type: ignore
+
+        mainnet_cache.get_network_config()
+        devnet_cache.get_network_config()
+        assert (mainnet.calls["get_network_config"], devnet.calls["get_network_config"]) == (1, 1)
+
+        mainnet.transaction_status = "success"
+        transaction = mainnet_cache.get_transaction("aa" * 32)
+        transaction.status = TransactionStatus("fail")
+        mainnet_cache.get_transaction("aa" * 32).status = TransactionStatus("fail")
+
+        assert mainnet_cache.get_transaction("aa" * 32).status.is_successful
+        assert mainnet.calls["get_transaction"] == 1
@@ -0,0 +1,162 @@
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Optional, Union
+
+# once the size limit is exceeded, entries are evicted until the cache shrinks to this fraction of the limit
+EVICTION_LOW_WATERMARK = 0.9
+# accesses are recorded in batches, so that reading from the cache doesn't imply a write for each hit
+MAX_PENDING_ACCESSES = 1024
+
+
+class ChainDataCache:
+    """
+    A disk-backed cache (SQLite, in WAL mode) of chain data: completed transactions and final blocks (which never change),
+    and token definitions (kept for `token_definitions_ttl_in_seconds`). Providers (see `NetworkProviderConfig`) consult it before hitting the network.
+
+    Entries are the raw JSON responses (zlib-compressed), keyed by the URL of the resource, so that a single file can be shared
+    by providers connected to different networks (or by several processes). When the total size of the entries exceeds `max_size_in_bytes`,
+    the least recently used ones are evicted.
+
+    Token definitions aren't final: their owner, properties, roles, supply and paused state change over time, so they expire.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_size_in_bytes: int = 512 * 1024 * 1024,
+        compression_level: int = 6,
+        token_definitions_ttl_in_seconds: float = 600,
+    ) -> None:
+        """
+        Args:
+            path (Union[str, Path]): the SQLite file.
+            max_size_in_bytes (int): the maximum total size of the (compressed) entries.
+            compression_level (int): the zlib compression level (from 0 to 9).
+            token_definitions_ttl_in_seconds (float): for how long the definitions of tokens (and collections) are served from the cache.
+        """
+        self.path = Path(path).expanduser()
+        self.max_size_in_bytes = max_size_in_bytes
+        self.compression_level = compression_level
+        self.token_definitions_ttl_in_seconds = token_definitions_ttl_in_seconds
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._pending_accesses: dict[str, float] = {}
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB, size INTEGER, last_access REAL, expires_at REAL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+        self._connection.commit()
+        self._size_in_bytes = self._compute_size()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the (decompressed, decoded) JSON data stored under the given key, or `None` (if missing or expired)."""
+        with self._lock:
+            row = self._connection.execute("SELECT value, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+
+            if row is None or (row[1] is not None and row[1] <= time.time()):
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._pending_accesses[key] = time.time()
+
+            if len(self._pending_accesses) >= MAX_PENDING_ACCESSES:
+                self._flush_accesses()
+                self._connection.commit()
+
+        return json.loads(zlib.decompress(row[0]))
+
+    def set(self, key: str, data: Any, ttl_in_seconds: Optional[float] = None) -> None:
+        """Stores JSON-serializable data. Unless a TTL is given, only call it for data known to be final."""
+        expires_at = time.time() + ttl_in_seconds if ttl_in_seconds is not None else None
+        value = zlib.compress(json.dumps(data, separators=(",", ":")).encode(), self.compression_level)
+        size = len(key) + len(value)
+
+        with self._lock:
+            previous = self._connection.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, last_access, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, time.time(), expires_at),
+            )
+            self._pending_accesses.pop(key, None)
+            self._size_in_bytes += size - (previous[0] if previous else 0)
+
+            if self._size_in_bytes > self.max_size_in_bytes:
+                self._evict()
+
+            self._connection.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._connection.commit()
+            self._pending_accesses.pop(key, None)
+            self._size_in_bytes = self._compute_size()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM entries")
+            self._connection.commit()
+            self._pending_accesses.clear()
+            self._size_in_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_accesses()
+            self._connection.commit()
+            self._connection.close()
+
+    @property
+    def size_in_bytes(self) -> int:
+        return self._size_in_bytes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def _flush_accesses(self) -> None:
+        if not self._pending_accesses:
+            return
+
+        self._connection.executemany(
+            "UPDATE entries SET last_access = ? WHERE key = ?",
+            [(last_access, key) for key, last_access in self._pending_accesses.items()],
+        )
+        self._pending_accesses.clear()
+
+    def _evict(self) -> None:
+        # other processes might share the file, so the size is recomputed before evicting
+        self._flush_accesses()
+        self._size_in_bytes = self._compute_size()
+
+        if self._size_in_bytes <= self.max_size_in_bytes:
+            return
+
+        excess = self._size_in_bytes - int(self.max_size_in_bytes * EVICTION_LOW_WATERMARK)
+
+        cursor = self._connection.execute("SELECT key, size FROM entries ORDER BY last_access")
+        evicted: list[tuple[str]] = []
+        evicted_size = 0
+
+        for key, size in cursor:
+            if evicted_size >= excess:
+                break
+            evicted.append((key,))
+            evicted_size += size
+
+        cursor.close()
+
+        self._connection.executemany("DELETE FROM entries WHERE key = ?", evicted)
+        self._size_in_bytes -= evicted_size
+
+    def _compute_size(self) -> int:
+        return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
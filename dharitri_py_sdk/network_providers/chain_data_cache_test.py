@@ -0,0 +1,159 @@
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from dharitri_py_sdk.network_providers.api_network_provider import ApiNetworkProvider
+from dharitri_py_sdk.network_providers.chain_data_cache import ChainDataCache
+from dharitri_py_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_py_sdk.network_providers.proxy_network_provider import (
+    ProxyNetworkProvider,
+)
+
+TX_HASH = "ab" * 32
+PENDING_TX_HASH = "cd" * 32
+
+
+def create_response(body: Any) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(body).encode()
+    return response
+
+
+def envelope(data: Any) -> dict[str, Any]:
+    return {"data": data, "error": "", "code": "successful"}
+
+
+def mock_gateway(mocker: Any) -> Any:
+    def get(url: str, **kwargs: Any) -> requests.Response:
+        if url.endswith("/process-status"):
+            status = "pending" if PENDING_TX_HASH in url else "success"
+            return create_response(envelope({"status": status}))
+        if "/transaction/" in url:
+            status = "pending" if PENDING_TX_HASH in url else "success"
+            return create_response(envelope({"transaction": {"nonce": 7, "status": status, "data": "aGVsbG8="}}))
+        if "/network/status/" in url:
+            return create_response(envelope({"status": {"drt_nonce": 12, "drt_highest_final_nonce": 10}}))
+        if "/block/1/by-nonce/" in url:
+            nonce = int(url.rsplit("/", 1)[1])
+            return create_response(envelope({"block": {"nonce": nonce, "shard": 1, "hash": f"{nonce:064x}"}}))
+
+        raise AssertionError(f"unexpected request: {url}")
+
+    return mocker.patch("requests.Session.get", side_effect=get)
+
+
+def test_persistence_and_compression(tmp_path: Path):
+    path = tmp_path / "cache.sqlite"
+    data = {"transaction": {"logs": ["a" * 100] * 100}}
+
+    cache = ChainDataCache(path)
+    cache.set("key", data)
+    assert cache.get("key") == data
+    assert cache.get("missing") is None
+    assert cache.size_in_bytes < len(json.dumps(data)) // 10
+    cache.close()
+
+    cache = ChainDataCache(path)
+    assert cache.get("key") == data
+    assert len(cache) == 1
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert sqlite3.connect(str(path)).execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_expiration(tmp_path: Path):
+    cache = ChainDataCache(tmp_path / "cache.sqlite")
+    cache.set("final", 1)
+    cache.set("fresh", 2, ttl_in_seconds=60)
+    cache.set("expired", 3, ttl_in_seconds=-1)
+
+    assert [cache.get("final"), cache.get("fresh"), cache.get("expired")] == [1, 2, None]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_eviction(tmp_path: Path):
+    cache = ChainDataCache(tmp_path / "cache.sqlite", max_size_in_bytes=2000, compression_level=0)
+
+    for index in range(4):
+        cache.set(f"key:{index}", "x" * 400)
+
+    # "key:0" becomes the most recently used entry
+    assert cache.get("key:0") is not None
+    cache.set("key:4", "x" * 400)
+
+    assert cache.size_in_bytes <= 2000 * 0.9
+    assert cache.get("key:1") is None
+    assert cache.get("key:0") is not None
+    assert cache.get("key:4") is not None
+
+
+def test_proxy_consults_the_cache(mocker: Any, tmp_path: Path):
+    session_get = mock_gateway(mocker)
+    path = tmp_path / "cache.sqlite"
+
+    proxy = ProxyNetworkProvider("https://gateway", config=NetworkProviderConfig(chain_data_cache=ChainDataCache(path)))
+    assert proxy.get_transaction(TX_HASH).status.is_successful
+    assert proxy.get_transaction(PENDING_TX_HASH).status.status == "pending"
+    assert proxy.get_block(1, block_nonce=9).nonce == 9
+    assert proxy.get_block(1, block_nonce=11).nonce == 11
+
+    # the block below is known to be final, without fetching the network status again
+    assert proxy.get_block(1, block_nonce=8).nonce == 8
+    assert session_get.call_count == 9
+
+    # a new run (provider) only fetches the pending transaction and the non-final block
+    session_get.reset_mock()
+    proxy = ProxyNetworkProvider("https://gateway", config=NetworkProviderConfig(chain_data_cache=ChainDataCache(path)))
+
+    transaction = proxy.get_transaction(TX_HASH)
+    assert transaction.status.is_successful
+    assert transaction.nonce == 7
+    assert transaction.data == b"hello"
+    assert proxy.get_block(1, block_nonce=9).hash == bytes.fromhex(f"{9:064x}")
+    assert proxy.get_block(1, block_nonce=8).nonce == 8
+    assert session_get.call_count == 0
+
+    proxy.get_transaction(PENDING_TX_HASH)
+    proxy.get_block(1, block_nonce=11)
+    assert session_get.call_count == 4
+
+    # entries of other networks are kept apart
+    other = ProxyNetworkProvider("https://other", config=NetworkProviderConfig(chain_data_cache=ChainDataCache(path)))
+    other.get_transaction(TX_HASH)
+    assert session_get.call_count == 6
+
+
+def test_api_consults_the_cache(mocker: Any, tmp_path: Path):
+    def get(url: str, **kwargs: Any) -> requests.Response:
+        if "/transactions/" in url:
+            return create_response({"txHash": TX_HASH, "status": "success", "nonce": 3})
+        if "/tokens/" in url:
+            return create_response({"identifier": "TEST-123456", "name": "Test", "decimals": 6})
+
+        raise AssertionError(f"unexpected request: {url}")
+
+    session_get = mocker.patch("requests.Session.get", side_effect=get)
+    config = NetworkProviderConfig(chain_data_cache=ChainDataCache(tmp_path / "cache.sqlite"))
+    api = ApiNetworkProvider("https://api", config=config)
+
+    for _ in range(3):
+        assert api.get_transaction(TX_HASH).nonce == 3
+        assert api.get_definition_of_fungible_token("TEST-123456").decimals == 6
+
+    # projections aren't served from (nor stored into) the cache
+    api.get_transaction(TX_HASH, fields=["status"])
+
+    assert session_get.call_count == 3
+
+    # token definitions expire (their owner, roles, supply or paused state might change)
+    config = NetworkProviderConfig(
+        chain_data_cache=ChainDataCache(tmp_path / "other.sqlite", token_definitions_ttl_in_seconds=-1)
+    )
+    api = ApiNetworkProvider("https://api", config=config)
+    api.get_definition_of_fungible_token("TEST-123456")
+    api.get_definition_of_fungible_token("TEST-123456")
+
+    assert session_get.call_count == 5
@@ -0,0 +1,218 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+from dharitri_py_sdk.core.constants import METACHAIN_ID
+from dharitri_py_sdk.core.transaction_on_network import TransactionOnNetwork
+from dharitri_py_sdk.network_providers.config import ChainFollowerOptions
+from dharitri_py_sdk.network_providers.constants import ONE_SECOND_IN_MILLISECONDS
+from dharitri_py_sdk.network_providers.errors import (
+    ChainDiscontinuityError,
+    NetworkProviderError,
+)
+from dharitri_py_sdk.network_providers.http_resources import (
+    block_from_response,
+    transaction_from_proxy_response,
+)
+from dharitri_py_sdk.network_providers.proxy_network_provider import (
+    ProxyNetworkProvider,
+)
+from dharitri_py_sdk.network_providers.resources import BlockOnNetwork
+from dharitri_py_sdk.network_providers.shared import submit_task, wait_or_steal
+
+logger = logging.getLogger("chain_follower")
+
+
+@dataclass
+class BlockWithTransactions:
+    block: BlockOnNetwork
+    transactions: list[TransactionOnNetwork]
+
+
+class ChainFollower:
+    """
+    Follows the blocks of a shard (or the hyperblocks of the metachain), in the order of their nonces.
+    Blocks are fetched in parallel (on the executor of the provider), ahead of the block being consumed (within a bounded window), and are yielded in order.
+    Once the tip of the chain is reached, the follower polls for new blocks.
+
+    If a checkpoint file is provided, the progress is saved there, and the iteration resumes from the last processed block.
+    A block is considered processed once the consumer asks for the next one (at-least-once delivery).
+    """
+
+    def __init__(
+        self,
+        provider: ProxyNetworkProvider,
+        shard: int = METACHAIN_ID,
+        start_nonce: Optional[int] = None,
+        end_nonce: Optional[int] = None,
+        use_hyperblocks: bool = False,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        options: Optional[ChainFollowerOptions] = None,
+    ) -> None:
+        """
+        Args:
+            provider (ProxyNetworkProvider): the provider used to fetch the blocks.
+            shard (int): the shard to follow.
+            start_nonce (Optional[int]): the first block to fetch. If not provided (and there is no checkpoint), the iteration starts at the tip of the chain.
+            end_nonce (Optional[int]): the last block to fetch. If not provided, the chain is followed indefinitely (until `stop()` is called).
+            use_hyperblocks (bool): whether to fetch metachain hyperblocks (which contain the transactions of all shards). Requires `shard` to be the metachain.
+            checkpoint_path (Optional[Union[str, Path]]): the file where the progress is saved.
+            options (Optional[ChainFollowerOptions]): the options of the follower.
+        """
+        if use_hyperblocks and shard != METACHAIN_ID:
+            raise ValueError("Hyperblocks are only available for the metachain")
+
+        self.provider = provider
+        self.shard = shard
+        self.start_nonce = start_nonce
+        self.end_nonce = end_nonce
+        self.use_hyperblocks = use_hyperblocks
+        self.checkpoint_path = Path(checkpoint_path).expanduser() if checkpoint_path else None
+        self.options = options or ChainFollowerOptions()
+        self._stopped = threading.Event()
+
+    def __iter__(self) -> Iterator[BlockWithTransactions]:
+        return self.follow()
+
+    def stop(self) -> None:
+        """Stops the iteration (the blocks already fetched are not yielded anymore)."""
+        self._stopped.set()
+
+    def follow(self) -> Iterator[BlockWithTransactions]:
+        self._stopped.clear()
+        checkpoint = self.load_checkpoint()
+
+        if checkpoint:
+            next_nonce = checkpoint["nonce"] + 1
+            previous_hash: Optional[bytes] = bytes.fromhex(checkpoint["hash"])
+        else:
+            next_nonce = self.start_nonce if self.start_nonce is not None else self._get_highest_available_nonce()
+            previous_hash = None
+
+        executor = self.provider.executor
+        pending: deque[tuple[int, Future[BlockWithTransactions]]] = deque()
+        highest_available_nonce = next_nonce - 1
+        num_unsaved_blocks = 0
+        last_processed: Optional[BlockOnNetwork] = None
+
+        try:
+            while not self._stopped.is_set():
+                if self.end_nonce is not None and next_nonce > self.end_nonce and not pending:
+                    break
+
+                # keep the window full
+                while len(pending) < self.options.fetch_ahead_window and self._can_schedule(next_nonce):
+                    if next_nonce > highest_available_nonce:
+                        highest_available_nonce = self._get_highest_available_nonce()
+                        if next_nonce > highest_available_nonce:
+                            break
+
+                    pending.append((next_nonce, submit_task(executor, partial(self._fetch_with_retries, next_nonce))))
+                    next_nonce += 1
+
+                if not pending:
+                    self._stopped.wait(self.options.polling_interval_in_milliseconds / ONE_SECOND_IN_MILLISECONDS)
+                    continue
+
+                # if the executor of the provider is busy, the block is fetched on the current thread
+                nonce, future = pending.popleft()
+                item = wait_or_steal(future, partial(self._fetch_with_retries, nonce))
+
+                if previous_hash is not None and item.block.previous_hash != previous_hash:
+                    raise ChainDiscontinuityError(self.shard, nonce)
+
+                yield item
+
+                previous_hash = item.block.hash
+                last_processed = item.block
+                num_unsaved_blocks += 1
+
+                if num_unsaved_blocks >= self.options.checkpoint_interval_in_blocks:
+                    self.save_checkpoint(last_processed)
+                    num_unsaved_blocks = 0
+        finally:
+            # the executor belongs to the provider, so only the blocks fetched ahead are cancelled
+            for _, future in pending:
+                future.cancel()
+
+            if last_processed and num_unsaved_blocks:
+                self.save_checkpoint(last_processed)
+
+    def fetch_block(self, nonce: int) -> BlockWithTransactions:
+        """Fetches a block (or a hyperblock), along with its transactions."""
+        if self.use_hyperblocks:
+            response = self.provider.do_get_generic(f"hyperblock/by-nonce/{nonce}")
+            raw_block: dict[str, Any] = response.get("hyperblock", {})
+            block = block_from_response(raw_block)
+            block.shard = METACHAIN_ID
+            raw_transactions: list[dict[str, Any]] = raw_block.get("transactions", []) or []
+        else:
+            response = self.provider.do_get_generic(f"block/{self.shard}/by-nonce/{nonce}", {"withTxs": "true"})
+            raw_block = response.get("block", {})
+            block = block_from_response(raw_block)
+            raw_transactions = [
+                transaction
+                for miniblock in raw_block.get("miniBlocks", []) or []
+                for transaction in miniblock.get("transactions", []) or []
+            ]
+
+        transactions = [transaction_from_proxy_response(tx.get("hash", ""), tx) for tx in raw_transactions]
+        return BlockWithTransactions(block=block, transactions=transactions)
+
+    def load_checkpoint(self) -> Optional[dict[str, Any]]:
+        if not self.checkpoint_path or not self.checkpoint_path.exists():
+            return None
+
+        checkpoint: dict[str, Any] = json.loads(self.checkpoint_path.read_text())
+        if checkpoint.get("shard") != self.shard:
+            raise ValueError(
+                f"The checkpoint {self.checkpoint_path} belongs to another shard: {checkpoint.get('shard')}"
+            )
+
+        return checkpoint
+
+    def save_checkpoint(self, block: BlockOnNetwork) -> None:
+        if not self.checkpoint_path:
+            return
+
+        checkpoint = {"shard": self.shard, "nonce": block.nonce, "hash": block.hash.hex()}
+
+        # write to a temporary file, then replace, so that the checkpoint is never left half-written
+        temporary_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        temporary_path.write_text(json.dumps(checkpoint))
+        os.replace(temporary_path, self.checkpoint_path)
+
+    def _can_schedule(self, nonce: int) -> bool:
+        return self.end_nonce is None or nonce <= self.end_nonce
+
+    def _get_highest_available_nonce(self) -> int:
+        status = self.provider.get_network_status(self.shard)
+
+        if self.options.only_final_blocks:
+            return status.highest_final_block_nonce
+        return status.block_nonce
+
+    def _fetch_with_retries(self, nonce: int) -> BlockWithTransactions:
+        delay = self.options.retry_delay_in_milliseconds / ONE_SECOND_IN_MILLISECONDS
+
+        attempt = 0
+
+        while True:
+            try:
+                return self.fetch_block(nonce)
+            except NetworkProviderError as error:
+                if attempt >= self.options.max_retries or self._stopped.is_set():
+                    raise
+
+                attempt += 1
+                logger.warning(f"Cannot fetch block {nonce} of shard {self.shard} (attempt {attempt}): {error}")
+                time.sleep(delay)
+                delay *= 2
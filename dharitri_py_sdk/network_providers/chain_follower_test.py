@@ -0,0 +1,169 @@
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+from dharitri_py_sdk.core.constants import METACHAIN_ID
+from dharitri_py_sdk.network_providers.chain_follower import ChainFollower
+from dharitri_py_sdk.network_providers.config import ChainFollowerOptions
+from dharitri_py_sdk.network_providers.errors import (
+    ChainDiscontinuityError,
+    NetworkProviderError,
+)
+from dharitri_py_sdk.network_providers.resources import NetworkStatus
+
+SENDER = "drt1c7pyyq2yaq5k7atn9z6qn5qkxwlc6zwc4vg7uuxn9ssy7evfh5jq4nm79l"
+
+
+def block_hash(nonce: int) -> str:
+    return f"{nonce:064x}"
+
+
+class FakeChain:
+    def __init__(self, highest_final_nonce: int, max_workers: int = 8) -> None:
+        self.highest_final_nonce = highest_final_nonce
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="provider")
+        self.fetching_threads: set[str] = set()
+        self.num_failures_by_nonce: dict[int, int] = {}
+        self.broken_nonce: Optional[int] = None
+        self.fetched_nonces: list[int] = []
+        self.lock = threading.Lock()
+
+    def get_network_status(self, shard: int) -> NetworkStatus:
+        return NetworkStatus(
+            raw={},
+            block_timestamp=0,
+            block_nonce=self.highest_final_nonce + 1,
+            highest_final_block_nonce=self.highest_final_nonce,
+            current_round=0,
+            current_epoch=0,
+        )
+
+    def do_get_generic(self, url: str, url_parameters: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        nonce = int(url.split("/")[-1])
+
+        # responses arrive out of order
+        time.sleep(random.random() / 100)
+
+        with self.lock:
+            if self.num_failures_by_nonce.get(nonce, 0) > 0:
+                self.num_failures_by_nonce[nonce] -= 1
+                raise NetworkProviderError(url, ConnectionError("connection reset"))
+
+            self.fetched_nonces.append(nonce)
+            self.fetching_threads.add(threading.current_thread().name.split("_")[0])
+
+        previous_hash = "ff" * 32 if nonce == self.broken_nonce else block_hash(nonce - 1)
+        transaction = {"hash": f"{nonce:064x}", "sender": SENDER, "receiver": SENDER, "nonce": nonce}
+        block = {"nonce": nonce, "shard": 1, "hash": block_hash(nonce), "prevBlockHash": previous_hash}
+
+        if url.startswith("hyperblock"):
+            return {"hyperblock": {**block, "transactions": [transaction]}}
+
+        assert url_parameters == {"withTxs": "true"}
+        return {"block": {**block, "miniBlocks": [{"transactions": [transaction]}, {}]}}
+
+
+def test_follow_blocks_in_order():
+    chain = FakeChain(highest_final_nonce=50)
+    chain.num_failures_by_nonce = {7: 2, 13: 1}
+    options = ChainFollowerOptions(fetch_ahead_window=4, retry_delay_in_milliseconds=1)
+    follower = ChainFollower(chain, shard=1, start_nonce=1, end_nonce=30, options=options)  # type: ignore
+
+    items = list(follower)
+
+    assert [item.block.nonce for item in items] == list(range(1, 31))
+    assert [item.transactions[0].nonce for item in items] == list(range(1, 31))
+    assert all(item.block.shard == 1 for item in items)
+    assert max(chain.fetched_nonces) == 30
+
+
+def test_blocks_are_fetched_on_the_executor_of_the_provider():
+    chain = FakeChain(highest_final_nonce=20, max_workers=2)
+    follower = ChainFollower(chain, shard=1, start_nonce=1, end_nonce=20)  # type: ignore
+
+    assert [item.block.nonce for item in follower] == list(range(1, 21))
+    assert "provider" in chain.fetching_threads
+
+    # the executor is shared, so it's still usable after the iteration
+    assert chain.executor.submit(lambda: 42).result() == 42
+
+    # a busy executor doesn't stall the iteration (the blocks are fetched on the current thread)
+    blocker = threading.Event()
+    for _ in range(2):
+        chain.executor.submit(blocker.wait)
+
+    follower = ChainFollower(chain, shard=1, start_nonce=1, end_nonce=5)  # type: ignore
+    assert [item.block.nonce for item in follower] == list(range(1, 6))
+    assert "MainThread" in chain.fetching_threads
+    blocker.set()
+
+
+def test_follow_hyperblocks_and_wait_for_new_blocks():
+    chain = FakeChain(highest_final_nonce=3)
+    options = ChainFollowerOptions(polling_interval_in_milliseconds=10)
+    follower = ChainFollower(chain, use_hyperblocks=True, start_nonce=1, options=options)  # type: ignore
+
+    nonces: list[int] = []
+    for item in follower:
+        nonces.append(item.block.nonce)
+        assert item.block.shard == METACHAIN_ID
+
+        if item.block.nonce == 3:
+            # new blocks are produced
+            threading.Timer(0.05, lambda: setattr(chain, "highest_final_nonce", 5)).start()
+        if item.block.nonce == 5:
+            follower.stop()
+
+    assert nonces == [1, 2, 3, 4, 5]
+    assert max(chain.fetched_nonces) == 5
+
+
+def test_resume_from_checkpoint(tmp_path: Path):
+    checkpoint_path = tmp_path / "checkpoint.json"
+    chain = FakeChain(highest_final_nonce=20)
+
+    follower = ChainFollower(chain, shard=1, start_nonce=1, end_nonce=20, checkpoint_path=checkpoint_path)  # type: ignore
+    for item in follower:
+        if item.block.nonce == 10:
+            break
+
+    # block 10 has been yielded, but not acknowledged (by asking for the next one)
+    assert json.loads(checkpoint_path.read_text()) == {"shard": 1, "nonce": 9, "hash": block_hash(9)}
+
+    items = list(ChainFollower(chain, shard=1, end_nonce=20, checkpoint_path=checkpoint_path))  # type: ignore
+    assert [item.block.nonce for item in items] == list(range(10, 21))
+    assert json.loads(checkpoint_path.read_text())["nonce"] == 20
+
+    with pytest.raises(ValueError, match="another shard"):
+        list(ChainFollower(chain, shard=0, checkpoint_path=checkpoint_path))  # type: ignore
+
+
+def test_chain_discontinuity_is_detected():
+    chain = FakeChain(highest_final_nonce=10)
+    chain.broken_nonce = 6
+    follower = ChainFollower(chain, shard=1, start_nonce=1, end_nonce=10)  # type: ignore
+
+    nonces: list[int] = []
+    with pytest.raises(ChainDiscontinuityError):
+        for item in follower:
+            nonces.append(item.block.nonce)
+
+    assert nonces == [1, 2, 3, 4, 5]
+
+
+def test_give_up_after_max_retries():
+    chain = FakeChain(highest_final_nonce=10)
+    chain.num_failures_by_nonce = {2: 10}
+    options = ChainFollowerOptions(max_retries=2, retry_delay_in_milliseconds=1)
+    follower = ChainFollower(chain, shard=1, start_nonce=1, end_nonce=10, options=options)  # type: ignore
+
+    with pytest.raises(NetworkProviderError):
+        list(follower)
+
+    assert chain.num_failures_by_nonce[2] == 7
@@ -0,0 +1,217 @@
+import logging
+import threading
+import time
+import urllib.parse
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Optional
+
+import requests
+
+from dharitri_py_sdk.network_providers.errors import CircuitOpenError
+
+logger = logging.getLogger("circuit_breaker")
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class Circuit:
+    """The state of the circuit of a single endpoint. Not thread-safe on its own (guarded by the lock of the breaker)."""
+
+    def __init__(self, endpoint: str, window_size: int) -> None:
+        self.endpoint = endpoint
+        self.state = CircuitState.CLOSED
+        self.outcomes: deque[bool] = deque(maxlen=window_size)
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probes_in_flight = 0
+        self.successful_probes = 0
+        self.num_rejected = 0
+
+    def get_bad_rate(self) -> float:
+        """The ratio of failed (or slow) calls within the window."""
+        if not self.outcomes:
+            return 0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def reset(self) -> None:
+        self.outcomes.clear()
+        self.consecutive_failures = 0
+        self.probes_in_flight = 0
+        self.successful_probes = 0
+
+
+class CircuitBreaker:
+    """
+    Client-side circuit breaker for the network providers, with one circuit per endpoint (scheme and host of the request URL).
+    A single instance can (and should) be shared among providers and threads that target the same gateway.
+
+    While the circuit of an endpoint is closed, requests flow normally. The circuit opens after `max_consecutive_failures` failures in a row,
+    or when the ratio of failed (or slow) calls within the last `window_size` calls reaches `failure_rate_threshold`.
+    While open, requests are rejected immediately with a `CircuitOpenError` (instead of waiting for the timeout of a degraded endpoint).
+    After `open_duration_in_seconds`, the circuit becomes half-open: up to `half_open_max_calls` probe requests are let through;
+    if all of them succeed, the circuit closes, otherwise it opens again.
+
+    A call fails if it raises a transport error (e.g. timeout, connection error, exhausted retries) or if it's answered with a 5xx status code.
+    Other status codes (e.g. 404 for a transaction that isn't found) are regular answers of a healthy endpoint.
+    """
+
+    def __init__(
+        self,
+        max_consecutive_failures: int = 5,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration_in_seconds: Optional[float] = None,
+        window_size: int = 20,
+        min_calls_in_window: int = 10,
+        open_duration_in_seconds: float = 10,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        """
+        Args:
+            max_consecutive_failures (int): the circuit opens after this number of failures in a row.
+            failure_rate_threshold (float): the circuit opens when the ratio of failed (or slow) calls within the window reaches this value.
+            slow_call_duration_in_seconds (Optional[float]): if set, calls lasting longer are counted as bad (within the window), even if they succeed.
+            window_size (int): the number of recent calls considered for the failure rate.
+            min_calls_in_window (int): the failure rate isn't evaluated until the window holds at least this number of calls.
+            open_duration_in_seconds (float): for how long requests are rejected, before probing the endpoint again.
+            half_open_max_calls (int): the number of probe requests (let through while half-open) that have to succeed, for the circuit to close.
+        """
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError("The failure rate threshold must be within (0, 1]")
+
+        self.max_consecutive_failures = max_consecutive_failures
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration_in_seconds = slow_call_duration_in_seconds
+        self.window_size = window_size
+        self.min_calls_in_window = min(min_calls_in_window, window_size)
+        self.open_duration_in_seconds = open_duration_in_seconds
+        self.half_open_max_calls = max(1, half_open_max_calls)
+
+        self._circuits: dict[str, Circuit] = {}
+        self._lock = threading.Lock()
+
+    def run(self, url: str, do_request: Callable[[], Any]) -> Any:
+        """Performs a request (a callable returning a `requests.Response`), unless the circuit of its endpoint is open."""
+        endpoint = get_endpoint(url)
+        is_probe = self._before_call(url, endpoint)
+        start = time.monotonic()
+
+        try:
+            response = do_request()
+        except requests.RequestException:
+            self._after_call(endpoint, is_probe, is_success=False)
+            raise
+        except BaseException:
+            # not a failure of the endpoint (e.g. a bug, or an interruption)
+            self._release_probe(endpoint, is_probe)
+            raise
+
+        duration = time.monotonic() - start
+        is_slow = self.slow_call_duration_in_seconds is not None and duration > self.slow_call_duration_in_seconds
+        is_failure = response.status_code >= 500
+        self._after_call(endpoint, is_probe, is_success=not (is_failure or is_slow), is_failure=is_failure)
+        return response
+
+    def get_state(self, url: str) -> CircuitState:
+        """Returns the state of the circuit of the endpoint of the given URL (an open circuit becomes half-open once its duration elapses)."""
+        with self._lock:
+            circuit = self._circuits.get(get_endpoint(url))
+            if circuit is None:
+                return CircuitState.CLOSED
+
+            if circuit.state == CircuitState.OPEN and self._get_remaining_open_time(circuit) <= 0:
+                return CircuitState.HALF_OPEN
+            return circuit.state
+
+    def get_num_rejected(self, url: str) -> int:
+        """Returns the number of requests rejected (so far) by the circuit of the endpoint of the given URL."""
+        with self._lock:
+            circuit = self._circuits.get(get_endpoint(url))
+            return circuit.num_rejected if circuit else 0
+
+    def _before_call(self, url: str, endpoint: str) -> bool:
+        """Raises if the request isn't allowed. Returns whether the request is a probe (of a half-open circuit)."""
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                circuit = self._circuits[endpoint] = Circuit(endpoint, self.window_size)
+
+            if circuit.state == CircuitState.OPEN and self._get_remaining_open_time(circuit) <= 0:
+                logger.info(f"Circuit of {endpoint} is half-open, probing the endpoint.")
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.reset()
+
+            if circuit.state == CircuitState.CLOSED:
+                return False
+
+            if circuit.state == CircuitState.HALF_OPEN and circuit.probes_in_flight < self.half_open_max_calls:
+                circuit.probes_in_flight += 1
+                return True
+
+            circuit.num_rejected += 1
+            retry_after = max(0.0, self._get_remaining_open_time(circuit))
+
+        raise CircuitOpenError(url, retry_after)
+
+    def _after_call(self, endpoint: str, is_probe: bool, is_success: bool, is_failure: bool = True) -> None:
+        with self._lock:
+            circuit = self._circuits[endpoint]
+
+            if is_probe:
+                circuit.probes_in_flight = max(0, circuit.probes_in_flight - 1)
+
+                if not is_success:
+                    self._open(circuit, "the probe request has failed")
+                    return
+
+                circuit.successful_probes += 1
+                if circuit.state == CircuitState.HALF_OPEN and circuit.successful_probes >= self.half_open_max_calls:
+                    logger.info(f"Circuit of {endpoint} is closed.")
+                    circuit.state = CircuitState.CLOSED
+                    circuit.reset()
+                return
+
+            # calls started before the circuit has opened don't count anymore
+            if circuit.state != CircuitState.CLOSED:
+                return
+
+            circuit.outcomes.append(is_success)
+            circuit.consecutive_failures = circuit.consecutive_failures + 1 if not is_success and is_failure else 0
+
+            if circuit.consecutive_failures >= self.max_consecutive_failures:
+                self._open(circuit, f"{circuit.consecutive_failures} consecutive failures")
+            elif (
+                len(circuit.outcomes) >= self.min_calls_in_window
+                and circuit.get_bad_rate() >= self.failure_rate_threshold
+            ):
+                self._open(circuit, f"{circuit.get_bad_rate():.0%} of the recent calls have failed (or were slow)")
+
+    def _release_probe(self, endpoint: str, is_probe: bool) -> None:
+        if not is_probe:
+            return
+
+        with self._lock:
+            circuit = self._circuits[endpoint]
+            circuit.probes_in_flight = max(0, circuit.probes_in_flight - 1)
+
+    def _open(self, circuit: Circuit, reason: str) -> None:
+        logger.warning(
+            f"Circuit of {circuit.endpoint} is open ({reason}), rejecting requests for {self.open_duration_in_seconds} seconds."
+        )
+
+        circuit.state = CircuitState.OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.reset()
+
+    def _get_remaining_open_time(self, circuit: Circuit) -> float:
+        return circuit.opened_at + self.open_duration_in_seconds - time.monotonic()
+
+
+def get_endpoint(url: str) -> str:
+    """The endpoint of a request URL: its scheme and host (e.g. "https://gateway.dharitri.org")."""
+    parsed = urllib.parse.urlsplit(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
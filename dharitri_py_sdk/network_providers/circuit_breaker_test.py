@@ -0,0 +1,192 @@
+import json
+import threading
+import time
+from typing import Any
+
+import pytest
+import requests
+
+from dharitri_py_sdk.network_providers.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
+from dharitri_py_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_py_sdk.network_providers.errors import (
+    CircuitOpenError,
+    NetworkProviderError,
+)
+from dharitri_py_sdk.network_providers.proxy_network_provider import (
+    ProxyNetworkProvider,
+)
+
+
+def create_response(status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps({"data": {"status": {"drt_nonce": 42}}, "code": "successful"}).encode()
+    return response
+
+
+class Gateway:
+    """
+    Answers with the configured status code (or fails to connect), after the configured delays (one per request, then the last one).
+    The first `num_failing_requests` requests fail to connect, as well.
+    """
+
+    def __init__(self) -> None:
+        self.status_code = 200
+        self.is_down = False
+        self.delays: list[float] = [0]
+        self.num_failing_requests = 0
+        self.num_requests = 0
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        with self._lock:
+            delay = self.delays[min(self.num_requests, len(self.delays) - 1)]
+            is_failing = self.num_requests < self.num_failing_requests
+            self.num_requests += 1
+
+        time.sleep(delay)
+
+        if self.is_down or is_failing:
+            raise requests.ConnectionError("connection refused")
+        return create_response(self.status_code)
+
+
+def test_circuit_opens_then_probes(mocker: Any):
+    gateway = Gateway()
+    mocker.patch("requests.Session.get", side_effect=gateway.get)
+
+    breaker = CircuitBreaker(max_consecutive_failures=3, open_duration_in_seconds=0.1)
+    proxy = ProxyNetworkProvider("https://gateway", config=NetworkProviderConfig(circuit_breaker=breaker))
+
+    assert proxy.get_network_status().block_nonce == 42
+
+    gateway.is_down = True
+    for _ in range(3):
+        with pytest.raises(NetworkProviderError):
+            proxy.get_network_status()
+
+    assert breaker.get_state("https://gateway/node/status") == CircuitState.OPEN
+    assert gateway.num_requests == 4
+
+    # requests are shed, without reaching the gateway
+    with pytest.raises(CircuitOpenError):
+        proxy.get_network_status()
+    assert gateway.num_requests == 4
+    assert breaker.get_num_rejected("https://gateway") == 1
+
+    # the probe fails, so the circuit opens again
+    time.sleep(0.1)
+    assert breaker.get_state("https://gateway") == CircuitState.HALF_OPEN
+    with pytest.raises(NetworkProviderError):
+        proxy.get_network_status()
+    assert breaker.get_state("https://gateway") == CircuitState.OPEN
+
+    # the probe succeeds, so the circuit closes
+    gateway.is_down = False
+    time.sleep(0.1)
+    assert proxy.get_network_status().block_nonce == 42
+    assert breaker.get_state("https://gateway") == CircuitState.CLOSED
+
+    # circuits are per endpoint
+    assert breaker.get_state("https://another-gateway") == CircuitState.CLOSED
+
+
+def test_circuit_opens_on_failure_rate_and_slow_calls():
+    breaker = CircuitBreaker(
+        max_consecutive_failures=100,
+        failure_rate_threshold=0.5,
+        slow_call_duration_in_seconds=0.02,
+        window_size=4,
+        min_calls_in_window=4,
+    )
+
+    def run(status_code: int, delay: float = 0) -> None:
+        def do_request() -> requests.Response:
+            time.sleep(delay)
+            return create_response(status_code)
+
+        breaker.run("https://gateway/network/status", do_request)
+
+    # 404 is a regular answer, while 500 is a failure
+    run(200)
+    run(404)
+    run(500)
+    assert breaker.get_state("https://gateway") == CircuitState.CLOSED
+
+    run(200, delay=0.05)
+    assert breaker.get_state("https://gateway") == CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError) as error:
+        run(200)
+    assert 0 < error.value.retry_after_in_seconds <= 10
+
+
+def test_hedging_of_get_requests(mocker: Any):
+    gateway = Gateway()
+    gateway.delays = [0.5, 0]
+    mocker.patch("requests.Session.get", side_effect=gateway.get)
+    close = mocker.spy(requests.Response, "close")
+
+    config = NetworkProviderConfig(hedging_delay_in_milliseconds=50)
+    proxy = ProxyNetworkProvider("https://gateway", config=config)
+
+    # the slow request is hedged by a second one, which answers first
+    start = time.perf_counter()
+    assert proxy.get_network_status().block_nonce == 42
+    elapsed = time.perf_counter() - start
+
+    assert gateway.num_requests == 2
+    assert elapsed < 0.3
+
+    # the response of the slow request is closed, once it arrives
+    assert close.call_count == 0
+    time.sleep(0.6)
+    assert close.call_count == 1
+
+    # the slow request fails (after a while), but the answer of the hedge is returned as soon as it arrives
+    gateway.delays = [0.5, 0]
+    gateway.num_requests = 0
+    gateway.num_failing_requests = 1
+
+    start = time.perf_counter()
+    assert proxy.get_network_status().block_nonce == 42
+    assert time.perf_counter() - start < 0.3
+    assert gateway.num_requests == 2
+
+    # fast requests aren't hedged
+    gateway.delays = [0]
+    proxy.get_network_status()
+    assert gateway.num_requests == 3
+
+
+def test_hedging_does_not_delay_concurrent_requests(mocker: Any):
+    gateway = Gateway()
+    gateway.delays = [0.1]
+    mocker.patch("requests.Session.get", side_effect=gateway.get)
+
+    config = NetworkProviderConfig(hedging_delay_in_milliseconds=200, max_workers=2)
+    proxy = ProxyNetworkProvider("https://gateway", config=config)
+
+    num_callers = 64
+    barrier = threading.Barrier(num_callers)
+
+    def call() -> None:
+        barrier.wait()
+        proxy.get_network_status()
+
+    callers = [threading.Thread(target=call) for _ in range(num_callers)]
+    start = time.perf_counter()
+
+    for caller in callers:
+        caller.start()
+    for caller in callers:
+        caller.join()
+    elapsed = time.perf_counter() - start
+
+    # the requests don't queue behind the few workers of the bulk operations (the pool of the hedged requests is sized like the pool of connections),
+    # so none of them is hedged
+    assert gateway.num_requests == num_callers
+    assert elapsed < 0.19
@@ -1,3 +1,4 @@
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from http.client import (
     BAD_GATEWAY,
@@ -7,6 +8,15 @@ from http.client import (
 )
 from typing import Any, Optional
 
+from dharitri_py_sdk.network_providers.chain_data_cache import ChainDataCache
+from dharitri_py_sdk.network_providers.circuit_breaker import CircuitBreaker
+from dharitri_py_sdk.network_providers.metrics import NetworkProviderMetrics
+from dharitri_py_sdk.network_providers.rate_limiter import RateLimit, RateLimiter
+from dharitri_py_sdk.network_providers.transaction_cost_cache import (
+    TransactionCostCache,
+)
+from dharitri_py_sdk.network_providers.transaction_notifier import ITransactionNotifier
+
 
 @dataclass
 class RequestsRetryOptions:
@@ -22,15 +32,149 @@ class RequestsRetryOptions:
     )
 
 
+@dataclass
+class MultiEndpointOptions:
+    """
+    Options of the `MultiEndpointNetworkProvider`.
+
+    Args:
+        hedged_methods (list[str]): the (idempotent) reads for which a duplicate request is sent to the next best endpoint, if the first one does not answer in time.
+        hedging_percentile (float): the latency percentile (of the primary endpoint) after which the duplicate request is sent.
+        min_samples_for_hedging (int): the number of latency samples an endpoint must have before hedging is applied.
+        latency_window_size (int): the number of recent latency samples kept for each endpoint.
+        max_consecutive_failures (int): the number of consecutive failures after which an endpoint is considered unhealthy.
+        unhealthy_cooldown_in_milliseconds (int): how long an unhealthy endpoint is avoided before being tried again.
+        error_penalty_in_milliseconds (int): added to the average latency of an endpoint (when ranking it), multiplied by its recent error rate.
+        probe_interval_in_milliseconds (int): an endpoint that hasn't been used for this long (or ever) is sent the next request, so that its statistics are refreshed.
+        max_workers (int): the maximum number of threads used for hedged requests.
+    """
+
+    hedged_methods: list[str] = field(default_factory=lambda: ["get_account", "query_contract"])
+    hedging_percentile: float = 0.95
+    min_samples_for_hedging: int = 20
+    latency_window_size: int = 100
+    max_consecutive_failures: int = 3
+    unhealthy_cooldown_in_milliseconds: int = 30000
+    error_penalty_in_milliseconds: int = 1000
+    probe_interval_in_milliseconds: int = 10000
+    max_workers: int = 8
+
+
+@dataclass
+class CachingOptions:
+    """
+    Options of the `CachingNetworkProvider`.
+
+    Args:
+        network_config_ttl_in_seconds (float): for how long the network configuration is cached.
+        network_status_ttl_in_seconds (float): for how long the network status (used to decide whether a block is final) is cached.
+        token_definitions_ttl_in_seconds (float): for how long the definitions of tokens and collections are cached.
+        query_ttl_in_rounds (int): for how many rounds the results of contract queries are cached. Set to 0 to disable caching of queries.
+    """
+
+    network_config_ttl_in_seconds: float = 3600
+    network_status_ttl_in_seconds: float = 1
+    token_definitions_ttl_in_seconds: float = 3600
+    query_ttl_in_rounds: int = 1
+
+
+@dataclass
+class ChainFollowerOptions:
+    """
+    Options of the `ChainFollower`.
+
+    Args:
+        fetch_ahead_window (int): the maximum number of blocks fetched in parallel (on the executor of the provider, see `NetworkProviderConfig.max_workers`), ahead of the block being consumed.
+        only_final_blocks (bool): whether to only follow blocks that are final (recommended, since they cannot be reverted).
+        polling_interval_in_milliseconds (int): how often to check for new blocks, once the tip of the chain is reached.
+        max_retries (int): how many times to retry fetching a block before giving up.
+        retry_delay_in_milliseconds (int): the delay between retries (doubled after each attempt).
+        checkpoint_interval_in_blocks (int): how often (in processed blocks) to save the progress to the checkpoint file.
+    """
+
+    fetch_ahead_window: int = 8
+    only_final_blocks: bool = True
+    polling_interval_in_milliseconds: int = 1000
+    max_retries: int = 5
+    retry_delay_in_milliseconds: int = 500
+    checkpoint_interval_in_blocks: int = 1
+
+
+@dataclass
+class TransactionSubmitterOptions:
+    """
+    Options of the `TransactionSubmitter`.
+
+    Args:
+        max_batch_size (int): the maximum number of transactions sent in a single `send_transactions()` call.
+        max_batch_size_in_bytes (int): the maximum size (of the JSON payload) of a batch.
+        max_batch_delay_in_milliseconds (int): how long to wait for a batch to fill up, once its first transaction is available.
+        max_queue_size (int): the maximum number of queued transactions. Once reached, `submit()` blocks (backpressure).
+        num_workers (int): the number of threads sending batches in parallel. With more than one worker, the transactions of a sender might reach the network out of order (the mempool accepts them, though).
+        rate_limit (Optional[RateLimit]): if set, the rate (in transactions per second) at which transactions are sent.
+        max_retries (int): how many times a batch is sent again after a failure (e.g. a timeout), before giving up.
+        retry_delay_in_milliseconds (int): the delay before the first retry (doubled after each attempt).
+    """
+
+    max_batch_size: int = 100
+    max_batch_size_in_bytes: int = 1024 * 1024
+    max_batch_delay_in_milliseconds: int = 50
+    max_queue_size: int = 10000
+    num_workers: int = 1
+    rate_limit: Optional[RateLimit] = None
+    max_retries: int = 3
+    retry_delay_in_milliseconds: int = 500
+
+
 class NetworkProviderConfig:
     def __init__(
         self,
         client_name: Optional[str] = None,
         requests_options: Optional[dict[str, Any]] = None,
         requests_retry_options: Optional[RequestsRetryOptions] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        max_workers: int = 8,
+        max_connections: int = 100,
+        metrics: Optional[NetworkProviderMetrics] = None,
+        transaction_notifier: Optional[ITransactionNotifier] = None,
+        chain_data_cache: Optional[ChainDataCache] = None,
+        transaction_cost_cache: Optional[TransactionCostCache] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging_delay_in_milliseconds: Optional[int] = None,
+        executor: Optional[Executor] = None,
     ) -> None:
+        """
+        Args:
+            client_name (Optional[str]): the name of the client, included in the user agent.
+            requests_options (Optional[dict[str, Any]]): extra arguments passed to `requests` (e.g. timeout, auth, headers).
+            requests_retry_options (Optional[RequestsRetryOptions]): the retry strategy for failed GET requests.
+            rate_limiter (Optional[RateLimiter]): if set, requests are throttled client-side. Share the same instance among providers (and threads) targeting the same gateway.
+            coalesce_requests (bool): if set, identical concurrent GET requests (and contract queries) are deduplicated: only one HTTP request is made, and all callers receive its result.
+            max_workers (int): the maximum number of requests issued in parallel by bulk operations (e.g. `get_accounts`).
+            max_connections (int): the size of the pool of (reused) HTTP connections. Set it to (at least) the number of threads calling the provider at the same time;
+                otherwise, the connections in excess are closed after each request (urllib3 logs "Connection pool is full"), and opened again for the next ones.
+            metrics (Optional[NetworkProviderMetrics]): if set, per-route latency, response size, JSON parsing time, status codes and retries are recorded. Share the same instance among providers to aggregate their metrics.
+            transaction_notifier (Optional[ITransactionNotifier]): if set (e.g. a `TransactionNotifier`, or a custom `BaseTransactionNotifier`), awaiting transactions relies on the events pushed by the notifier, instead of polling the gateway (polling is still used as a fallback).
+            chain_data_cache (Optional[ChainDataCache]): if set, completed transactions and final blocks (and, for a while, token definitions) are read from (and stored into) this disk-backed cache, before hitting the network.
+            transaction_cost_cache (Optional[TransactionCostCache]): if set, cost estimations are reused across similar transactions (same receiver and function, data of similar length).
+            circuit_breaker (Optional[CircuitBreaker]): if set, requests to a failing (or slow) endpoint are rejected immediately (with a `CircuitOpenError`) for a while, instead of waiting for their timeout. Share the same instance among providers targeting the same gateway.
+            hedging_delay_in_milliseconds (Optional[int]): if set, GET requests run on a pool of threads (of `max_connections` threads), and a request that isn't answered within this delay is sent once more; the first successful answer is used (the other one is discarded). It cuts the tail latency of requests stuck on a degraded node, at the expense of extra requests (a good value is the p95 latency of the gateway, e.g. as recorded by the metrics).
+            executor (Optional[Executor]): if set, it runs the parallel work of the provider (bulk operations, the parallel requests of `get_transaction` and `get_account`, the prefetching of pages), instead of a pool owned by the provider (of `max_workers` threads). Share the same instance among providers to bound the number of threads of the application. The provider never shuts it down.
+        """
         self.client_name = client_name
         self.requests_options = requests_options or {}
         self.requests_options.setdefault("timeout", 5)
         self.requests_options.setdefault("auth", tuple())
         self.requests_retry_options = requests_retry_options if requests_retry_options else RequestsRetryOptions()
+        self.rate_limiter = rate_limiter
+        self.coalesce_requests = coalesce_requests
+        self.max_workers = max_workers
+        self.max_connections = max_connections
+        self.metrics = metrics
+        self.transaction_notifier = transaction_notifier
+        self.chain_data_cache = chain_data_cache
+        self.transaction_cost_cache = transaction_cost_cache
+        self.circuit_breaker = circuit_breaker
+        self.hedging_delay_in_milliseconds = hedging_delay_in_milliseconds
+        self.executor = executor
@@ -1,6 +1,8 @@
 DEFAULT_TRANSACTION_AWAITING_POLLING_TIMEOUT_IN_MILLISECONDS = 6000
 DEFAULT_TRANSACTION_AWAITING_TIMEOUT_IN_MILLISECONDS = 15 * DEFAULT_TRANSACTION_AWAITING_POLLING_TIMEOUT_IN_MILLISECONDS
 DEFAULT_TRANSACTION_AWAITING_PATIENCE_IN_MILLISECONDS = 3000
+# after a notification, the transaction is polled (at the polling interval) up to this many times, since the gateway might lag behind the notifier
+TRANSACTION_AWAITING_POLLS_AFTER_NOTIFICATION = 5
 
 DEFAULT_ACCOUNT_AWAITING_POLLING_TIMEOUT_IN_MILLISECONDS = 6000
 DEFAULT_ACCOUNT_AWAITING_TIMEOUT_IN_MILLISECONDS = 15 * DEFAULT_TRANSACTION_AWAITING_POLLING_TIMEOUT_IN_MILLISECONDS
@@ -9,3 +11,12 @@ DEFAULT_ACCOUNT_AWAITING_PATIENCE_IN_MILLISECONDS = 0
 BASE_USER_AGENT = "dharitri-py-sdk"
 UNKNOWN_CLIENT_NAME = "unknown"
 ONE_SECOND_IN_MILLISECONDS = 1000
+
+DEFAULT_PAGE_SIZE = 100
+# the API doesn't allow "from + size" to exceed this value
+API_MAX_RESULTS_WINDOW = 10000
+# the maximum number of addresses passed to the API in a single request (e.g. "accounts?addresses=...")
+API_MAX_ADDRESSES_PER_REQUEST = 50
+
+# the size of the chunks read from streamed responses (e.g. large account storages)
+STREAMING_CHUNK_SIZE = 1 << 16
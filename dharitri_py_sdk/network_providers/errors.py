@@ -21,3 +21,22 @@ class ExpectedAccountConditionNotReachedError(Exception):
 class TransactionFetchingError(NetworkProviderError):
     def __init__(self, url: str, error: Any):
         super().__init__(url, error)
+
+
+class ChainDiscontinuityError(Exception):
+    def __init__(self, shard: int, nonce: int) -> None:
+        super().__init__(f"Block {nonce} of shard {shard} does not follow the previously processed block")
+        self.shard = shard
+        self.nonce = nonce
+
+
+class TransactionNotAcceptedError(Exception):
+    def __init__(self, transaction_hash: bytes) -> None:
+        super().__init__(f"Transaction {transaction_hash.hex()} was not accepted by the network")
+        self.transaction_hash = transaction_hash
+
+
+class CircuitOpenError(NetworkProviderError):
+    def __init__(self, url: str, retry_after_in_seconds: float) -> None:
+        super().__init__(url, f"the circuit of the endpoint is open, retry in {retry_after_in_seconds:.1f} seconds")
+        self.retry_after_in_seconds = retry_after_in_seconds
@@ -0,0 +1,136 @@
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator, Optional, Protocol, Union
+
+
+@dataclass
+class RecordedExchange:
+    """
+    A request (against the network), along with its response, as recorded by the `RecordingNetworkProvider`.
+
+    Args:
+        key (str): identifies the request (method, relative URL and query parameters). See `get_exchange_key()`.
+        data (Any): the payload of the request (for POST requests).
+        response (Any): the (JSON) data of the response, if the request succeeded.
+        error (Any): the error data, if the request failed.
+    """
+
+    key: str
+    data: Any = None
+    response: Any = None
+    error: Any = None
+
+
+# fmt: off
+class IExchangeStore(Protocol):
+    def append(self, exchange: RecordedExchange) -> None:
+        ...
+
+    def get_exchanges(self, key: str) -> list[RecordedExchange]:
+        ...
+# fmt: on
+
+
+class JsonLinesExchangeStore:
+    """
+    Stores exchanges in a JSON Lines file (one exchange per line), in the order they were recorded.
+    When opened, the existing exchanges are loaded and indexed by key.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path).expanduser()
+        self._lock = threading.Lock()
+        self._index: dict[str, list[RecordedExchange]] = {}
+
+        for exchange in self._read():
+            self._index.setdefault(exchange.key, []).append(exchange)
+
+    def append(self, exchange: RecordedExchange) -> None:
+        line = json.dumps(
+            {"key": exchange.key, "data": exchange.data, "response": exchange.response, "error": exchange.error}
+        )
+
+        with self._lock:
+            with open(self.path, "a") as file:
+                file.write(line + "\n")
+
+            self._index.setdefault(exchange.key, []).append(exchange)
+
+    def get_exchanges(self, key: str) -> list[RecordedExchange]:
+        with self._lock:
+            return list(self._index.get(key, []))
+
+    def _read(self) -> Iterator[RecordedExchange]:
+        if not self.path.exists():
+            return
+
+        with open(self.path) as file:
+            for line in file:
+                if line.strip():
+                    item = json.loads(line)
+                    yield RecordedExchange(
+                        key=item["key"], data=item.get("data"), response=item.get("response"), error=item.get("error")
+                    )
+
+
+class SQLiteExchangeStore:
+    """Stores exchanges in a SQLite file, indexed by key (suitable for large recordings, since they aren't loaded in memory)."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path).expanduser()
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS exchanges "
+            "(id INTEGER PRIMARY KEY AUTOINCREMENT, key TEXT, data TEXT, response TEXT, error TEXT)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS exchanges_key ON exchanges (key, id)")
+        self._connection.commit()
+
+    def append(self, exchange: RecordedExchange) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO exchanges (key, data, response, error) VALUES (?, ?, ?, ?)",
+                (exchange.key, _to_json(exchange.data), _to_json(exchange.response), _to_json(exchange.error)),
+            )
+            self._connection.commit()
+
+    def get_exchanges(self, key: str) -> list[RecordedExchange]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT data, response, error FROM exchanges WHERE key = ? ORDER BY id", (key,)
+            ).fetchall()
+
+        return [
+            RecordedExchange(key=key, data=_from_json(data), response=_from_json(response), error=_from_json(error))
+            for data, response, error in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM exchanges").fetchone()[0]
+
+
+def get_exchange_key(method: str, url: str, url_parameters: Optional[dict[str, Any]] = None) -> str:
+    """Identifies a request by its method, relative URL and (sorted) query parameters. The payload is stored aside."""
+    key = f"{method} {url}"
+
+    if url_parameters:
+        key += "?" + json.dumps(url_parameters, sort_keys=True, default=str)
+
+    return key
+
+
+def _to_json(value: Any) -> Optional[str]:
+    return json.dumps(value) if value is not None else None
+
+
+def _from_json(value: Optional[str]) -> Any:
+    return json.loads(value) if value is not None else None
@@ -1,5 +1,5 @@
 import base64
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Iterator, Optional, Union
 
 from dharitri_py_sdk.core.address import Address
 from dharitri_py_sdk.core.code_metadata import CodeMetadata
@@ -12,6 +12,11 @@ from dharitri_py_sdk.core.transaction_on_network import (
     TransactionOnNetwork,
 )
 from dharitri_py_sdk.core.transaction_status import TransactionStatus
+from dharitri_py_sdk.network_providers.json_stream import JsonStreamReader
+from dharitri_py_sdk.network_providers.lazy_transaction_on_network import (
+    FieldDecoder,
+    LazyTransactionOnNetwork,
+)
 from dharitri_py_sdk.network_providers.resources import (
     AccountOnNetwork,
     AccountStorage,
@@ -63,56 +68,7 @@ def vm_query_response_to_smart_contract_query_response(
 
 
 def transaction_from_api_response(tx_hash: str, response: dict[str, Any]) -> TransactionOnNetwork:
-    sender = Address.new_from_bech32(response.get("sender", ""))
-    receiver = Address.new_from_bech32(response.get("receiver", ""))
-    hash = bytes.fromhex(tx_hash)
-    nonce = response.get("nonce", -1)
-    round = response.get("round", -1)
-    epoch = response.get("epoch", -1)
-    timestamp = response.get("timestamp", 0)
-    block_hash = bytes.fromhex(response.get("blockHash", ""))
-    miniblock_hash = bytes.fromhex(response.get("miniBlockHash", ""))
-    sender_shard = response.get("senderShard", -1)
-    receiver_shard = response.get("receiverShard", -1)
-    value = int(response.get("value", 0))
-    gas_limit = response.get("gasLimit", 0)
-    gas_price = response.get("gasPrice", 0)
-    function = response.get("function", "")
-    data = base64.b64decode(response.get("data", "") or "")
-    version = response.get("version", -1)
-    options = response.get("options", -1)
-    signature = bytes.fromhex(response.get("signature", ""))
-    status = TransactionStatus(response.get("status", ""))
-    logs = transaction_logs_from_response(response.get("logs", {}))
-
-    sc_results = response.get("results", [])
-    smart_contract_results = [smart_contract_result_from_api_response(result) for result in sc_results]
-
-    return TransactionOnNetwork(
-        raw=response,
-        sender=sender,
-        receiver=receiver,
-        hash=hash,
-        nonce=nonce,
-        round=round,
-        epoch=epoch,
-        timestamp=timestamp,
-        block_hash=block_hash,
-        miniblock_hash=miniblock_hash,
-        sender_shard=sender_shard,
-        receiver_shard=receiver_shard,
-        value=value,
-        gas_limit=gas_limit,
-        gas_price=gas_price,
-        function=function,
-        data=data,
-        version=version,
-        options=options,
-        signature=signature,
-        status=status,
-        smart_contract_results=smart_contract_results,
-        logs=logs,
-    )
+    return _decode_transaction(response, _API_TRANSACTION_FIELD_DECODERS, hash=bytes.fromhex(tx_hash))
 
 
 def transaction_from_proxy_response(
@@ -120,61 +76,144 @@ def transaction_from_proxy_response(
     response: dict[str, Any],
     process_status: Optional[TransactionStatus] = None,
 ) -> "TransactionOnNetwork":
-    sender = Address.new_from_bech32(response.get("sender", ""))
-    receiver = Address.new_from_bech32(response.get("receiver", ""))
-    hash = bytes.fromhex(tx_hash)
-    nonce = response.get("nonce", -1)
-    round = response.get("round", -1)
-    epoch = response.get("epoch", -1)
-    timestamp = response.get("timestamp", 0)
-    block_hash = bytes.fromhex(response.get("blockHash", ""))
-    miniblock_hash = bytes.fromhex(response.get("miniblockHash", ""))
-    sender_shard = response.get("sourceShard", -1)
-    receiver_shard = response.get("destinationShard", -1)
-    value = int(response.get("value", 0))
-    gas_limit = response.get("gasLimit", 0)
-    gas_price = response.get("gasPrice", 0)
-    function = response.get("function", "")
-    data = base64.b64decode(response.get("data", "") or "")
-    version = response.get("version", -1)
-    options = response.get("options", -1)
-    signature = bytes.fromhex(response.get("signature", ""))
-    status = TransactionStatus(response.get("status", ""))
-    logs = transaction_logs_from_response(response.get("logs", {}))
-
-    sc_results = response.get("smartContractResults", [])
-    smart_contract_results = [smart_contract_result_from_proxy_response(result) for result in sc_results]
+    fields: dict[str, Any] = {"hash": bytes.fromhex(tx_hash)}
+    if process_status:
+        fields["status"] = process_status
+
+    return _decode_transaction(response, _PROXY_TRANSACTION_FIELD_DECODERS, **fields)
+
 
+def lazy_transaction_from_api_response(
+    tx_hash: str, response: dict[str, Any], drop_raw: bool = False
+) -> LazyTransactionOnNetwork:
+    """Same as `transaction_from_api_response`, but the fields are decoded upon first access."""
+    return LazyTransactionOnNetwork(
+        raw=response,
+        decoders=_API_TRANSACTION_FIELD_DECODERS,
+        drop_raw=drop_raw,
+        hash=bytes.fromhex(tx_hash),
+    )
+
+
+def lazy_transaction_from_proxy_response(
+    tx_hash: str,
+    response: dict[str, Any],
+    process_status: Optional[TransactionStatus] = None,
+    drop_raw: bool = False,
+) -> LazyTransactionOnNetwork:
+    """Same as `transaction_from_proxy_response`, but the fields are decoded upon first access."""
+    fields: dict[str, Any] = {"hash": bytes.fromhex(tx_hash)}
     if process_status:
-        status = process_status
+        fields["status"] = process_status
 
-    return TransactionOnNetwork(
+    return LazyTransactionOnNetwork(
         raw=response,
-        sender=sender,
-        receiver=receiver,
-        hash=hash,
-        nonce=nonce,
-        round=round,
-        epoch=epoch,
-        timestamp=timestamp,
-        block_hash=block_hash,
-        miniblock_hash=miniblock_hash,
-        sender_shard=sender_shard,
-        receiver_shard=receiver_shard,
-        value=value,
-        gas_limit=gas_limit,
-        gas_price=gas_price,
-        function=function,
-        data=data,
-        version=version,
-        options=options,
-        signature=signature,
-        status=status,
-        smart_contract_results=smart_contract_results,
-        logs=logs,
+        decoders=_PROXY_TRANSACTION_FIELD_DECODERS,
+        drop_raw=drop_raw,
+        **fields,
     )
 
 
+def _decode_transaction(
+    response: dict[str, Any], decoders: dict[str, FieldDecoder], **fields: Any
+) -> TransactionOnNetwork:
+    """Decodes all the fields of a transaction (but the ones given explicitly), using the same decoders as the lazy variant."""
+    decoded = {name: decode(response) for name, decode in decoders.items() if name not in fields}
+    return TransactionOnNetwork(raw=response, **decoded, **fields)
+
+
+def _decode_field(key: str, default: Any) -> FieldDecoder:
+    def decode(response: dict[str, Any]) -> Any:
+        return response.get(key, default)
+
+    return decode
+
+
+def _decode_sender(response: dict[str, Any]) -> Address:
+    return _convert_bech32_to_address(response.get("sender", ""))
+
+
+def _decode_receiver(response: dict[str, Any]) -> Address:
+    return _convert_bech32_to_address(response.get("receiver", ""))
+
+
+def _decode_block_hash(response: dict[str, Any]) -> bytes:
+    return bytes.fromhex(response.get("blockHash", ""))
+
+
+def _decode_api_miniblock_hash(response: dict[str, Any]) -> bytes:
+    return bytes.fromhex(response.get("miniBlockHash", ""))
+
+
+def _decode_proxy_miniblock_hash(response: dict[str, Any]) -> bytes:
+    return bytes.fromhex(response.get("miniblockHash", ""))
+
+
+def _decode_value(response: dict[str, Any]) -> int:
+    return int(response.get("value", 0))
+
+
+def _decode_data(response: dict[str, Any]) -> bytes:
+    return base64.b64decode(response.get("data", "") or "")
+
+
+def _decode_signature(response: dict[str, Any]) -> bytes:
+    return bytes.fromhex(response.get("signature", ""))
+
+
+def _decode_status(response: dict[str, Any]) -> TransactionStatus:
+    return TransactionStatus(response.get("status", ""))
+
+
+def _decode_logs(response: dict[str, Any]) -> TransactionLogs:
+    return transaction_logs_from_response(response.get("logs", {}))
+
+
+def _decode_api_smart_contract_results(response: dict[str, Any]) -> list[SmartContractResult]:
+    return [smart_contract_result_from_api_response(result) for result in response.get("results", [])]
+
+
+def _decode_proxy_smart_contract_results(response: dict[str, Any]) -> list[SmartContractResult]:
+    return [smart_contract_result_from_proxy_response(result) for result in response.get("smartContractResults", [])]
+
+
+_COMMON_TRANSACTION_FIELD_DECODERS: dict[str, FieldDecoder] = {
+    "sender": _decode_sender,
+    "receiver": _decode_receiver,
+    "nonce": _decode_field("nonce", -1),
+    "round": _decode_field("round", -1),
+    "epoch": _decode_field("epoch", -1),
+    "timestamp": _decode_field("timestamp", 0),
+    "block_hash": _decode_block_hash,
+    "value": _decode_value,
+    "gas_limit": _decode_field("gasLimit", 0),
+    "gas_price": _decode_field("gasPrice", 0),
+    "function": _decode_field("function", ""),
+    "data": _decode_data,
+    "version": _decode_field("version", -1),
+    "options": _decode_field("options", -1),
+    "signature": _decode_signature,
+    "status": _decode_status,
+    "logs": _decode_logs,
+}
+
+_API_TRANSACTION_FIELD_DECODERS: dict[str, FieldDecoder] = {
+    **_COMMON_TRANSACTION_FIELD_DECODERS,
+    "miniblock_hash": _decode_api_miniblock_hash,
+    "sender_shard": _decode_field("senderShard", -1),
+    "receiver_shard": _decode_field("receiverShard", -1),
+    "smart_contract_results": _decode_api_smart_contract_results,
+}
+
+_PROXY_TRANSACTION_FIELD_DECODERS: dict[str, FieldDecoder] = {
+    **_COMMON_TRANSACTION_FIELD_DECODERS,
+    "miniblock_hash": _decode_proxy_miniblock_hash,
+    "sender_shard": _decode_field("sourceShard", -1),
+    "receiver_shard": _decode_field("destinationShard", -1),
+    "smart_contract_results": _decode_proxy_smart_contract_results,
+}
+
+
 def transaction_logs_from_response(raw_response: dict[str, Any]) -> TransactionLogs:
     address = _convert_bech32_to_address(raw_response.get("address", ""))
 
@@ -409,7 +448,7 @@ def _get_address_or_none(address: str) -> Union[Address, None]:
 
 
 def account_from_api_response(raw_response: dict[str, Any]) -> AccountOnNetwork:
-    address = Address.new_from_bech32(raw_response.get("address", ""))
+    address = _convert_bech32_to_address(raw_response.get("address", ""))
     owner_address = _get_address_or_none(raw_response.get("ownerAddress", ""))
 
     nonce = raw_response.get("nonce", 0)
@@ -449,25 +488,50 @@ def account_storage_from_response(raw_response: dict[str, Any]) -> AccountStorag
     pairs: dict[str, Any] = raw_response.get("pairs", {})
     block_coordinates = _get_block_coordinates_from_raw_response(raw_response)
 
-    entries: list[AccountStorageEntry] = []
-    for key, value in pairs.items():
-        decoded_key = bytes.fromhex(str(key))
-        decoded_value = bytes.fromhex(str(value))
+    entries = [account_storage_entry_from_pair(key, value) for key, value in pairs.items()]
+    return AccountStorage(raw=raw_response, entries=entries, block_coordinates=block_coordinates)
 
-        entries.append(
-            AccountStorageEntry(
-                raw={key: value},
-                key=decoded_key.decode(errors="ignore"),
-                value=decoded_value,
-            )
-        )
 
-    return AccountStorage(raw=raw_response, entries=entries, block_coordinates=block_coordinates)
+def account_storage_entry_from_pair(key: str, value: str) -> AccountStorageEntry:
+    decoded_key = bytes.fromhex(str(key))
+    decoded_value = bytes.fromhex(str(value))
+
+    return AccountStorageEntry(
+        raw={key: value},
+        key=decoded_key.decode(errors="ignore"),
+        value=decoded_value,
+    )
+
+
+def account_storage_pairs_from_stream(
+    chunks: Iterable[bytes],
+    key_prefix: Optional[Union[str, bytes]] = None,
+    other_fields: Optional[dict[str, Any]] = None,
+) -> Iterator[tuple[str, str]]:
+    """
+    Incrementally parses the body of an account storage response, yielding the (hex-encoded) key-value pairs.
+    Optionally, only the pairs whose keys start with the given prefix are yielded.
+    The other fields of the response (e.g. `blockInfo`) are stored in `other_fields`, if provided.
+    """
+    prefix = key_prefix.encode() if isinstance(key_prefix, str) else key_prefix or b""
+    prefix_as_hex = prefix.hex()
+    other_fields = other_fields if other_fields is not None else {}
+
+    for key, value in JsonStreamReader(chunks).iter_object_items(["data", "pairs"], other_fields):
+        if key.startswith(prefix_as_hex):
+            yield key, value
+
+    error = other_fields.get("error")
+    if error:
+        raise ValueError(f"code:{other_fields.get('code')}, error: {error}")
 
 
 def account_storage_entry_from_response(raw_response: dict[str, Any], key: str) -> AccountStorageEntry:
     value = raw_response.get("value", "")
-    return AccountStorageEntry(raw=raw_response, key=key, value=bytes.fromhex(value))
+    block_coordinates = block_coordinates_from_response(raw_response)
+    return AccountStorageEntry(
+        raw=raw_response, key=key, value=bytes.fromhex(value), block_coordinates=block_coordinates
+    )
 
 
 def transaction_cost_estimation_from_response(raw_response: dict[str, Any]) -> TransactionCostResponse:
@@ -646,6 +710,14 @@ def _parse_value_of_token_property(value: str) -> Any:
         return int(value)
 
 
+def block_coordinates_from_response(raw_response: dict[str, Any]) -> Optional[BlockCoordinates]:
+    """Parses the `blockInfo` field of a response, if present."""
+    if not raw_response.get("blockInfo"):
+        return None
+
+    return _get_block_coordinates_from_raw_response(raw_response)
+
+
 def _get_block_coordinates_from_raw_response(raw_response: dict[str, Any]) -> BlockCoordinates:
     block_info: dict[str, Any] = raw_response.get("blockInfo", {})
 
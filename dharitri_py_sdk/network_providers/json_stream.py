@@ -0,0 +1,178 @@
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+_WHITESPACE = " \t\n\r"
+_SCALAR_END = re.compile(r"[,}\]\s]")
+# fast path for the most frequent case: a string key, mapped to a string value (without escapes)
+_STRING_ITEM = re.compile(r'\s*"([^"\\]*)"\s*:\s*"([^"\\]*)"\s*([,}])')
+_COMPACTION_THRESHOLD = 1 << 16
+
+
+class JsonStreamReader:
+    """
+    A minimal, pull-based JSON reader over a stream of chunks (e.g. the body of an HTTP response).
+    Only the data being read is held in memory (plus one chunk).
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._is_exhausted = False
+
+    def iter_object_items(
+        self, path: Sequence[str], siblings: Optional[dict[str, Any]] = None
+    ) -> Iterator[tuple[str, Any]]:
+        """
+        Yields the items of the object found at the given path (e.g. `["data", "pairs"]`), one by one.
+        The other fields of the objects along the path are parsed (and stored in `siblings`, if provided).
+        """
+        yield from self._iter_object_items_at(list(path), siblings)
+
+    def read_value(self) -> Any:
+        char = self._peek_non_whitespace()
+
+        if char == "{":
+            return dict(self._iter_object_items_at([], None))
+        if char == "[":
+            return self._read_array()
+        if char == '"':
+            return self._read_string()
+        return self._read_scalar()
+
+    def _iter_object_items_at(self, path: list[str], siblings: Optional[dict[str, Any]]) -> Iterator[tuple[str, Any]]:
+        self._expect("{")
+
+        if self._peek_non_whitespace() == "}":
+            self._position += 1
+            return
+
+        while True:
+            if not path:
+                match = _STRING_ITEM.match(self._buffer, self._position)
+                if match:
+                    self._position = match.end()
+                    yield match.group(1), match.group(2)
+
+                    if match.group(3) == "}":
+                        return
+                    self._compact()
+                    continue
+
+            key = self._read_string()
+            self._expect(":")
+
+            if not path:
+                yield key, self.read_value()
+            elif key == path[0] and self._peek_non_whitespace() == "{":
+                yield from self._iter_object_items_at(path[1:], siblings)
+            else:
+                value = self.read_value()
+                if siblings is not None:
+                    siblings[key] = value
+
+            separator = self._peek_non_whitespace()
+            self._position += 1
+
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Unexpected character in JSON object: {separator!r}")
+
+    def _read_array(self) -> list[Any]:
+        self._expect("[")
+        items: list[Any] = []
+
+        if self._peek_non_whitespace() == "]":
+            self._position += 1
+            return items
+
+        while True:
+            items.append(self.read_value())
+            separator = self._peek_non_whitespace()
+            self._position += 1
+
+            if separator == "]":
+                return items
+            if separator != ",":
+                raise ValueError(f"Unexpected character in JSON array: {separator!r}")
+
+    def _read_string(self) -> str:
+        self._expect('"')
+        start = self._position
+        search_from = start
+
+        while True:
+            end = self._buffer.find('"', search_from)
+            if end < 0:
+                search_from = len(self._buffer)
+                if not self._fill():
+                    raise ValueError("Unterminated JSON string")
+                continue
+
+            # count the preceding backslashes, to tell whether the quote is escaped
+            num_backslashes = 0
+            while self._buffer[end - 1 - num_backslashes] == "\\":
+                num_backslashes += 1
+
+            if num_backslashes % 2 == 0:
+                break
+            search_from = end + 1
+
+        raw = self._buffer[start:end]
+        self._position = end + 1
+        return json.loads(f'"{raw}"') if "\\" in raw else raw
+
+    def _read_scalar(self) -> Any:
+        while True:
+            match = _SCALAR_END.search(self._buffer, self._position)
+            if match or not self._fill():
+                break
+
+        end = match.start() if match else len(self._buffer)
+        token = self._buffer[self._position : end]
+        self._position = end
+        return json.loads(token)
+
+    def _expect(self, char: str) -> None:
+        actual = self._peek_non_whitespace()
+        if actual != char:
+            raise ValueError(f"Expected {char!r} in JSON, but found {actual!r}")
+
+        self._position += 1
+
+    def _peek_non_whitespace(self) -> str:
+        self._compact()
+
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in _WHITESPACE:
+                self._position += 1
+
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON")
+
+    def _compact(self) -> None:
+        """Drops the consumed part of the buffer (only called between tokens, so that no offsets are held)."""
+        if self._position > _COMPACTION_THRESHOLD:
+            self._buffer = self._buffer[self._position :]
+            self._position = 0
+
+    def _fill(self) -> bool:
+        """Reads the next chunk into the buffer. Returns False if the stream is exhausted."""
+        if self._is_exhausted:
+            return False
+
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self._buffer += text
+                return True
+
+        self._is_exhausted = True
+        self._buffer += self._decoder.decode(b"", final=True)
+        return False
@@ -0,0 +1,65 @@
+import json
+from typing import Any, Iterator
+
+import pytest
+
+from dharitri_py_sdk.network_providers.json_stream import JsonStreamReader
+
+
+def split_in_chunks(text: str, chunk_size: int) -> Iterator[bytes]:
+    data = text.encode()
+    for i in range(0, len(data), chunk_size):
+        yield data[i : i + chunk_size]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 16])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_object_items(chunk_size: int, indent: Any):
+    document = {
+        "data": {
+            "blockInfo": {"nonce": 42, "hash": "abcd", "extra": [1, -2.5e3, None, True, False, {"a": 'x"y\\z'}]},
+            "pairs": {f"{i:04x}": f"{i * 7:x}" for i in range(300)} | {"7a": "é\n"},
+            "after": [],
+        },
+        "error": "",
+        "code": "successful",
+    }
+    text = json.dumps(document, indent=indent, ensure_ascii=False)
+
+    other_fields: dict[str, Any] = {}
+    reader = JsonStreamReader(split_in_chunks(text, chunk_size))
+    items = list(reader.iter_object_items(["data", "pairs"], other_fields))
+
+    assert dict(items) == document["data"]["pairs"]
+    assert other_fields == {
+        "blockInfo": document["data"]["blockInfo"],
+        "after": [],
+        "error": "",
+        "code": "successful",
+    }
+
+
+def test_iter_object_items_is_lazy():
+    consumed_chunks: list[bytes] = []
+
+    def chunks() -> Iterator[bytes]:
+        for chunk in split_in_chunks(json.dumps({"pairs": {f"{i:04x}": "00" for i in range(1000)}}), 100):
+            consumed_chunks.append(chunk)
+            yield chunk
+
+    items = JsonStreamReader(chunks()).iter_object_items(["pairs"])
+    assert next(items) == ("0000", "00")
+    assert len(consumed_chunks) == 1
+
+
+def test_missing_path():
+    reader = JsonStreamReader(split_in_chunks('{"data": {"pairs": ["a"]}, "code": "ok"}', 4))
+    assert list(reader.iter_object_items(["data", "pairs"])) == []
+
+
+def test_malformed_documents():
+    with pytest.raises(ValueError):
+        list(JsonStreamReader(split_in_chunks('{"pairs": {"a": "b"', 4)).iter_object_items(["pairs"]))
+
+    with pytest.raises(ValueError):
+        list(JsonStreamReader(split_in_chunks('{"pairs": {"a" "b"}}', 4)).iter_object_items(["pairs"]))
@@ -0,0 +1,77 @@
+import dataclasses
+from typing import Any, Callable, Mapping
+
+from dharitri_py_sdk.core.transaction_on_network import TransactionOnNetwork
+
+FieldDecoder = Callable[[dict[str, Any]], Any]
+
+
+class LazyTransactionOnNetwork(TransactionOnNetwork):
+    """
+    A `TransactionOnNetwork` whose fields are decoded from the raw payload upon first access (and then memoized).
+    Useful when scanning many transactions, but only reading a few fields of each (e.g. `status`, `hash`, `function`).
+
+    If `drop_raw` is set, the raw payload is released (and `raw` becomes empty) once all the fields have been decoded.
+    """
+
+    def __init__(
+        self,
+        raw: dict[str, Any],
+        decoders: Mapping[str, FieldDecoder],
+        drop_raw: bool = False,
+        **fields: Any,
+    ) -> None:
+        self._raw_payload = raw
+        self._decoders = decoders
+        self._pending_fields = set(decoders) - set(fields)
+        self._drop_raw = drop_raw
+        self.raw = raw
+
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for attributes not yet set (i.e. fields not yet decoded)
+        if name.startswith("_") or name not in self.__dict__.get("_pending_fields", ()):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        value = self._decoders[name](self._raw_payload)
+        setattr(self, name, value)
+        self._on_field_decoded(name)
+        return value
+
+    @property
+    def is_materialized(self) -> bool:
+        return not self._pending_fields
+
+    def materialize(self, drop_raw: bool = False) -> "LazyTransactionOnNetwork":
+        """Decodes all the remaining fields. Optionally, releases the raw payload afterwards."""
+        self._drop_raw = self._drop_raw or drop_raw
+
+        for name in list(self._pending_fields):
+            getattr(self, name)
+
+        self._release_raw_if_requested()
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TransactionOnNetwork):
+            return NotImplemented
+
+        return all(getattr(self, field.name) == getattr(other, field.name) for field in dataclasses.fields(self))
+
+    def __getstate__(self) -> dict[str, Any]:
+        self.materialize()
+        return {field.name: getattr(self, field.name) for field in dataclasses.fields(self)}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(raw=state.pop("raw"), decoders={}, **state)  # type: ignore
+
+    def _on_field_decoded(self, name: str) -> None:
+        self._pending_fields.discard(name)
+        self._release_raw_if_requested()
+
+    def _release_raw_if_requested(self) -> None:
+        if self._drop_raw and not self._pending_fields:
+            self._raw_payload = {}
+            self.raw = {}
@@ -0,0 +1,83 @@
+import pickle
+from typing import Any
+
+from dharitri_py_sdk.core.transaction_status import TransactionStatus
+from dharitri_py_sdk.network_providers.http_resources import (
+    lazy_transaction_from_api_response,
+    lazy_transaction_from_proxy_response,
+    transaction_from_api_response,
+    transaction_from_proxy_response,
+)
+
+SENDER = "drt1c7pyyq2yaq5k7atn9z6qn5qkxwlc6zwc4vg7uuxn9ssy7evfh5jq4nm79l"
+CONTRACT = "drt1qqqqqqqqqqqqqpgq076flgeualrdu5jyyj60snvrh7zu4qrg05vqy7r36d"
+TX_HASH = "aa" * 32
+
+
+def create_response() -> dict[str, Any]:
+    return {
+        "sender": SENDER,
+        "receiver": CONTRACT,
+        "nonce": 7,
+        "value": "1000",
+        "function": "add",
+        "data": "YWRkQDA1",
+        "status": "success",
+        "blockHash": "bb" * 32,
+        "logs": {
+            "address": CONTRACT,
+            "events": [{"address": CONTRACT, "identifier": "add", "topics": ["AQ=="], "data": "Ag=="}],
+        },
+        "results": [{"sender": CONTRACT, "receiver": SENDER, "data": "QDZmNmI="}],
+        "smartContractResults": [{"sender": CONTRACT, "receiver": SENDER, "data": "@6f6b"}],
+    }
+
+
+def test_fields_are_decoded_upon_first_access():
+    transaction = lazy_transaction_from_api_response(TX_HASH, create_response())
+
+    assert transaction.__dict__.keys().isdisjoint({"sender", "logs", "smart_contract_results"})
+    assert transaction.status.is_successful
+    assert transaction.function == "add"
+    assert transaction.hash.hex() == TX_HASH
+    assert "logs" not in transaction.__dict__
+    assert not transaction.is_materialized
+
+    assert transaction.logs.events[0].topics == [b"\x01"]
+    assert transaction.logs is transaction.logs
+    assert transaction.sender.to_bech32() == SENDER
+
+
+def test_lazy_transaction_equals_eager_transaction():
+    response = create_response()
+
+    assert lazy_transaction_from_api_response(TX_HASH, response) == transaction_from_api_response(TX_HASH, response)
+    assert lazy_transaction_from_proxy_response(TX_HASH, response) == transaction_from_proxy_response(TX_HASH, response)
+
+    lazy = lazy_transaction_from_proxy_response(TX_HASH, response, process_status=TransactionStatus("fail"))
+    assert lazy.status.is_failed
+    assert lazy.smart_contract_results[0].data == b"@6f6b"
+
+
+def test_raw_is_dropped_once_materialized():
+    transaction = lazy_transaction_from_api_response(TX_HASH, create_response(), drop_raw=True)
+    assert transaction.raw["nonce"] == 7
+
+    transaction.materialize()
+    assert transaction.is_materialized
+    assert transaction.raw == {}
+    assert transaction.nonce == 7
+    assert transaction.value == 1000
+
+    transaction = lazy_transaction_from_api_response(TX_HASH, create_response())
+    transaction.materialize(drop_raw=True)
+    assert transaction.raw == {}
+
+
+def test_lazy_transaction_can_be_pickled():
+    transaction = lazy_transaction_from_api_response(TX_HASH, create_response())
+    restored = pickle.loads(pickle.dumps(transaction))
+
+    assert restored == transaction
+    assert restored.is_materialized
+    assert restored.receiver.to_bech32() == CONTRACT
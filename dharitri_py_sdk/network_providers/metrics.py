@@ -0,0 +1,344 @@
+import re
+import threading
+import time
+import urllib.parse
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Sequence
+
+import requests
+
+# upper bounds of the buckets of the histograms
+DEFAULT_LATENCY_BUCKETS_IN_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+DEFAULT_SIZE_BUCKETS_IN_BYTES = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+DEFAULT_PARSING_BUCKETS_IN_SECONDS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1)
+
+# status code recorded for requests that failed without a response (e.g. connection errors, timeouts)
+NO_RESPONSE_STATUS_CODE = 0
+
+# path segments followed by a (hex-encoded) storage key, which might be as short as a single byte
+_KEY_SEGMENTS = {"key", "keys"}
+
+# path segments that vary among requests to the same route (bech32 addresses, hex-encoded hashes, numbers)
+_ROUTE_PLACEHOLDERS = [
+    (re.compile(r"^[a-z]{1,10}1[02-9ac-hj-np-z]{38,}$"), "{address}"),
+    (re.compile(r"^(0x)?[0-9a-fA-F]{16,}$"), "{hex}"),
+    (re.compile(r"^\d+$"), "{number}"),
+    # token identifiers, e.g. "TOKEN-abcdef" or "NFT-abcdef-0a"
+    (re.compile(r"^[A-Z0-9]{3,10}-[0-9a-f]{6}(-[0-9a-f]+)?$"), "{token}"),
+]
+
+
+class Histogram:
+    """A histogram with fixed buckets (as in Prometheus). Not thread-safe on its own."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = list(buckets)
+        # the last count is for the values above the highest bucket
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0
+
+    def quantile(self, quantile: float) -> float:
+        """Estimates a quantile (e.g. 0.95), by linear interpolation within the bucket it falls into."""
+        if not self.count:
+            return 0
+
+        rank = quantile * self.count
+        cumulative = 0
+
+        for index, count in enumerate(self.counts):
+            if cumulative + count >= rank and count:
+                if index == len(self.buckets):
+                    return self.buckets[-1] if self.buckets else 0
+
+                lower = self.buckets[index - 1] if index else 0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / count
+
+            cumulative += count
+
+        return self.buckets[-1] if self.buckets else 0
+
+    def cumulative_counts(self) -> list[int]:
+        result: list[int] = []
+        total = 0
+
+        for count in self.counts:
+            total += count
+            result.append(total)
+
+        return result
+
+
+@dataclass
+class RouteMetrics:
+    """The metrics recorded for a route (e.g. `GET /address/{address}/key/{hex}`)."""
+
+    method: str
+    route: str
+    latency: Histogram
+    response_size: Histogram
+    parsing_duration: Histogram
+    status_codes: Counter[int] = field(default_factory=Counter)
+    num_retries: int = 0
+
+    @property
+    def num_requests(self) -> int:
+        return self.latency.count
+
+    @property
+    def num_errors(self) -> int:
+        return sum(count for status_code, count in self.status_codes.items() if not 200 <= status_code < 400)
+
+
+@dataclass
+class RouteSummary:
+    """A summary of the metrics of a route, as returned by the in-memory exporter (see `NetworkProviderMetrics.get_summaries()`)."""
+
+    method: str
+    route: str
+    num_requests: int
+    num_errors: int
+    num_retries: int
+    status_codes: dict[int, int]
+    mean_latency_in_seconds: float
+    p50_latency_in_seconds: float
+    p95_latency_in_seconds: float
+    p99_latency_in_seconds: float
+    total_response_size_in_bytes: int
+    mean_parsing_duration_in_seconds: float
+
+
+class NetworkProviderMetrics:
+    """
+    A small, thread-safe registry of HTTP metrics, to be set on `NetworkProviderConfig` (and shared among providers, if desired).
+    For each route, it records latency, response size and JSON parsing time histograms, status codes and retries.
+    Latency is measured around the HTTP request itself (waiting for the rate limiter, if any, is not included).
+    """
+
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_IN_SECONDS,
+        size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS_IN_BYTES,
+        parsing_buckets: Sequence[float] = DEFAULT_PARSING_BUCKETS_IN_SECONDS,
+    ) -> None:
+        self.latency_buckets = list(latency_buckets)
+        self.size_buckets = list(size_buckets)
+        self.parsing_buckets = list(parsing_buckets)
+        self._routes: dict[tuple[str, str], RouteMetrics] = {}
+        self._lock = threading.Lock()
+
+    def observe_request(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        duration_in_seconds: float,
+        response_size: int = 0,
+        num_retries: int = 0,
+    ) -> None:
+        with self._lock:
+            metrics = self._get_route_metrics(method, route)
+            metrics.latency.observe(duration_in_seconds)
+            metrics.response_size.observe(response_size)
+            metrics.status_codes[status_code] += 1
+            metrics.num_retries += num_retries
+
+    def observe_parsing(self, method: str, route: str, duration_in_seconds: float) -> None:
+        with self._lock:
+            self._get_route_metrics(method, route).parsing_duration.observe(duration_in_seconds)
+
+    def send_request(
+        self, method: str, url: str, do_request: Callable[[], requests.Response], is_stream: bool = False
+    ) -> requests.Response:
+        """
+        Does the request (by calling `do_request`) and records its latency, status code, response size and retries.
+        For streamed responses, the size is only known if the `Content-Length` header is present (the body isn't read here).
+        """
+        route = get_route(url)
+        start = time.perf_counter()
+
+        try:
+            response = do_request()
+        except Exception:
+            self.observe_request(method, route, NO_RESPONSE_STATUS_CODE, time.perf_counter() - start)
+            raise
+
+        duration = time.perf_counter() - start
+        self.observe_request(
+            method,
+            route,
+            response.status_code,
+            duration,
+            response_size=_get_response_size(response, is_stream),
+            num_retries=_get_num_retries(response),
+        )
+        return response
+
+    def parse_json(self, method: str, url: str, response: requests.Response) -> Any:
+        """Parses the body of the response (as JSON) and records the duration of parsing."""
+        start = time.perf_counter()
+        parsed = response.json()
+        self.observe_parsing(method, get_route(url), time.perf_counter() - start)
+        return parsed
+
+    def get_route_metrics(self) -> list[RouteMetrics]:
+        with self._lock:
+            return list(self._routes.values())
+
+    def get_summaries(self) -> list[RouteSummary]:
+        """The in-memory exporter: returns a summary of each route, the slowest routes (by p95 latency) first."""
+        with self._lock:
+            summaries = [
+                RouteSummary(
+                    method=metrics.method,
+                    route=metrics.route,
+                    num_requests=metrics.num_requests,
+                    num_errors=metrics.num_errors,
+                    num_retries=metrics.num_retries,
+                    status_codes=dict(metrics.status_codes),
+                    mean_latency_in_seconds=metrics.latency.mean(),
+                    p50_latency_in_seconds=metrics.latency.quantile(0.5),
+                    p95_latency_in_seconds=metrics.latency.quantile(0.95),
+                    p99_latency_in_seconds=metrics.latency.quantile(0.99),
+                    total_response_size_in_bytes=int(metrics.response_size.sum),
+                    mean_parsing_duration_in_seconds=metrics.parsing_duration.mean(),
+                )
+                for metrics in self._routes.values()
+            ]
+
+        return sorted(summaries, key=lambda summary: summary.p95_latency_in_seconds, reverse=True)
+
+    def to_prometheus_text(self, prefix: str = "drt_network_provider") -> str:
+        """Dumps the metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        with self._lock:
+            routes = list(self._routes.values())
+
+            histograms: list[tuple[str, str, Callable[[RouteMetrics], Histogram]]] = [
+                ("request_duration_seconds", "The latency of HTTP requests.", lambda metrics: metrics.latency),
+                ("response_size_bytes", "The size of HTTP responses.", lambda metrics: metrics.response_size),
+                (
+                    "json_parse_duration_seconds",
+                    "The duration of parsing responses.",
+                    lambda metrics: metrics.parsing_duration,
+                ),
+            ]
+
+            for name, help, get_histogram in histograms:
+                lines.append(f"# HELP {prefix}_{name} {help}")
+                lines.append(f"# TYPE {prefix}_{name} histogram")
+
+                for metrics in routes:
+                    histogram = get_histogram(metrics)
+                    labels = _format_labels(method=metrics.method, route=metrics.route)
+                    bounds = [_format_number(bucket) for bucket in histogram.buckets] + ["+Inf"]
+
+                    for bound, count in zip(bounds, histogram.cumulative_counts()):
+                        bucket_labels = _format_labels(method=metrics.method, route=metrics.route, le=bound)
+                        lines.append(f"{prefix}_{name}_bucket{bucket_labels} {count}")
+
+                    lines.append(f"{prefix}_{name}_sum{labels} {_format_number(histogram.sum)}")
+                    lines.append(f"{prefix}_{name}_count{labels} {histogram.count}")
+
+            lines.append(
+                f"# HELP {prefix}_responses_total The number of responses, by status code (0 means no response)."
+            )
+            lines.append(f"# TYPE {prefix}_responses_total counter")
+            for metrics in routes:
+                for status_code, count in sorted(metrics.status_codes.items()):
+                    labels = _format_labels(method=metrics.method, route=metrics.route, code=str(status_code))
+                    lines.append(f"{prefix}_responses_total{labels} {count}")
+
+            lines.append(f"# HELP {prefix}_retries_total The number of retried requests.")
+            lines.append(f"# TYPE {prefix}_retries_total counter")
+            for metrics in routes:
+                labels = _format_labels(method=metrics.method, route=metrics.route)
+                lines.append(f"{prefix}_retries_total{labels} {metrics.num_retries}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+    def _get_route_metrics(self, method: str, route: str) -> RouteMetrics:
+        key = (method, route)
+        metrics = self._routes.get(key)
+
+        if metrics is None:
+            metrics = RouteMetrics(
+                method=method,
+                route=route,
+                latency=Histogram(self.latency_buckets),
+                response_size=Histogram(self.size_buckets),
+                parsing_duration=Histogram(self.parsing_buckets),
+            )
+            self._routes[key] = metrics
+
+        return metrics
+
+
+@lru_cache(maxsize=4096)
+def get_route(url: str) -> str:
+    """
+    Returns the route of a URL: its path, with the variable segments (e.g. addresses, hashes, nonces) replaced by placeholders.
+    E.g. `https://gateway/address/drt1.../key/6b6579` becomes `/address/{address}/key/{hex}`.
+    """
+    path = urllib.parse.urlsplit(url).path
+    segments = path.split("/")
+    route = [_get_route_segment(segment, previous) for previous, segment in zip([""] + segments, segments)]
+    return "/".join(route)
+
+
+def _get_route_segment(segment: str, previous: str) -> str:
+    if previous in _KEY_SEGMENTS and segment:
+        return "{hex}"
+
+    for pattern, placeholder in _ROUTE_PLACEHOLDERS:
+        if pattern.match(segment):
+            return placeholder
+
+    return segment
+
+
+def _get_response_size(response: requests.Response, is_stream: bool) -> int:
+    content_length = response.headers.get("Content-Length", "")
+    if content_length.isdigit():
+        return int(content_length)
+    if is_stream:
+        return 0
+
+    return len(response.content or b"")
+
+
+def _get_num_retries(response: requests.Response) -> int:
+    # when retries are enabled (see "RequestsRetryOptions"), urllib3 records them on the raw response
+    retries = getattr(response.raw, "retries", None)
+    history = getattr(retries, "history", ())
+    return len(history) if isinstance(history, tuple) else 0
+
+
+def _format_labels(**labels: str) -> str:
+    escaped = [f'{name}="{_escape_label_value(value)}"' for name, value in labels.items()]
+    return "{" + ",".join(escaped) + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
@@ -0,0 +1,117 @@
+import json
+from typing import Any
+
+import pytest
+import requests
+
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.network_providers.api_network_provider import ApiNetworkProvider
+from dharitri_py_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_py_sdk.network_providers.errors import NetworkProviderError
+from dharitri_py_sdk.network_providers.metrics import (
+    Histogram,
+    NetworkProviderMetrics,
+    get_route,
+)
+from dharitri_py_sdk.network_providers.proxy_network_provider import (
+    ProxyNetworkProvider,
+)
+
+
+def create_response(status_code: int, body: Any) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode()
+    return response
+
+
+def test_histogram():
+    histogram = Histogram([1, 2, 4])
+
+    for value in [0.5, 1, 1.5, 3, 3, 10]:
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 2, 1]
+    assert histogram.cumulative_counts() == [2, 3, 5, 6]
+    assert histogram.count == 6
+    assert histogram.mean() == pytest.approx(19 / 6)
+    assert histogram.quantile(0.5) == pytest.approx(2)
+    assert histogram.quantile(0.75) == pytest.approx(3.5)
+    assert histogram.quantile(0.99) == 4
+    assert Histogram([1]).quantile(0.5) == 0
+
+
+def test_get_route():
+    address = "drt1qqqqqqqqqqqqqpgq076flgeualrdu5jyyj60snvrh7zu4qrg05vqy7r36d"
+    tx_hash = "2a" * 32
+
+    assert (
+        get_route(f"https://gateway/address/{address}/key/{b'some-long-key'.hex()}") == "/address/{address}/key/{hex}"
+    )
+    assert get_route(f"https://gateway/address/{address}/key/6b6579") == "/address/{address}/key/{hex}"
+    assert get_route(f"https://gateway/address/{address}/key/01") == "/address/{address}/key/{hex}"
+    assert get_route(f"https://gateway/transaction/{tx_hash}?withResults=true") == "/transaction/{hex}"
+    assert get_route("https://gateway/block/1/by-nonce/42") == "/block/{number}/by-nonce/{number}"
+    assert get_route(f"https://api/accounts/{address}/tokens/TOKEN-abcdef") == "/accounts/{address}/tokens/{token}"
+    assert get_route("https://gateway/network/config") == "/network/config"
+
+
+def test_prometheus_text():
+    metrics = NetworkProviderMetrics(latency_buckets=[0.1, 1], size_buckets=[100], parsing_buckets=[0.01])
+    metrics.observe_request("GET", "/network/config", 200, 0.05, response_size=50)
+    metrics.observe_request("GET", "/network/config", 500, 2, response_size=500, num_retries=3)
+    metrics.observe_parsing("GET", "/network/config", 0.001)
+
+    text = metrics.to_prometheus_text()
+    labels = 'method="GET",route="/network/config"'
+
+    assert "# TYPE drt_network_provider_request_duration_seconds histogram" in text
+    assert f'drt_network_provider_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+    assert f'drt_network_provider_request_duration_seconds_bucket{{{labels},le="1"}} 1' in text
+    assert f'drt_network_provider_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"drt_network_provider_request_duration_seconds_sum{{{labels}}} 2.05" in text
+    assert f"drt_network_provider_request_duration_seconds_count{{{labels}}} 2" in text
+    assert f"drt_network_provider_response_size_bytes_sum{{{labels}}} 550" in text
+    assert f"drt_network_provider_json_parse_duration_seconds_count{{{labels}}} 1" in text
+    assert f'drt_network_provider_responses_total{{{labels},code="500"}} 1' in text
+    assert f"drt_network_provider_retries_total{{{labels}}} 3" in text
+
+    metrics.reset()
+    assert metrics.get_summaries() == []
+
+
+def test_providers_record_metrics(mocker: Any):
+    metrics = NetworkProviderMetrics()
+    config = NetworkProviderConfig(metrics=metrics)
+    address = Address.new_from_bech32("drt1qqqqqqqqqqqqqpgq076flgeualrdu5jyyj60snvrh7zu4qrg05vqy7r36d")
+
+    status_body = {"data": {"status": {"drt_nonce": 1}}, "error": "", "code": "successful"}
+    mocker.patch("requests.Session.get", return_value=create_response(200, status_body))
+    proxy = ProxyNetworkProvider("https://gateway", config=config)
+    proxy.get_network_status(1)
+    proxy.get_network_status(2)
+
+    mocker.patch("requests.Session.get", return_value=create_response(404, {"error": "not found"}))
+    api = ApiNetworkProvider("https://api", config=config)
+    with pytest.raises(NetworkProviderError):
+        api.get_account(address)
+
+    mocker.patch("requests.Session.post", side_effect=requests.ConnectionError("refused"))
+    with pytest.raises(NetworkProviderError):
+        proxy.do_post_generic("transaction/send", {})
+
+    summaries = {(summary.method, summary.route): summary for summary in metrics.get_summaries()}
+
+    status = summaries[("GET", "/network/status/{number}")]
+    assert status.num_requests == 2
+    assert status.num_errors == 0
+    assert status.status_codes == {200: 2}
+    assert status.total_response_size_in_bytes == 2 * len(json.dumps(status_body))
+    assert status.mean_parsing_duration_in_seconds > 0
+
+    account = summaries[("GET", "/accounts/{address}")]
+    assert account.num_errors == 1
+    assert account.status_codes == {404: 1}
+
+    send = summaries[("POST", "/transaction/send")]
+    assert send.status_codes == {0: 1}
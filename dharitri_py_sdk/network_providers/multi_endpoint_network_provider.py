@@ -0,0 +1,455 @@
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional, Sequence, TypeVar, Union
+
+import requests
+
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.core.constants import METACHAIN_ID
+from dharitri_py_sdk.core.tokens import Token
+from dharitri_py_sdk.core.transaction import Transaction
+from dharitri_py_sdk.core.transaction_on_network import TransactionOnNetwork
+from dharitri_py_sdk.network_providers.account_awaiter import AccountAwaiter
+from dharitri_py_sdk.network_providers.config import MultiEndpointOptions
+from dharitri_py_sdk.network_providers.constants import (
+    DEFAULT_ACCOUNT_AWAITING_PATIENCE_IN_MILLISECONDS,
+    ONE_SECOND_IN_MILLISECONDS,
+)
+from dharitri_py_sdk.network_providers.errors import (
+    CircuitOpenError,
+    NetworkProviderError,
+)
+from dharitri_py_sdk.network_providers.interface import INetworkProvider
+from dharitri_py_sdk.network_providers.resources import (
+    AccountOnNetwork,
+    AccountStorage,
+    AccountStorageEntry,
+    AwaitingOptions,
+    FungibleTokenMetadata,
+    NetworkConfig,
+    NetworkStatus,
+    TokenAmountOnNetwork,
+    TokensCollectionMetadata,
+    TransactionCostResponse,
+)
+from dharitri_py_sdk.network_providers.shared import convert_tx_hash_to_string
+from dharitri_py_sdk.network_providers.transaction_awaiter import TransactionAwaiter
+from dharitri_py_sdk.smart_contracts.smart_contract_query import (
+    SmartContractQuery,
+    SmartContractQueryResponse,
+)
+
+T = TypeVar("T")
+
+logger = logging.getLogger("multi_endpoint_network_provider")
+
+
+class EndpointStats:
+    """Latency and error statistics of an endpoint. Safe to use from multiple threads."""
+
+    def __init__(self, window_size: int) -> None:
+        self._latencies: deque[float] = deque(maxlen=window_size)
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._lock = threading.Lock()
+        self.num_requests = 0
+        self.num_failures = 0
+        self.consecutive_failures = 0
+        self.last_failure_timestamp = 0.0
+        # the time of the last request (or of the last probe claimed by a caller), see `claim_probe()`
+        self.last_use_timestamp = -math.inf
+
+    def record_success(self, latency_in_seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(latency_in_seconds)
+            self._outcomes.append(True)
+            self.num_requests += 1
+            self.consecutive_failures = 0
+            self.last_use_timestamp = time.monotonic()
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._outcomes.append(False)
+            self.num_requests += 1
+            self.num_failures += 1
+            self.consecutive_failures += 1
+            self.last_failure_timestamp = time.monotonic()
+            self.last_use_timestamp = self.last_failure_timestamp
+
+    def claim_probe(self, interval_in_seconds: float) -> bool:
+        """
+        Returns True (once, among concurrent callers) if the endpoint hasn't been used for the given interval (or ever),
+        in which case the caller should send it a request, so that its statistics are refreshed.
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            if now - self.last_use_timestamp < interval_in_seconds:
+                return False
+
+            self.last_use_timestamp = now
+            return True
+
+    @property
+    def num_samples(self) -> int:
+        return len(self._latencies)
+
+    @property
+    def error_rate(self) -> float:
+        """The ratio of failed requests, over the recent requests. Zero if the endpoint wasn't used yet."""
+        with self._lock:
+            if not self._outcomes:
+                return 0.0
+            return self._outcomes.count(False) / len(self._outcomes)
+
+    @property
+    def average_latency(self) -> float:
+        """The average latency (in seconds) over the recent requests. Zero if the endpoint wasn't used yet."""
+        with self._lock:
+            if not self._latencies:
+                return 0.0
+            return sum(self._latencies) / len(self._latencies)
+
+    def get_score(self, error_penalty_in_seconds: float) -> float:
+        """
+        The lower, the better: the average latency (in seconds) over the recent requests, plus the error rate multiplied by the penalty.
+        Since both are computed over the recent requests, past errors are forgotten as the endpoint serves requests again.
+        Infinite if the endpoint wasn't used yet.
+        """
+        with self._lock:
+            if not self._outcomes:
+                return math.inf
+
+            average_latency = sum(self._latencies) / len(self._latencies) if self._latencies else 0.0
+            error_rate = self._outcomes.count(False) / len(self._outcomes)
+
+        return average_latency + error_rate * error_penalty_in_seconds
+
+    def get_latency_percentile(self, percentile: float) -> Optional[float]:
+        """Returns the given percentile (e.g. 0.95) of the recent latencies (in seconds), or None if there are no samples."""
+        with self._lock:
+            if not self._latencies:
+                return None
+            ordered = sorted(self._latencies)
+
+        index = min(len(ordered) - 1, max(0, math.ceil(percentile * len(ordered)) - 1))
+        return ordered[index]
+
+
+class Endpoint:
+    """A backend provider of a `MultiEndpointNetworkProvider`, along with its statistics."""
+
+    def __init__(self, provider: INetworkProvider, stats: EndpointStats) -> None:
+        self.provider = provider
+        self.stats = stats
+
+    @property
+    def url(self) -> str:
+        return getattr(self.provider, "url", "")
+
+    def is_healthy(self, max_consecutive_failures: int, cooldown_in_seconds: float) -> bool:
+        if self.stats.consecutive_failures < max_consecutive_failures:
+            return True
+        return time.monotonic() - self.stats.last_failure_timestamp >= cooldown_in_seconds
+
+
+class MultiEndpointNetworkProvider(INetworkProvider):
+    """
+    A network provider that holds multiple backend providers (e.g. several proxies or observers).
+
+    Requests are routed to the healthy endpoint having the best score (its recent latency, penalized by its recent error rate).
+    An endpoint that hasn't been used for a while (including new endpoints, and the ones that have cooled down after failing)
+    is probed with a request, once in a while, so that a faster endpoint is eventually found, and a recovered one is used again.
+    Upon transport errors (e.g. connection errors, timeouts, an open circuit), the request is retried against the next endpoint. For the methods listed in `MultiEndpointOptions.hedged_methods`,
+    a duplicate request is sent to the second best endpoint if the first one hasn't answered within its latency percentile.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[INetworkProvider],
+        options: Optional[MultiEndpointOptions] = None,
+    ) -> None:
+        if not providers:
+            raise ValueError("at least one provider must be specified")
+
+        self.options = options if options is not None else MultiEndpointOptions()
+        self.endpoints = [Endpoint(provider, EndpointStats(self.options.latency_window_size)) for provider in providers]
+        self._executor = ThreadPoolExecutor(max_workers=self.options.max_workers)
+
+    def close(self) -> None:
+        """Shuts down the pool of threads of the hedged requests (the backend providers aren't closed)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_network_config(self) -> NetworkConfig:
+        """Fetches the general configuration of the network."""
+        return self._call("get_network_config", lambda provider: provider.get_network_config())
+
+    def get_network_status(self, shard: int = METACHAIN_ID) -> NetworkStatus:
+        """Fetches the current status of the network."""
+        return self._call("get_network_status", lambda provider: provider.get_network_status(shard))
+
+    def get_account(self, address: Address) -> AccountOnNetwork:
+        """Fetches account information for a given address."""
+        return self._call("get_account", lambda provider: provider.get_account(address))
+
+    def get_account_storage(self, address: Address) -> AccountStorage:
+        """Fetches the storage (key-value pairs) of an account."""
+        return self._call("get_account_storage", lambda provider: provider.get_account_storage(address))
+
+    def get_account_storage_entry(self, address: Address, entry_key: str) -> AccountStorageEntry:
+        """Fetches a specific storage entry of an account."""
+        return self._call(
+            "get_account_storage_entry",
+            lambda provider: provider.get_account_storage_entry(address, entry_key),
+        )
+
+    def await_account_on_condition(
+        self,
+        address: Address,
+        condition: Callable[[AccountOnNetwork], bool],
+        options: Optional[AwaitingOptions] = None,
+    ) -> AccountOnNetwork:
+        """Waits until an account satisfies a given condition."""
+        if options is None:
+            options = AwaitingOptions(patience_in_milliseconds=DEFAULT_ACCOUNT_AWAITING_PATIENCE_IN_MILLISECONDS)
+
+        awaiter = AccountAwaiter(
+            fetcher=self,
+            polling_interval_in_milliseconds=options.polling_interval_in_milliseconds,
+            timeout_interval_in_milliseconds=options.timeout_in_milliseconds,
+            patience_time_in_milliseconds=options.patience_in_milliseconds,
+        )
+
+        return awaiter.await_on_condition(address=address, condition=condition)
+
+    def send_transaction(self, transaction: Transaction) -> bytes:
+        """
+        Broadcasts a transaction and returns its hash.
+        Broadcasting the same (signed) transaction to another endpoint, upon failure, is safe, since its hash does not change.
+        """
+        return self._call("send_transaction", lambda provider: provider.send_transaction(transaction))
+
+    def simulate_transaction(self, transaction: Transaction) -> TransactionOnNetwork:
+        """Simulates a transaction."""
+        return self._call("simulate_transaction", lambda provider: provider.simulate_transaction(transaction))
+
+    def estimate_transaction_cost(self, transaction: Transaction) -> TransactionCostResponse:
+        """Estimates the cost of a transaction."""
+        return self._call(
+            "estimate_transaction_cost",
+            lambda provider: provider.estimate_transaction_cost(transaction),
+        )
+
+    def send_transactions(self, transactions: list[Transaction]) -> tuple[int, list[bytes]]:
+        """Broadcasts multiple transactions and returns a tuple of (number of accepted transactions, list of transaction hashes)."""
+        return self._call("send_transactions", lambda provider: provider.send_transactions(transactions))
+
+    def get_transaction(self, transaction_hash: Union[bytes, str]) -> TransactionOnNetwork:
+        """Fetches a transaction that was previously broadcasted (maybe already processed by the network)."""
+        return self._call("get_transaction", lambda provider: provider.get_transaction(transaction_hash))
+
+    def await_transaction_completed(
+        self,
+        transaction_hash: Union[bytes, str],
+        options: Optional[AwaitingOptions] = None,
+    ) -> TransactionOnNetwork:
+        """Waits until the transaction is completely processed."""
+        transaction_hash = convert_tx_hash_to_string(transaction_hash)
+
+        if options is None:
+            options = AwaitingOptions()
+
+        awaiter = TransactionAwaiter(
+            fetcher=self,
+            polling_interval_in_milliseconds=options.polling_interval_in_milliseconds,
+            timeout_interval_in_milliseconds=options.timeout_in_milliseconds,
+            patience_time_in_milliseconds=options.patience_in_milliseconds,
+        )
+
+        return awaiter.await_completed(transaction_hash)
+
+    def await_transaction_on_condition(
+        self,
+        transaction_hash: Union[bytes, str],
+        condition: Callable[[TransactionOnNetwork], bool],
+        options: Optional[AwaitingOptions] = None,
+    ) -> TransactionOnNetwork:
+        """Waits until a transaction satisfies a given condition."""
+        transaction_hash = convert_tx_hash_to_string(transaction_hash)
+
+        if options is None:
+            options = AwaitingOptions()
+
+        awaiter = TransactionAwaiter(
+            fetcher=self,
+            polling_interval_in_milliseconds=options.polling_interval_in_milliseconds,
+            timeout_interval_in_milliseconds=options.timeout_in_milliseconds,
+            patience_time_in_milliseconds=options.patience_in_milliseconds,
+        )
+
+        return awaiter.await_on_condition(transaction_hash, condition)
+
+    def get_token_of_account(self, address: Address, token: Token) -> TokenAmountOnNetwork:
+        """Fetches the balance of an account, for a given token."""
+        return self._call("get_token_of_account", lambda provider: provider.get_token_of_account(address, token))
+
+    def get_fungible_tokens_of_account(self, address: Address) -> list[TokenAmountOnNetwork]:
+        """Fetches the balances of an account, for all fungible tokens held by the account."""
+        return self._call(
+            "get_fungible_tokens_of_account",
+            lambda provider: provider.get_fungible_tokens_of_account(address),
+        )
+
+    def get_non_fungible_tokens_of_account(self, address: Address) -> list[TokenAmountOnNetwork]:
+        """Fetches the balances of an account, for all non-fungible tokens held by the account."""
+        return self._call(
+            "get_non_fungible_tokens_of_account",
+            lambda provider: provider.get_non_fungible_tokens_of_account(address),
+        )
+
+    def get_definition_of_fungible_token(self, token_identifier: str) -> FungibleTokenMetadata:
+        """Fetches the definition of a fungible token."""
+        return self._call(
+            "get_definition_of_fungible_token",
+            lambda provider: provider.get_definition_of_fungible_token(token_identifier),
+        )
+
+    def get_definition_of_tokens_collection(self, collection_name: str) -> TokensCollectionMetadata:
+        """Fetches the definition of a tokens collection."""
+        return self._call(
+            "get_definition_of_tokens_collection",
+            lambda provider: provider.get_definition_of_tokens_collection(collection_name),
+        )
+
+    def query_contract(self, query: SmartContractQuery) -> SmartContractQueryResponse:
+        """Queries a smart contract."""
+        return self._call("query_contract", lambda provider: provider.query_contract(query))
+
+    def do_get_generic(self, url: str, url_parameters: Optional[dict[str, Any]] = None) -> Any:
+        """Does a generic GET request against the best endpoint."""
+        return self._call("do_get_generic", lambda provider: provider.do_get_generic(url, url_parameters))
+
+    def do_post_generic(self, url: str, data: Any, url_parameters: Optional[dict[str, Any]] = None) -> Any:
+        """Does a generic POST request against the best endpoint."""
+        return self._call("do_post_generic", lambda provider: provider.do_post_generic(url, data, url_parameters))
+
+    def get_ranked_endpoints(self) -> list[Endpoint]:
+        """
+        Returns the endpoints, best first: healthy endpoints ordered by their score (see `EndpointStats.get_score()`; endpoints without samples
+        come after the measured ones), followed by the unhealthy ones (ordered by the time of their last failure, oldest first).
+        """
+        cooldown = self.options.unhealthy_cooldown_in_milliseconds / ONE_SECOND_IN_MILLISECONDS
+        healthy: list[Endpoint] = []
+        unhealthy: list[Endpoint] = []
+
+        for endpoint in self.endpoints:
+            if endpoint.is_healthy(self.options.max_consecutive_failures, cooldown):
+                healthy.append(endpoint)
+            else:
+                unhealthy.append(endpoint)
+
+        error_penalty = self.options.error_penalty_in_milliseconds / ONE_SECOND_IN_MILLISECONDS
+        healthy.sort(key=lambda endpoint: endpoint.stats.get_score(error_penalty))
+        unhealthy.sort(key=lambda endpoint: endpoint.stats.last_failure_timestamp)
+        return healthy + unhealthy
+
+    def _call(self, method: str, call: Callable[[INetworkProvider], T]) -> T:
+        endpoints = self._probe_if_due(self.get_ranked_endpoints())
+
+        if method in self.options.hedged_methods and len(endpoints) > 1:
+            return self._call_hedged(endpoints, call)
+        return self._call_with_failover(endpoints, call)
+
+    def _probe_if_due(self, endpoints: list[Endpoint]) -> list[Endpoint]:
+        """Moves to the front a (healthy) endpoint that hasn't been used for a while, if any (the others follow, as a fallback)."""
+        cooldown = self.options.unhealthy_cooldown_in_milliseconds / ONE_SECOND_IN_MILLISECONDS
+        probe_interval = self.options.probe_interval_in_milliseconds / ONE_SECOND_IN_MILLISECONDS
+
+        for endpoint in endpoints[1:]:
+            is_healthy = endpoint.is_healthy(self.options.max_consecutive_failures, cooldown)
+
+            if is_healthy and endpoint.stats.claim_probe(probe_interval):
+                logger.debug(f"Probing endpoint [{endpoint.url}].")
+                return [endpoint] + [other for other in endpoints if other is not endpoint]
+
+        return endpoints
+
+    def _call_with_failover(self, endpoints: list[Endpoint], call: Callable[[INetworkProvider], T]) -> T:
+        last_error: Optional[Exception] = None
+
+        for endpoint in endpoints:
+            try:
+                return self._call_endpoint(endpoint, call)
+            except Exception as error:
+                if not _is_endpoint_failure(error):
+                    raise
+                logger.warning(f"Endpoint [{endpoint.url}] failed, trying the next one. Error: {error}")
+                last_error = error
+
+        assert last_error is not None
+        raise last_error
+
+    def _call_hedged(self, endpoints: list[Endpoint], call: Callable[[INetworkProvider], T]) -> T:
+        primary, secondary = endpoints[0], endpoints[1]
+
+        hedging_delay = None
+        if primary.stats.num_samples >= self.options.min_samples_for_hedging:
+            hedging_delay = primary.stats.get_latency_percentile(self.options.hedging_percentile)
+
+        if hedging_delay is None:
+            return self._call_with_failover(endpoints, call)
+
+        futures: list[Future[T]] = [self._executor.submit(self._call_endpoint, primary, call)]
+        done, _ = wait(futures, timeout=hedging_delay)
+
+        if not done:
+            futures.append(self._executor.submit(self._call_endpoint, secondary, call))
+
+        last_error: Optional[Exception] = None
+        pending = set(futures)
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    return future.result()
+                if not isinstance(error, Exception) or not _is_endpoint_failure(error):
+                    raise error
+                last_error = error
+
+        remaining = endpoints[len(futures) :]
+        if remaining:
+            return self._call_with_failover(remaining, call)
+
+        assert last_error is not None
+        raise last_error
+
+    def _call_endpoint(self, endpoint: Endpoint, call: Callable[[INetworkProvider], T]) -> T:
+        start = time.perf_counter()
+
+        try:
+            result = call(endpoint.provider)
+        except Exception as error:
+            if _is_endpoint_failure(error):
+                endpoint.stats.record_failure()
+            raise
+
+        endpoint.stats.record_success(time.perf_counter() - start)
+        return result
+
+
+def _is_endpoint_failure(error: Exception) -> bool:
+    """
+    Errors carrying a response from the server (e.g. "transaction not found") are not endpoint failures,
+    while connection errors, timeouts, exhausted retries, malformed responses or an open circuit (see `CircuitBreaker`) are.
+    """
+    if isinstance(error, CircuitOpenError):
+        return True
+    if isinstance(error, NetworkProviderError):
+        return isinstance(error.data, Exception)
+    return isinstance(error, (TimeoutError, ConnectionError, requests.RequestException))
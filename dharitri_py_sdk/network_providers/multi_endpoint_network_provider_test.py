@@ -0,0 +1,183 @@
+import time
+from typing import Any
+
+import pytest
+import requests
+
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.network_providers.circuit_breaker import CircuitBreaker
+from dharitri_py_sdk.network_providers.config import (
+    MultiEndpointOptions,
+    NetworkProviderConfig,
+)
+from dharitri_py_sdk.network_providers.errors import NetworkProviderError
+from dharitri_py_sdk.network_providers.multi_endpoint_network_provider import (
+    MultiEndpointNetworkProvider,
+)
+from dharitri_py_sdk.network_providers.proxy_network_provider import (
+    ProxyNetworkProvider,
+)
+from dharitri_py_sdk.network_providers.resources import AccountOnNetwork
+
+
+class FakeProvider:
+    def __init__(self, url: str, latency: float = 0, fails: bool = False, error_data: Any = None) -> None:
+        self.url = url
+        self.latency = latency
+        self.fails = fails
+        self.error_data = error_data if error_data is not None else requests.ConnectionError("connection refused")
+        self.num_calls = 0
+
+    def get_account(self, address: Address) -> AccountOnNetwork:
+        self.num_calls += 1
+        time.sleep(self.latency)
+
+        if self.fails:
+            raise NetworkProviderError(f"{self.url}/accounts/{address.to_bech32()}", self.error_data)
+
+        return AccountOnNetwork(raw={"url": self.url}, address=address, nonce=7, balance=0, is_guarded=False)
+
+
+class TestMultiEndpointNetworkProvider:
+    alice = Address.new_from_bech32("drt1c7pyyq2yaq5k7atn9z6qn5qkxwlc6zwc4vg7uuxn9ssy7evfh5jq4nm79l")
+
+    def test_routes_to_fastest_endpoint(self):
+        slow = FakeProvider("slow", latency=0.02)
+        fast = FakeProvider("fast")
+        provider = MultiEndpointNetworkProvider([slow, fast], MultiEndpointOptions(hedged_methods=[]))  # type: ignore
+
+        # the endpoints without samples are probed (one request each), then the fastest one is preferred
+        for _ in range(7):
+            provider.get_account(self.alice)
+
+        assert slow.num_calls == 1
+        assert fast.num_calls == 6
+        assert provider.get_ranked_endpoints()[0].url == "fast"
+
+    def test_transient_error_does_not_demote_endpoint(self):
+        provider = MultiEndpointNetworkProvider([FakeProvider("slow"), FakeProvider("fast")])  # type: ignore
+        slow, fast = provider.endpoints
+
+        for _ in range(10):
+            slow.stats.record_success(0.2)
+            fast.stats.record_success(0.001)
+        fast.stats.record_failure()
+
+        # the error is penalized, but the fast endpoint is still much faster
+        assert provider.get_ranked_endpoints()[0].url == "fast"
+
+    def test_probes_endpoints_not_used_for_a_while(self):
+        recovered = FakeProvider("recovered")
+        other = FakeProvider("other", latency=0.01)
+        options = MultiEndpointOptions(hedged_methods=[], latency_window_size=1, probe_interval_in_milliseconds=100)
+        provider = MultiEndpointNetworkProvider([recovered, other], options)  # type: ignore
+        provider.endpoints[0].stats.record_success(0.2)
+        provider.endpoints[1].stats.record_success(0.01)
+
+        for _ in range(3):
+            provider.get_account(self.alice)
+        assert (recovered.num_calls, other.num_calls) == (0, 3)
+
+        # once the interval has elapsed, the endpoint that was slow is probed; it's now the fastest, so it's preferred
+        # (in turn, the other endpoint, not used since the interval has elapsed, is probed once)
+        time.sleep(0.15)
+        for _ in range(3):
+            provider.get_account(self.alice)
+        assert (recovered.num_calls, other.num_calls) == (2, 4)
+        assert provider.get_ranked_endpoints()[0].url == "recovered"
+
+    def test_fails_over_on_transport_errors(self):
+        broken = FakeProvider("broken", fails=True)
+        healthy = FakeProvider("healthy")
+        options = MultiEndpointOptions(hedged_methods=[], max_consecutive_failures=2)
+        provider = MultiEndpointNetworkProvider([broken, healthy], options)  # type: ignore
+
+        for _ in range(5):
+            assert provider.get_account(self.alice).raw["url"] == "healthy"
+
+        # the broken endpoint is probed once, then ranked after the healthy one (its errors are penalized)
+        assert broken.num_calls == 1
+        assert provider.endpoints[0].stats.consecutive_failures == 1
+        assert provider.endpoints[0].stats.error_rate == 1
+        assert provider.get_ranked_endpoints()[0].url == "healthy"
+
+    def test_fails_over_when_circuit_is_open(self, mocker: Any):
+        def get(url: str, **kwargs: Any) -> requests.Response:
+            if url.startswith("https://first"):
+                raise requests.ConnectionError("connection refused")
+
+            response = requests.Response()
+            response.status_code = 200
+            response._content = b'{"data": {"status": {"drt_nonce": 42}}, "code": "successful"}'
+            return response
+
+        session_get = mocker.patch("requests.Session.get", side_effect=get)
+
+        breaker = CircuitBreaker(max_consecutive_failures=1, open_duration_in_seconds=60)
+        first = ProxyNetworkProvider("https://first", config=NetworkProviderConfig(circuit_breaker=breaker))
+        second = ProxyNetworkProvider("https://second")
+        provider = MultiEndpointNetworkProvider([first, second], MultiEndpointOptions(hedged_methods=[]))
+        provider.endpoints[0].stats.record_success(0.001)
+        provider.endpoints[1].stats.record_success(0.01)
+
+        # the circuit of the first endpoint opens
+        with pytest.raises(NetworkProviderError):
+            first.get_network_status()
+        assert session_get.call_count == 1
+
+        assert provider.get_network_status().block_nonce == 42
+        assert session_get.call_count == 2
+        assert provider.endpoints[0].stats.num_failures == 1
+
+    def test_does_not_fail_over_on_application_errors(self):
+        not_found = FakeProvider("first", fails=True, error_data={"error": "account not found"})
+        other = FakeProvider("second")
+        provider = MultiEndpointNetworkProvider([not_found, other], MultiEndpointOptions(hedged_methods=[]))  # type: ignore
+        provider.endpoints[0].stats.record_success(0.001)
+        provider.endpoints[1].stats.record_success(0.01)
+
+        with pytest.raises(NetworkProviderError):
+            provider.get_account(self.alice)
+
+        assert other.num_calls == 0
+        assert provider.endpoints[0].stats.num_failures == 0
+
+    def test_raises_last_error_if_all_endpoints_fail(self):
+        provider = MultiEndpointNetworkProvider(
+            [FakeProvider("a", fails=True), FakeProvider("b", fails=True)],  # type: ignore
+            MultiEndpointOptions(hedged_methods=[]),
+        )
+        provider.endpoints[0].stats.record_success(0.001)
+        provider.endpoints[1].stats.record_success(0.01)
+
+        with pytest.raises(NetworkProviderError, match="b/accounts"):
+            provider.get_account(self.alice)
+
+    def test_hedges_slow_reads(self):
+        primary = FakeProvider("primary")
+        secondary = FakeProvider("secondary", latency=0.005)
+        options = MultiEndpointOptions(min_samples_for_hedging=3)
+        provider = MultiEndpointNetworkProvider([primary, secondary], options)  # type: ignore
+        provider.endpoints[1].stats.record_success(0.005)
+
+        # build up the latency history of the primary endpoint (probed first, since it has no samples; hedging isn't applied yet)
+        for _ in range(3):
+            provider.get_account(self.alice)
+
+        assert primary.num_calls == 3
+        assert secondary.num_calls == 0
+
+        # the primary endpoint degrades: the duplicate request, sent to the secondary endpoint, wins
+        primary.latency = 0.5
+        start = time.perf_counter()
+        account = provider.get_account(self.alice)
+
+        assert account.raw["url"] == "secondary"
+        assert time.perf_counter() - start < 0.4
+
+    def test_close_shuts_down_the_executor(self):
+        provider = MultiEndpointNetworkProvider([FakeProvider("a"), FakeProvider("b")])  # type: ignore
+        provider.close()
+
+        with pytest.raises(RuntimeError):
+            provider._executor.submit(lambda: None)
@@ -1,20 +1,19 @@
+import base64
+import json
 import urllib.parse
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
-from threading import Thread
-from typing import Any, Callable, Optional, Union
-
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3 import Retry
+from concurrent.futures import TimeoutError
+from typing import Any, Callable, Optional, Sequence, Union
 
 from dharitri_py_sdk.core.address import Address
-from dharitri_py_sdk.core.config import LibraryConfig
 from dharitri_py_sdk.core.constants import DCDT_CONTRACT_ADDRESS_HEX, METACHAIN_ID
 from dharitri_py_sdk.core.tokens import Token
 from dharitri_py_sdk.core.transaction import Transaction
 from dharitri_py_sdk.core.transaction_on_network import TransactionOnNetwork
 from dharitri_py_sdk.core.transaction_status import TransactionStatus
 from dharitri_py_sdk.network_providers.account_awaiter import AccountAwaiter
+from dharitri_py_sdk.network_providers.base_http_network_provider import (
+    BaseHttpNetworkProvider,
+)
 from dharitri_py_sdk.network_providers.config import NetworkProviderConfig
 from dharitri_py_sdk.network_providers.constants import (
     BASE_USER_AGENT,
@@ -60,28 +59,25 @@ from dharitri_py_sdk.network_providers.resources import (
 from dharitri_py_sdk.network_providers.shared import (
     convert_boolean_query_params_to_lowercase,
     convert_tx_hash_to_string,
+    map_concurrently,
+    submit_task,
+    wait_or_steal,
 )
 from dharitri_py_sdk.network_providers.transaction_awaiter import TransactionAwaiter
-from dharitri_py_sdk.network_providers.user_agent import extend_user_agent
 from dharitri_py_sdk.smart_contracts.smart_contract_query import (
     SmartContractQuery,
     SmartContractQueryResponse,
 )
 
 
-class ProxyNetworkProvider(INetworkProvider):
+class ProxyNetworkProvider(BaseHttpNetworkProvider, INetworkProvider):
     def __init__(
         self,
         url: str,
         address_hrp: Optional[str] = None,
         config: Optional[NetworkProviderConfig] = None,
     ) -> None:
-        self.url = url
-        self.address_hrp = address_hrp or LibraryConfig.default_address_hrp
-        self.config = config if config is not None else NetworkProviderConfig()
-
-        self.user_agent_prefix = f"{BASE_USER_AGENT}/proxy"
-        extend_user_agent(self.user_agent_prefix, self.config)
+        super().__init__(url, address_hrp, config, f"{BASE_USER_AGENT}/proxy")
 
     def get_network_config(self) -> NetworkConfig:
         """Fetches the general configuration of the network."""
@@ -102,13 +98,23 @@ class ProxyNetworkProvider(INetworkProvider):
         """Fetches a block by nonce or by hash."""
         if block_hash:
             block_hash = block_hash.hex() if isinstance(block_hash, bytes) else block_hash
-            response = self.do_get_generic(f"block/{shard}/by-hash/{block_hash}")
+            url = f"block/{shard}/by-hash/{block_hash}"
         elif block_nonce:
-            response = self.do_get_generic(f"block/{shard}/by-nonce/{block_nonce}")
+            url = f"block/{shard}/by-nonce/{block_nonce}"
         else:
             raise Exception("Block hash or block nonce not provided.")
 
-        return block_from_response(response.get("block", {}))
+        cached = self._get_from_chain_data_cache(url)
+        if cached is not None:
+            return block_from_response(cached)
+
+        raw_block = self.do_get_generic(url).get("block", {})
+        block = block_from_response(raw_block)
+
+        if self.config.chain_data_cache is not None and self._is_block_final(block):
+            self._store_in_chain_data_cache(url, raw_block)
+
+        return block
 
     def get_latest_block(self, shard: int = METACHAIN_ID) -> BlockOnNetwork:
         """Fetches the latest block of a shard."""
@@ -120,15 +126,44 @@ class ProxyNetworkProvider(INetworkProvider):
         """Fetches account information for a given address."""
         data: dict[str, bool] = {}
 
-        get_guardian_data_thread = Thread(target=self._get_guardian_data, args=(address, data))
-        get_guardian_data_thread.start()
+        def get_guardian_data() -> None:
+            try:
+                self._get_guardian_data(address, data)
+            except NetworkProviderError:
+                pass
+
+        guardian_data_task = submit_task(self._get_executor(), get_guardian_data)
 
         response = self.do_get_generic(f"address/{address.to_bech32()}")
         account = account_from_proxy_response(response.to_dictionary())
 
-        get_guardian_data_thread.join(timeout=2)
+        try:
+            wait_or_steal(guardian_data_task, get_guardian_data, timeout=2)
+        except TimeoutError:
+            pass
+
         account.is_guarded = data.get("is_guarded", False)
+        return account
 
+    def get_accounts(self, addresses: Sequence[Address]) -> list[Union[AccountOnNetwork, NetworkProviderError]]:
+        """
+        Fetches multiple accounts, in parallel (see `NetworkProviderConfig.max_workers`).
+        The results are returned in the order of the addresses. If an account cannot be fetched, the error is returned in its place.
+        """
+        return map_concurrently(self._get_executor(), self._get_account_and_guardian_data, addresses)
+
+    def _get_account_and_guardian_data(self, address: Address) -> AccountOnNetwork:
+        data: dict[str, bool] = {}
+
+        response = self.do_get_generic(f"address/{address.to_bech32()}")
+        account = account_from_proxy_response(response.to_dictionary())
+
+        try:
+            self._get_guardian_data(address, data)
+        except NetworkProviderError:
+            pass
+
+        account.is_guarded = data.get("is_guarded", False)
         return account
 
     def _get_guardian_data(self, address: Address, return_data: dict[str, bool]):
@@ -149,6 +184,12 @@ class ProxyNetworkProvider(INetworkProvider):
         response = self.do_get_generic(f"address/{address.to_bech32()}/key/{key_as_hex}")
         return account_storage_entry_from_response(response.to_dictionary(), entry_key)
 
+    def get_pending_nonces_of_account(self, address: Address) -> list[int]:
+        """Fetches the nonces of the transactions of an account that are waiting in the mempool (sorted)."""
+        response = self.do_get_generic("transaction/pool", {"by-sender": address.to_bech32(), "fields": "nonce"})
+        transactions = response.get("txPool", {}).get("transactions") or []
+        return sorted(int(transaction.get("txFields", {}).get("nonce", 0)) for transaction in transactions)
+
     def await_account_on_condition(
         self,
         address: Address,
@@ -183,8 +224,7 @@ class ProxyNetworkProvider(INetworkProvider):
         response = self.do_post_generic(url, transaction.to_dictionary())
         return transaction_from_simulate_response(transaction, response.to_dictionary().get("result", {}))
 
-    def estimate_transaction_cost(self, transaction: Transaction) -> TransactionCostResponse:
-        """Estimates the cost of a transaction."""
+    def _fetch_transaction_cost(self, transaction: Transaction) -> TransactionCostResponse:
         response = self.do_post_generic("transaction/cost", transaction.to_dictionary())
         return transaction_cost_estimation_from_response(response.to_dictionary())
 
@@ -202,25 +242,40 @@ class ProxyNetworkProvider(INetworkProvider):
         """Fetches a transaction that was previously broadcasted (maybe already processed by the network)."""
         transaction_hash = convert_tx_hash_to_string(transaction_hash)
 
+        cached = self._get_from_chain_data_cache(f"transaction/{transaction_hash}")
+        if cached is not None:
+            return transaction_from_proxy_response(
+                transaction_hash, cached["transaction"], TransactionStatus(cached["status"])
+            )
+
         def get_tx() -> dict[str, Any]:
             url = f"transaction/{transaction_hash}?withResults=true"
             return self.do_get_generic(url).get("transaction", "")
 
-        status_task = None
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            try:
-                status_task = executor.submit(self.get_transaction_status, transaction_hash)
-                tx_task = executor.submit(get_tx)
+        def get_status() -> TransactionStatus:
+            return self.get_transaction_status(transaction_hash)
 
-                process_status = status_task.result(timeout=5)
-                tx = tx_task.result(timeout=5)
+        # the status is fetched in parallel (on the executor of the provider), while the transaction is fetched on the current thread
+        status_task = submit_task(self._get_executor(), get_status)
 
-            except TimeoutError:
-                raise TimeoutError("Fetching transaction or process status timed out")
-            except NetworkProviderError as ge:
-                raise TransactionFetchingError(ge.url, ge.data)
+        try:
+            tx = get_tx()
+            process_status = wait_or_steal(status_task, get_status, timeout=5)
+        except TimeoutError:
+            raise TimeoutError("Fetching transaction or process status timed out")
+        except NetworkProviderError as ge:
+            raise TransactionFetchingError(ge.url, ge.data)
+        finally:
+            status_task.cancel()
+
+        transaction = transaction_from_proxy_response(transaction_hash, tx, process_status)
+
+        if transaction.status.is_completed:
+            self._store_in_chain_data_cache(
+                f"transaction/{transaction_hash}", {"transaction": tx, "status": process_status.status}
+            )
 
-        return transaction_from_proxy_response(transaction_hash, tx, process_status)
+        return transaction
 
     def await_transaction_completed(
         self,
@@ -238,6 +293,7 @@ class ProxyNetworkProvider(INetworkProvider):
             polling_interval_in_milliseconds=options.polling_interval_in_milliseconds,
             timeout_interval_in_milliseconds=options.timeout_in_milliseconds,
             patience_time_in_milliseconds=options.patience_in_milliseconds,
+            notifier=self.config.transaction_notifier,
         )
 
         return awaiter.await_completed(transaction_hash)
@@ -259,6 +315,7 @@ class ProxyNetworkProvider(INetworkProvider):
             polling_interval_in_milliseconds=options.polling_interval_in_milliseconds,
             timeout_interval_in_milliseconds=options.timeout_in_milliseconds,
             patience_time_in_milliseconds=options.patience_in_milliseconds,
+            notifier=self.config.transaction_notifier,
         )
 
         return awaiter.await_on_condition(transaction_hash, condition)
@@ -297,36 +354,46 @@ class ProxyNetworkProvider(INetworkProvider):
 
     def get_definition_of_fungible_token(self, token_identifier: str) -> FungibleTokenMetadata:
         """Fetches the definition of a fungible token."""
-        encoded_identifier = token_identifier.encode()
-        query = SmartContractQuery(
-            contract=Address.new_from_hex(DCDT_CONTRACT_ADDRESS_HEX, self.address_hrp),
-            function="getTokenProperties",
-            arguments=[encoded_identifier],
-        )
-        query_response = self.query_contract(query)
-
         return definition_of_fungible_token_from_query_response(
-            query_response.return_data_parts, token_identifier, self.address_hrp
+            self._get_token_properties(token_identifier), token_identifier, self.address_hrp
         )
 
     def get_definition_of_tokens_collection(self, collection_name: str) -> TokensCollectionMetadata:
         """Fetches the definition of a tokens collection."""
-        encoded_identifier = collection_name.encode()
+        return definition_of_tokens_collection_from_query_response(
+            self._get_token_properties(collection_name), collection_name, self.address_hrp
+        )
+
+    def _get_token_properties(self, token_identifier: str) -> list[bytes]:
+        url = f"token-properties/{token_identifier}"
+        cached = self._get_from_chain_data_cache(url)
+        if cached is not None:
+            return [base64.b64decode(part) for part in cached["returnDataParts"]]
+
         query = SmartContractQuery(
             contract=Address.new_from_hex(DCDT_CONTRACT_ADDRESS_HEX, self.address_hrp),
             function="getTokenProperties",
-            arguments=[encoded_identifier],
+            arguments=[token_identifier.encode()],
         )
-        query_response = self.query_contract(query)
+        return_data_parts = self.query_contract(query).return_data_parts
 
-        return definition_of_tokens_collection_from_query_response(
-            query_response.return_data_parts, collection_name, self.address_hrp
-        )
+        if return_data_parts:
+            self._store_token_definition_in_chain_data_cache(
+                url, {"returnDataParts": [base64.b64encode(part).decode() for part in return_data_parts]}
+            )
+
+        return return_data_parts
 
     def query_contract(self, query: SmartContractQuery) -> SmartContractQueryResponse:
         """Queries a smart contract."""
         request = smart_contract_query_to_vm_query_request(query)
-        response = self.do_post_generic("vm-values/query", request)
+
+        if self.config.coalesce_requests:
+            key = ("vm-values/query", json.dumps(request, sort_keys=True))
+            response = self._single_flight.do(key, lambda: self.do_post_generic("vm-values/query", request))
+        else:
+            response = self.do_post_generic("vm-values/query", request)
+
         response = response.get("data", "")
 
         return vm_query_response_to_smart_contract_query_response(response, query.function)
@@ -347,6 +414,9 @@ class ProxyNetworkProvider(INetworkProvider):
             params = urllib.parse.urlencode(url_parameters)
             url = f"{url}?{params}"
 
+        if self.config.coalesce_requests:
+            return self._single_flight.do(url, lambda: self._do_get(url))
+
         response = self._do_get(url)
         return response
 
@@ -362,46 +432,6 @@ class ProxyNetworkProvider(INetworkProvider):
         response = self._do_post(url, data)
         return response
 
-    def _do_get(self, url: str) -> GenericResponse:
-        try:
-            retry_strategy = Retry(
-                total=self.config.requests_retry_options.retries,
-                backoff_factor=self.config.requests_retry_options.backoff_factor,
-                status_forcelist=self.config.requests_retry_options.status_forcelist,
-            )
-
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-
-            with requests.Session() as session:
-                session.mount("https://", adapter)
-                session.mount("http://", adapter)
-                response = session.get(url, **self.config.requests_options)
-
-            response.raise_for_status()
-            parsed = response.json()
-            return self._get_data(parsed, url)
-        except requests.HTTPError as err:
-            error_data = self._extract_error_from_response(err.response)
-            raise NetworkProviderError(url, error_data)
-        except requests.ConnectionError as err:
-            raise NetworkProviderError(url, err)
-        except Exception as err:
-            raise NetworkProviderError(url, err)
-
-    def _do_post(self, url: str, payload: Any) -> GenericResponse:
-        try:
-            response = requests.post(url, json=payload, **self.config.requests_options)
-            response.raise_for_status()
-            parsed = response.json()
-            return self._get_data(parsed, url)
-        except requests.HTTPError as err:
-            error_data = self._extract_error_from_response(err.response)
-            raise NetworkProviderError(url, error_data)
-        except requests.ConnectionError as err:
-            raise NetworkProviderError(url, err)
-        except Exception as err:
-            raise NetworkProviderError(url, err)
-
     def _get_data(self, parsed: dict[str, Any], url: str) -> GenericResponse:
         err = parsed.get("error")
         code = parsed.get("code")
@@ -411,9 +441,3 @@ class ProxyNetworkProvider(INetworkProvider):
 
         data: dict[str, Any] = parsed.get("data", dict())
         return GenericResponse(data)
-
-    def _extract_error_from_response(self, response: Any):
-        try:
-            return response.json()
-        except Exception:
-            return response.text
@@ -1,3 +1,6 @@
+import json
+from typing import Any
+
 import pytest
 import requests
 
@@ -11,6 +14,7 @@ from dharitri_py_sdk.core import (
 )
 from dharitri_py_sdk.network_providers.config import NetworkProviderConfig
 from dharitri_py_sdk.network_providers.constants import BASE_USER_AGENT
+from dharitri_py_sdk.network_providers.errors import NetworkProviderError
 from dharitri_py_sdk.network_providers.http_resources import block_from_response
 from dharitri_py_sdk.network_providers.proxy_network_provider import ProxyNetworkProvider
 from dharitri_py_sdk.network_providers.resources import TokenAmountOnNetwork
@@ -424,3 +428,101 @@ class TestProxy:
         response = requests.get(proxy.url + "/network/config", **config.requests_options)
         headers = response.request.headers
         assert headers.get("User-Agent") == "dharitri-py-sdk/proxy/test-client"
+
+
+class TestProxyBulk:
+    def test_get_accounts(self, mocker: Any):
+        alice = Address.new_from_bech32("drt1c7pyyq2yaq5k7atn9z6qn5qkxwlc6zwc4vg7uuxn9ssy7evfh5jq4nm79l")
+        bob = Address.new_from_bech32("drt1qqqqqqqqqqqqqpgq076flgeualrdu5jyyj60snvrh7zu4qrg05vqy7r36d")
+
+        def get(url: str, **kwargs: Any) -> Any:
+            response = mocker.Mock()
+            response.status_code = 200
+
+            if bob.to_bech32() in url:
+                response.raise_for_status.side_effect = requests.HTTPError(response=response)
+                response.json.return_value = {"error": "internal issue"}
+            elif url.endswith("/guardian-data"):
+                response.json.return_value = {"data": {"guardianData": {"guarded": True}}}
+            else:
+                response.json.return_value = {
+                    "data": {"account": {"address": alice.to_bech32(), "nonce": 7, "balance": "1000"}}
+                }
+
+            return response
+
+        session_get = mocker.patch("requests.Session.get", side_effect=get)
+        proxy = ProxyNetworkProvider("https://gateway", config=NetworkProviderConfig(max_workers=4))
+
+        results = proxy.get_accounts([alice, bob, alice])
+
+        assert session_get.call_count == 5
+        assert isinstance(results[1], NetworkProviderError)
+        assert results[0] == results[2]
+
+        account = results[0]
+        assert not isinstance(account, NetworkProviderError)
+        assert account.address == alice
+        assert account.nonce == 7
+        assert account.balance == 1000
+        assert account.is_guarded
+
+        # the HTTP session (and its connections) and the executor are reused
+        assert proxy._get_session() is proxy._get_session()
+        assert proxy._get_executor() is proxy._get_executor()
+
+    def test_iter_account_storage(self, mocker: Any):
+        address = Address.new_from_bech32("drt1qqqqqqqqqqqqqpgq076flgeualrdu5jyyj60snvrh7zu4qrg05vqy7r36d")
+        pairs = {b"sum".hex(): "2a", b"user1".hex(): "01", b"user2".hex(): "02"}
+        body = json.dumps({"data": {"blockInfo": {"nonce": 7}, "pairs": pairs}, "error": "", "code": "successful"})
+
+        response = mocker.MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.side_effect = lambda chunk_size: (
+            body[i : i + 8].encode() for i in range(0, len(body), 8)
+        )
+        session_get = mocker.patch("requests.Session.get", return_value=response)
+
+        proxy = ProxyNetworkProvider("https://gateway")
+        entries = list(proxy.iter_account_storage(address, key_prefix="user"))
+
+        assert session_get.call_args.kwargs["stream"]
+        assert [(entry.key, entry.value) for entry in entries] == [("user1", b"\x01"), ("user2", b"\x02")]
+        response.__exit__.assert_called_once()
+
+        snapshot = proxy.get_account_storage_snapshot(address)
+        assert len(snapshot) == 3
+        assert snapshot.get("sum") == b"\x2a"
+        assert snapshot.block_coordinates is not None
+        assert snapshot.block_coordinates.nonce == 7
+
+        response.iter_content.side_effect = lambda chunk_size: iter(
+            [b'{"data": null, "error": "not found", "code": "x"}']
+        )
+        with pytest.raises(NetworkProviderError, match="not found"):
+            list(proxy.iter_account_storage(address))
+
+    def test_get_pending_nonces_of_account(self, mocker: Any):
+        alice = Address.new_from_bech32("drt1c7pyyq2yaq5k7atn9z6qn5qkxwlc6zwc4vg7uuxn9ssy7evfh5jq4nm79l")
+
+        response = mocker.Mock()
+        response.status_code = 200
+        response.json.return_value = {
+            "data": {"txPool": {"transactions": [{"txFields": {"nonce": 9}}, {"txFields": {"nonce": 8}}]}},
+            "code": "successful",
+        }
+        session_get = mocker.patch("requests.Session.get", return_value=response)
+
+        proxy = ProxyNetworkProvider("https://gateway")
+
+        assert proxy.get_pending_nonces_of_account(alice) == [8, 9]
+        assert session_get.call_args.args[0] == (
+            f"https://gateway/transaction/pool?by-sender={alice.to_bech32()}&fields=nonce"
+        )
+
+    def test_connection_pool_is_sized_independently_of_workers(self):
+        config = NetworkProviderConfig(max_workers=2, max_connections=500)
+        proxy = ProxyNetworkProvider("https://gateway", config=config)
+
+        adapter = proxy._get_session().get_adapter("https://gateway")
+        assert adapter._pool_maxsize == 500  # type: ignore
@@ -0,0 +1,165 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http.client import TOO_MANY_REQUESTS
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger("rate_limiter")
+
+
+@dataclass
+class RateLimit:
+    """
+    Args:
+        requests_per_second (float): the sustained rate.
+        burst (Optional[int]): the number of requests that can be sent at once (the capacity of the bucket). Defaults to one second worth of requests.
+    """
+
+    requests_per_second: float
+    burst: Optional[int] = None
+
+
+class TokenBucket:
+    """A thread-safe token bucket. If no rate limit is given, the bucket never runs out of tokens, but can still be paused."""
+
+    def __init__(self, limit: Optional[RateLimit] = None) -> None:
+        self.limit = limit
+        self.capacity = float(max(1, limit.burst or int(limit.requests_per_second))) if limit else 0.0
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until a token is available (and the bucket isn't paused), then consumes it."""
+        while True:
+            delay = self._try_acquire()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """No tokens are handed out for the given duration (e.g. as requested by a `Retry-After` header)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+            self._last_refill = self._paused_until
+
+    def _try_acquire(self) -> float:
+        """Returns 0 if a token has been consumed, otherwise the number of seconds to wait before trying again."""
+        with self._lock:
+            now = time.monotonic()
+
+            if now < self._paused_until:
+                return self._paused_until - now
+
+            if self.limit is None:
+                return 0
+
+            elapsed = now - self._last_refill
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.limit.requests_per_second)
+            self._last_refill = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+
+            return (1 - self._tokens) / self.limit.requests_per_second
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter for the network providers, with a global budget and (optional) budgets per route.
+    A single instance can (and should) be shared among providers and threads that target the same gateway.
+
+    Routes are matched as substrings of the request URL (e.g. "vm-values/query", "transaction/send"); the longest matching route wins.
+    When the server answers with "429 Too Many Requests", the budgets of the request are paused for the duration indicated by
+    the `Retry-After` header (or `default_retry_after_in_seconds`), then the request is retried.
+    """
+
+    def __init__(
+        self,
+        global_limit: Optional[RateLimit] = None,
+        route_limits: Optional[dict[str, RateLimit]] = None,
+        max_retries_on_throttling: int = 3,
+        default_retry_after_in_seconds: float = 1,
+    ) -> None:
+        self.max_retries_on_throttling = max_retries_on_throttling
+        self.default_retry_after_in_seconds = default_retry_after_in_seconds
+
+        self._global_bucket = TokenBucket(global_limit)
+        self._route_buckets = {route: TokenBucket(limit) for route, limit in (route_limits or {}).items()}
+        self._routes_by_length = sorted(self._route_buckets, key=len, reverse=True)
+
+        self._queue_depth = 0
+        self._queue_depth_lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of requests currently waiting for a token."""
+        return self._queue_depth
+
+    def acquire(self, url: str) -> None:
+        """Blocks until the request is allowed by both the route budget (if any) and the global budget."""
+        with self._queue_depth_lock:
+            self._queue_depth += 1
+
+        try:
+            for bucket in self._get_buckets(url):
+                bucket.acquire()
+        finally:
+            with self._queue_depth_lock:
+                self._queue_depth -= 1
+
+    def pause(self, url: str, seconds: float) -> None:
+        for bucket in self._get_buckets(url):
+            bucket.pause(seconds)
+
+    def run(self, url: str, do_request: Callable[[], Any]) -> Any:
+        """Performs a request (a callable returning a `requests.Response`) within the rate limits, retrying it when throttled."""
+        retries = 0
+
+        while True:
+            self.acquire(url)
+            response = do_request()
+
+            if response.status_code != TOO_MANY_REQUESTS or retries >= self.max_retries_on_throttling:
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            delay = retry_after if retry_after is not None else self.default_retry_after_in_seconds
+            logger.warning(f"Throttled by the server, retrying in {delay} seconds. Url = [{url}]")
+
+            self.pause(url, delay)
+            retries += 1
+
+    def _get_buckets(self, url: str) -> list[TokenBucket]:
+        for route in self._routes_by_length:
+            if route in url:
+                return [self._route_buckets[route], self._global_bucket]
+
+        return [self._global_bucket]
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a `Retry-After` header, given either as a number of seconds or as an HTTP date."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,124 @@
+import threading
+import time
+from typing import Any
+
+from dharitri_py_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_py_sdk.network_providers.proxy_network_provider import (
+    ProxyNetworkProvider,
+)
+from dharitri_py_sdk.network_providers.rate_limiter import (
+    RateLimit,
+    RateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers: dict[str, str] = {}, json: Any = None) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self._json = json
+
+    def json(self) -> Any:
+        return self._json
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def test_token_bucket_allows_burst_then_throttles():
+    bucket = TokenBucket(RateLimit(requests_per_second=100, burst=5))
+
+    start = time.perf_counter()
+    for _ in range(5):
+        bucket.acquire()
+    assert time.perf_counter() - start < 0.05
+
+    for _ in range(5):
+        bucket.acquire()
+    assert time.perf_counter() - start >= 0.04
+
+
+def test_token_bucket_pause():
+    bucket = TokenBucket()
+    bucket.pause(0.1)
+
+    start = time.perf_counter()
+    bucket.acquire()
+    assert time.perf_counter() - start >= 0.09
+
+
+def test_rate_limiter_uses_route_budgets():
+    limiter = RateLimiter(
+        global_limit=RateLimit(requests_per_second=1000),
+        route_limits={"vm-values/query": RateLimit(requests_per_second=20, burst=1)},
+    )
+
+    start = time.perf_counter()
+    for _ in range(10):
+        limiter.acquire("https://gateway/transaction/send")
+    assert time.perf_counter() - start < 0.05
+
+    start = time.perf_counter()
+    for _ in range(3):
+        limiter.acquire("https://gateway/vm-values/query")
+    assert time.perf_counter() - start >= 0.09
+
+
+def test_rate_limiter_exposes_queue_depth():
+    limiter = RateLimiter(global_limit=RateLimit(requests_per_second=10, burst=1))
+    limiter.acquire("https://gateway/network/config")
+
+    threads = [threading.Thread(target=limiter.acquire, args=("https://gateway/network/config",)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+
+    time.sleep(0.02)
+    assert limiter.queue_depth == 3
+
+    for thread in threads:
+        thread.join()
+    assert limiter.queue_depth == 0
+
+
+def test_rate_limiter_retries_on_too_many_requests():
+    limiter = RateLimiter(max_retries_on_throttling=2)
+    responses = [FakeResponse(429, {"Retry-After": "0.1"}), FakeResponse(200)]
+
+    start = time.perf_counter()
+    response = limiter.run("https://gateway/transaction/send", lambda: responses.pop(0))
+
+    assert response.status_code == 200
+    assert time.perf_counter() - start >= 0.09
+
+    # when retries are exhausted, the throttled response is returned
+    limiter = RateLimiter(max_retries_on_throttling=1, default_retry_after_in_seconds=0)
+    responses = [FakeResponse(429), FakeResponse(429), FakeResponse(200)]
+    response = limiter.run("https://gateway/transaction/send", lambda: responses.pop(0))
+
+    assert response.status_code == 429
+    assert len(responses) == 1
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("3") == 3
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("not a date") is None
+
+
+def test_provider_honors_retry_after(mocker: Any):
+    responses = [
+        FakeResponse(429, {"Retry-After": "0"}),
+        FakeResponse(200, json={"data": {"txHash": "abba"}, "error": "", "code": "successful"}),
+    ]
+    post = mocker.patch("requests.Session.post", side_effect=lambda *args, **kwargs: responses.pop(0))
+
+    config = NetworkProviderConfig(rate_limiter=RateLimiter())
+    proxy = ProxyNetworkProvider("https://gateway", config=config)
+    response = proxy.do_post_generic("transaction/send", {})
+
+    assert response.get("txHash") == "abba"
+    assert post.call_count == 2
@@ -0,0 +1,136 @@
+import json
+import random
+import time
+from functools import partial
+from threading import Lock
+from typing import Any, Callable, Optional
+
+from dharitri_py_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_py_sdk.network_providers.constants import ONE_SECOND_IN_MILLISECONDS
+from dharitri_py_sdk.network_providers.errors import NetworkProviderError
+from dharitri_py_sdk.network_providers.exchange_stores import (
+    IExchangeStore,
+    RecordedExchange,
+    get_exchange_key,
+)
+from dharitri_py_sdk.network_providers.proxy_network_provider import (
+    ProxyNetworkProvider,
+)
+from dharitri_py_sdk.network_providers.resources import GenericResponse
+
+
+class RecordingNetworkProvider(ProxyNetworkProvider):
+    """
+    A proxy network provider that records all the exchanges made through `do_get_generic()` and `do_post_generic()`
+    (that is, almost all requests, including the ones made while awaiting), so that they can be replayed later by the `ReplayNetworkProvider`.
+    Failed requests are recorded, as well.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        store: IExchangeStore,
+        address_hrp: Optional[str] = None,
+        config: Optional[NetworkProviderConfig] = None,
+    ) -> None:
+        super().__init__(url, address_hrp, config)
+        self.store = store
+
+    def do_get_generic(self, url: str, url_parameters: Optional[dict[str, Any]] = None) -> GenericResponse:
+        key = get_exchange_key("GET", url, url_parameters)
+        return self._record(key, None, partial(super().do_get_generic, url, url_parameters))
+
+    def do_post_generic(self, url: str, data: Any, url_parameters: Optional[dict[str, Any]] = None) -> GenericResponse:
+        key = get_exchange_key("POST", url, url_parameters)
+        return self._record(key, data, partial(super().do_post_generic, url, data, url_parameters))
+
+    def _record(self, key: str, data: Any, do_request: Callable[[], GenericResponse]) -> GenericResponse:
+        try:
+            response = do_request()
+        except NetworkProviderError as error:
+            self.store.append(RecordedExchange(key=key, data=data, error=_get_error_data(error)))
+            raise
+
+        self.store.append(RecordedExchange(key=key, data=data, response=response.to_dictionary()))
+        return response
+
+
+class ReplayNetworkProvider(ProxyNetworkProvider):
+    """
+    A network provider that serves the exchanges recorded by the `RecordingNetworkProvider`, without connecting to the network.
+    If a request has been recorded several times (e.g. while awaiting a transaction), the responses are served in the recorded order
+    (the last one is repeated afterwards). An artificial latency can be added, to simulate a real network.
+    """
+
+    def __init__(
+        self,
+        store: IExchangeStore,
+        address_hrp: Optional[str] = None,
+        latency_in_milliseconds: float = 0,
+        latency_jitter_in_milliseconds: float = 0,
+        match_payloads: bool = True,
+        config: Optional[NetworkProviderConfig] = None,
+    ) -> None:
+        """
+        Args:
+            store (IExchangeStore): the recorded exchanges.
+            address_hrp (Optional[str]): the human-readable part of the addresses.
+            latency_in_milliseconds (float): the (artificial) duration of each request.
+            latency_jitter_in_milliseconds (float): a random duration (up to this value) added to the latency of each request.
+            match_payloads (bool): whether the payloads of POST requests should match the recorded ones. Disable it to send new transactions (e.g. in load tests), getting the recorded responses in return.
+            config (Optional[NetworkProviderConfig]): the configuration of the provider.
+        """
+        super().__init__("replay://", address_hrp, config)
+        self.store = store
+        self.latency_in_milliseconds = latency_in_milliseconds
+        self.latency_jitter_in_milliseconds = latency_jitter_in_milliseconds
+        self.match_payloads = match_payloads
+        self._positions: dict[str, int] = {}
+        self._positions_lock = Lock()
+
+    def do_get_generic(self, url: str, url_parameters: Optional[dict[str, Any]] = None) -> GenericResponse:
+        return self._replay(url, get_exchange_key("GET", url, url_parameters), None)
+
+    def do_post_generic(self, url: str, data: Any, url_parameters: Optional[dict[str, Any]] = None) -> GenericResponse:
+        return self._replay(url, get_exchange_key("POST", url, url_parameters), data)
+
+    def _replay(self, url: str, key: str, data: Any) -> GenericResponse:
+        self._wait_latency()
+
+        exchanges = self.store.get_exchanges(key)
+        position_key = key
+
+        if data is not None and self.match_payloads:
+            payload = _normalize_payload(data)
+            exchanges = [exchange for exchange in exchanges if _normalize_payload(exchange.data) == payload]
+            position_key = f"{key} {payload}"
+
+        if not exchanges:
+            raise NetworkProviderError(url, f"no recorded response for: {key}")
+
+        with self._positions_lock:
+            position = self._positions.get(position_key, 0)
+            self._positions[position_key] = position + 1
+
+        exchange = exchanges[min(position, len(exchanges) - 1)]
+
+        if exchange.error is not None:
+            raise NetworkProviderError(url, exchange.error)
+        return GenericResponse(exchange.response)
+
+    def _wait_latency(self) -> None:
+        latency = self.latency_in_milliseconds + random.uniform(0, self.latency_jitter_in_milliseconds)
+        if latency > 0:
+            time.sleep(latency / ONE_SECOND_IN_MILLISECONDS)
+
+
+def _get_error_data(error: NetworkProviderError) -> Any:
+    try:
+        json.dumps(error.data)
+        return error.data
+    except (TypeError, ValueError):
+        return str(error.data)
+
+
+def _normalize_payload(data: Any) -> str:
+    return json.dumps(data, sort_keys=True, default=str)
@@ -0,0 +1,100 @@
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+
+from dharitri_py_sdk.network_providers.errors import NetworkProviderError
+from dharitri_py_sdk.network_providers.exchange_stores import (
+    JsonLinesExchangeStore,
+    SQLiteExchangeStore,
+)
+from dharitri_py_sdk.network_providers.replay_network_provider import (
+    RecordingNetworkProvider,
+    ReplayNetworkProvider,
+)
+
+
+def create_response(status_code: int, body: Any) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode()
+    return response
+
+
+def envelope(data: Any) -> dict[str, Any]:
+    return {"data": data, "error": "", "code": "successful"}
+
+
+def record(mocker: Any, store: Any) -> None:
+    statuses = [
+        create_response(200, envelope({"status": {"drt_nonce": 100}})),
+        create_response(200, envelope({"status": {"drt_nonce": 101}})),
+    ]
+    mocker.patch("requests.Session.get", side_effect=statuses)
+    mocker.patch(
+        "requests.Session.post",
+        side_effect=[
+            create_response(200, envelope({"txHash": "aa" * 32})),
+            create_response(400, {"error": "invalid signature"}),
+        ],
+    )
+
+    provider = RecordingNetworkProvider("https://gateway", store)
+
+    assert provider.get_network_status(1).block_nonce == 100
+    assert provider.get_network_status(1).block_nonce == 101
+    assert provider.do_post_generic("transaction/send", {"nonce": 1}).get("txHash") == "aa" * 32
+    with pytest.raises(NetworkProviderError):
+        provider.do_post_generic("transaction/send", {"nonce": 2})
+
+
+@pytest.mark.parametrize("store_type", [JsonLinesExchangeStore, SQLiteExchangeStore])
+def test_record_and_replay(mocker: Any, tmp_path: Path, store_type: Any):
+    path = tmp_path / "recording"
+    record(mocker, store_type(path))
+
+    # the requests below must not reach the network
+    mocker.patch("requests.Session.get", side_effect=AssertionError("network"))
+    mocker.patch("requests.Session.post", side_effect=AssertionError("network"))
+
+    replay = ReplayNetworkProvider(store_type(path))
+
+    # responses are served in the recorded order, then the last one is repeated
+    assert replay.get_network_status(1).block_nonce == 100
+    assert replay.get_network_status(1).block_nonce == 101
+    assert replay.get_network_status(1).block_nonce == 101
+
+    assert replay.do_post_generic("transaction/send", {"nonce": 1}).get("txHash") == "aa" * 32
+    with pytest.raises(NetworkProviderError, match="invalid signature"):
+        replay.do_post_generic("transaction/send", {"nonce": 2})
+    with pytest.raises(NetworkProviderError, match="no recorded response"):
+        replay.do_post_generic("transaction/send", {"nonce": 3})
+    with pytest.raises(NetworkProviderError, match="no recorded response"):
+        replay.get_network_status(2)
+
+
+def test_replay_without_matching_payloads(mocker: Any, tmp_path: Path):
+    store = JsonLinesExchangeStore(tmp_path / "recording.jsonl")
+    record(mocker, store)
+
+    replay = ReplayNetworkProvider(store, match_payloads=False)
+
+    assert replay.do_post_generic("transaction/send", {"nonce": 42}).get("txHash") == "aa" * 32
+    with pytest.raises(NetworkProviderError):
+        replay.do_post_generic("transaction/send", {"nonce": 43})
+
+
+def test_replay_latency(mocker: Any, tmp_path: Path):
+    store = SQLiteExchangeStore(tmp_path / "recording.sqlite")
+    record(mocker, store)
+
+    replay = ReplayNetworkProvider(store, latency_in_milliseconds=50, latency_jitter_in_milliseconds=10)
+
+    start = time.perf_counter()
+    replay.get_network_status(1)
+    duration = time.perf_counter() - start
+
+    assert 0.05 <= duration < 0.5
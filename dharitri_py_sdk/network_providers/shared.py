@@ -1,4 +1,22 @@
-from typing import Any, Union
+import threading
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Any, Callable, Optional, Sequence, TypeVar, Union
+
+import requests
+
+from dharitri_py_sdk.core.transaction import Transaction
+from dharitri_py_sdk.network_providers.errors import NetworkProviderError
+from dharitri_py_sdk.network_providers.resources import TransactionCostResponse
+from dharitri_py_sdk.network_providers.transaction_cost_cache import (
+    TransactionCostCache,
+)
+from dharitri_py_sdk.smart_contracts.smart_contract_query import SmartContractQuery
+
+TItem = TypeVar("TItem")
+TResult = TypeVar("TResult")
+
+# marks the threads currently running a fan-out task (see `submit_task`)
+_fan_out_state = threading.local()
 
 
 def convert_tx_hash_to_string(tx_hash: Union[bytes, str]) -> str:
@@ -9,3 +27,159 @@ def convert_tx_hash_to_string(tx_hash: Union[bytes, str]) -> str:
 
 def convert_boolean_query_params_to_lowercase(query_params: dict[str, Any]) -> dict[str, Any]:
     return {key: str(value).lower() if isinstance(value, bool) else value for key, value in query_params.items()}
+
+
+def get_smart_contract_query_key(query: SmartContractQuery) -> str:
+    """Returns a key that identifies a contract query (contract, function, arguments, caller and value)."""
+    caller = query.caller.to_bech32() if query.caller else ""
+    arguments = ",".join(argument.hex() for argument in query.arguments)
+    return f"{query.contract.to_bech32()}:{query.function}:{arguments}:{caller}:{query.value or 0}"
+
+
+def map_concurrently(
+    executor: Executor, function: Callable[[TItem], TResult], items: Sequence[TItem]
+) -> list[Union[TResult, NetworkProviderError]]:
+    """
+    Applies the function on each item, in parallel, and returns the results in the order of the items.
+    If the function fails with a `NetworkProviderError` for an item, the error is returned in place of its result.
+    """
+
+    def apply(item: TItem) -> Union[TResult, NetworkProviderError]:
+        try:
+            return function(item)
+        except NetworkProviderError as error:
+            return error
+
+    # within a fan-out task, the items are processed on the current thread (see `submit_task`)
+    if is_within_fan_out_task():
+        return [apply(item) for item in items]
+
+    futures = [executor.submit(_run_fan_out_task, apply, item) for item in items]
+    return [future.result() for future in futures]
+
+
+def submit_task(executor: Executor, function: Callable[[], TResult]) -> "Future[TResult]":
+    """
+    Submits a fan-out task (e.g. a request issued in parallel with another one), to be collected with `wait_or_steal`.
+
+    When called from within another fan-out task (a nested fan-out), the task isn't submitted; it's run by `wait_or_steal`, on the current thread, instead.
+    Otherwise, the tasks of a saturated executor would wait for tasks queued behind them, on the same executor (a deadlock).
+    """
+    if is_within_fan_out_task():
+        return Future()
+    return executor.submit(_run_fan_out_task, function)
+
+
+def wait_or_steal(
+    future: "Future[TResult]", function: Callable[[], TResult], timeout: Optional[float] = None
+) -> TResult:
+    """
+    Returns the result of a task submitted by `submit_task`. If the task hasn't started yet, it's cancelled and run on the current thread,
+    instead of waiting for a worker of the executor to become available.
+    """
+    if future.cancel():
+        return function()
+    return future.result(timeout=timeout)
+
+
+def is_within_fan_out_task() -> bool:
+    return getattr(_fan_out_state, "depth", 0) > 0
+
+
+def _run_fan_out_task(function: Callable[..., TResult], *args: Any) -> TResult:
+    _fan_out_state.depth = getattr(_fan_out_state, "depth", 0) + 1
+
+    try:
+        return function(*args)
+    finally:
+        _fan_out_state.depth -= 1
+
+
+def estimate_costs_concurrently(
+    executor: Executor,
+    estimate: Callable[[Transaction], TransactionCostResponse],
+    transactions: Sequence[Transaction],
+    cache: Optional[TransactionCostCache] = None,
+) -> list[Union[TransactionCostResponse, NetworkProviderError]]:
+    """
+    Estimates the costs of the transactions, in parallel, and returns them in the order of the transactions (errors in place of the failed estimations).
+    If a cache is given, similar transactions (see `TransactionCostCache`) are estimated only once, unless the estimation fails.
+    """
+    if cache is None:
+        return map_concurrently(executor, estimate, transactions)
+
+    keys = [cache.get_key(transaction) for transaction in transactions]
+    first_index_by_key: dict[str, int] = {}
+
+    for index, key in enumerate(keys):
+        first_index_by_key.setdefault(key, index)
+
+    results: list[Optional[Union[TransactionCostResponse, NetworkProviderError]]] = [None] * len(transactions)
+
+    def estimate_at(indices: list[int]) -> None:
+        estimations = map_concurrently(executor, estimate, [transactions[index] for index in indices])
+        for index, estimation in zip(indices, estimations):
+            results[index] = estimation
+
+    estimate_at(list(first_index_by_key.values()))
+
+    def is_reusable(key: str) -> bool:
+        first = results[first_index_by_key[key]]
+        return isinstance(first, TransactionCostResponse) and cache.is_reusable(first)
+
+    # similar transactions are estimated on their own, if the first estimation has failed
+    estimate_at([index for index, key in enumerate(keys) if results[index] is None and not is_reusable(key)])
+
+    estimations: list[Union[TransactionCostResponse, NetworkProviderError]] = []
+
+    for transaction, result, key in zip(transactions, results, keys):
+        if result is not None:
+            estimations.append(result)
+            continue
+
+        first_index = first_index_by_key[key]
+        first = results[first_index]
+        assert isinstance(first, TransactionCostResponse)
+        estimations.append(cache.adjust(first, len(transactions[first_index].data), transaction))
+
+    return estimations
+
+
+def run_hedged(
+    executor: Executor, do_request: Callable[[], requests.Response], delay_in_seconds: float
+) -> requests.Response:
+    """
+    Runs the (idempotent) request on the executor; if it hasn't completed within the delay, a duplicate (the hedge) is sent, as well.
+    The first successful response is returned; the other attempt is cancelled (if it hasn't started), or its response is closed when it arrives.
+    If both attempts fail, the error of the original request is raised.
+
+    If the executor is saturated (the original request hasn't started within the delay), the request runs on the calling thread instead, without a hedge.
+    """
+    original = executor.submit(do_request)
+    done, _ = wait([original], timeout=delay_in_seconds)
+
+    if not done:
+        if original.cancel():
+            return do_request()
+
+    attempts = [original] if done else [original, executor.submit(do_request)]
+    pending = set(attempts)
+
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        winner = next((attempt for attempt in attempts if attempt in done and attempt.exception() is None), None)
+
+        if winner is not None:
+            for attempt in pending:
+                if not attempt.cancel():
+                    attempt.add_done_callback(_close_response)
+            return winner.result()
+
+    return original.result()
+
+
+def _close_response(attempt: "Future[requests.Response]") -> None:
+    if attempt.cancelled() or attempt.exception() is not None:
+        return
+
+    attempt.result().close()
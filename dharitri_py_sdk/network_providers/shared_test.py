@@ -0,0 +1,144 @@
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import requests
+
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_py_sdk.network_providers.proxy_network_provider import (
+    ProxyNetworkProvider,
+)
+from dharitri_py_sdk.network_providers.shared import (
+    map_concurrently,
+    run_hedged,
+    submit_task,
+    wait_or_steal,
+)
+
+logger = logging.getLogger("shared_test")
+
+ALICE = "drt1c7pyyq2yaq5k7atn9z6qn5qkxwlc6zwc4vg7uuxn9ssy7evfh5jq4nm79l"
+BOB = "drt18h03w0y7qtqwtra3u4f0gu7e3kn2fslj83lqxny39m5c4rwaectswerhd2"
+
+
+def create_response(data: dict[str, Any]) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps({"data": data, "code": "successful"}).encode()
+    return response
+
+
+def answer(url: str, **kwargs: Any) -> requests.Response:
+    if url.endswith("/process-status"):
+        return create_response({"status": "success"})
+    if url.endswith("/guardian-data"):
+        return create_response({"guardianData": {"guarded": True}})
+    if "/address/" in url:
+        return create_response({"account": {"address": ALICE, "nonce": 7, "balance": "0"}})
+    return create_response({"transaction": {"sender": ALICE, "receiver": BOB, "nonce": 7}})
+
+
+def test_nested_fan_out_on_saturated_executor():
+    executor = ThreadPoolExecutor(max_workers=2)
+
+    def fan_out(depth: int) -> int:
+        if depth == 0:
+            return 1
+
+        task = submit_task(executor, lambda: fan_out(depth - 1))
+        return fan_out(depth - 1) + wait_or_steal(task, lambda: fan_out(depth - 1))
+
+    # all the workers are busy with tasks that fan out again (they would wait forever for tasks queued behind them)
+    results = map_concurrently(executor, fan_out, [3] * 8)
+    assert results == [8] * 8
+
+    executor.shutdown()
+
+
+def test_hedged_request_on_saturated_executor():
+    executor = ThreadPoolExecutor(max_workers=1)
+    is_released = threading.Event()
+    executor.submit(is_released.wait)
+
+    response = create_response({})
+    threads: list[threading.Thread] = []
+
+    def do_request() -> requests.Response:
+        threads.append(threading.current_thread())
+        return response
+
+    # the original request can't start on the executor, so it runs on the calling thread (and isn't hedged)
+    assert run_hedged(executor, do_request, 0.05) is response
+    assert threads == [threading.current_thread()]
+
+    is_released.set()
+    executor.shutdown()
+
+
+def test_get_transaction_and_get_account_use_the_shared_executor(mocker: Any):
+    mocker.patch("requests.Session.get", side_effect=answer)
+
+    executor = ThreadPoolExecutor(max_workers=4)
+    proxy = ProxyNetworkProvider("https://gateway", config=NetworkProviderConfig(executor=executor))
+
+    assert proxy._get_executor() is executor
+    assert proxy.get_transaction(bytes(32)).status.is_successful
+    assert proxy.get_account(Address.new_from_bech32(ALICE)).is_guarded
+
+    # bulk operations fetch the accounts (along with their guardian data) on the same executor
+    accounts = proxy.get_accounts([Address.new_from_bech32(ALICE)] * 10)
+    assert all(not isinstance(account, Exception) and account.nonce == 7 for account in accounts)
+
+    executor.shutdown()
+
+
+def test_benchmark_thread_creation_with_500_concurrent_callers(mocker: Any):
+    """
+    500 callers fetch a transaction at the same time. Before, each call created (and tore down) a pool of 2 threads;
+    now, the status is fetched on the shared executor of the provider, while the transaction is fetched on the calling thread.
+    """
+    mocker.patch("requests.Session.get", side_effect=answer)
+    num_callers = 500
+
+    def run_callers(get_transaction: Any) -> tuple[int, float]:
+        barrier = threading.Barrier(num_callers)
+
+        def call() -> None:
+            barrier.wait()
+            get_transaction(bytes(32))
+
+        callers = [threading.Thread(target=call) for _ in range(num_callers)]
+        spy = mocker.spy(threading.Thread, "start")
+        start = time.perf_counter()
+
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join()
+        elapsed = time.perf_counter() - start
+
+        num_threads_created = spy.call_count - num_callers
+        mocker.stop(spy)
+        return num_threads_created, elapsed
+
+    proxy = ProxyNetworkProvider("https://gateway", config=NetworkProviderConfig(max_workers=8))
+
+    def get_transaction_with_a_pool_per_call(transaction_hash: bytes) -> None:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            status_task = executor.submit(proxy.get_transaction_status, transaction_hash)
+            transaction_task = executor.submit(proxy.do_get_generic, f"transaction/{transaction_hash.hex()}")
+            status_task.result()
+            transaction_task.result()
+
+    threads_before, elapsed_before = run_callers(get_transaction_with_a_pool_per_call)
+    threads_after, elapsed_after = run_callers(proxy.get_transaction)
+
+    logger.info(f"Pool per call: {threads_before} threads created, {elapsed_before:.3f} seconds.")
+    logger.info(f"Shared executor: {threads_after} threads created, {elapsed_after:.3f} seconds.")
+
+    assert threads_before >= num_callers
+    assert threads_after <= 8
@@ -0,0 +1,53 @@
+import threading
+from typing import Any, Callable, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _InFlightCall:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[Exception] = None
+
+
+class SingleFlight:
+    """
+    Deduplicates identical concurrent calls: while a call for a given key is in flight, other callers asking for the same key
+    wait for it and receive the same result (or the same error), instead of doing the work again.
+    Once the call completes, the key is forgotten (nothing is cached).
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _InFlightCall] = {}
+        self._lock = threading.Lock()
+        self.num_coalesced_calls = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+
+            if call is None:
+                call = _InFlightCall()
+                self._calls[key] = call
+            else:
+                self.num_coalesced_calls += 1
+
+        if not is_leader:
+            call.done.wait()
+
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
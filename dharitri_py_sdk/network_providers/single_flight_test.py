@@ -0,0 +1,83 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_py_sdk.network_providers.proxy_network_provider import (
+    ProxyNetworkProvider,
+)
+from dharitri_py_sdk.network_providers.single_flight import SingleFlight
+from dharitri_py_sdk.smart_contracts.smart_contract_query import SmartContractQuery
+
+
+def test_concurrent_calls_are_coalesced():
+    single_flight = SingleFlight()
+    num_executions = 0
+    lock = threading.Lock()
+
+    def work() -> dict[str, int]:
+        nonlocal num_executions
+        with lock:
+            num_executions += 1
+        time.sleep(0.1)
+        return {"nonce": 42}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(single_flight.do, "network/config", work) for _ in range(8)]
+        results = [future.result() for future in futures]
+
+    assert num_executions == 1
+    assert single_flight.num_coalesced_calls == 7
+    assert all(result is results[0] for result in results)
+
+
+def test_errors_are_shared_and_not_remembered():
+    single_flight = SingleFlight()
+
+    def fail() -> Any:
+        time.sleep(0.05)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(single_flight.do, "key", fail) for _ in range(4)]
+
+        for future in futures:
+            with pytest.raises(ValueError, match="boom"):
+                future.result()
+
+    # once completed, the key is forgotten
+    assert single_flight.do("key", lambda: 1) == 1
+    assert single_flight.do("key", lambda: 2) == 2
+
+
+def test_provider_coalesces_identical_requests(mocker: Any):
+    def slow_get(*args: Any, **kwargs: Any) -> Any:
+        time.sleep(0.1)
+        response = mocker.Mock()
+        response.json.return_value = {"data": {"config": {"drt_chain_id": "D"}}, "code": "successful"}
+        return response
+
+    def slow_post(*args: Any, **kwargs: Any) -> Any:
+        time.sleep(0.1)
+        response = mocker.Mock()
+        response.json.return_value = {"data": {"data": {"returnData": ["Kg=="], "returnCode": "ok"}}}
+        return response
+
+    get = mocker.patch("requests.Session.get", side_effect=slow_get)
+    post = mocker.patch("requests.Session.post", side_effect=slow_post)
+
+    proxy = ProxyNetworkProvider("https://gateway", config=NetworkProviderConfig(coalesce_requests=True))
+    query = SmartContractQuery(contract=Address.new_from_hex("00" * 32), function="getSum", arguments=[b"\x01"])
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        configs = list(executor.map(lambda _: proxy.get_network_config(), range(5)))
+        responses = list(executor.map(lambda _: proxy.query_contract(query), range(5)))
+
+    assert get.call_count == 1
+    assert post.call_count == 1
+    assert all(config.chain_id == "D" for config in configs)
+    assert all(response.return_data_parts == [b"\x2a"] for response in responses)
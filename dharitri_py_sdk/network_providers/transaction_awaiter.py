@@ -1,5 +1,7 @@
 import logging
 import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Callable, Optional, Protocol, Union
 
 from dharitri_py_sdk.core.transaction_on_network import TransactionOnNetwork
@@ -8,11 +10,13 @@ from dharitri_py_sdk.network_providers.constants import (
     DEFAULT_TRANSACTION_AWAITING_POLLING_TIMEOUT_IN_MILLISECONDS,
     DEFAULT_TRANSACTION_AWAITING_TIMEOUT_IN_MILLISECONDS,
     ONE_SECOND_IN_MILLISECONDS,
+    TRANSACTION_AWAITING_POLLS_AFTER_NOTIFICATION,
 )
 from dharitri_py_sdk.network_providers.errors import (
     ExpectedTransactionStatusNotReachedError,
     TransactionFetchingError,
 )
+from dharitri_py_sdk.network_providers.transaction_notifier import ITransactionNotifier
 
 logger = logging.getLogger("transaction_awaiter")
 
@@ -30,6 +34,7 @@ class TransactionAwaiter:
         polling_interval_in_milliseconds: Optional[int] = None,
         timeout_interval_in_milliseconds: Optional[int] = None,
         patience_time_in_milliseconds: Optional[int] = None,
+        notifier: Optional[ITransactionNotifier] = None,
     ) -> None:
         """
         Args:
@@ -37,8 +42,10 @@ class TransactionAwaiter:
             polling_interval_in_milliseconds (Optional[int]): The polling interval, in milliseconds.
             timeout_interval_in_milliseconds (Optional[int]): The timeout, in milliseconds.
             patience_time_in_milliseconds (Optional[int]): The patience, an extra time (in milliseconds) to wait, after the transaction has reached its desired status. Currently there's a delay between the moment a transaction is marked as "completed" and the moment its outcome (contract results, events and logs) is available.
+            notifier (Optional[ITransactionNotifier]): if set (and connected), the transaction is fetched only when the notifier reports it, instead of at each polling interval. Each time the transaction is reported (e.g. once per shard of a cross-shard transaction), it's polled (since the gateway might lag behind the notifier), until it satisfies the condition, or for a few polling intervals, before waiting for the next notification; if the notifier disconnects, the awaiter falls back to polling.
         """
         self.fetcher = fetcher
+        self.notifier = notifier
 
         if polling_interval_in_milliseconds is None:
             self.polling_interval_in_milliseconds = DEFAULT_TRANSACTION_AWAITING_POLLING_TIMEOUT_IN_MILLISECONDS
@@ -68,6 +75,7 @@ class TransactionAwaiter:
             is_satisfied=is_completed,
             do_fetch=do_fetch,
             error=ExpectedTransactionStatusNotReachedError(),
+            transaction_hash=transaction_hash,
         )
 
     def await_on_condition(
@@ -84,6 +92,7 @@ class TransactionAwaiter:
             is_satisfied=condition,
             do_fetch=do_fetch,
             error=ExpectedTransactionStatusNotReachedError(),
+            transaction_hash=transaction_hash,
         )
 
     def _await_conditionally(
@@ -91,7 +100,11 @@ class TransactionAwaiter:
         is_satisfied: Callable[[TransactionOnNetwork], bool],
         do_fetch: Callable[[], TransactionOnNetwork],
         error: Exception,
+        transaction_hash: Optional[Union[str, bytes]] = None,
     ) -> TransactionOnNetwork:
+        if self.notifier is not None and transaction_hash is not None:
+            return self._await_with_notifier(self.notifier, transaction_hash, is_satisfied, do_fetch, error)
+
         is_condition_satisfied = False
         fetched_data: Union[TransactionOnNetwork, None] = None
         max_number_of_retries = self.timeout_interval_in_milliseconds // self.polling_interval_in_milliseconds
@@ -120,3 +133,69 @@ class TransactionAwaiter:
             return do_fetch()
 
         return fetched_data
+
+    def _await_with_notifier(
+        self,
+        notifier: ITransactionNotifier,
+        transaction_hash: Union[str, bytes],
+        is_satisfied: Callable[[TransactionOnNetwork], bool],
+        do_fetch: Callable[[], TransactionOnNetwork],
+        error: Exception,
+    ) -> TransactionOnNetwork:
+        is_condition_satisfied = False
+        fetched_data: Union[TransactionOnNetwork, None] = None
+        deadline = time.monotonic() + self.timeout_interval_in_milliseconds / ONE_SECOND_IN_MILLISECONDS
+        polling_interval = self.polling_interval_in_milliseconds / ONE_SECOND_IN_MILLISECONDS
+        # the number of polls left, after the last notification
+        num_polls_left = 0
+        subscription: Optional["Future[bool]"] = None
+
+        try:
+            while True:
+                # subscribe before fetching, so that a notification can't be missed in between
+                if subscription is None:
+                    subscription = notifier.subscribe(transaction_hash)
+
+                try:
+                    fetched_data = do_fetch()
+                    is_condition_satisfied = is_satisfied(fetched_data)
+
+                    if is_condition_satisfied:
+                        break
+                except TransactionFetchingError:
+                    logger.warning("Couldn't fetch transaction. Retrying...")
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                # the gateway might lag behind the notifier, so (after a notification) the transaction is polled a few times,
+                # before waiting for the next notification
+                can_wait_for_notification = notifier.is_connected and num_polls_left == 0
+                wait_time = remaining if can_wait_for_notification else min(polling_interval, remaining)
+
+                try:
+                    was_notified = subscription.result(timeout=wait_time)
+                except FutureTimeoutError:
+                    num_polls_left = max(0, num_polls_left - 1)
+                    continue
+
+                if was_notified:
+                    num_polls_left = TRANSACTION_AWAITING_POLLS_AFTER_NOTIFICATION
+                else:
+                    num_polls_left = max(0, num_polls_left - 1)
+
+                notifier.unsubscribe(transaction_hash, subscription)
+                subscription = None
+        finally:
+            if subscription is not None:
+                notifier.unsubscribe(transaction_hash, subscription)
+
+        if fetched_data is None or not is_condition_satisfied:
+            raise error
+
+        if self.patience_time_in_milliseconds:
+            time.sleep(self.patience_time_in_milliseconds / ONE_SECOND_IN_MILLISECONDS)
+            return do_fetch()
+
+        return fetched_data
@@ -0,0 +1,115 @@
+import dataclasses
+import math
+import threading
+from typing import Optional
+
+from dharitri_py_sdk.core.transaction import Transaction
+from dharitri_py_sdk.network_providers.cache_backends import (
+    ICacheBackend,
+    InMemoryCacheBackend,
+)
+from dharitri_py_sdk.network_providers.resources import TransactionCostResponse
+from dharitri_py_sdk.network_providers.transaction_decoder import ADDRESS_HEX_LENGTH
+
+
+class TransactionCostCache:
+    """
+    Caches cost estimations, so that they are reused across similar transactions: same destination, same function (the first part of the data field),
+    and data of similar length (in the same bucket). Transfers of the native token (without data) share an entry per receiver.
+    For transfers of tokens, the destination and the function called (if any) are decoded from the data field, since e.g. `DCDTNFTTransfer`
+    and `MultiDCDTNFTTransfer` are sent to the sender itself (see `get_key()`).
+    When an estimation is reused for a transaction with longer data, the gas of the extra bytes is added to it.
+
+    The cost of a contract call might depend on its arguments (and on the state of the contract), not only on their length;
+    make sure to apply a safety margin (or to disable the cache) when that matters.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[ICacheBackend] = None,
+        data_length_bucket_size: int = 64,
+        ttl_in_seconds: Optional[float] = 600,
+        gas_per_data_byte: int = 1_500,
+    ) -> None:
+        """
+        Args:
+            backend (Optional[ICacheBackend]): where the estimations are stored. Defaults to an in-memory cache.
+            data_length_bucket_size (int): the length of the data field is rounded up to a multiple of this value, when computing the key.
+            ttl_in_seconds (Optional[float]): for how long an estimation is reused. If `None`, estimations never expire.
+            gas_per_data_byte (int): the gas charged for each byte of data (as in the network config).
+        """
+        self.backend = backend if backend is not None else InMemoryCacheBackend()
+        self.data_length_bucket_size = data_length_bucket_size
+        self.ttl_in_seconds = ttl_in_seconds
+        self.gas_per_data_byte = gas_per_data_byte
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, transaction: Transaction) -> Optional[TransactionCostResponse]:
+        """Returns the estimation of a similar transaction (if any), accounting for the gas of the extra data bytes of this one."""
+        entry: Optional[tuple[int, TransactionCostResponse]] = self.backend.get(self.get_key(transaction))
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if entry is None:
+            return None
+
+        data_length, cost = entry
+        return self.adjust(cost, data_length, transaction)
+
+    def adjust(
+        self, cost: TransactionCostResponse, data_length: int, transaction: Transaction
+    ) -> TransactionCostResponse:
+        """Adapts the estimation of a similar transaction (with data of the given length) to this one, adding the gas of its extra data bytes."""
+        extra_data_length = len(transaction.data) - data_length
+        if extra_data_length <= 0:
+            return cost
+
+        return dataclasses.replace(cost, gas_limit=cost.gas_limit + extra_data_length * self.gas_per_data_byte)
+
+    def set(self, transaction: Transaction, cost: TransactionCostResponse) -> None:
+        """Stores the estimation (along with the length of the data it was made for), unless it has failed."""
+        if self.is_reusable(cost):
+            self.backend.set(self.get_key(transaction), (len(transaction.data), cost), self.ttl_in_seconds)
+
+    def is_reusable(self, cost: TransactionCostResponse) -> bool:
+        return cost.gas_limit > 0 and not cost.raw.get("returnMessage")
+
+    def get_key(self, transaction: Transaction) -> str:
+        """
+        The key of the transaction: its destination, its function and the bucket of the length of its data.
+        For transfers of tokens, the function is the transfer function, along with the function it calls (and, for `MultiDCDTNFTTransfer`, the number of tokens).
+        """
+        destination, function = _get_destination_and_function(transaction)
+        bucket = math.ceil(len(transaction.data) / self.data_length_bucket_size)
+        return f"cost:{destination}:{function}:{bucket}"
+
+
+def _get_destination_and_function(transaction: Transaction) -> tuple[str, str]:
+    function, *args = transaction.data.decode(errors="replace").split("@")
+    receiver = transaction.receiver.to_hex()
+
+    try:
+        if function == "DCDTTransfer" and len(args) >= 2:
+            return receiver, f"{function}:{_decode_function(args[2:])}"
+
+        if function == "DCDTNFTTransfer" and len(args) >= 4 and len(args[3]) == ADDRESS_HEX_LENGTH:
+            return args[3], f"{function}:{_decode_function(args[4:])}"
+
+        if function == "MultiDCDTNFTTransfer" and len(args) >= 2 and len(args[0]) == ADDRESS_HEX_LENGTH:
+            num_transfers = int(args[1], 16)
+            return args[0], f"{function}:{num_transfers}:{_decode_function(args[2 + 3 * num_transfers :])}"
+    except ValueError:
+        pass
+
+    return receiver, function
+
+
+def _decode_function(args: list[str]) -> str:
+    """Decodes the name of the function called by a transfer of tokens (the argument that follows the transfers), if any."""
+    return bytes.fromhex(args[0]).decode(errors="replace") if args else ""
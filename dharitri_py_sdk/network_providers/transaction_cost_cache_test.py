@@ -0,0 +1,177 @@
+import json
+import threading
+import time
+from typing import Any
+
+import requests
+
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.core.transaction import Transaction
+from dharitri_py_sdk.core.transaction_status import TransactionStatus
+from dharitri_py_sdk.network_providers.api_network_provider import ApiNetworkProvider
+from dharitri_py_sdk.network_providers.cache_backends import InMemoryCacheBackend
+from dharitri_py_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_py_sdk.network_providers.errors import NetworkProviderError
+from dharitri_py_sdk.network_providers.proxy_network_provider import (
+    ProxyNetworkProvider,
+)
+from dharitri_py_sdk.network_providers.resources import TransactionCostResponse
+from dharitri_py_sdk.network_providers.transaction_cost_cache import (
+    TransactionCostCache,
+)
+
+ALICE = Address.new_from_bech32("drt1c7pyyq2yaq5k7atn9z6qn5qkxwlc6zwc4vg7uuxn9ssy7evfh5jq4nm79l")
+CONTRACT = Address.new_from_bech32("drt1qqqqqqqqqqqqqpgq076flgeualrdu5jyyj60snvrh7zu4qrg05vqy7r36d")
+
+
+def create_response(body: Any) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(body).encode()
+    return response
+
+
+def create_transaction(nonce: int, data: bytes) -> Transaction:
+    return Transaction(sender=ALICE, receiver=CONTRACT, gas_limit=0, chain_id="D", nonce=nonce, data=data)
+
+
+class Gateway:
+    """Answers the cost and simulation requests (slowly, so that requests overlap), estimating the cost by the nonce."""
+
+    def __init__(self) -> None:
+        self.requests: list[str] = []
+        self.max_concurrent_requests = 0
+        self._concurrent_requests = 0
+        self._lock = threading.Lock()
+
+    def post(self, url: str, json: Any, **kwargs: Any) -> requests.Response:
+        with self._lock:
+            self.requests.append(url)
+            self._concurrent_requests += 1
+            self.max_concurrent_requests = max(self.max_concurrent_requests, self._concurrent_requests)
+
+        time.sleep(0.05)
+
+        with self._lock:
+            self._concurrent_requests -= 1
+
+        if json["nonce"] == 13:
+            return create_response({"data": {}, "error": "bad nonce", "code": "bad_request"})
+        if "transaction/cost" in url:
+            return create_response({"data": {"txGasUnits": 1000 + json["nonce"]}, "code": "successful"})
+        return create_response({"data": {"result": {"status": "success", "hash": f"{json['nonce']:064x}"}}})
+
+
+def test_cache_keys():
+    cache = TransactionCostCache(data_length_bucket_size=16)
+
+    assert cache.get_key(create_transaction(1, b"add@01")) == cache.get_key(create_transaction(2, b"add@ff"))
+    assert cache.get_key(create_transaction(1, b"add@01")) != cache.get_key(create_transaction(1, b"sub@01"))
+    assert cache.get_key(create_transaction(1, b"add@01")) != cache.get_key(create_transaction(1, b"add@" + b"01" * 8))
+
+    failed = TransactionCostResponse(raw={"returnMessage": "out of gas"}, gas_limit=1, status=TransactionStatus(""))
+    cache.set(create_transaction(1, b"add@01"), failed)
+    assert cache.get(create_transaction(1, b"add@01")) is None
+
+    # the estimation is reused for longer data (within the bucket), along with the gas of the extra bytes
+    cost = TransactionCostResponse(raw={}, gas_limit=100_000, status=TransactionStatus("success"))
+    cache.set(create_transaction(1, b"add@0102"), cost)
+    assert cache.get(create_transaction(2, b"add@01")) == cost
+    assert cache.get(create_transaction(3, b"add@010203")).gas_limit == 100_000 + 2 * 1_500  # type: ignore
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_cache_keys_of_token_transfers():
+    cache = TransactionCostCache()
+    other_contract = Address.new_from_bech32("drt1qqqqqqqqqqqqqpgqak8zt22wl2ph4tswtyc39namqx6ysa2sd8ssg6vu30")
+
+    def nft_transfer(destination: Address, function: bytes, token: bytes = b"NFT-123456") -> Transaction:
+        data = b"DCDTNFTTransfer@" + token.hex().encode() + b"@01@01@" + destination.to_hex().encode()
+        data += b"@" + function.hex().encode() if function else b""
+        return Transaction(sender=ALICE, receiver=ALICE, gas_limit=0, chain_id="D", data=data)
+
+    def multi_transfer(destination: Address, function: bytes, num_transfers: int) -> Transaction:
+        transfers = b"".join(b"@" + b"NFT-123456".hex().encode() + b"@01@01" for _ in range(num_transfers))
+        data = (
+            b"MultiDCDTNFTTransfer@"
+            + destination.to_hex().encode()
+            + b"@"
+            + f"{num_transfers:02x}".encode()
+            + transfers
+        )
+        data += b"@" + function.hex().encode()
+        return Transaction(sender=ALICE, receiver=ALICE, gas_limit=0, chain_id="D", data=data)
+
+    # transfers sent to the sender itself are keyed by their actual destination and function
+    assert cache.get_key(nft_transfer(CONTRACT, b"stake")) == cache.get_key(
+        nft_transfer(CONTRACT, b"stake", b"NFT-abcdef")
+    )
+    assert cache.get_key(nft_transfer(CONTRACT, b"stake")) != cache.get_key(nft_transfer(other_contract, b"stake"))
+    assert cache.get_key(nft_transfer(CONTRACT, b"stake")) != cache.get_key(nft_transfer(CONTRACT, b"unstake"))
+    assert cache.get_key(nft_transfer(CONTRACT, b"stake")) != cache.get_key(nft_transfer(CONTRACT, b""))
+
+    assert cache.get_key(multi_transfer(CONTRACT, b"stake", 1)) != cache.get_key(
+        multi_transfer(other_contract, b"stake", 1)
+    )
+    assert cache.get_key(multi_transfer(CONTRACT, b"stake", 1)) != cache.get_key(multi_transfer(CONTRACT, b"claim", 1))
+    assert cache.get_key(multi_transfer(CONTRACT, b"stake", 1)) != cache.get_key(multi_transfer(CONTRACT, b"stake", 2))
+
+    # fungible transfers to a contract are keyed by the function they call, as well
+    assert cache.get_key(
+        create_transaction(1, b"DCDTTransfer@544f4b454e@01@" + b"stake".hex().encode())
+    ) != cache.get_key(create_transaction(1, b"DCDTTransfer@544f4b454e@01@" + b"claim".hex().encode()))
+
+    # malformed data is keyed by its first part
+    assert cache.get_key(create_transaction(1, b"MultiDCDTNFTTransfer@zz@01")).startswith(
+        f"cost:{CONTRACT.to_hex()}:MultiDCDTNFTTransfer:"
+    )
+
+
+def test_empty_backend_is_used():
+    backend = InMemoryCacheBackend()
+    assert len(backend) == 0
+    assert TransactionCostCache(backend=backend).backend is backend
+
+
+def test_estimate_transactions_cost(mocker: Any):
+    gateway = Gateway()
+    mocker.patch("requests.Session.post", side_effect=gateway.post)
+
+    config = NetworkProviderConfig(max_workers=4, transaction_cost_cache=TransactionCostCache())
+    proxy = ProxyNetworkProvider("https://gateway", config=config)
+
+    transactions = [create_transaction(nonce, b"add@%02x" % nonce) for nonce in range(10)]
+    transactions += [create_transaction(13, b"sub@01"), create_transaction(14, b"sub@02")]
+    costs = proxy.estimate_transactions_cost(transactions)
+
+    # similar transactions share the estimation of the first one
+    assert [cost.gas_limit for cost in costs[:10] if isinstance(cost, TransactionCostResponse)] == [1000] * 10
+    # a failed estimation isn't reused
+    assert isinstance(costs[10], NetworkProviderError)
+    assert isinstance(costs[11], TransactionCostResponse) and costs[11].gas_limit == 1014
+    assert len(gateway.requests) == 3
+
+    assert proxy.estimate_transaction_cost(create_transaction(42, b"add@2a")).gas_limit == 1000
+    assert len(gateway.requests) == 3
+
+    # the estimation of a similar transaction accounts for the longer data
+    costs = proxy.estimate_transactions_cost([create_transaction(50, b"mul@01"), create_transaction(51, b"mul@0102")])
+    assert [cost.gas_limit for cost in costs if isinstance(cost, TransactionCostResponse)] == [1050, 1050 + 2 * 1_500]
+    assert len(gateway.requests) == 4
+
+
+def test_simulate_transactions(mocker: Any):
+    gateway = Gateway()
+    mocker.patch("requests.Session.post", side_effect=gateway.post)
+
+    api = ApiNetworkProvider("https://api", config=NetworkProviderConfig(max_workers=4))
+    transactions = [create_transaction(nonce, b"add@01") for nonce in range(12)]
+
+    start = time.perf_counter()
+    results = api.simulate_transactions(transactions)
+    elapsed = time.perf_counter() - start
+
+    assert len(gateway.requests) == 12
+    assert gateway.max_concurrent_requests == 4
+    assert elapsed < 12 * 0.05
+    assert [result.nonce for result in results if not isinstance(result, NetworkProviderError)] == list(range(12))
@@ -1,6 +1,7 @@
 import base64
 
 from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.core.transaction_on_network import TransactionOnNetwork
 from dharitri_py_sdk.network_providers.transaction_decoder import TransactionDecoder
 from dharitri_py_sdk.testutils.mock_transaction_on_network import (
     get_empty_transaction_on_network,
@@ -271,3 +272,96 @@ class TestTransactionDecoder:
         assert metadata.transfers[0].token.identifier == "MNY-3a1cef"
         assert metadata.transfers[0].token.nonce == 2
         assert metadata.transfer_messages == [bytes.fromhex("aaaaaaaa"), bytes.fromhex("aa")]
+
+
+class TestBulkTransactionDecoding:
+    alice = Address.new_from_bech32("drt1c7pyyq2yaq5k7atn9z6qn5qkxwlc6zwc4vg7uuxn9ssy7evfh5jq4nm79l")
+    bob = Address.new_from_bech32("drt18w6yj09l9jwlpj5cjqq9eccfgulkympv7d4rj6vq4u49j8fpwzws36f6y2")
+    contract = Address.new_from_bech32("drt1qqqqqqqqqqqqqpgqmua7hcd05yxypyj7sv7pffrquy9gf86s535qmyujkw")
+
+    def create_transactions(self) -> list[TransactionOnNetwork]:
+        contract_hex = self.contract.to_hex()
+        bob_hex = self.bob.to_hex()
+        inputs = [
+            (self.alice, self.bob, 5, b""),
+            (self.alice, self.bob, 7, b"6869"),
+            (self.alice, self.contract, 0, b"withdrawGlobalOffer@0173d0"),
+            (self.alice, self.contract, 0, b"DCDTTransfer@544553542d326534306437@02540be400@73776170@01"),
+            (self.alice, self.bob, 0, b"DCDTTransfer@544553542d326534306437@0a@6869@6f6b"),
+            (self.alice, self.alice, 0, f"DCDTNFTTransfer@4d4e592d336131636566@01@01@{contract_hex}@73776170".encode()),
+            (
+                self.alice,
+                self.alice,
+                0,
+                f"MultiDCDTNFTTransfer@{bob_hex}@02@4d4e592d336131636566@02@01@544553542d326534306437@@64@6869".encode(),
+            ),
+            # the NFT transfer isn't a self-transfer, so it's decoded as a regular call
+            (self.alice, self.bob, 0, f"DCDTNFTTransfer@4d4e592d336131636566@01@01@{contract_hex}".encode()),
+        ]
+
+        transactions: list[TransactionOnNetwork] = []
+        for sender, receiver, value, data in inputs:
+            transaction = get_empty_transaction_on_network()
+            transaction.sender = sender
+            transaction.receiver = receiver
+            transaction.value = value
+            transaction.data = data
+            transactions.append(transaction)
+
+        return transactions
+
+    def test_same_metadata_as_single_decoding(self):
+        decoder = TransactionDecoder()
+        transactions = self.create_transactions()
+
+        expected = [decoder.get_transaction_metadata(transaction).to_dict() for transaction in transactions]
+        actual = [metadata.to_dict() for metadata in decoder.get_transactions_metadata(transactions)]
+
+        assert actual == expected
+
+    def test_malformed_data(self):
+        transaction = get_empty_transaction_on_network()
+        transaction.sender = self.alice
+        transaction.receiver = self.bob
+        transaction.value = 1
+        transaction.data = b"hello"
+
+        multi_transfer = get_empty_transaction_on_network()
+        multi_transfer.sender = self.alice
+        multi_transfer.receiver = self.alice
+        multi_transfer.data = f"MultiDCDTNFTTransfer@{self.bob.to_hex()}@05@4d4e592d336131636566@02".encode()
+
+        [metadata, multi_transfer_metadata] = TransactionDecoder().get_transactions_metadata(
+            [transaction, multi_transfer]
+        )
+
+        assert metadata.to_dict()["sender"] == self.alice.to_bech32()
+        assert metadata.value == 1
+        assert metadata.function_name is None
+        assert multi_transfer_metadata.transfers is None
+
+    def test_transfers_columns(self):
+        columns = TransactionDecoder().get_transfers_columns(self.create_transactions())
+
+        assert len(columns) == 7
+        assert columns.transaction_index == [0, 1, 3, 4, 5, 6, 6]
+        assert columns.token == [
+            "REWA",
+            "REWA",
+            "TEST-2e40d7",
+            "TEST-2e40d7",
+            "MNY-3a1cef",
+            "MNY-3a1cef",
+            "TEST-2e40d7",
+        ]
+        assert columns.nonce == [0, 0, 0, 0, 1, 2, 0]
+        assert columns.amount == [5, 7, 10000000000, 10, 1, 1, 100]
+        assert columns.sender == [self.alice.to_bech32()] * 7
+        assert columns.receiver[2:] == [
+            self.contract.to_bech32(),
+            self.bob.to_bech32(),
+            self.contract.to_bech32(),
+            self.bob.to_bech32(),
+            self.bob.to_bech32(),
+        ]
+        assert list(columns.to_dict()) == ["transaction_index", "sender", "receiver", "token", "nonce", "amount"]
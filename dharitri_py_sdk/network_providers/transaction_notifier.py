@@ -0,0 +1,248 @@
+import logging
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Protocol, Union
+
+import requests
+
+from dharitri_py_sdk.network_providers.constants import ONE_SECOND_IN_MILLISECONDS
+
+logger = logging.getLogger("transaction_notifier")
+
+
+@dataclass
+class TransactionNotifierOptions:
+    """
+    Options of the `TransactionNotifier`.
+
+    Args:
+        long_polling_timeout_in_seconds (float): for how long the notifier holds a request open, when there are no new events.
+        reconnect_delay_in_milliseconds (int): the delay before reconnecting, after a failed request (doubled after each consecutive failure).
+        max_reconnect_delay_in_milliseconds (int): the maximum delay before reconnecting.
+    """
+
+    long_polling_timeout_in_seconds: float = 30
+    reconnect_delay_in_milliseconds: int = 1000
+    max_reconnect_delay_in_milliseconds: int = 30000
+
+
+# fmt: off
+class ITransactionNotifier(Protocol):
+    @property
+    def is_connected(self) -> bool:
+        ...
+
+    def subscribe(self, transaction_hash: Union[str, bytes]) -> "Future[bool]":
+        ...
+
+    def unsubscribe(self, transaction_hash: Union[str, bytes], future: "Future[bool]") -> None:
+        ...
+# fmt: on
+
+
+class BaseTransactionNotifier:
+    """
+    The transport-agnostic part of a transaction notifier: it holds the subscriptions of the awaiters and resolves them with `True`
+    when the transport reports the corresponding transactions (`notify_transactions()`), or with `False` when the transport
+    loses the connection or misses events (`set_disconnected()`), in which case the awaiters fall back to polling.
+
+    The SDK doesn't ship clients for the WebSocket or RabbitMQ feeds of the events notifier service (to avoid extra dependencies).
+    To plug such a feed, either subclass this and implement `_listen()` (a blocking loop, run in a background thread until `_stopped` is set),
+    or use an instance as it is and call `set_connected()`, `notify_transactions()` and `set_disconnected()` from your own consumer.
+    `TransactionNotifier` is such a transport, over HTTP long polling.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscriptions: dict[str, list["Future[bool]"]] = {}
+        self._is_connected = False
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self._is_connected
+
+    def start(self) -> None:
+        """Starts listening for events (in a background thread). Subscribing starts the notifier, as well."""
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._listen, name="transaction-notifier", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stops listening for events. The pending subscriptions are resolved with `False`."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+            self._stopped.set()
+
+        self._close()
+        self.set_disconnected()
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1)
+
+    def subscribe(self, transaction_hash: Union[str, bytes]) -> "Future[bool]":
+        """Returns a future, resolved when the transaction is reported by the notifier (`True`), or when the connection is lost (`False`)."""
+        self.start()
+
+        future: "Future[bool]" = Future()
+        with self._lock:
+            self._subscriptions.setdefault(_normalize_hash(transaction_hash), []).append(future)
+
+        return future
+
+    def unsubscribe(self, transaction_hash: Union[str, bytes], future: "Future[bool]") -> None:
+        with self._lock:
+            key = _normalize_hash(transaction_hash)
+            futures = self._subscriptions.get(key, [])
+
+            if future in futures:
+                futures.remove(future)
+            if not futures:
+                self._subscriptions.pop(key, None)
+
+    def count_subscriptions(self) -> int:
+        with self._lock:
+            return sum(len(futures) for futures in self._subscriptions.values())
+
+    def set_connected(self) -> None:
+        """To be called by the transport once it's receiving events (until then, the awaiters poll)."""
+        self._is_connected = True
+
+    def notify_transactions(self, transaction_hashes: Iterable[Union[str, bytes]]) -> None:
+        """To be called by the transport when transactions are reported (e.g. executed in a block): resolves their subscriptions with `True`."""
+        with self._lock:
+            futures = [
+                future
+                for transaction_hash in transaction_hashes
+                for future in self._subscriptions.pop(_normalize_hash(transaction_hash), [])
+            ]
+
+        for future in futures:
+            _resolve(future, True)
+
+    def set_disconnected(self) -> None:
+        """To be called by the transport when the connection is lost (or events are missed): resolves all the subscriptions with `False`."""
+        self._is_connected = False
+
+        with self._lock:
+            futures = [future for futures in self._subscriptions.values() for future in futures]
+            self._subscriptions.clear()
+
+        for future in futures:
+            _resolve(future, False)
+
+    def _listen(self) -> None:
+        # events are pushed by an external consumer (see the class docstring)
+        self._stopped.wait()
+
+    def _close(self) -> None:
+        """Releases the resources of the transport (e.g. the connection), so that a blocked `_listen()` returns."""
+        pass
+
+
+class TransactionNotifier(BaseTransactionNotifier):
+    """
+    A transaction notifier over HTTP long polling, so that awaiting transactions doesn't require polling the gateway.
+
+    The events notifier service itself publishes over WebSocket or RabbitMQ; this transport talks to a relay in front of it
+    (or any service) exposing `GET {url}/events?cursor=<cursor>&timeout=<seconds>`, which answers (as soon as there are events newer than the cursor,
+    or after the timeout) with `{"cursor": <next cursor>, "events": [...], "truncated": <bool>}`. The events are either
+    `{"type": "transaction", "hash": "<hash>", "status": "<status>"}` or `{"type": "block", "hash": "<hash>", "shard": <shard>, "nonce": <nonce>, "transactions": ["<hash>", ...]}`.
+    When the cursor is omitted, the relay answers immediately, with its latest cursor. The relay sets `truncated` if some of the events newer than the cursor have been dropped.
+    For other transports, see `BaseTransactionNotifier`.
+
+    Pass the notifier to `NetworkProviderConfig` to use it in `await_transaction_completed()`.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        options: Optional[TransactionNotifierOptions] = None,
+        requests_options: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """
+        Args:
+            url (str): the URL of the relay.
+            options (Optional[TransactionNotifierOptions]): the options of the notifier.
+            requests_options (Optional[dict[str, Any]]): extra arguments passed to `requests` (e.g. auth, headers). The timeout is derived from the long polling timeout.
+        """
+        super().__init__()
+        self.url = url.rstrip("/")
+        self.options = options or TransactionNotifierOptions()
+        self.requests_options = dict(requests_options or {})
+        self.requests_options["timeout"] = self.options.long_polling_timeout_in_seconds + 5
+
+        self._session = requests.Session()
+        self._cursor: Optional[int] = None
+
+    def _listen(self) -> None:
+        delay_in_milliseconds = self.options.reconnect_delay_in_milliseconds
+
+        while not self._stopped.is_set():
+            try:
+                payload = self._fetch_events()
+            except (requests.RequestException, ValueError, KeyError) as error:
+                if self._stopped.is_set():
+                    break
+
+                logger.warning(f"Lost connection to the events notifier: {error}. Falling back to polling.")
+                self.set_disconnected()
+                self._stopped.wait(delay_in_milliseconds / ONE_SECOND_IN_MILLISECONDS)
+                delay_in_milliseconds = min(delay_in_milliseconds * 2, self.options.max_reconnect_delay_in_milliseconds)
+                continue
+
+            if self._stopped.is_set():
+                break
+
+            delay_in_milliseconds = self.options.reconnect_delay_in_milliseconds
+
+            if payload.get("truncated", False):
+                logger.warning(
+                    "Missed some events of the notifier. Falling back to polling for the pending subscriptions."
+                )
+                self.set_disconnected()
+
+            self._cursor = int(payload["cursor"])
+            self.set_connected()
+            self._dispatch(payload.get("events") or [])
+
+    def _close(self) -> None:
+        self._session.close()
+
+    def _fetch_events(self) -> dict[str, Any]:
+        parameters: dict[str, Any] = {"timeout": self.options.long_polling_timeout_in_seconds}
+        if self._cursor is not None:
+            parameters["cursor"] = self._cursor
+
+        response = self._session.get(f"{self.url}/events", params=parameters, **self.requests_options)
+        response.raise_for_status()
+        return response.json()
+
+    def _dispatch(self, events: list[dict[str, Any]]) -> None:
+        transaction_hashes: list[str] = []
+
+        for event in events:
+            if event.get("type") == "block":
+                transaction_hashes.extend(event.get("transactions") or [])
+            elif event.get("hash"):
+                transaction_hashes.append(event["hash"])
+
+        self.notify_transactions(transaction_hashes)
+
+
+def _normalize_hash(transaction_hash: Union[str, bytes]) -> str:
+    if isinstance(transaction_hash, bytes):
+        return transaction_hash.hex()
+    return transaction_hash.lower()
+
+
+def _resolve(future: "Future[bool]", result: bool) -> None:
+    if not future.done():
+        future.set_result(result)
@@ -0,0 +1,256 @@
+import threading
+import time
+from typing import Any, Union
+
+import pytest
+
+from dharitri_py_sdk.core.transaction_on_network import TransactionOnNetwork
+from dharitri_py_sdk.core.transaction_status import TransactionStatus
+from dharitri_py_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_py_sdk.network_providers.proxy_network_provider import (
+    ProxyNetworkProvider,
+)
+from dharitri_py_sdk.network_providers.resources import AwaitingOptions
+from dharitri_py_sdk.network_providers.transaction_awaiter import TransactionAwaiter
+from dharitri_py_sdk.network_providers.transaction_notifier import (
+    BaseTransactionNotifier,
+    TransactionNotifier,
+    TransactionNotifierOptions,
+)
+from dharitri_py_sdk.testutils.events_notifier_server import EventsNotifierServer
+from dharitri_py_sdk.testutils.mock_transaction_on_network import (
+    get_empty_transaction_on_network,
+)
+
+TX_HASH = "ab" * 32
+OTHER_TX_HASH = "cd" * 32
+
+
+class TransactionsFetcher:
+    def __init__(self) -> None:
+        self.status = "pending"
+        self.num_fetches = 0
+
+    def get_transaction(self, transaction_hash: Union[bytes, str]) -> TransactionOnNetwork:
+        self.num_fetches += 1
+        transaction = get_empty_transaction_on_network()
+        transaction.status = TransactionStatus(self.status)
+        return transaction
+
+
+@pytest.fixture
+def server():
+    server = EventsNotifierServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def notifier(server: EventsNotifierServer):
+    options = TransactionNotifierOptions(long_polling_timeout_in_seconds=1, reconnect_delay_in_milliseconds=50)
+    notifier = TransactionNotifier(server.url, options)
+    notifier.start()
+    wait_until(lambda: notifier.is_connected)
+    yield notifier
+    notifier.stop()
+
+
+def wait_until(condition: Any, timeout_in_seconds: float = 5) -> None:
+    deadline = time.monotonic() + timeout_in_seconds
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+def run_later(delay_in_seconds: float, function: Any) -> None:
+    threading.Timer(delay_in_seconds, function).start()
+
+
+def test_subscriptions_are_resolved(server: EventsNotifierServer, notifier: TransactionNotifier):
+    transaction_subscription = notifier.subscribe(TX_HASH)
+    block_subscription = notifier.subscribe(bytes.fromhex(OTHER_TX_HASH))
+    assert notifier.count_subscriptions() == 2
+
+    server.publish_transaction(TX_HASH.upper())
+    assert transaction_subscription.result(timeout=2) is True
+    assert not block_subscription.done()
+
+    server.publish_block("ff" * 32, shard=1, nonce=42, transaction_hashes=[OTHER_TX_HASH])
+    assert block_subscription.result(timeout=2) is True
+    assert notifier.count_subscriptions() == 0
+
+    # on disconnection, the pending subscriptions are resolved with "False"
+    pending = notifier.subscribe(TX_HASH)
+    server.stop()
+    assert pending.result(timeout=2) is False
+    assert not notifier.is_connected
+
+
+def test_missed_events_resolve_subscriptions(notifier: TransactionNotifier):
+    server = EventsNotifierServer(max_buffered_events=2).start()
+    notifier.stop()
+    notifier.url = server.url
+
+    try:
+        subscription = notifier.subscribe(TX_HASH)
+        wait_until(lambda: notifier.is_connected)
+
+        # the notifier drops events before the client gets the chance to fetch them
+        with server._condition:
+            for index in range(5):
+                server.publish_transaction(f"{index:064x}")
+
+        assert subscription.result(timeout=2) is False
+    finally:
+        server.stop()
+
+
+def test_await_completed_with_notifier(server: EventsNotifierServer, notifier: TransactionNotifier):
+    fetcher = TransactionsFetcher()
+    awaiter = TransactionAwaiter(
+        fetcher=fetcher,
+        polling_interval_in_milliseconds=10000,
+        timeout_interval_in_milliseconds=20000,
+        patience_time_in_milliseconds=0,
+        notifier=notifier,
+    )
+
+    def complete():
+        fetcher.status = "success"
+        server.publish_transaction(TX_HASH)
+
+    run_later(0.2, complete)
+
+    start = time.perf_counter()
+    transaction = awaiter.await_completed(TX_HASH)
+
+    assert transaction.status.is_completed
+    assert time.perf_counter() - start < 2
+    # fetched once initially, then once after being notified
+    assert fetcher.num_fetches == 2
+    assert notifier.count_subscriptions() == 0
+
+
+def test_await_completed_keeps_relying_on_the_notifier(server: EventsNotifierServer, notifier: TransactionNotifier):
+    fetcher = TransactionsFetcher()
+    awaiter = TransactionAwaiter(
+        fetcher=fetcher,
+        polling_interval_in_milliseconds=10000,
+        timeout_interval_in_milliseconds=20000,
+        patience_time_in_milliseconds=0,
+        notifier=notifier,
+    )
+
+    def complete():
+        fetcher.status = "success"
+        server.publish_block("ff" * 32, shard=1, nonce=42, transaction_hashes=[TX_HASH])
+
+    # a cross-shard transaction is reported in the source shard (still pending), then in the destination shard
+    run_later(0.2, lambda: server.publish_block("ee" * 32, shard=0, nonce=41, transaction_hashes=[TX_HASH]))
+    run_later(0.4, complete)
+
+    start = time.perf_counter()
+    transaction = awaiter.await_completed(TX_HASH)
+
+    assert transaction.status.is_completed
+    assert time.perf_counter() - start < 2
+    assert fetcher.num_fetches == 3
+    assert notifier.count_subscriptions() == 0
+
+
+def test_await_completed_polls_after_notification(server: EventsNotifierServer, notifier: TransactionNotifier):
+    fetcher = TransactionsFetcher()
+    awaiter = TransactionAwaiter(
+        fetcher=fetcher,
+        polling_interval_in_milliseconds=100,
+        timeout_interval_in_milliseconds=8000,
+        patience_time_in_milliseconds=0,
+        notifier=notifier,
+    )
+
+    def complete():
+        fetcher.status = "success"
+
+    # the transaction is reported once, but the gateway shows it as completed only a few polling intervals later
+    run_later(0.2, lambda: server.publish_transaction(TX_HASH))
+    run_later(0.5, complete)
+
+    start = time.perf_counter()
+    transaction = awaiter.await_completed(TX_HASH)
+
+    assert transaction.status.is_completed
+    assert time.perf_counter() - start < 1
+    assert notifier.count_subscriptions() == 0
+
+
+def test_custom_transport():
+    notifier = BaseTransactionNotifier()
+    fetcher = TransactionsFetcher()
+    awaiter = TransactionAwaiter(
+        fetcher=fetcher,
+        polling_interval_in_milliseconds=10000,
+        timeout_interval_in_milliseconds=20000,
+        patience_time_in_milliseconds=0,
+        notifier=notifier,
+    )
+
+    def on_block_received():
+        fetcher.status = "success"
+        notifier.notify_transactions([bytes.fromhex(TX_HASH)])
+
+    # e.g. a consumer of the WebSocket feed of the events notifier
+    notifier.set_connected()
+    run_later(0.2, on_block_received)
+
+    start = time.perf_counter()
+    assert awaiter.await_completed(TX_HASH).status.is_completed
+    assert time.perf_counter() - start < 2
+    assert fetcher.num_fetches == 2
+
+    subscription = notifier.subscribe(TX_HASH)
+    notifier.stop()
+    assert subscription.result(timeout=1) is False
+
+
+def test_await_completed_falls_back_to_polling(server: EventsNotifierServer, notifier: TransactionNotifier):
+    fetcher = TransactionsFetcher()
+    awaiter = TransactionAwaiter(
+        fetcher=fetcher,
+        polling_interval_in_milliseconds=50,
+        timeout_interval_in_milliseconds=5000,
+        patience_time_in_milliseconds=0,
+        notifier=notifier,
+    )
+
+    def complete():
+        fetcher.status = "success"
+
+    # the notifier goes away, then the transaction completes (without being reported)
+    run_later(0.1, server.stop)
+    run_later(0.5, complete)
+
+    start = time.perf_counter()
+    transaction = awaiter.await_completed(TX_HASH)
+
+    assert transaction.status.is_completed
+    assert time.perf_counter() - start < 2
+    assert fetcher.num_fetches > 2
+
+
+def test_providers_use_the_notifier(mocker: Any, server: EventsNotifierServer, notifier: TransactionNotifier):
+    fetcher = TransactionsFetcher()
+    mocker.patch.object(ProxyNetworkProvider, "get_transaction", side_effect=fetcher.get_transaction)
+
+    provider = ProxyNetworkProvider("https://gateway", config=NetworkProviderConfig(transaction_notifier=notifier))
+    options = AwaitingOptions(polling_interval_in_milliseconds=10000, patience_in_milliseconds=0)
+
+    def complete():
+        fetcher.status = "success"
+        server.publish_block("ff" * 32, shard=0, nonce=1, transaction_hashes=[TX_HASH])
+
+    run_later(0.2, complete)
+
+    start = time.perf_counter()
+    assert provider.await_transaction_completed(TX_HASH, options).status.is_successful
+    assert time.perf_counter() - start < 2
+    assert fetcher.num_fetches == 2
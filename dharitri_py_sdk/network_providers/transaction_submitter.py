@@ -0,0 +1,245 @@
+import json
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Optional, Protocol, Union
+
+from dharitri_py_sdk.core.transaction import Transaction
+from dharitri_py_sdk.core.transaction_computer import TransactionComputer
+from dharitri_py_sdk.core.transaction_on_network import TransactionOnNetwork
+from dharitri_py_sdk.network_providers.config import TransactionSubmitterOptions
+from dharitri_py_sdk.network_providers.constants import ONE_SECOND_IN_MILLISECONDS
+from dharitri_py_sdk.network_providers.errors import (
+    NetworkProviderError,
+    TransactionNotAcceptedError,
+)
+from dharitri_py_sdk.network_providers.rate_limiter import TokenBucket
+
+logger = logging.getLogger("transaction_submitter")
+
+# how often idle workers check whether the submitter has been stopped
+IDLE_POLLING_INTERVAL_IN_SECONDS = 0.1
+
+
+# fmt: off
+class ITransactionsSender(Protocol):
+    def send_transactions(self, transactions: list[Transaction]) -> tuple[int, list[bytes]]:
+        ...
+
+    def get_transaction(self, transaction_hash: Union[bytes, str]) -> TransactionOnNetwork:
+        ...
+# fmt: on
+
+
+@dataclass
+class _Submission:
+    transaction: Transaction
+    transaction_hash: bytes
+    size: int
+    future: "Future[bytes]"
+
+
+class TransactionSubmitter:
+    """
+    Sends (signed) transactions in the background, in batches: callers enqueue transactions with `submit()`,
+    while worker threads group them into `send_transactions()` calls (bounded by count and by size), within the configured rate limit.
+
+    Each transaction is tracked by its hash (computed locally), end-to-end: `submit()` returns a future,
+    resolved with the hash once the network accepts the transaction (or with an error, if it's not accepted).
+    Failed batches are sent again, as they are: since the transactions don't change, neither do their hashes, so retrying is idempotent.
+    Asyncio users can await the futures by wrapping them with `asyncio.wrap_future()`.
+
+    When the queue is full, `submit()` blocks (backpressure), so that producers can't outpace the network indefinitely.
+    """
+
+    def __init__(self, provider: ITransactionsSender, options: Optional[TransactionSubmitterOptions] = None) -> None:
+        """
+        Args:
+            provider (ITransactionsSender): used to send the transactions (e.g. a network provider).
+            options (Optional[TransactionSubmitterOptions]): the options of the submitter.
+        """
+        self.provider = provider
+        self.options = options or TransactionSubmitterOptions()
+        self.num_batches = 0
+        self.num_retries = 0
+
+        self._queue: queue.Queue[_Submission] = queue.Queue(maxsize=self.options.max_queue_size)
+        self._bucket = TokenBucket(self.options.rate_limit) if self.options.rate_limit else None
+        self._computer = TransactionComputer()
+        self._workers: list[threading.Thread] = []
+        self._stopped = threading.Event()
+
+    def __enter__(self) -> "TransactionSubmitter":
+        return self.start()
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    def start(self) -> "TransactionSubmitter":
+        if self._workers:
+            return self
+
+        self._stopped.clear()
+        self._workers = [
+            threading.Thread(target=self._work, name=f"transaction-submitter-{index}", daemon=True)
+            for index in range(self.options.num_workers)
+        ]
+
+        for worker in self._workers:
+            worker.start()
+
+        return self
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stops the workers. If `wait` is set, the queued transactions are sent first;
+        otherwise, they are dropped (and their futures are cancelled).
+        """
+        self._stopped.set()
+
+        if not wait:
+            self._cancel_queued()
+
+        for worker in self._workers:
+            worker.join()
+
+        self._workers = []
+        # transactions submitted while stopping are not sent anymore
+        self._cancel_queued()
+
+    def submit(self, transaction: Transaction, timeout: Optional[float] = None) -> "Future[bytes]":
+        """
+        Enqueues a signed transaction and returns a future, resolved with the hash of the transaction once accepted by the network.
+        Blocks while the queue is full; if a timeout (in seconds) is given and elapses, `queue.Full` is raised.
+        """
+        if self._stopped.is_set():
+            raise RuntimeError("the transaction submitter is stopped")
+
+        submission = _Submission(
+            transaction=transaction,
+            transaction_hash=self._computer.compute_transaction_hash(transaction),
+            size=len(json.dumps(transaction.to_dictionary())),
+            future=Future(),
+        )
+
+        self._queue.put(submission, timeout=timeout)
+        return submission.future
+
+    def submit_many(self, transactions: list[Transaction]) -> list["Future[bytes]"]:
+        return [self.submit(transaction) for transaction in transactions]
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of transactions waiting to be sent."""
+        return self._queue.qsize()
+
+    def _work(self) -> None:
+        carried_over: Optional[_Submission] = None
+
+        while True:
+            batch, carried_over = self._collect_batch(carried_over)
+
+            if not batch:
+                return
+
+            self._send_batch(batch)
+
+    def _collect_batch(self, first: Optional[_Submission]) -> tuple[list[_Submission], Optional[_Submission]]:
+        """
+        Returns the next batch, along with the submission that didn't fit into it (if any), to be placed into the next one.
+        An empty batch is returned once the submitter is stopped and the queue is drained.
+        """
+        batch = [first] if first else []
+        size = first.size if first else 0
+        max_delay = self.options.max_batch_delay_in_milliseconds / ONE_SECOND_IN_MILLISECONDS
+        deadline = time.monotonic() + max_delay
+
+        while len(batch) < self.options.max_batch_size:
+            timeout = deadline - time.monotonic() if batch else IDLE_POLLING_INTERVAL_IN_SECONDS
+
+            try:
+                submission = self._queue.get(timeout=max(timeout, 0))
+            except queue.Empty:
+                if batch or self._stopped.is_set():
+                    break
+                continue
+
+            if batch and size + submission.size > self.options.max_batch_size_in_bytes:
+                return batch, submission
+
+            if not batch:
+                deadline = time.monotonic() + max_delay
+
+            batch.append(submission)
+            size += submission.size
+
+        return batch, None
+
+    def _send_batch(self, batch: list[_Submission]) -> None:
+        # cancelled submissions are dropped
+        pending = [submission for submission in batch if submission.future.set_running_or_notify_cancel()]
+
+        if self._bucket:
+            for _ in pending:
+                self._bucket.acquire()
+
+        attempt = 0
+
+        while pending:
+            try:
+                _, hashes = self.provider.send_transactions([submission.transaction for submission in pending])
+                self.num_batches += 1
+            except NetworkProviderError as error:
+                if attempt >= self.options.max_retries:
+                    self._fail(pending, error)
+                    return
+
+                delay = self.options.retry_delay_in_milliseconds * 2**attempt / ONE_SECOND_IN_MILLISECONDS
+                logger.warning(f"Could not send {len(pending)} transactions ({error}), retrying in {delay} seconds.")
+
+                attempt += 1
+                self.num_retries += 1
+                time.sleep(delay)
+                continue
+            except Exception as error:
+                self._fail(pending, error)
+                return
+
+            for submission, transaction_hash in zip(pending, hashes):
+                self._resolve(submission, transaction_hash, is_retry=attempt > 0)
+
+            return
+
+    def _resolve(self, submission: _Submission, transaction_hash: bytes, is_retry: bool) -> None:
+        if transaction_hash:
+            if transaction_hash != submission.transaction_hash:
+                logger.warning(
+                    f"Hash mismatch: computed {submission.transaction_hash.hex()}, received {transaction_hash.hex()}."
+                )
+            submission.future.set_result(submission.transaction_hash)
+        elif is_retry and self._is_known(submission.transaction_hash):
+            # a previous (seemingly failed) attempt has reached the network, after all
+            submission.future.set_result(submission.transaction_hash)
+        else:
+            submission.future.set_exception(TransactionNotAcceptedError(submission.transaction_hash))
+
+    def _is_known(self, transaction_hash: bytes) -> bool:
+        try:
+            self.provider.get_transaction(transaction_hash)
+            return True
+        except NetworkProviderError:
+            return False
+
+    def _fail(self, submissions: list[_Submission], error: Exception) -> None:
+        for submission in submissions:
+            submission.future.set_exception(error)
+
+    def _cancel_queued(self) -> None:
+        while True:
+            try:
+                self._queue.get_nowait().future.cancel()
+            except queue.Empty:
+                return
@@ -0,0 +1,137 @@
+import queue
+from typing import Union
+
+import pytest
+
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.core.transaction import Transaction
+from dharitri_py_sdk.core.transaction_computer import TransactionComputer
+from dharitri_py_sdk.core.transaction_on_network import TransactionOnNetwork
+from dharitri_py_sdk.network_providers.config import TransactionSubmitterOptions
+from dharitri_py_sdk.network_providers.errors import (
+    NetworkProviderError,
+    TransactionNotAcceptedError,
+)
+from dharitri_py_sdk.network_providers.transaction_submitter import TransactionSubmitter
+from dharitri_py_sdk.testutils.mock_transaction_on_network import (
+    get_empty_transaction_on_network,
+)
+
+ALICE = Address.new_from_bech32("drt1c7pyyq2yaq5k7atn9z6qn5qkxwlc6zwc4vg7uuxn9ssy7evfh5jq4nm79l")
+BOB = Address.new_from_bech32("drt18h03w0y7qtqwtra3u4f0gu7e3kn2fslj83lqxny39m5c4rwaectswerhd2")
+
+
+class TransactionsSender:
+    def __init__(self) -> None:
+        self.batches: list[list[Transaction]] = []
+        self.num_failures = 0
+        self.rejected_nonces: set[int] = set()
+        self.known_hashes: set[bytes] = set()
+
+    def send_transactions(self, transactions: list[Transaction]) -> tuple[int, list[bytes]]:
+        self.batches.append(transactions)
+
+        if self.num_failures:
+            self.num_failures -= 1
+            raise NetworkProviderError("transaction/send-multiple", "timeout")
+
+        computer = TransactionComputer()
+        hashes = [
+            b"" if transaction.nonce in self.rejected_nonces else computer.compute_transaction_hash(transaction)
+            for transaction in transactions
+        ]
+        return len([item for item in hashes if item]), hashes
+
+    def get_transaction(self, transaction_hash: Union[bytes, str]) -> TransactionOnNetwork:
+        if transaction_hash not in self.known_hashes:
+            raise NetworkProviderError("transaction", "not found")
+        return get_empty_transaction_on_network()
+
+
+def create_transactions(count: int, data: bytes = b"") -> list[Transaction]:
+    return [
+        Transaction(
+            sender=ALICE,
+            receiver=BOB,
+            gas_limit=50000 + 1500 * len(data),
+            chain_id="D",
+            nonce=nonce,
+            data=data,
+            signature=bytes(64),
+        )
+        for nonce in range(count)
+    ]
+
+
+def test_batching_by_count_and_size():
+    sender = TransactionsSender()
+    options = TransactionSubmitterOptions(max_batch_size=4, max_batch_size_in_bytes=3000)
+    submitter = TransactionSubmitter(sender, options)
+
+    # about 550 bytes each
+    futures = submitter.submit_many(create_transactions(10))
+    # about 1350 bytes each
+    futures += submitter.submit_many(create_transactions(3, data=b"x" * 600))
+
+    with submitter:
+        hashes = [future.result(timeout=5) for future in futures]
+
+    computer = TransactionComputer()
+    assert hashes[:10] == [computer.compute_transaction_hash(transaction) for transaction in create_transactions(10)]
+    assert [len(batch) for batch in sender.batches] == [4, 4, 3, 2]
+
+
+def test_retries_are_idempotent():
+    sender = TransactionsSender()
+    sender.num_failures = 2
+    options = TransactionSubmitterOptions(retry_delay_in_milliseconds=10)
+
+    with TransactionSubmitter(sender, options) as submitter:
+        futures = submitter.submit_many(create_transactions(3))
+        hashes = [future.result(timeout=5) for future in futures]
+
+    assert submitter.num_retries == 2
+    assert len(sender.batches) == 3
+    # the very same transactions are sent again
+    assert all(batch == sender.batches[0] for batch in sender.batches)
+    assert len(set(hashes)) == 3
+
+
+def test_rejections_and_exhausted_retries():
+    sender = TransactionsSender()
+    transactions = create_transactions(3)
+    sender.rejected_nonces = {1, 2}
+    sender.known_hashes = {TransactionComputer().compute_transaction_hash(transactions[2])}
+    sender.num_failures = 1
+    options = TransactionSubmitterOptions(max_retries=1, retry_delay_in_milliseconds=10)
+
+    with TransactionSubmitter(sender, options) as submitter:
+        futures = submitter.submit_many(transactions)
+
+        assert futures[0].result(timeout=5)
+        with pytest.raises(TransactionNotAcceptedError):
+            futures[1].result(timeout=5)
+        # rejected on retry, but the first (seemingly failed) attempt reached the network
+        assert futures[2].result(timeout=5) == sender.known_hashes.pop()
+
+        sender.num_failures = 2
+        with pytest.raises(NetworkProviderError):
+            submitter.submit(transactions[0]).result(timeout=5)
+
+
+def test_backpressure():
+    sender = TransactionsSender()
+    submitter = TransactionSubmitter(sender, TransactionSubmitterOptions(max_queue_size=2))
+
+    futures = submitter.submit_many(create_transactions(2))
+    assert submitter.queue_depth == 2
+
+    with pytest.raises(queue.Full):
+        submitter.submit(create_transactions(1)[0], timeout=0.1)
+
+    submitter.start()
+    submitter.stop()
+
+    assert all(future.done() for future in futures)
+    with pytest.raises(RuntimeError):
+        submitter.submit(create_transactions(1)[0])
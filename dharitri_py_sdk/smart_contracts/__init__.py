@@ -1,6 +1,9 @@
 from dharitri_py_sdk.smart_contracts.smart_contract_controller import (
     SmartContractController,
 )
+from dharitri_py_sdk.smart_contracts.smart_contract_queries_runner import (
+    SmartContractQueriesRunner,
+)
 from dharitri_py_sdk.smart_contracts.smart_contract_query import (
     SmartContractQuery,
     SmartContractQueryResponse,
@@ -26,4 +29,5 @@ __all__ = [
     "DeployedSmartContract",
     "ParsedSmartContractCallOutcome",
     "SmartContractDeployOutcome",
+    "SmartContractQueriesRunner",
 ]
@@ -10,7 +10,8 @@ from dharitri_py_sdk.core import (
     Transaction,
     TransactionOnNetwork,
 )
-from dharitri_py_sdk.core.base_controller import BaseController
+from dharitri_py_sdk.core.base_controller import BaseController, IGasLimitEstimator
+from dharitri_py_sdk.core.errors import BadUsageError
 from dharitri_py_sdk.core.interfaces import IAccount
 from dharitri_py_sdk.core.transactions_factory_config import TransactionsFactoryConfig
 from dharitri_py_sdk.network_providers.resources import AwaitingOptions
@@ -31,8 +32,8 @@ from dharitri_py_sdk.smart_contracts.smart_contract_transactions_outcome_parser_
 )
 
 
-# fmt: off
 class INetworkProvider(Protocol):
+    # fmt: off
     def query_contract(self, query: SmartContractQuery) -> SmartContractQueryResponse:
         ...
 
@@ -40,7 +41,7 @@ class INetworkProvider(Protocol):
         self, transaction_hash: Union[str, bytes], options: Optional[AwaitingOptions] = None
     ) -> TransactionOnNetwork:
         ...
-# fmt: on
+    # fmt: on
 
 
 class SmartContractController(BaseController):
@@ -49,19 +50,28 @@ class SmartContractController(BaseController):
         chain_id: str,
         network_provider: INetworkProvider,
         abi: Optional[Abi] = None,
+        gas_limit_estimator: Optional[IGasLimitEstimator] = None,
     ) -> None:
+        """
+        Args:
+            chain_id (str): the chain ID.
+            network_provider (INetworkProvider): used to await transactions and to run queries.
+            abi (Optional[Abi]): the ABI of the contract, used to encode the arguments and to decode the outcomes.
+            gas_limit_estimator (Optional[IGasLimitEstimator]): if set, the gas limit of the transactions is estimated (e.g. using a `GasLimitEstimator`) whenever it isn't explicitly provided.
+        """
         self.abi = abi
         self.factory = SmartContractTransactionsFactory(TransactionsFactoryConfig(chain_id), abi=self.abi)
         self.parser = SmartContractTransactionsOutcomeParser(abi=self.abi)
         self.network_provider = network_provider
         self.serializer = Serializer()
+        self.gas_limit_estimator = gas_limit_estimator
 
     def create_transaction_for_deploy(
         self,
         sender: IAccount,
         nonce: int,
         bytecode: Union[Path, bytes],
-        gas_limit: int,
+        gas_limit: Optional[int] = None,
         arguments: Sequence[Any] = [],
         native_transfer_amount: int = 0,
         is_upgradeable: bool = True,
@@ -72,10 +82,12 @@ class SmartContractController(BaseController):
         guardian: Optional[Address] = None,
         relayer: Optional[Address] = None,
     ) -> Transaction:
+        self._ensure_gas_limit_can_be_set(gas_limit)
+
         transaction = self.factory.create_transaction_for_deploy(
             sender=sender.address,
             bytecode=bytecode,
-            gas_limit=gas_limit,
+            gas_limit=gas_limit or 0,
             arguments=arguments,
             native_transfer_amount=native_transfer_amount,
             is_upgradeable=is_upgradeable,
@@ -108,7 +120,7 @@ class SmartContractController(BaseController):
         nonce: int,
         contract: Address,
         bytecode: Union[Path, bytes],
-        gas_limit: int,
+        gas_limit: Optional[int] = None,
         arguments: Sequence[Any] = [],
         native_transfer_amount: int = 0,
         is_upgradeable: bool = True,
@@ -119,11 +131,13 @@ class SmartContractController(BaseController):
         guardian: Optional[Address] = None,
         relayer: Optional[Address] = None,
     ) -> Transaction:
+        self._ensure_gas_limit_can_be_set(gas_limit)
+
         transaction = self.factory.create_transaction_for_upgrade(
             sender=sender.address,
             contract=contract,
             bytecode=bytecode,
-            gas_limit=gas_limit,
+            gas_limit=gas_limit or 0,
             arguments=arguments,
             native_transfer_amount=native_transfer_amount,
             is_upgradeable=is_upgradeable,
@@ -148,7 +162,7 @@ class SmartContractController(BaseController):
         sender: IAccount,
         nonce: int,
         contract: Address,
-        gas_limit: int,
+        gas_limit: Optional[int],
         function: str,
         arguments: Sequence[Any] = [],
         native_transfer_amount: int = 0,
@@ -157,10 +171,12 @@ class SmartContractController(BaseController):
         guardian: Optional[Address] = None,
         relayer: Optional[Address] = None,
     ) -> Transaction:
+        self._ensure_gas_limit_can_be_set(gas_limit)
+
         transaction = self.factory.create_transaction_for_execute(
             sender=sender.address,
             contract=contract,
-            gas_limit=gas_limit,
+            gas_limit=gas_limit or 0,
             function=function,
             arguments=arguments,
             native_transfer_amount=native_transfer_amount,
@@ -172,12 +188,17 @@ class SmartContractController(BaseController):
         transaction.nonce = nonce
 
         self._set_version_and_options_for_hash_signing(sender, transaction)
-        self._set_transaction_gas_options(transaction, gas_limit, gas_price)
+        endpoint = f"{contract.to_bech32()}:{function}"
+        self._set_transaction_gas_options(transaction, gas_limit, gas_price, endpoint)
         self._set_version_and_options_for_guardian(transaction)
         transaction.signature = sender.sign_transaction(transaction)
 
         return transaction
 
+    def _ensure_gas_limit_can_be_set(self, gas_limit: Optional[int]):
+        if gas_limit is None and self.gas_limit_estimator is None:
+            raise BadUsageError("The gas limit must be provided when no gas limit estimator is configured")
+
     def parse_execute(
         self,
         transaction_on_network: TransactionOnNetwork,
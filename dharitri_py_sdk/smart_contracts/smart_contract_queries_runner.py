@@ -0,0 +1,119 @@
+from concurrent.futures import Executor, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Optional, Protocol, Sequence, Union
+
+from dharitri_py_sdk.abi.abi import Abi
+from dharitri_py_sdk.network_providers.cache_backends import InMemoryCacheBackend
+from dharitri_py_sdk.network_providers.caching_network_provider import (
+    CachingNetworkProvider,
+)
+from dharitri_py_sdk.network_providers.config import CachingOptions
+from dharitri_py_sdk.network_providers.errors import NetworkProviderError
+from dharitri_py_sdk.network_providers.resources import NetworkConfig
+from dharitri_py_sdk.network_providers.shared import (
+    get_smart_contract_query_key,
+    map_concurrently,
+)
+from dharitri_py_sdk.smart_contracts.errors import SmartContractQueryError
+from dharitri_py_sdk.smart_contracts.smart_contract_query import (
+    SmartContractQuery,
+    SmartContractQueryResponse,
+)
+
+
+class INetworkProvider(Protocol):
+    # fmt: off
+    def query_contract(self, query: SmartContractQuery) -> SmartContractQueryResponse:
+        ...
+
+    def get_network_config(self) -> NetworkConfig:
+        ...
+    # fmt: on
+
+
+class SmartContractQueriesRunner:
+    """
+    Runs many smart contract queries concurrently, deduplicating identical queries.
+    The queries run on the executor of the network provider, if it has one (e.g. `ProxyNetworkProvider`), otherwise on a pool owned by the runner.
+    Optionally, the responses are cached for a number of rounds (identical queries are identified by contract, function, arguments, caller and value).
+    """
+
+    def __init__(
+        self,
+        network_provider: INetworkProvider,
+        abi: Optional[Abi] = None,
+        max_concurrency: int = 8,
+        cache_ttl_in_rounds: int = 0,
+    ) -> None:
+        """
+        Args:
+            network_provider (INetworkProvider): the provider used to run the queries.
+            abi (Optional[Abi]): if provided, the responses are decoded by `query_many()`.
+            max_concurrency (int): the maximum number of queries running at the same time, if the network provider has no executor of its own
+                (otherwise, see `NetworkProviderConfig.max_workers`).
+            cache_ttl_in_rounds (int): for how many rounds the responses are cached (until the round boundary). Set to 0 to disable caching.
+        """
+        self.abi = abi
+        self.max_concurrency = max_concurrency
+        self.network_provider: INetworkProvider = network_provider
+
+        if cache_ttl_in_rounds > 0:
+            self.network_provider = CachingNetworkProvider(
+                network_provider,  # type: ignore
+                backend=InMemoryCacheBackend(),
+                options=CachingOptions(query_ttl_in_rounds=cache_ttl_in_rounds),
+            )
+
+        self._executor: Optional[Executor] = getattr(network_provider, "executor", None)
+        self._lock = Lock()
+
+    def run_queries(
+        self, queries: Sequence[SmartContractQuery]
+    ) -> list[Union[SmartContractQueryResponse, NetworkProviderError]]:
+        """
+        Runs the queries and returns the responses, in the order of the queries.
+        If a query cannot be run, the error is returned in place of its response.
+        """
+        unique_queries = {get_smart_contract_query_key(query): query for query in queries}
+        responses = map_concurrently(
+            self._get_executor(), self.network_provider.query_contract, list(unique_queries.values())
+        )
+        responses_by_key = dict(zip(unique_queries.keys(), responses))
+
+        return [responses_by_key[get_smart_contract_query_key(query)] for query in queries]
+
+    def query_many(self, queries: Sequence[SmartContractQuery]) -> list[Union[list[Any], Exception]]:
+        """
+        Runs the queries and returns the decoded output values (if an ABI is available, otherwise the raw return data parts), in the order of the queries.
+        If a query cannot be run, does not succeed (see `SmartContractQueryError`), or its output cannot be decoded, the error is returned in place of its output.
+        """
+        results: list[Union[list[Any], Exception]] = []
+
+        for response in self.run_queries(queries):
+            if isinstance(response, NetworkProviderError):
+                results.append(response)
+            elif response.return_code != "ok":
+                results.append(SmartContractQueryError(response.return_code, response.return_message))
+            else:
+                results.append(self._try_parse_response(response))
+
+        return results
+
+    def _try_parse_response(self, response: SmartContractQueryResponse) -> Union[list[Any], Exception]:
+        try:
+            return self._parse_response(response)
+        except Exception as error:
+            return error
+
+    def _parse_response(self, response: SmartContractQueryResponse) -> list[Any]:
+        if self.abi:
+            return self.abi.decode_endpoint_output_parameters(response.function, response.return_data_parts)
+
+        return response.return_data_parts
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+
+            return self._executor
@@ -0,0 +1,140 @@
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from dharitri_py_sdk.abi.abi import Abi
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.network_providers.errors import NetworkProviderError
+from dharitri_py_sdk.network_providers.resources import NetworkConfig
+from dharitri_py_sdk.smart_contracts.errors import SmartContractQueryError
+from dharitri_py_sdk.smart_contracts.smart_contract_queries_runner import (
+    SmartContractQueriesRunner,
+)
+from dharitri_py_sdk.smart_contracts.smart_contract_query import (
+    SmartContractQuery,
+    SmartContractQueryResponse,
+)
+
+CONTRACTS = [Address(bytes([0] * 8 + [5, 0] + [index] * 22), "drt") for index in range(10)]
+
+
+class FakeProvider:
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+        self.num_running = 0
+        self.max_num_running = 0
+        self.lock = threading.Lock()
+
+    def query_contract(self, query: SmartContractQuery) -> SmartContractQueryResponse:
+        with self.lock:
+            self.calls[query.contract.to_bech32()] += 1
+            self.num_running += 1
+            self.max_num_running = max(self.max_num_running, self.num_running)
+
+        time.sleep(0.02)
+
+        with self.lock:
+            self.num_running -= 1
+
+        if query.function == "unknown":
+            return SmartContractQueryResponse(
+                function=query.function,
+                return_code="user error",
+                return_message="invalid function",
+                return_data_parts=[],
+            )
+        if query.contract == CONTRACTS[9]:
+            raise NetworkProviderError("vm-values/query", "timeout")
+
+        index = CONTRACTS.index(query.contract)
+        return SmartContractQueryResponse(
+            function=query.function, return_code="ok", return_message="", return_data_parts=[bytes([index])]
+        )
+
+    def get_network_config(self) -> NetworkConfig:
+        return NetworkConfig(
+            raw={},
+            chain_id="D",
+            gas_per_data_byte=1500,
+            gas_price_modifier=0.01,
+            min_gas_limit=50000,
+            min_gas_price=1000000000,
+            extra_gas_limit_for_guarded_transactions=50000,
+            num_shards=3,
+            round_duration=600000,
+            num_rounds_per_epoch=14400,
+            genesis_timestamp=0,
+        )
+
+
+def test_run_queries_concurrently_and_deduplicate():
+    provider = FakeProvider()
+    runner = SmartContractQueriesRunner(provider, max_concurrency=3)
+    queries = [SmartContractQuery(contract=contract, function="getSum", arguments=[]) for contract in CONTRACTS[:6]]
+
+    responses = runner.run_queries([*queries, *queries])
+
+    assert len(responses) == 12
+    assert all(provider.calls[contract.to_bech32()] == 1 for contract in CONTRACTS[:6])
+    assert provider.max_num_running == 3
+    assert [response.return_data_parts for response in responses] == [[bytes([index % 6])] for index in range(12)]  # type: ignore
+
+
+def test_query_many_with_abi():
+    abi = Abi.load(Path(__file__).parent.parent / "testutils" / "testdata" / "adder.abi.json")
+    runner = SmartContractQueriesRunner(FakeProvider(), abi=abi)
+
+    results = runner.query_many(
+        [
+            SmartContractQuery(contract=CONTRACTS[7], function="getSum", arguments=[]),
+            SmartContractQuery(contract=CONTRACTS[0], function="unknown", arguments=[]),
+            SmartContractQuery(contract=CONTRACTS[9], function="getSum", arguments=[]),
+        ]
+    )
+
+    assert results[0] == [7]
+    assert isinstance(results[1], SmartContractQueryError)
+    assert isinstance(results[2], NetworkProviderError)
+
+
+def test_query_many_returns_decoding_errors_in_place():
+    abi = Abi.load(Path(__file__).parent.parent / "testutils" / "testdata" / "adder.abi.json")
+    runner = SmartContractQueriesRunner(FakeProvider(), abi=abi)
+
+    results = runner.query_many(
+        [
+            SmartContractQuery(contract=CONTRACTS[1], function="notInAbi", arguments=[]),
+            SmartContractQuery(contract=CONTRACTS[2], function="getSum", arguments=[]),
+        ]
+    )
+
+    assert isinstance(results[0], Exception)
+    assert results[1] == [2]
+
+
+def test_run_queries_on_executor_of_provider():
+    provider = FakeProvider()
+
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="provider") as executor:
+        provider.executor = executor  # type: ignore
+        runner = SmartContractQueriesRunner(provider, max_concurrency=8)
+        queries = [SmartContractQuery(contract=contract, function="getSum", arguments=[]) for contract in CONTRACTS[:6]]
+
+        responses = runner.run_queries(queries)
+
+    assert len(responses) == 6
+    assert provider.max_num_running == 2
+
+
+def test_responses_are_cached_for_rounds():
+    provider = FakeProvider()
+    runner = SmartContractQueriesRunner(provider, cache_ttl_in_rounds=1)
+    query = SmartContractQuery(contract=CONTRACTS[1], function="getSum", arguments=[b"\x01"], caller=CONTRACTS[2])
+    other_query = SmartContractQuery(contract=CONTRACTS[1], function="getSum", arguments=[b"\x01"], value=1)
+
+    runner.run_queries([query])
+    runner.run_queries([query, other_query])
+
+    assert provider.calls[CONTRACTS[1].to_bech32()] == 2
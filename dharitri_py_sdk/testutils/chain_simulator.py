@@ -0,0 +1,568 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from typing import Optional, Union
+
+from dharitri_py_sdk.core.address import Address, AddressComputer
+from dharitri_py_sdk.core.constants import (
+    METACHAIN_ID,
+    REWA_IDENTIFIER_FOR_MULTI_DCDTNFT_TRANSFER,
+)
+from dharitri_py_sdk.core.errors import NotEnoughGasError
+from dharitri_py_sdk.core.tokens import Token
+from dharitri_py_sdk.core.transaction import Transaction
+from dharitri_py_sdk.core.transaction_computer import TransactionComputer
+from dharitri_py_sdk.core.transaction_on_network import (
+    TransactionEvent,
+    TransactionLogs,
+    TransactionOnNetwork,
+)
+from dharitri_py_sdk.core.transaction_status import TransactionStatus
+from dharitri_py_sdk.network_providers.errors import NetworkProviderError
+from dharitri_py_sdk.network_providers.resources import (
+    AccountOnNetwork,
+    AwaitingOptions,
+    BlockOnNetwork,
+    NetworkConfig,
+    NetworkStatus,
+    TokenAmountOnNetwork,
+)
+from dharitri_py_sdk.network_providers.transaction_awaiter import TransactionAwaiter
+from dharitri_py_sdk.testutils.mock_network_provider import MockNetworkProvider
+from dharitri_py_sdk.wallet.user_verifer import UserVerifier
+
+
+@dataclass
+class ChainSimulatorOptions:
+    """
+    Options of the `ChainSimulator`.
+
+    Args:
+        num_shards (int): the number of (regular) shards.
+        round_duration_in_milliseconds (int): the duration of a round, when rounds are produced in the background (see `start()`).
+        max_transactions_per_block (int): how many transactions a shard includes in a block (that is, the throughput per shard and round).
+        validate_signatures (bool): whether the signatures of the senders are checked (disable it for very large load tests, with unsigned transactions).
+        chain_id (str): the chain ID expected in transactions.
+        min_gas_limit (int): the gas limit of a simple transfer.
+        gas_per_data_byte (int): the gas charged for each byte of data.
+        gas_price_modifier (float): the fraction of the gas price charged for processing gas.
+        min_gas_price (int): the minimum gas price.
+    """
+
+    num_shards: int = 3
+    round_duration_in_milliseconds: int = 100
+    max_transactions_per_block: int = 10_000
+    validate_signatures: bool = True
+    chain_id: str = "localnet"
+    min_gas_limit: int = 50_000
+    gas_per_data_byte: int = 1_500
+    gas_price_modifier: float = 0.01
+    min_gas_price: int = 1_000_000_000
+
+
+@dataclass
+class _PendingTransaction:
+    transaction: Transaction
+    hash: bytes
+    sender_shard: int
+    receiver_shard: int
+
+
+@dataclass
+class _Transfer:
+    receiver: Address
+    tokens: list[tuple[Token, int]] = field(default_factory=list)
+    # REWA transferred through "MultiDCDTNFTTransfer"
+    native_amount: int = 0
+
+
+class ChainSimulator(MockNetworkProvider):
+    """
+    A local, in-memory chain, to be used in tests (including load tests) instead of a real network.
+    Submitted transactions are validated (chain ID, gas, nonce and, optionally, signature), then executed in blocks,
+    produced round by round (on demand, with `produce_rounds()`, or in the background, with `start()`).
+
+    Native (REWA) transfers and token transfers (`DCDTTransfer`, `DCDTNFTTransfer` and `MultiDCDTNFTTransfer`) are applied; other function calls
+    only transfer the value. Transactions are executed in the shard of the sender (including the cross-shard ones).
+    The canned data and responders of the `MockNetworkProvider` are still available.
+    """
+
+    def __init__(self, options: Optional[ChainSimulatorOptions] = None) -> None:
+        super().__init__()
+        self.options = options or ChainSimulatorOptions()
+        self.network_config = NetworkConfig(
+            raw={},
+            chain_id=self.options.chain_id,
+            gas_per_data_byte=self.options.gas_per_data_byte,
+            gas_price_modifier=self.options.gas_price_modifier,
+            min_gas_limit=self.options.min_gas_limit,
+            min_gas_price=self.options.min_gas_price,
+            extra_gas_limit_for_guarded_transactions=50_000,
+            num_shards=self.options.num_shards,
+            round_duration=self.options.round_duration_in_milliseconds,
+            num_rounds_per_epoch=14_400,
+            genesis_timestamp=int(time.time()),
+        )
+
+        self.tokens: dict[str, dict[tuple[str, int], int]] = {}
+        self.blocks: dict[int, list[BlockOnNetwork]] = {shard: [] for shard in self._get_all_shards()}
+        self.current_round = 0
+
+        self._transaction_computer = TransactionComputer()
+        self._address_computer = AddressComputer(self.options.num_shards)
+        # bech32 encoding is slow, so it's done once per address
+        self._bech32_by_public_key: dict[bytes, str] = {}
+        self._shards_by_address: dict[bytes, int] = {}
+        # pending transactions, by shard, sender and nonce
+        self._pending: dict[int, dict[str, dict[int, _PendingTransaction]]] = {
+            shard: {} for shard in self._get_all_shards()
+        }
+        self._lock = threading.RLock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def mock_put_account(self, address: Address, balance: int = 0, nonce: int = 0) -> None:
+        with self._lock:
+            self.accounts[self._to_bech32(address)] = AccountOnNetwork(
+                raw={}, address=address, nonce=nonce, balance=balance, is_guarded=False
+            )
+
+    def mock_put_token_balance(self, address: Address, token: Token, amount: int) -> None:
+        with self._lock:
+            self.tokens.setdefault(self._to_bech32(address), {})[(token.identifier, token.nonce)] = amount
+
+    def start(self) -> None:
+        """Starts producing rounds in the background (one round every `round_duration_in_milliseconds`)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._produce_rounds_until_stopped, daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+
+        self._stop_event.set()
+        thread.join()
+        self._thread = None
+
+    def produce_rounds(self, num_rounds: int = 1) -> None:
+        """Produces rounds on demand: in each round, each shard produces a block (possibly empty)."""
+        for _ in range(num_rounds):
+            self._produce_round()
+
+    def count_pending_transactions(self) -> int:
+        with self._lock:
+            return sum(len(nonces) for senders in self._pending.values() for nonces in senders.values())
+
+    def get_network_config(self) -> NetworkConfig:
+        return self.network_config
+
+    def get_network_status(self, shard: int = METACHAIN_ID) -> NetworkStatus:
+        with self._lock:
+            blocks = self.blocks[shard]
+            nonce = blocks[-1].nonce if blocks else 0
+
+            return NetworkStatus(
+                raw={},
+                block_timestamp=self._get_timestamp(self.current_round),
+                block_nonce=nonce,
+                highest_final_block_nonce=nonce,
+                current_round=self.current_round,
+                current_epoch=self._get_epoch(self.current_round),
+            )
+
+    def get_block(
+        self,
+        shard: int,
+        block_hash: Optional[Union[str, bytes]] = None,
+        block_nonce: Optional[int] = None,
+    ) -> BlockOnNetwork:
+        with self._lock:
+            blocks = self.blocks[shard]
+
+            if block_nonce is not None and 0 < block_nonce <= len(blocks):
+                return blocks[block_nonce - 1]
+
+            if block_hash is not None:
+                block_hash = bytes.fromhex(block_hash) if isinstance(block_hash, str) else block_hash
+                for block in blocks:
+                    if block.hash == block_hash:
+                        return block
+
+        raise NetworkProviderError(f"block/{shard}", "block not found")
+
+    def get_latest_block(self, shard: int = METACHAIN_ID) -> BlockOnNetwork:
+        with self._lock:
+            if not self.blocks[shard]:
+                raise NetworkProviderError(f"block/{shard}", "block not found")
+            return self.blocks[shard][-1]
+
+    def get_account(self, address: Address) -> AccountOnNetwork:
+        with self._lock:
+            account = self.accounts.get(self._to_bech32(address))
+
+            if account is None:
+                # as on the real network, unknown accounts are empty
+                return AccountOnNetwork(raw={}, address=address, nonce=0, balance=0, is_guarded=False)
+
+            return AccountOnNetwork(
+                raw={}, address=address, nonce=account.nonce, balance=account.balance, is_guarded=account.is_guarded
+            )
+
+    def get_token_of_account(self, address: Address, token: Token) -> TokenAmountOnNetwork:
+        with self._lock:
+            amount = self.tokens.get(self._to_bech32(address), {}).get((token.identifier, token.nonce), 0)
+
+        return TokenAmountOnNetwork(raw={}, token=token, amount=amount, attributes=b"")
+
+    def get_fungible_tokens_of_account(self, address: Address) -> list[TokenAmountOnNetwork]:
+        return [amount for amount in self._get_tokens_of_account(address) if not amount.token.nonce]
+
+    def get_non_fungible_tokens_of_account(self, address: Address) -> list[TokenAmountOnNetwork]:
+        return [amount for amount in self._get_tokens_of_account(address) if amount.token.nonce]
+
+    def send_transaction(self, transaction: Transaction) -> bytes:
+        """Validates the transaction and adds it to the pool. Raises `NetworkProviderError` if the transaction is invalid."""
+        with self._lock:
+            return self._accept_transaction(transaction)
+
+    def send_transactions(self, transactions: list[Transaction]) -> tuple[int, list[bytes]]:
+        """Same as `send_transaction()`, for many transactions. The invalid ones get an empty hash."""
+        hashes: list[bytes] = []
+
+        with self._lock:
+            for transaction in transactions:
+                try:
+                    hashes.append(self._accept_transaction(transaction))
+                except NetworkProviderError:
+                    hashes.append(b"")
+
+        return len([tx_hash for tx_hash in hashes if tx_hash]), hashes
+
+    def await_transaction_completed(
+        self,
+        transaction_hash: Union[str, bytes],
+        options: Optional[AwaitingOptions] = None,
+    ) -> TransactionOnNetwork:
+        if options is None:
+            options = AwaitingOptions(
+                polling_interval_in_milliseconds=max(1, self.options.round_duration_in_milliseconds // 2),
+                patience_in_milliseconds=0,
+            )
+
+        awaiter = TransactionAwaiter(
+            fetcher=self,
+            polling_interval_in_milliseconds=options.polling_interval_in_milliseconds,
+            timeout_interval_in_milliseconds=options.timeout_in_milliseconds,
+            patience_time_in_milliseconds=options.patience_in_milliseconds,
+        )
+
+        return awaiter.await_completed(transaction_hash)
+
+    def _accept_transaction(self, transaction: Transaction) -> bytes:
+        url = "transaction/send"
+
+        if transaction.chain_id != self.options.chain_id:
+            raise NetworkProviderError(url, f"invalid chain ID: {transaction.chain_id}")
+        if transaction.gas_price < self.options.min_gas_price:
+            raise NetworkProviderError(url, "insufficient gas price")
+
+        try:
+            self._transaction_computer.compute_transaction_fee(transaction, self.network_config)
+        except NotEnoughGasError:
+            raise NetworkProviderError(url, "insufficient gas limit")
+
+        sender = self._to_bech32(transaction.sender)
+        account = self.accounts.get(sender)
+        account_nonce = account.nonce if account else 0
+
+        if transaction.nonce < account_nonce:
+            raise NetworkProviderError(url, "transaction generation failed: lowerNonceInTx")
+        if self.options.validate_signatures and not self._is_signature_valid(transaction):
+            raise NetworkProviderError(url, "transaction generation failed: invalid signature")
+
+        tx_hash = self._transaction_computer.compute_transaction_hash(transaction)
+        sender_shard = self._get_shard(transaction.sender)
+        pending = _PendingTransaction(
+            transaction=transaction,
+            hash=tx_hash,
+            sender_shard=sender_shard,
+            receiver_shard=self._get_shard(transaction.receiver),
+        )
+
+        # a transaction with the same nonce replaces the pending one (which becomes invalid)
+        nonces = self._pending[sender_shard].setdefault(sender, {})
+        replaced = nonces.get(transaction.nonce)
+        if replaced and replaced.hash != tx_hash:
+            self.transactions[replaced.hash.hex()] = self._create_transaction_on_network(
+                replaced, TransactionStatus("invalid")
+            )
+
+        nonces[transaction.nonce] = pending
+        self.transactions[tx_hash.hex()] = self._create_transaction_on_network(pending, TransactionStatus("pending"))
+        return tx_hash
+
+    def _is_signature_valid(self, transaction: Transaction) -> bool:
+        try:
+            data = self._transaction_computer.compute_bytes_for_verifying(transaction)
+            return UserVerifier.from_address(transaction.sender).verify(data, transaction.signature)
+        except Exception:
+            return False
+
+    def _produce_rounds_until_stopped(self) -> None:
+        interval = self.options.round_duration_in_milliseconds / 1000
+
+        while not self._stop_event.wait(interval):
+            self._produce_round()
+
+    def _produce_round(self) -> None:
+        with self._lock:
+            self.current_round += 1
+
+            for shard in self._get_all_shards():
+                self._produce_block(shard)
+
+    def _produce_block(self, shard: int) -> None:
+        blocks = self.blocks[shard]
+        nonce = len(blocks) + 1
+        previous_hash = blocks[-1].hash if blocks else bytes(32)
+        block_hash = blake2b(f"{shard}/{nonce}/{self.current_round}".encode() + previous_hash, digest_size=32).digest()
+
+        block = BlockOnNetwork(
+            raw={},
+            shard=shard,
+            nonce=nonce,
+            hash=block_hash,
+            previous_hash=previous_hash,
+            timestamp=self._get_timestamp(self.current_round),
+            round=self.current_round,
+            epoch=self._get_epoch(self.current_round),
+        )
+
+        for pending in self._pick_executable_transactions(shard):
+            self.transactions[pending.hash.hex()] = self._execute(pending, block)
+
+        blocks.append(block)
+
+    def _pick_executable_transactions(self, shard: int) -> list[_PendingTransaction]:
+        """Picks (and removes from the pool) the transactions whose nonces follow the nonces of their senders (without gaps)."""
+        picked: list[_PendingTransaction] = []
+        budget = self.options.max_transactions_per_block
+        senders = self._pending[shard]
+
+        for sender in list(senders.keys()):
+            nonces = senders[sender]
+            account = self.accounts.get(sender)
+            next_nonce = account.nonce if account else 0
+
+            while budget and next_nonce in nonces:
+                picked.append(nonces.pop(next_nonce))
+                next_nonce += 1
+                budget -= 1
+
+            # stale transactions (with nonces lower than the account nonce) are dropped
+            for nonce in [nonce for nonce in nonces if nonce < next_nonce]:
+                del nonces[nonce]
+
+            if not nonces:
+                del senders[sender]
+            if not budget:
+                break
+
+        return picked
+
+    def _execute(self, pending: _PendingTransaction, block: BlockOnNetwork) -> TransactionOnNetwork:
+        transaction = pending.transaction
+        sender = self._get_or_create_account(transaction.sender)
+        fee = self._transaction_computer.compute_transaction_fee(transaction, self.network_config)
+
+        sender.nonce += 1
+        transfer = _parse_transfer(transaction)
+        error = self._check_funds(transaction, transfer, fee)
+
+        if error:
+            sender.balance -= min(fee, sender.balance)
+            event = _create_event(
+                "signalError", transaction.sender, [transaction.sender.get_public_key(), error.encode()]
+            )
+            return self._create_transaction_on_network(pending, TransactionStatus("fail"), block, [event])
+
+        sender.balance -= fee + transaction.value + transfer.native_amount
+        self._get_or_create_account(transfer.receiver).balance += transaction.value + transfer.native_amount
+        events: list[TransactionEvent] = []
+
+        sender_tokens = self.tokens.setdefault(self._to_bech32(transaction.sender), {})
+        receiver_tokens = self.tokens.setdefault(self._to_bech32(transfer.receiver), {})
+        identifier = _get_function(transaction)
+
+        for token, amount in transfer.tokens:
+            key = (token.identifier, token.nonce)
+            sender_tokens[key] -= amount
+            receiver_tokens[key] = receiver_tokens.get(key, 0) + amount
+
+            topics = [token.identifier.encode(), _to_bytes(token.nonce), _to_bytes(amount)]
+            events.append(_create_event(identifier, transaction.sender, [*topics, transfer.receiver.get_public_key()]))
+
+        return self._create_transaction_on_network(pending, TransactionStatus("success"), block, events)
+
+    def _check_funds(self, transaction: Transaction, transfer: _Transfer, fee: int) -> str:
+        sender = self.accounts[self._to_bech32(transaction.sender)]
+
+        if sender.balance < fee + transaction.value + transfer.native_amount:
+            return "insufficient funds"
+
+        sender_tokens = self.tokens.get(self._to_bech32(transaction.sender), {})
+        needed: dict[tuple[str, int], int] = {}
+
+        for token, amount in transfer.tokens:
+            key = (token.identifier, token.nonce)
+            needed[key] = needed.get(key, 0) + amount
+
+        for key, amount in needed.items():
+            if sender_tokens.get(key, 0) < amount:
+                return "insufficient funds"
+
+        return ""
+
+    def _create_transaction_on_network(
+        self,
+        pending: _PendingTransaction,
+        status: TransactionStatus,
+        block: Optional[BlockOnNetwork] = None,
+        events: Optional[list[TransactionEvent]] = None,
+    ) -> TransactionOnNetwork:
+        transaction = pending.transaction
+
+        return TransactionOnNetwork(
+            raw={},
+            sender=transaction.sender,
+            receiver=transaction.receiver,
+            hash=pending.hash,
+            nonce=transaction.nonce,
+            round=block.round if block else 0,
+            epoch=block.epoch if block else 0,
+            timestamp=block.timestamp if block else 0,
+            block_hash=block.hash if block else b"",
+            miniblock_hash=block.hash if block else b"",
+            sender_shard=pending.sender_shard,
+            receiver_shard=pending.receiver_shard,
+            value=transaction.value,
+            gas_limit=transaction.gas_limit,
+            gas_price=transaction.gas_price,
+            function=_get_function(transaction),
+            data=transaction.data,
+            version=transaction.version,
+            options=transaction.options,
+            signature=transaction.signature,
+            status=status,
+            smart_contract_results=[],
+            logs=TransactionLogs(address=transaction.sender, events=events or []),
+        )
+
+    def _get_or_create_account(self, address: Address) -> AccountOnNetwork:
+        bech32 = self._to_bech32(address)
+        account = self.accounts.get(bech32)
+
+        if account is None:
+            account = AccountOnNetwork(raw={}, address=address, nonce=0, balance=0, is_guarded=False)
+            self.accounts[bech32] = account
+
+        return account
+
+    def _get_tokens_of_account(self, address: Address) -> list[TokenAmountOnNetwork]:
+        with self._lock:
+            tokens = dict(self.tokens.get(self._to_bech32(address), {}))
+
+        return [
+            TokenAmountOnNetwork(raw={}, token=Token(identifier, nonce), amount=amount, attributes=b"")
+            for (identifier, nonce), amount in tokens.items()
+            if amount
+        ]
+
+    def _to_bech32(self, address: Address) -> str:
+        public_key = address.get_public_key()
+        bech32 = self._bech32_by_public_key.get(public_key)
+
+        if bech32 is None:
+            bech32 = address.to_bech32()
+            self._bech32_by_public_key[public_key] = bech32
+
+        return bech32
+
+    def _get_shard(self, address: Address) -> int:
+        public_key = address.get_public_key()
+        shard = self._shards_by_address.get(public_key)
+
+        if shard is None:
+            shard = self._address_computer.get_shard_of_address(address)
+            self._shards_by_address[public_key] = shard
+
+        return shard
+
+    def _get_all_shards(self) -> list[int]:
+        return [*range(self.options.num_shards), METACHAIN_ID]
+
+    def _get_timestamp(self, round: int) -> int:
+        return self.network_config.genesis_timestamp + round * self.options.round_duration_in_milliseconds // 1000
+
+    def _get_epoch(self, round: int) -> int:
+        return round // self.network_config.num_rounds_per_epoch
+
+
+def _get_function(transaction: Transaction) -> str:
+    if not transaction.data:
+        return ""
+    return transaction.data.split(b"@", 1)[0].decode(errors="ignore")
+
+
+def _parse_transfer(transaction: Transaction) -> _Transfer:
+    """Decodes the token transfers of a transaction, if any."""
+    function = _get_function(transaction)
+    args = transaction.data.decode(errors="ignore").split("@")[1:]
+
+    try:
+        if function == "DCDTTransfer" and len(args) >= 2:
+            token = Token(bytes.fromhex(args[0]).decode())
+            return _Transfer(receiver=transaction.receiver, tokens=[(token, _hex_to_int(args[1]))])
+
+        if function == "DCDTNFTTransfer" and len(args) >= 4 and transaction.sender == transaction.receiver:
+            token = Token(bytes.fromhex(args[0]).decode(), _hex_to_int(args[1]))
+            receiver = Address.new_from_hex(args[3], transaction.sender.get_hrp())
+            return _Transfer(receiver=receiver, tokens=[(token, _hex_to_int(args[2]))])
+
+        if function == "MultiDCDTNFTTransfer" and len(args) >= 2 and transaction.sender == transaction.receiver:
+            transfer = _Transfer(receiver=Address.new_from_hex(args[0], transaction.sender.get_hrp()))
+            num_transfers = _hex_to_int(args[1])
+
+            for index in range(2, 2 + 3 * num_transfers, 3):
+                identifier, nonce, amount = args[index : index + 3]
+                token = Token(bytes.fromhex(identifier).decode(), _hex_to_int(nonce))
+
+                if token.identifier == REWA_IDENTIFIER_FOR_MULTI_DCDTNFT_TRANSFER:
+                    transfer.native_amount += _hex_to_int(amount)
+                else:
+                    transfer.tokens.append((token, _hex_to_int(amount)))
+
+            return transfer
+    except ValueError:
+        pass
+
+    return _Transfer(receiver=transaction.receiver)
+
+
+def _create_event(identifier: str, address: Address, topics: list[bytes]) -> TransactionEvent:
+    return TransactionEvent(raw={}, address=address, identifier=identifier, topics=topics, data=b"", additional_data=[])
+
+
+def _hex_to_int(value: str) -> int:
+    return int(value, 16) if value else 0
+
+
+def _to_bytes(value: int) -> bytes:
+    return value.to_bytes((value.bit_length() + 7) // 8, "big")
@@ -0,0 +1,181 @@
+import time
+from collections import Counter
+
+import pytest
+
+from dharitri_py_sdk.accounts.account import Account
+from dharitri_py_sdk.core.address import Address
+from dharitri_py_sdk.core.tokens import Token, TokenTransfer
+from dharitri_py_sdk.core.transaction import Transaction
+from dharitri_py_sdk.core.transactions_factory_config import TransactionsFactoryConfig
+from dharitri_py_sdk.network_providers.errors import NetworkProviderError
+from dharitri_py_sdk.testutils.chain_simulator import (
+    ChainSimulator,
+    ChainSimulatorOptions,
+)
+from dharitri_py_sdk.testutils.utils import create_account_rewa_balance
+from dharitri_py_sdk.testutils.wallets import alice_pem
+from dharitri_py_sdk.transfers.transfer_transactions_factory import (
+    TransferTransactionsFactory,
+)
+
+ALICE = Account.new_from_pem(alice_pem)
+BOB = ChainSimulator.bob
+CAROL = ChainSimulator.carol
+FACTORY = TransferTransactionsFactory(TransactionsFactoryConfig("localnet"))
+
+
+def sign(transaction: Transaction, nonce: int) -> Transaction:
+    transaction.nonce = nonce
+    transaction.signature = ALICE.sign_transaction(transaction)
+    return transaction
+
+
+def test_native_transfers():
+    simulator = ChainSimulator()
+    transaction = sign(FACTORY.create_transaction_for_native_token_transfer(ALICE.address, BOB, 10**18), 0)
+
+    tx_hash = simulator.send_transaction(transaction)
+    assert simulator.get_transaction(tx_hash).status.status == "pending"
+
+    simulator.produce_rounds()
+    transaction_on_network = simulator.get_transaction(tx_hash)
+
+    assert transaction_on_network.status.is_successful
+    assert transaction_on_network.block_hash == simulator.get_latest_block(transaction_on_network.sender_shard).hash
+    assert simulator.get_account(ALICE.address).nonce == 1
+    assert simulator.get_account(BOB).balance == create_account_rewa_balance(501)
+    assert simulator.get_account(ALICE.address).balance < create_account_rewa_balance(999)
+
+
+def test_transactions_are_validated():
+    simulator = ChainSimulator()
+    transaction = FACTORY.create_transaction_for_native_token_transfer(ALICE.address, BOB, 1)
+
+    with pytest.raises(NetworkProviderError, match="invalid signature"):
+        simulator.send_transaction(transaction)
+
+    sign(transaction, 0)
+    transaction.signature = bytes(64)
+    with pytest.raises(NetworkProviderError, match="invalid signature"):
+        simulator.send_transaction(transaction)
+
+    simulator.mock_put_account(ALICE.address, balance=create_account_rewa_balance(1), nonce=7)
+    with pytest.raises(NetworkProviderError, match="lowerNonceInTx"):
+        simulator.send_transaction(sign(transaction, 6))
+
+    transaction.gas_limit = 1
+    with pytest.raises(NetworkProviderError, match="insufficient gas limit"):
+        simulator.send_transaction(sign(transaction, 7))
+
+    transaction.chain_id = "D"
+    with pytest.raises(NetworkProviderError, match="invalid chain ID"):
+        simulator.send_transaction(sign(transaction, 7))
+
+
+def test_nonce_gaps_and_failed_transactions():
+    simulator = ChainSimulator()
+    simulator.mock_put_account(ALICE.address, balance=create_account_rewa_balance(1))
+    amount = create_account_rewa_balance(1) * 2 // 5
+
+    transactions = [
+        sign(FACTORY.create_transaction_for_native_token_transfer(ALICE.address, BOB, amount), nonce)
+        for nonce in [0, 2, 1]
+    ]
+    num_sent, hashes = simulator.send_transactions([transactions[0], transactions[1]])
+    assert num_sent == 2
+
+    simulator.produce_rounds()
+    assert simulator.get_transaction(hashes[0]).status.is_successful
+    # the second transaction waits for the gap to be filled
+    assert simulator.get_transaction(hashes[1]).status.status == "pending"
+    assert simulator.count_pending_transactions() == 1
+
+    gap_hash = simulator.send_transaction(transactions[2])
+    simulator.produce_rounds()
+
+    assert simulator.get_transaction(gap_hash).status.is_successful
+    # not enough funds left for the third transfer (because of the fees)
+    failed = simulator.get_transaction(hashes[1])
+    assert failed.status.is_failed
+    assert failed.logs.events[0].identifier == "signalError"
+    assert simulator.get_account(ALICE.address).nonce == 3
+    assert simulator.count_pending_transactions() == 0
+
+
+def test_token_transfers():
+    simulator = ChainSimulator()
+    simulator.mock_put_token_balance(ALICE.address, Token("TEST-123456"), 1000)
+    simulator.mock_put_token_balance(ALICE.address, Token("NFT-abcdef", 7), 1)
+
+    single = FACTORY.create_transaction_for_dcdt_token_transfer(
+        ALICE.address, BOB, [TokenTransfer(Token("TEST-123456"), 100)]
+    )
+    multi = FACTORY.create_transaction_for_dcdt_token_transfer(
+        ALICE.address,
+        CAROL,
+        [TokenTransfer(Token("TEST-123456"), 200), TokenTransfer(Token("NFT-abcdef", 7), 1)],
+    )
+    too_much = FACTORY.create_transaction_for_dcdt_token_transfer(
+        ALICE.address, BOB, [TokenTransfer(Token("TEST-123456"), 701)]
+    )
+
+    _, hashes = simulator.send_transactions([sign(single, 0), sign(multi, 1), sign(too_much, 2)])
+    simulator.produce_rounds()
+
+    assert simulator.get_token_of_account(ALICE.address, Token("TEST-123456")).amount == 700
+    assert simulator.get_token_of_account(BOB, Token("TEST-123456")).amount == 100
+    assert simulator.get_token_of_account(CAROL, Token("TEST-123456")).amount == 200
+    assert [amount.token.identifier for amount in simulator.get_non_fungible_tokens_of_account(CAROL)] == ["NFT-abcdef"]
+    assert simulator.get_non_fungible_tokens_of_account(ALICE.address) == []
+
+    event = simulator.get_transaction(hashes[0]).logs.events[0]
+    assert event.identifier == "DCDTTransfer"
+    assert event.topics == [b"TEST-123456", b"", bytes([100]), BOB.get_public_key()]
+
+    events = simulator.get_transaction(hashes[1]).logs.events
+    assert [event.identifier for event in events] == ["MultiDCDTNFTTransfer", "MultiDCDTNFTTransfer"]
+    assert events[1].topics[:2] == [b"NFT-abcdef", bytes([7])]
+
+    assert simulator.get_transaction(hashes[2]).status.is_failed
+
+
+def test_throughput_per_shard():
+    simulator = ChainSimulator(ChainSimulatorOptions(max_transactions_per_block=10, validate_signatures=False))
+    senders = [Address(bytes([index] * 32), "drt") for index in range(1, 31)]
+    transactions: list[Transaction] = []
+
+    for sender in senders:
+        simulator.mock_put_account(sender, balance=create_account_rewa_balance(1))
+        for nonce in range(3):
+            transaction = FACTORY.create_transaction_for_native_token_transfer(sender, BOB, 1)
+            transaction.nonce = nonce
+            transactions.append(transaction)
+
+    _, hashes = simulator.send_transactions(transactions)
+    num_transactions_by_shard = Counter(simulator.get_transaction(tx_hash).sender_shard for tx_hash in hashes)
+
+    simulator.produce_rounds()
+    # each shard executes (at most) 10 transactions per round
+    expected_pending = sum(max(0, count - 10) for count in num_transactions_by_shard.values())
+    assert simulator.count_pending_transactions() == expected_pending
+
+    simulator.produce_rounds(10)
+    assert simulator.count_pending_transactions() == 0
+    assert simulator.get_network_status(0).block_nonce == 11
+    assert simulator.get_block(0, block_nonce=2).previous_hash == simulator.get_block(0, block_nonce=1).hash
+
+
+def test_background_rounds_and_awaiting():
+    simulator = ChainSimulator(ChainSimulatorOptions(round_duration_in_milliseconds=10))
+    simulator.start()
+
+    try:
+        transaction = sign(FACTORY.create_transaction_for_native_token_transfer(ALICE.address, BOB, 1), 0)
+        start = time.perf_counter()
+        transaction_on_network = simulator.await_transaction_completed(simulator.send_transaction(transaction))
+
+        assert transaction_on_network.status.is_successful
+        assert time.perf_counter() - start < 1
+    finally:
+        simulator.stop()
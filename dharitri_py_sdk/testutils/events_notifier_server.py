@@ -0,0 +1,113 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+class EventsNotifierServer:
+    """
+    A local stand-in for an events notifier, speaking the long polling protocol expected by the `TransactionNotifier`.
+    Events are published by the tests (e.g. `publish_transaction()`), then served to the connected clients.
+    """
+
+    def __init__(self, max_buffered_events: int = 1000, max_long_polling_timeout_in_seconds: float = 5) -> None:
+        self.max_buffered_events = max_buffered_events
+        self.max_long_polling_timeout_in_seconds = max_long_polling_timeout_in_seconds
+        self.num_requests = 0
+
+        # the cursor of an event is its position in the (whole) stream of events
+        self._events: list[dict[str, Any]] = []
+        self._first_cursor = 0
+        self._condition = threading.Condition()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None, "server not started"
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> "EventsNotifierServer":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _create_handler(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+
+        # wake up the pending (long polling) requests
+        with self._condition:
+            self._condition.notify_all()
+
+    def publish_transaction(self, transaction_hash: str, status: str = "success") -> None:
+        self.publish({"type": "transaction", "hash": transaction_hash, "status": status})
+
+    def publish_block(self, block_hash: str, shard: int, nonce: int, transaction_hashes: list[str]) -> None:
+        self.publish(
+            {"type": "block", "hash": block_hash, "shard": shard, "nonce": nonce, "transactions": transaction_hashes}
+        )
+
+    def publish(self, event: dict[str, Any]) -> None:
+        with self._condition:
+            self._events.append(event)
+
+            if len(self._events) > self.max_buffered_events:
+                num_dropped = len(self._events) - self.max_buffered_events
+                del self._events[:num_dropped]
+                self._first_cursor += num_dropped
+
+            self._condition.notify_all()
+
+    def get_events(self, cursor: Optional[int], timeout_in_seconds: float) -> dict[str, Any]:
+        timeout_in_seconds = min(timeout_in_seconds, self.max_long_polling_timeout_in_seconds)
+
+        with self._condition:
+            self.num_requests += 1
+            last_cursor = self._first_cursor + len(self._events)
+
+            if cursor is None:
+                return {"cursor": last_cursor, "events": []}
+
+            self._condition.wait_for(
+                lambda: self._server is None or self._first_cursor + len(self._events) > cursor, timeout_in_seconds
+            )
+
+            truncated = cursor < self._first_cursor
+            start = max(cursor - self._first_cursor, 0)
+            events = self._events[start:]
+            return {"cursor": self._first_cursor + len(self._events), "events": events, "truncated": truncated}
+
+
+def _create_handler(server: EventsNotifierServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            if url.path != "/events":
+                self.send_error(404)
+                return
+
+            parameters = parse_qs(url.query)
+            cursor = int(parameters["cursor"][0]) if "cursor" in parameters else None
+            timeout = float(parameters.get("timeout", ["30"])[0])
+
+            body = json.dumps(server.get_events(cursor, timeout)).encode()
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
@@ -1,7 +1,7 @@
 from typing import Optional, Protocol, Union
 
 from dharitri_py_sdk.core import Address, Transaction, TransactionOnNetwork
-from dharitri_py_sdk.core.base_controller import BaseController
+from dharitri_py_sdk.core.base_controller import BaseController, IGasLimitEstimator
 from dharitri_py_sdk.core.interfaces import IAccount
 from dharitri_py_sdk.core.transactions_factory_config import TransactionsFactoryConfig
 from dharitri_py_sdk.network_providers.resources import AwaitingOptions
@@ -40,18 +40,30 @@ from dharitri_py_sdk.token_management.token_management_transactions_outcome_pars
 )
 
 
-# fmt: off
 class INetworkProvider(Protocol):
+    # fmt: off
     def await_transaction_completed(self, transaction_hash: Union[str, bytes], options: Optional[AwaitingOptions] = None) -> TransactionOnNetwork:
         ...
-# fmt: on
+    # fmt: on
 
 
 class TokenManagementController(BaseController):
-    def __init__(self, chain_id: str, network_provider: INetworkProvider) -> None:
+    def __init__(
+        self,
+        chain_id: str,
+        network_provider: INetworkProvider,
+        gas_limit_estimator: Optional[IGasLimitEstimator] = None,
+    ) -> None:
+        """
+        Args:
+            chain_id (str): the chain ID.
+            network_provider (INetworkProvider): used to await transactions.
+            gas_limit_estimator (Optional[IGasLimitEstimator]): if set, the gas limit of the transactions is estimated (e.g. using a `GasLimitEstimator`) whenever it isn't explicitly provided, instead of using the static values of `TransactionsFactoryConfig`.
+        """
         self.factory = TokenManagementTransactionsFactory(TransactionsFactoryConfig(chain_id))
         self.network_provider = network_provider
         self.parser = TokenManagementTransactionsOutcomeParser()
+        self.gas_limit_estimator = gas_limit_estimator
 
     def create_transaction_for_issuing_fungible(
         self,